@@ -591,6 +591,12 @@ class DocumentDaemon:
 
         self.stats["start_time"] = datetime.now()
 
+        # Долгоживущий процесс: загрузить модели Docling и перевода до первого документа
+        try:
+            self.pipeline.preload()
+        except Exception as e:
+            logger.warning(f"Pipeline preload failed, components will load on first use: {e}")
+
         try:
             while True:
                 try:
@@ -607,6 +613,8 @@ class DocumentDaemon:
             logger.info("Daemon stopped by user")
             self._print_statistics()
             logger.info("=" * 60)
+        finally:
+            self.pipeline.close()
 
     def _print_statistics(self):
         """Вывести статистику работы daemon."""
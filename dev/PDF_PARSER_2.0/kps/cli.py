@@ -41,6 +41,7 @@ def translate(
     ),
     skip_translation_qa: bool = typer.Option(False, "--skip-translation-qa", help="Bypass translation QA gate"),
     glossary: Optional[str] = typer.Option(None, "--glossary", "-g", help="Glossary file path"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Target languages processed in parallel"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     layout_preserve: bool = typer.Option(
         False,
@@ -83,6 +84,7 @@ def translate(
         memory_type=MemoryType.SEMANTIC,
         glossary_path=glossary or "glossary.yaml",
         export_formats=export_formats,
+        language_workers=workers,
     )
 
     # Create pipeline and layout context
@@ -537,6 +539,97 @@ def memory(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def cache(
+    action: str = typer.Argument(..., help="Action: prune, stats, clear"),
+    path: Optional[str] = typer.Option(
+        None, "--path", help="Extraction cache file (default: data/extraction_cache.db)"
+    ),
+    max_mb: Optional[float] = typer.Option(None, "--max-mb", help="Shrink cache to this size (MB)"),
+    max_age_days: Optional[float] = typer.Option(
+        None, "--max-age-days", help="Drop extractions unused for this many days"
+    ),
+):
+    """
+    Docling extraction cache maintenance.
+
+    Actions:
+        prune  - Drop stale entries and shrink the cache to its size bound
+        stats  - Show entry count and size
+        clear  - Remove all cached extractions
+
+    Example:
+        kps cache prune --max-mb 256 --max-age-days 30
+    """
+    from kps.core.unified_pipeline import DEFAULT_EXTRACTION_CACHE_PATH
+    from kps.extraction.extraction_cache import ExtractionCache
+
+    extraction_cache = ExtractionCache(Path(path) if path else DEFAULT_EXTRACTION_CACHE_PATH)
+    try:
+        if action == "prune":
+            evicted = extraction_cache.prune(
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+                max_age_seconds=max_age_days * 86400 if max_age_days is not None else None,
+            )
+            stats = extraction_cache.stats()
+            typer.secho(
+                f"✓ Pruned {evicted} extractions ({stats.entries} left, {stats.bytes / 1024 / 1024:.1f} MB)",
+                fg=typer.colors.GREEN,
+            )
+
+        elif action == "stats":
+            stats = extraction_cache.stats()
+            typer.echo(f"Cache: {extraction_cache.path}")
+            typer.echo(f"Entries: {stats.entries}")
+            typer.echo(f"Size: {stats.bytes / 1024 / 1024:.1f} MB")
+
+        elif action == "clear":
+            extraction_cache.clear()
+            typer.secho("✓ Extraction cache cleared", fg=typer.colors.GREEN)
+
+        else:
+            typer.secho(f"Unknown action: {action}", fg=typer.colors.RED, err=True)
+            typer.echo("Valid actions: prune, stats, clear")
+            raise typer.Exit(code=1)
+    finally:
+        extraction_cache.close()
+
+
+@app.command()
+def startup(
+    preload: bool = typer.Option(
+        False, "--preload", help="Also build and warm the pipeline components (loads models)"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the profile as JSON"),
+):
+    """
+    Profile startup: import time per subsystem and component init times.
+
+    Example:
+        kps startup
+        kps startup --preload --json
+    """
+    import json
+
+    from kps.startup import profile_imports
+
+    profile = profile_imports()
+    if preload:
+        from kps.core import PipelineConfig, UnifiedPipeline
+
+        pipeline = UnifiedPipeline(PipelineConfig())
+        pipeline.startup_profile = profile
+        try:
+            pipeline.preload()
+        finally:
+            pipeline.close()
+
+    if as_json:
+        typer.echo(json.dumps(profile.to_dict(), indent=2))
+    else:
+        typer.echo(profile.format())
+
+
 @app.command()
 def version():
     """Show version information."""
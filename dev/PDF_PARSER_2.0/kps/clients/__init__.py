@@ -1,5 +1,6 @@
 """Client adapters for external services."""
 
+from .embedding_cache import EmbeddingCache, EmbeddingCacheStats
 from .embeddings import EmbeddingsClient
 
-__all__ = ["EmbeddingsClient"]
+__all__ = ["EmbeddingCache", "EmbeddingCacheStats", "EmbeddingsClient"]
@@ -0,0 +1,141 @@
+"""Persistent content-addressed cache for embedding vectors.
+
+Vectors are keyed by ``(model, dimensions, sha256(normalized text))`` and
+stored as float32 blobs in a small SQLite file, so the same segment is
+embedded once no matter whether semantic memory, the knowledge base or
+hybrid search asks for it, and across runs.
+
+Usage:
+    cache = EmbeddingCache("data/embedding_cache.db", max_entries=200_000)
+    client = EmbeddingsClient(model="text-embedding-3-small", cache=cache)
+    client.create_vectors(["2 лиц, 2 изн"])  # API call
+    client.create_vectors(["2 лиц, 2 изн"])  # served from disk
+"""
+
+from __future__ import annotations
+
+import hashlib
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+from kps.metrics import record_embedding_cache
+from kps.storage import CacheStats, SQLiteLRUStore
+
+
+# Reads only buffer their last_used updates; the buffer is written with the
+# next insert, prune or close, or once it holds this many keys
+TOUCH_FLUSH_SIZE = 1024
+
+EmbeddingCacheStats = CacheStats
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys (NFC, surrounding whitespace stripped)."""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def embedding_cache_key(model: str, dimensions: Optional[int], text: str) -> str:
+    """Content address of ``text`` for the given model and output size."""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{dimensions or 0}:{digest}"
+
+
+def _decode_vector(blob: bytes) -> List[float]:
+    return array("f", blob).tolist()
+
+
+class EmbeddingCache:
+    """Embedding vectors as float32 blobs in an entry-bounded ``SQLiteLRUStore``."""
+
+    def __init__(self, path: Union[str, Path], max_entries: Optional[int] = 200_000):
+        """
+        Args:
+            path: SQLite file (created with parent directories if missing)
+            max_entries: Upper bound on stored vectors; None disables eviction
+        """
+        self._store = SQLiteLRUStore(
+            path, max_entries=max_entries, touch_flush_size=TOUCH_FLUSH_SIZE
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._store.path
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._store.max_entries
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get_many(
+        self, model: str, texts: Sequence[str], dimensions: Optional[int] = None
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up vectors for ``texts``.
+
+        Returns:
+            One entry per text: the cached vector or None on a miss
+        """
+        if not texts:
+            return []
+
+        keys = [embedding_cache_key(model, dimensions, text) for text in texts]
+        results = self._store.get_many(keys, _decode_vector)
+        hits = sum(1 for vector in results if vector is not None)
+        record_embedding_cache(model, "hit", hits)
+        record_embedding_cache(model, "miss", len(results) - hits)
+        return results
+
+    def put_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        dimensions: Optional[int] = None,
+    ) -> None:
+        """Store vectors for ``texts`` (same order) and evict if over capacity."""
+        if len(texts) != len(vectors):
+            raise ValueError("texts and vectors must have the same length")
+        if not texts:
+            return
+
+        evicted = self._store.put_many(
+            [
+                (embedding_cache_key(model, dimensions, text), array("f", vector).tobytes())
+                for text, vector in zip(texts, vectors)
+            ]
+        )
+        record_embedding_cache(model, "eviction", evicted)
+
+    def prune(self, max_entries: Optional[int] = None) -> int:
+        """
+        Drop least recently used vectors down to ``max_entries``.
+
+        Args:
+            max_entries: Target size; defaults to the configured bound
+
+        Returns:
+            Number of evicted vectors
+        """
+        return self._store.prune(max_entries=max_entries)
+
+    def clear(self) -> None:
+        """Remove all cached vectors."""
+        self._store.clear()
+
+    def stats(self) -> EmbeddingCacheStats:
+        return self._store.stats()
+
+    def close(self) -> None:
+        self._store.close()
+
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "embedding_cache_key",
+    "normalize_text",
+]
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
 
 try:
     from openai import OpenAI  # type: ignore
 except ImportError:  # pragma: no cover
     OpenAI = None  # type: ignore
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .embedding_cache import EmbeddingCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +30,20 @@ class EmbeddingsClient:
         retry_base_seconds: float = 1.0,
         timeout: float = 30.0,
         client=None,
+        max_concurrency: int = 1,
+        dimensions: Optional[int] = None,
+        cache: Optional["EmbeddingCache"] = None,
     ) -> None:
         if max_batch <= 0:
             raise ValueError("max_batch must be positive")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
 
         self.model = model
         self.max_batch = max_batch
+        self.max_concurrency = max_concurrency
+        self.dimensions = dimensions
+        self.cache = cache
         self.max_retries = max_retries
         self.retry_base_seconds = retry_base_seconds
         self._client = client or self._default_client(timeout)
@@ -48,20 +60,51 @@ class EmbeddingsClient:
         return self._client
 
     def create_vectors(self, texts: Sequence[str]) -> List[List[float]]:
-        """Generate embeddings for the provided texts."""
+        """Generate embeddings for the provided texts.
+
+        Texts are split into ``max_batch`` chunks; with ``max_concurrency`` > 1
+        chunks are requested in parallel. Output order matches ``texts``.
+        When a ``cache`` is attached only texts missing from it are sent to
+        the API, and the new vectors are written back.
+        """
+
+        if self.cache is None:
+            return self._create_uncached(texts)
+
+        cached = self.cache.get_many(self.model, texts, self.dimensions)
+        missing = list(
+            dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None)
+        )
+        if missing:
+            fetched = self._create_uncached(missing)
+            self.cache.put_many(self.model, missing, fetched, self.dimensions)
+            by_text = dict(zip(missing, fetched))
+            cached = [
+                by_text[text] if vector is None else vector
+                for text, vector in zip(texts, cached)
+            ]
+        return cached
+
+    def _create_uncached(self, texts: Sequence[str]) -> List[List[float]]:
+        batches = [
+            list(texts[start : start + self.max_batch])
+            for start in range(0, len(texts), self.max_batch)
+        ]
+        if not batches:
+            return []
+
+        workers = min(self.max_concurrency, len(batches))
+        if workers == 1:
+            chunks = [self._fetch_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="kps-embed"
+            ) as executor:
+                chunks = list(executor.map(self._fetch_batch, batches))
 
         results: List[List[float]] = []
-        batch: List[str] = []
-
-        for text in texts:
-            batch.append(text)
-            if len(batch) >= self.max_batch:
-                results.extend(self._fetch_batch(batch))
-                batch = []
-
-        if batch:
-            results.extend(self._fetch_batch(batch))
-
+        for chunk in chunks:
+            results.extend(chunk)
         return results
 
     # ------------------------------------------------------------------
@@ -70,10 +113,12 @@ class EmbeddingsClient:
         while True:
             attempt += 1
             try:
-                response = self._client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                )
+                if self.dimensions is None:
+                    response = self._client.embeddings.create(model=self.model, input=batch)
+                else:
+                    response = self._client.embeddings.create(
+                        model=self.model, input=batch, dimensions=self.dimensions
+                    )
                 return [item.embedding for item in response.data]
             except Exception as exc:  # pylint: disable=broad-except
                 if attempt > self.max_retries or not self._is_retryable(exc):
@@ -130,7 +130,11 @@ class KPSDocument:
 
     def save_json(self, path: Path) -> None:
         """Serialize to JSON."""
-        data = {
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False))
+
+    def to_dict(self) -> dict:
+        """JSON-compatible form (without ``docling_document``)."""
+        return {
             "slug": self.slug,
             "metadata": {
                 "title": self.metadata.title,
@@ -168,13 +172,15 @@ class KPSDocument:
                 for s in self.sections
             ],
         }
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
 
     @classmethod
     def load_json(cls, path: Path) -> "KPSDocument":
         """Deserialize from JSON."""
-        data = json.loads(path.read_text())
+        return cls.from_dict(json.loads(path.read_text()))
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "KPSDocument":
+        """Inverse of :meth:`to_dict`."""
         metadata = DocumentMetadata(**data["metadata"])
 
         sections = [
@@ -17,15 +17,18 @@ import copy
 import json
 import logging
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union, cast
 
 # Extraction
 from kps.extraction.docling_extractor import DoclingExtractor
+from kps.extraction.extraction_cache import ExtractionCache
 from kps.extraction.pymupdf_extractor import PyMuPDFExtractor
 from kps.extraction.segmenter import Segmenter, SegmenterConfig  # FIXED: correct class name
 
@@ -33,9 +36,6 @@ from kps.extraction.segmenter import Segmenter, SegmenterConfig  # FIXED: correc
 from kps.core.document import KPSDocument, BlockType
 
 # Translation
-from docling_core.types.doc import RefItem
-from docling_core.types.doc.document import DoclingDocument
-
 from kps.translation import (
     GlossaryManager,
     GlossaryTranslator,
@@ -45,6 +45,10 @@ from kps.translation import (
     TranslationOrchestrator,
 )
 from kps.translation.orchestrator import TranslationSegment
+from kps.translation.segment_dedup import DedupPlan, deduplicate_segments
+from kps.translation.block_manifest import BLOCK_MANIFEST_NAME, BlockManifest, IncrementalPlan
+from kps.translation.glossary_translator import TranslationResult
+from kps.clients.embedding_cache import EmbeddingCache
 from kps.clients.embeddings import EmbeddingsClient
 
 # Knowledge Base (NEW: integrate KB layer)
@@ -54,15 +58,6 @@ try:
 except ImportError:
     KNOWLEDGE_AVAILABLE = False
 
-# InDesign
-try:
-    from kps.indesign.idml_handler import IDMLHandler
-    from kps.indesign.style_manager import StyleManager
-
-    INDESIGN_AVAILABLE = True
-except ImportError:
-    INDESIGN_AVAILABLE = False
-
 # QA
 try:
     from kps.qa.pipeline import QAPipeline
@@ -76,27 +71,21 @@ except ImportError:
 
 from kps.translation.term_validator import TermRule, TermValidator
 from kps.io.layout import RunContext
-from kps.export import (
-    build_docx_from_structure,
-    render_docx_inplace,
-    render_html,
-    render_pdf,
-    export_pdf_browser,
-    load_pdf_style_map,
-    export_docx_with_fallback,
-    export_markdown_with_fallback,
-    export_pdf_with_fallback,
-    write_html_document,
-)
-from kps.export.docling_writer import apply_translations
+from kps.startup import StartupProfile
 
+if TYPE_CHECKING:
+    from docling_core.types.doc.document import DoclingDocument
+    from kps.indesign.idml_handler import IDMLHandler
+    from kps.indesign.style_manager import StyleManager
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 REPO_ROOT = PROJECT_ROOT.parents[1]
 DEFAULT_MEMORY_PATH = PROJECT_ROOT / "data" / "translation_memory.db"
+DEFAULT_EMBEDDING_CACHE_PATH = PROJECT_ROOT / "data" / "embedding_cache.db"
+DEFAULT_EXTRACTION_CACHE_PATH = PROJECT_ROOT / "data" / "extraction_cache.db"
 DEFAULT_PUBLISH_ROOT = (REPO_ROOT / "translations").resolve()
 
 
@@ -130,6 +119,11 @@ class PipelineConfig:
     # Extraction
     extraction_method: ExtractionMethod = ExtractionMethod.AUTO
     use_ocr: bool = False  # OCR для сканов
+    extraction_cache_enabled: bool = True  # Дисковый кэш конвертаций Docling
+    extraction_cache_path: Optional[str] = None  # None = data/extraction_cache.db
+    extraction_cache_max_bytes: Optional[int] = 512 * 1024 * 1024
+    extraction_workers: int = 1  # Процессы для постраничной конвертации длинных PDF
+    extraction_pages_per_chunk: int = 8
 
     # Translation
     memory_type: MemoryType = MemoryType.SEMANTIC
@@ -137,12 +131,25 @@ class PipelineConfig:
     glossary_path: Optional[str] = "config/glossaries/knitting_custom.yaml"
     enable_few_shot: bool = True
     enable_auto_suggestions: bool = True
+    defer_term_suggestions: bool = False  # Писать предложения терминов в фоне
+    dedup_segments: bool = True  # Переводить повторяющиеся сегменты один раз
+    dedup_ignore_placeholder_values: bool = False  # Объединять тексты, отличающиеся числами
     embedding_model: str = "text-embedding-3-small"
     translation_model: str = "gpt-4o-mini"
     translation_fallback_model: Optional[str] = "gpt-4o-mini"
+    translation_max_in_flight: int = 4  # Параллельные LLM-запросы на язык
+    translation_batch_size: Optional[int] = 40  # Макс. сегментов в запросе
+    translation_batch_tokens: Optional[int] = None  # None = из лимитов модели
     embedding_batch_size: int = 16
     embedding_timeout: float = 30.0
     embedding_max_retries: int = 2
+    embedding_max_concurrency: int = 4  # Параллельные запросы embeddings
+    embedding_cache_enabled: bool = True  # Дисковый кэш embeddings (memory, KB)
+    embedding_cache_path: Optional[str] = None  # None = data/embedding_cache.db
+    embedding_cache_max_entries: int = 200_000
+    memory_cache_max_entries: Optional[int] = 10_000  # LRU-кэш семантической памяти
+    memory_cache_max_bytes: Optional[int] = 64 * 1024 * 1024
+    memory_cache_ttl_seconds: Optional[float] = None  # None = без истечения
     semantic_backend: SemanticMemoryBackend = SemanticMemoryBackend.SQLITE
     postgres_dsn: Optional[str] = None
 
@@ -156,6 +163,9 @@ class PipelineConfig:
     rag_min_similarity: float = 0.75  # Порог релевантности для RAG
     special_symbol_min_similarity: float = 0.6  # Порог для спецсимволов
 
+    # Concurrency
+    language_workers: int = 1  # Параллельные языки (1 = последовательно)
+
     # QA
     enable_qa: bool = False  # QA проверка (опционально)
     qa_tolerance: float = 2.0  # Допустимая погрешность (px)
@@ -166,6 +176,7 @@ class PipelineConfig:
     publish_outputs: bool = True
     publish_root: Optional[str] = None
     reuse_identical_inputs: bool = True
+    incremental_retranslation: bool = True  # Новая версия slug переводит только изменённые блоки
 
 
 @dataclass
@@ -184,7 +195,7 @@ class PipelineResult:
     # Translation
     target_languages: List[str]
     segments_translated: int
-    cache_hit_rate: float  # 0.0-1.0
+    cache_hit_rate: float  # 0.0-1.0 (по сегментам, отправленным переводчику; без blocks_reused)
     glossary_terms_found: int
     translation_cost: float
 
@@ -195,9 +206,73 @@ class PipelineResult:
     processing_time: float  # seconds
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    segments_unique: int = 0  # После дедупликации
+    dedup_ratio: float = 0.0  # Доля сегментов, не требующих отдельного перевода
+    blocks_reused: int = 0  # Блоки, взятые из прошлой версии без перевода (по всем языкам)
+    language_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LanguageRun:
+    """Результат перевода и экспорта одного целевого языка."""
+
+    target_language: str
+    translated_segments: Optional[List[str]] = None
+    translated_document: Optional[KPSDocument] = None
+    docling_document: Optional[DoclingDocument] = None
+    qa_passed: bool = False
+    cost: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_segments: int = 0
+    segments_requested: int = 0  # Уникальные сегменты, отправленные переводчику
+    blocks_reused: int = 0
+    terms_found: int = 0
+    output_files: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
+    @property
+    def translated(self) -> bool:
+        return self.translated_segments is not None
+
+
+_T = TypeVar("_T")
+
+
+class _lazy_component(Generic[_T]):
+    """
+    Компонент pipeline, создаваемый при первом обращении.
+
+    Значение кладётся в __dict__ экземпляра, поэтому повторные обращения —
+    обычный доступ к атрибуту, а присваивание (например, test double)
+    отменяет создание. Время создания пишется в startup_profile.
+    """
+
+    def __init__(self, factory: Callable[..., _T]):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, pipeline: Optional["UnifiedPipeline"], owner: Optional[type] = None):
+        if pipeline is None:
+            return self
+        with pipeline._component_lock:
+            if self.name not in pipeline.__dict__:
+                start = time.perf_counter()
+                value = self.factory(pipeline)
+                pipeline.__dict__[self.name] = value
+                pipeline.startup_profile.record_component(
+                    self.name, time.perf_counter() - start
+                )
+        return pipeline.__dict__[self.name]
+
 
 class UnifiedPipeline:
     """
@@ -230,6 +305,10 @@ class UnifiedPipeline:
         """
         Инициализация pipeline.
 
+        Тяжёлые компоненты (Docling, глоссарий, оркестратор, embeddings,
+        семантическая память, база знаний, QA) создаются при первом
+        обращении; долгоживущие процессы прогревают их через preload().
+
         Args:
             config: Конфигурация (defaults если None)
         """
@@ -238,11 +317,11 @@ class UnifiedPipeline:
         self.publish_outputs_enabled = bool(self.config.publish_outputs)
         self.publish_root = self._resolve_publish_root(self.config.publish_root)
         self.reuse_identical_inputs = bool(self.config.reuse_identical_inputs)
+        self.startup_profile = StartupProfile()
+        self._component_lock = threading.RLock()
 
-        # Инициализация компонентов
+        # Инициализация лёгких компонентов
         self._init_extractors()
-        self._init_translation()
-        self._init_qa()
         self._init_export()
         self.docling_document: Optional[DoclingDocument] = None
         self._cached_css_text: Optional[str] = None
@@ -252,6 +331,58 @@ class UnifiedPipeline:
         if self.publish_outputs_enabled:
             logger.info("Canonical output dir: %s", self.publish_root)
 
+    def preload(self, translation: bool = True) -> "UnifiedPipeline":
+        """
+        Заранее построить ленивые компоненты (daemon, UI workers).
+
+        Прогревает DoclingExtractor (модели и пул процессов постраничной
+        конвертации) и, если translation=True, систему перевода и QA.
+
+        Returns:
+            self
+        """
+        self.docling_extractor.warm_up()
+        if translation:
+            self.translator
+            self.translation_qa_gate
+            self.qa_pipeline
+        logger.info(
+            "Pipeline preloaded in %.2fs",
+            self.startup_profile.component_seconds,
+        )
+        return self
+
+    def close(self) -> None:
+        """
+        Освободить созданные компоненты: фоновые потоки и процессы,
+        соединения с БД памяти, базы знаний и дисковых кэшей.
+
+        Компоненты, к которым не обращались, не создаются. Повторный вызов
+        безопасен; SQLite-соединения открываются заново при следующем обращении.
+        """
+        components = self.__dict__
+        resources = [
+            components.get(name)
+            for name in ("translator", "memory", "knowledge_base", "docling_extractor")
+        ]
+        resources.append(getattr(components.get("embedding_client"), "cache", None))
+        resources.append(components.get("extraction_cache"))
+
+        for resource in resources:
+            close = getattr(resource, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as exc:  # pragma: no cover - best effort shutdown
+                logger.warning("Failed to close %s: %s", type(resource).__name__, exc)
+
+    def __enter__(self) -> "UnifiedPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _normalize_paths(self) -> None:
         """Resolve relative paths to actual files inside the project tree."""
 
@@ -268,9 +399,44 @@ class UnifiedPipeline:
         resolved.parent.mkdir(parents=True, exist_ok=True)
         self.config.memory_path = str(resolved)
 
+    def _create_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Общий дисковый кэш embeddings (None если отключён или недоступен)."""
+        if not self.config.embedding_cache_enabled:
+            return None
+
+        cache_path = self.config.embedding_cache_path
+        if not cache_path:
+            resolved = DEFAULT_EMBEDDING_CACHE_PATH
+        else:
+            maybe_path = Path(cache_path)
+            resolved = maybe_path if maybe_path.is_absolute() else PROJECT_ROOT / maybe_path
+
+        try:
+            return EmbeddingCache(resolved, max_entries=self.config.embedding_cache_max_entries)
+        except Exception as exc:  # pragma: no cover - read-only FS etc.
+            logger.warning("Embedding cache disabled (%s): %s", resolved, exc)
+            return None
+
+    def _create_extraction_cache(self) -> Optional[ExtractionCache]:
+        """Дисковый кэш конвертаций Docling (None если отключён или недоступен)."""
+        if not self.config.extraction_cache_enabled:
+            return None
+
+        cache_path = self.config.extraction_cache_path
+        if not cache_path:
+            resolved = DEFAULT_EXTRACTION_CACHE_PATH
+        else:
+            maybe_path = Path(cache_path)
+            resolved = maybe_path if maybe_path.is_absolute() else PROJECT_ROOT / maybe_path
+
+        try:
+            return ExtractionCache(resolved, max_bytes=self.config.extraction_cache_max_bytes)
+        except Exception as exc:  # pragma: no cover - read-only FS etc.
+            logger.warning("Extraction cache disabled (%s): %s", resolved, exc)
+            return None
+
     def _init_extractors(self):
-        """Инициализация извлекателей."""
-        self.docling_extractor = DoclingExtractor()
+        """Инициализация лёгких извлекателей (Docling создаётся лениво)."""
         self.pymupdf_extractor = PyMuPDFExtractor()
 
         # FIXED: Use correct Segmenter class with config
@@ -279,20 +445,31 @@ class UnifiedPipeline:
 
         logger.debug("Extractors initialized")
 
-    def _init_translation(self):
-        """Инициализация системы перевода."""
-        # Glossary
-        self.glossary = GlossaryManager()
+    @_lazy_component
+    def extraction_cache(self) -> Optional[ExtractionCache]:
+        return self._create_extraction_cache()
+
+    @_lazy_component
+    def docling_extractor(self) -> DoclingExtractor:
+        return DoclingExtractor(
+            cache=self.extraction_cache,
+            workers=self.config.extraction_workers,
+            pages_per_chunk=self.config.extraction_pages_per_chunk,
+        )
+
+    @_lazy_component
+    def glossary(self) -> GlossaryManager:
+        glossary = GlossaryManager()
         if self.config.glossary_path:
             glossary_file = Path(self.config.glossary_path)
             if not glossary_file.is_absolute():
                 glossary_file = PROJECT_ROOT / glossary_file
 
             if glossary_file.exists():
-                self.glossary.load_from_yaml(str(glossary_file))
+                glossary.load_from_yaml(str(glossary_file))
                 logger.info(
                     "Loaded %s glossary terms from %s",
-                    len(self.glossary.get_all_entries()),
+                    len(glossary.get_all_entries()),
                     glossary_file,
                 )
             else:
@@ -300,107 +477,141 @@ class UnifiedPipeline:
                     "Glossary file %s not found. Run scripts/sync_glossary.py to generate it.",
                     glossary_file,
                 )
+        return glossary
 
-        # Term validator from glossary entries
-        self.term_validator = self._build_term_validator()
+    @_lazy_component
+    def term_validator(self) -> Optional[TermValidator]:
+        return self._build_term_validator()
 
-        # Orchestrator
-        self.orchestrator = TranslationOrchestrator(
+    @_lazy_component
+    def orchestrator(self) -> TranslationOrchestrator:
+        return TranslationOrchestrator(
             model=self.config.translation_model,
             fallback_model=self.config.translation_fallback_model,
             term_validator=self.term_validator,
             strict_glossary=bool(self.term_validator),
+            max_batch_size=self.config.translation_batch_size,
+            max_in_flight=self.config.translation_max_in_flight,
+            max_batch_tokens=self.config.translation_batch_tokens,
         )
 
-        # Memory
-        self.memory = None
-        if self.config.memory_type != MemoryType.NONE and self.config.memory_path:
-            if self.config.memory_type == MemoryType.SEMANTIC:
-                embedding_client = None
-                try:
-                    embedding_client = EmbeddingsClient(
-                        model=self.config.embedding_model,
-                        max_batch=self.config.embedding_batch_size,
-                        max_retries=self.config.embedding_max_retries,
-                        timeout=self.config.embedding_timeout,
-                    )
-                except Exception as exc:  # pragma: no cover - best effort init
-                    logger.warning(
-                        "Failed to initialize embeddings client (%s). Semantic memory will degrade to non-embedding mode.",
-                        exc,
-                    )
+    @_lazy_component
+    def embedding_client(self) -> Optional[EmbeddingsClient]:
+        """Клиент embeddings (только для семантической памяти)."""
+        if (
+            self.config.memory_type != MemoryType.SEMANTIC
+            or not self.config.memory_path
+        ):
+            return None
+        try:
+            return EmbeddingsClient(
+                model=self.config.embedding_model,
+                max_batch=self.config.embedding_batch_size,
+                max_retries=self.config.embedding_max_retries,
+                timeout=self.config.embedding_timeout,
+                max_concurrency=self.config.embedding_max_concurrency,
+                cache=self._create_embedding_cache(),
+            )
+        except Exception as exc:  # pragma: no cover - best effort init
+            logger.warning(
+                "Failed to initialize embeddings client (%s). Semantic memory will degrade to non-embedding mode.",
+                exc,
+            )
+            return None
 
-                if self.config.semantic_backend == SemanticMemoryBackend.POSTGRES:
-                    if not self.config.postgres_dsn:
-                        raise ValueError("postgres_dsn must be set for SemanticMemoryBackend.POSTGRES")
-                    self.memory = SemanticTranslationMemoryPG(
-                        self.config.postgres_dsn,
-                        embedding_client=embedding_client,
-                    )
-                    logger.info("Semantic memory initialized (Postgres backend)")
-                else:
-                    self.memory = SemanticTranslationMemory(
-                        self.config.memory_path,
-                        use_embeddings=embedding_client is not None,
-                        embedding_client=embedding_client,
-                    )
-                    logger.info(
-                        "Semantic memory initialized (SQLite backend, embeddings: %s)",
-                        bool(embedding_client),
-                    )
-            else:  # SIMPLE
-                self.memory = TranslationMemory(self.config.memory_path)
-                logger.info("Simple memory initialized (JSON cache)")
-
-        # Knowledge Base (NEW: integrate KB layer for RAG)
-        self.knowledge_base = None
-        if self.config.enable_knowledge_base and KNOWLEDGE_AVAILABLE:
-            if self.config.knowledge_db_path:
-                kb_path = Path(self.config.knowledge_db_path)
-                # Create parent directory if needed
-                kb_path.parent.mkdir(parents=True, exist_ok=True)
-
-                self.knowledge_base = KnowledgeBase(
-                    str(kb_path),
-                    use_embeddings=True,
-                    split_sections=True,
-                    use_chunking=True,
+    @_lazy_component
+    def memory(self):
+        if self.config.memory_type == MemoryType.NONE or not self.config.memory_path:
+            return None
+
+        if self.config.memory_type == MemoryType.SEMANTIC:
+            embedding_client = self.embedding_client
+            if self.config.semantic_backend == SemanticMemoryBackend.POSTGRES:
+                if not self.config.postgres_dsn:
+                    raise ValueError("postgres_dsn must be set for SemanticMemoryBackend.POSTGRES")
+                memory = SemanticTranslationMemoryPG(
+                    self.config.postgres_dsn,
+                    embedding_client=embedding_client,
                 )
-                logger.info(f"Knowledge Base initialized: {kb_path}")
-            else:
-                logger.warning("Knowledge Base enabled but no path specified")
+                logger.info("Semantic memory initialized (Postgres backend)")
+                return memory
+
+            memory = SemanticTranslationMemory(
+                self.config.memory_path,
+                use_embeddings=embedding_client is not None,
+                embedding_client=embedding_client,
+                cache_max_entries=self.config.memory_cache_max_entries,
+                cache_max_bytes=self.config.memory_cache_max_bytes,
+                cache_ttl_seconds=self.config.memory_cache_ttl_seconds,
+            )
+            logger.info(
+                "Semantic memory initialized (SQLite backend, embeddings: %s)",
+                bool(embedding_client),
+            )
+            return memory
+
+        # SIMPLE
+        memory = TranslationMemory(self.config.memory_path)
+        logger.info("Simple memory initialized (JSON cache)")
+        return memory
 
-        # Translator
-        self.translator = GlossaryTranslator(
+    @_lazy_component
+    def knowledge_base(self):
+        """Knowledge Base (NEW: integrate KB layer for RAG)."""
+        if not (self.config.enable_knowledge_base and KNOWLEDGE_AVAILABLE):
+            return None
+        if not self.config.knowledge_db_path:
+            logger.warning("Knowledge Base enabled but no path specified")
+            return None
+
+        kb_path = Path(self.config.knowledge_db_path)
+        # Create parent directory if needed
+        kb_path.parent.mkdir(parents=True, exist_ok=True)
+
+        knowledge_base = KnowledgeBase(
+            str(kb_path),
+            use_embeddings=True,
+            split_sections=True,
+            use_chunking=True,
+        )
+        logger.info(f"Knowledge Base initialized: {kb_path}")
+        return knowledge_base
+
+    @_lazy_component
+    def translator(self) -> GlossaryTranslator:
+        translator = GlossaryTranslator(
             self.orchestrator,
             self.glossary,
             memory=self.memory,
             enable_few_shot=self.config.enable_few_shot,
             enable_auto_suggestions=self.config.enable_auto_suggestions,
             config=self.config,  # Pass config for RAG parameters
+            defer_suggestions=self.config.defer_term_suggestions,
         )
 
         # FIXED: Connect Knowledge Base to translator for RAG
         if self.knowledge_base:
-            self.translator.knowledge_base = self.knowledge_base
+            translator.knowledge_base = self.knowledge_base
             logger.info("Knowledge Base connected to translator (RAG enabled)")
 
-        # Translation QA gate (fail-closed)
-        self.translation_qa_gate = None
-        if self.term_validator and TRANSLATION_QA_AVAILABLE:
-            self.translation_qa_gate = TranslationQAGate(
-                self.term_validator,
-                min_pass_rate=0.95,
-                min_len_ratio=0.3,
-                max_len_ratio=2.8,
-                len_ratio_overrides={
-                    ("en", "ru"): (0.25, 3.2),
-                    ("ru", "en"): (0.25, 2.8),
-                },
-            )
-
         logger.debug("Translation system initialized")
-        self.docling_document: Optional[DoclingDocument] = None
+        return translator
+
+    @_lazy_component
+    def translation_qa_gate(self):
+        """Translation QA gate (fail-closed)."""
+        if not (self.term_validator and TRANSLATION_QA_AVAILABLE):
+            return None
+        return TranslationQAGate(
+            self.term_validator,
+            min_pass_rate=0.95,
+            min_len_ratio=0.3,
+            max_len_ratio=2.8,
+            len_ratio_overrides={
+                ("en", "ru"): (0.25, 3.2),
+                ("ru", "en"): (0.25, 2.8),
+            },
+        )
 
     def _build_term_validator(self) -> Optional[TermValidator]:
         """Build TermValidator rules from glossary entries."""
@@ -451,29 +662,23 @@ class UnifiedPipeline:
 
         return TermValidator(rules) if rules else None
 
-    def _init_qa(self):
-        """Инициализация QA системы."""
-        self.qa_pipeline = None
-        if self.config.enable_qa and QA_AVAILABLE:
-            self.qa_pipeline = QAPipeline()
-            logger.info("QA pipeline initialized")
+    @_lazy_component
+    def qa_pipeline(self):
+        if not (self.config.enable_qa and QA_AVAILABLE):
+            return None
+        qa_pipeline = QAPipeline()
+        logger.info("QA pipeline initialized")
+        return qa_pipeline
 
     def _init_export(self):
-        """Инициализация экспорта."""
-        self.idml_handler = None
-        self.style_manager = None
+        """Инициализация экспорта (InDesign и рендереры импортируются при первом использовании)."""
         self.style_map_path = None
         self._style_contract_cache = None
 
-        if INDESIGN_AVAILABLE:
-            self.idml_handler = IDMLHandler()
-
-            if self.config.style_template:
-                template_file = Path(self.config.style_template)
-                if template_file.exists():
-                    self.style_manager = StyleManager.from_yaml(str(template_file))
-                    logger.info(f"Loaded style template: {template_file}")
-                    self.style_map_path = template_file
+        if self.config.style_template:
+            template_file = Path(self.config.style_template)
+            if template_file.exists():
+                self.style_map_path = template_file
 
         if not self.style_map_path:
             default_style_map = Path(__file__).resolve().parents[3] / "styles" / "style_map.yml"
@@ -482,6 +687,29 @@ class UnifiedPipeline:
 
         logger.debug("Export system initialized")
 
+    @_lazy_component
+    def idml_handler(self) -> Optional[IDMLHandler]:
+        try:
+            from kps.indesign.idml_handler import IDMLHandler
+        except ImportError:
+            return None
+        return IDMLHandler()
+
+    @_lazy_component
+    def style_manager(self) -> Optional[StyleManager]:
+        if not self.config.style_template:
+            return None
+        template_file = Path(self.config.style_template)
+        if not template_file.exists():
+            return None
+        try:
+            from kps.indesign.style_manager import StyleManager
+        except ImportError:
+            return None
+        style_manager = StyleManager.from_yaml(str(template_file))
+        logger.info(f"Loaded style template: {template_file}")
+        return style_manager
+
     def process(
         self,
         input_file: Union[str, Path],
@@ -558,105 +786,79 @@ class UnifiedPipeline:
         source_language = self._detect_language(segments)
         logger.info(f"Source language: {source_language}")
 
-        # STEP 3: Перевод
+        # Дедупликация повторяющихся сегментов
+        dedup_plan: Optional[DedupPlan] = None
+        if self.config.dedup_segments and segments:
+            dedup_plan = deduplicate_segments(
+                segments,
+                ignore_placeholder_values=self.config.dedup_ignore_placeholder_values,
+            )
+            logger.info(
+                "Deduplicated %s segments to %s unique (%.0f%% saved)",
+                dedup_plan.total,
+                dedup_plan.unique,
+                dedup_plan.ratio * 100,
+            )
+        unique_segments = dedup_plan.unique if dedup_plan else len(segments)
+
+        # Блочный манифест: хэши блоков/сегментов + переводы прошлой версии
+        block_manifest: Optional[BlockManifest] = None
+        previous_blocks: Optional[BlockManifest] = None
+        if can_publish and self.config.incremental_retranslation:
+            block_manifest = BlockManifest.build(
+                document,
+                segments,
+                source_language,
+                model=self.config.translation_model,
+            )
+            previous_blocks = self._find_previous_block_manifest(run_context)
+
+        # STEP 3-5: Перевод → Translation QA gate → Экспорт (по языкам)
         logger.info("Step 3: Translating...")
-        translations: Dict[str, List[str]] = {}
-        translated_documents: Dict[str, KPSDocument] = {}
-        docling_translations: Dict[str, DoclingDocument] = {}
+        format_list = self.config.export_formats or ["json"]
+        language_runs = self._run_languages(
+            target_languages,
+            segments=segments,
+            document=document,
+            source_language=source_language,
+            dedup_plan=dedup_plan,
+            block_manifest=block_manifest,
+            previous_blocks=previous_blocks,
+            input_path=input_path,
+            output_path=output_path,
+            format_list=format_list,
+        )
+
         total_cost = 0.0
         total_input_tokens = 0
         total_output_tokens = 0
         cache_hits = 0
+        cache_lookups = 0
         total_segments = len(segments)
         glossary_terms_found = 0
+        blocks_reused = 0
+        output_files: Dict[str, Dict[str, str]] = {}
+        language_timings: Dict[str, Dict[str, float]] = {}
 
-        for target_lang in target_languages:
-            logger.info(f"Translating to {target_lang}...")
-
-            try:
-                result = self.translator.translate(
-                    segments, target_language=target_lang, source_language=source_language
-                )
-
-                translations[target_lang] = result.segments
-                translated_documents[target_lang] = self.segmenter.merge_segments(
-                    result.segments, document
-                )
-                self._translate_table_blocks(
-                    translated_documents[target_lang],
-                    source_language,
-                    target_lang,
-                )
-                if self.docling_document:
-                    try:
-                        docling_doc, missing_segments = apply_translations(
-                            self.docling_document, segments, result.segments
-                        )
-                        docling_translations[target_lang] = docling_doc
-                        if missing_segments:
-                            warnings.append(
-                                f"Docling export missing {len(missing_segments)} segments for {target_lang}"
-                            )
-                    except Exception as exc:
-                        warnings.append(
-                            f"Docling export unavailable for {target_lang}: {exc}"
-                        )
-                total_cost += result.total_cost
-                total_input_tokens += getattr(result, "total_input_tokens", 0)
-                total_output_tokens += getattr(result, "total_output_tokens", 0)
-                cache_hits += result.cached_segments
-                glossary_terms_found = max(glossary_terms_found, result.terms_found)
-
-                logger.info(
-                    f"{target_lang}: {result.cached_segments}/{total_segments} from cache"
-                )
-
-            except Exception as e:
-                errors.append(f"Translation to {target_lang} failed: {e}")
-                logger.error(f"Translation error ({target_lang}): {e}")
+        for run in language_runs:
+            errors.extend(run.errors)
+            warnings.extend(run.warnings)
+            language_timings[run.target_language] = run.timings
+            if not run.translated:
                 continue
-
-        # FIXED: Add zero division protection
-        total_operations = total_segments * max(1, len(translations))
-        cache_hit_rate = cache_hits / total_operations if total_operations > 0 else 0.0
-
-        # Translation QA gate
-        if self.translation_qa_gate:
-            logger.info("Step 3b: Translation QA gate...")
-            gated_translations = {}
-            gated_documents = {}
-            for target_lang, translated_segments in translations.items():
-                batch = [
-                    {
-                        "id": segment.segment_id,
-                        "src": segment.text,
-                        "tgt": translated_segments[i],
-                        "src_lang": source_language,
-                        "tgt_lang": target_lang,
-                    }
-                    for i, segment in enumerate(segments)
-                ]
-
-                qa_result = self.translation_qa_gate.check_batch(batch)
-                if not qa_result.passed:
-                    sample = qa_result.findings[:3]
-                    summary = ", ".join(f"{f.kind}:{f.segment_id}" for f in sample)
-                    errors.append(
-                        f"Translation QA failed for {target_lang} (pass_rate={qa_result.pass_rate:.2f}): {summary}"
-                    )
-                    logger.error("Translation QA failed for %s: %s", target_lang, summary)
-                    continue
-
-                gated_translations[target_lang] = translated_segments
-                gated_documents[target_lang] = translated_documents[target_lang]
-
-            translations = gated_translations
-            translated_documents = gated_documents
-            docling_translations = {
-                lang: docling_translations[lang]
-                for lang in gated_translations.keys()
-                if lang in docling_translations
-            }
+            total_cost += run.cost
+            total_input_tokens += run.input_tokens
+            total_output_tokens += run.output_tokens
+            cache_hits += run.cached_segments
+            cache_lookups += run.segments_requested
+            blocks_reused += run.blocks_reused
+            glossary_terms_found = max(glossary_terms_found, run.terms_found)
+            if run.qa_passed:
+                output_files[run.target_language] = run.output_files
+
+        # Доля попаданий среди сегментов, реально отправленных переводчику:
+        # блоки из прошлой версии в переводчик не попадают (см. blocks_reused)
+        cache_hit_rate = cache_hits / cache_lookups if cache_lookups > 0 else 0.0
 
         # STEP 4: QA (опционально)
         if self.config.enable_qa and self.qa_pipeline:
@@ -668,41 +870,7 @@ class UnifiedPipeline:
                 warnings.append(f"QA validation failed: {e}")
                 logger.warning(f"QA error: {e}")
 
-        # STEP 5: Экспорт
-        logger.info("Step 5: Exporting...")
-        output_files: Dict[str, Dict[str, str]] = {}
-        format_list = self.config.export_formats or ["json"]
-
-        for target_lang, translated_segments in translations.items():
-            translated_doc = translated_documents[target_lang]
-            docling_doc_for_lang = docling_translations.get(target_lang)
-            output_files[target_lang] = {}
-
-            for fmt in format_list:
-                ext = self._extension_for_format(fmt)
-                output_file = output_path / f"{input_path.stem}_{target_lang}.{ext}"
-
-                try:
-                    export_warnings = self._export_translation_for_format(
-                        fmt=fmt,
-                        translated_doc=translated_doc,
-                        translated_segments=translated_segments,
-                        output_file=output_file,
-                        source_lang=source_language,
-                        target_lang=target_lang,
-                        original_input=input_path,
-                        original_document=document,
-                        docling_document=docling_doc_for_lang,
-                    )
-                    output_files[target_lang][fmt] = str(output_file)
-                    warnings.extend(export_warnings)
-                    logger.info("Exported %s for %s", fmt, target_lang)
-
-                except Exception as e:
-                    errors.append(f"Export {fmt} to {target_lang} failed: {e}")
-                    logger.error("Export error (%s/%s): %s", target_lang, fmt, e)
-
-        # Сохранить память переводов
+        # Сохранить память переводов (дождавшись отложенных предложений терминов)
         if self.memory:
             self.translator.save_memory()
             logger.debug("Translation memory saved")
@@ -715,8 +883,8 @@ class UnifiedPipeline:
             extraction_method=self.config.extraction_method.value,
             pages_extracted=pages_extracted,
             segments_extracted=len(segments),
-            target_languages=list(translations.keys()),
-            segments_translated=len(segments) * len(translations),
+            target_languages=list(output_files.keys()),
+            segments_translated=len(segments) * len(output_files),
             cache_hit_rate=cache_hit_rate,
             glossary_terms_found=glossary_terms_found,
             translation_cost=total_cost,
@@ -724,6 +892,10 @@ class UnifiedPipeline:
             total_output_tokens=total_output_tokens,
             output_files=output_files,
             processing_time=processing_time,
+            segments_unique=unique_segments,
+            dedup_ratio=dedup_plan.ratio if dedup_plan else 0.0,
+            blocks_reused=blocks_reused,
+            language_timings=language_timings,
             errors=errors,
             warnings=warnings,
         )
@@ -736,13 +908,246 @@ class UnifiedPipeline:
                 published_dir,
             )
             self._write_manifest(published_dir, run_context, result)
+            if block_manifest:
+                block_manifest.save(published_dir / BLOCK_MANIFEST_NAME)
 
+        if blocks_reused:
+            logger.info(f"Reused {blocks_reused} unchanged blocks from the previous version")
         logger.info(f"Processing complete in {processing_time:.1f}s")
         logger.info(f"Cache hit rate: {cache_hit_rate:.0%}")
         logger.info(f"Translation cost: ${total_cost:.4f}")
 
         return result
 
+    def _run_languages(
+        self,
+        target_languages: List[str],
+        **language_kwargs,
+    ) -> List[LanguageRun]:
+        """
+        Перевести и экспортировать каждый язык, последовательно или в пуле потоков.
+
+        Результаты всегда возвращаются в порядке ``target_languages``,
+        независимо от порядка завершения воркеров.
+        """
+        workers = max(1, int(self.config.language_workers or 1))
+        workers = min(workers, len(target_languages))
+
+        if workers <= 1:
+            return [
+                self._process_language(lang, **language_kwargs) for lang in target_languages
+            ]
+
+        logger.info(
+            "Processing %s languages with %s workers", len(target_languages), workers
+        )
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kps-lang") as pool:
+            futures = [
+                pool.submit(self._process_language, lang, **language_kwargs)
+                for lang in target_languages
+            ]
+            return [future.result() for future in futures]
+
+    def _process_language(
+        self,
+        target_lang: str,
+        *,
+        segments: List[TranslationSegment],
+        document: KPSDocument,
+        source_language: str,
+        input_path: Path,
+        output_path: Path,
+        format_list: List[str],
+        dedup_plan: Optional[DedupPlan] = None,
+        block_manifest: Optional[BlockManifest] = None,
+        previous_blocks: Optional[BlockManifest] = None,
+    ) -> LanguageRun:
+        """Перевод → Translation QA gate → экспорт для одного языка."""
+        run = LanguageRun(target_language=target_lang)
+        language_start = time.perf_counter()
+
+        # Перевод
+        logger.info(f"Translating to {target_lang}...")
+        step_start = time.perf_counter()
+        try:
+            incremental = (
+                previous_blocks.plan(block_manifest, segments, target_lang)
+                if previous_blocks and block_manifest
+                else None
+            )
+            if incremental and incremental.reused:
+                result, translated_segments = self._translate_incremental(
+                    incremental, target_lang, source_language
+                )
+                run.blocks_reused = incremental.blocks_reused
+                logger.info(
+                    "%s: reused %s/%s unchanged blocks",
+                    target_lang,
+                    incremental.blocks_reused,
+                    incremental.blocks_total,
+                )
+            else:
+                result = self.translator.translate(
+                    dedup_plan.unique_segments if dedup_plan else segments,
+                    target_language=target_lang,
+                    source_language=source_language,
+                )
+                translated_segments = (
+                    dedup_plan.expand(result.segments) if dedup_plan else result.segments
+                )
+
+            translated_doc = self.segmenter.merge_segments(translated_segments, document)
+            self._translate_table_blocks(translated_doc, source_language, target_lang)
+            if self.docling_document:
+                try:
+                    from kps.export.docling_writer import apply_translations
+
+                    docling_doc, missing_segments = apply_translations(
+                        self.docling_document, segments, translated_segments
+                    )
+                    run.docling_document = docling_doc
+                    if missing_segments:
+                        run.warnings.append(
+                            f"Docling export missing {len(missing_segments)} segments for {target_lang}"
+                        )
+                except Exception as exc:
+                    run.warnings.append(f"Docling export unavailable for {target_lang}: {exc}")
+
+            run.translated_segments = translated_segments
+            run.translated_document = translated_doc
+            run.cost = result.total_cost
+            run.input_tokens = getattr(result, "total_input_tokens", 0)
+            run.output_tokens = getattr(result, "total_output_tokens", 0)
+            run.cached_segments = result.cached_segments
+            run.segments_requested = len(result.segments)
+            run.terms_found = result.terms_found
+
+            logger.info(
+                f"{target_lang}: {result.cached_segments}/{len(result.segments)} from cache"
+            )
+        except Exception as e:
+            run.errors.append(f"Translation to {target_lang} failed: {e}")
+            logger.error(f"Translation error ({target_lang}): {e}")
+        run.timings["translate"] = time.perf_counter() - step_start
+
+        if not run.translated:
+            run.timings["total"] = time.perf_counter() - language_start
+            return run
+
+        # Translation QA gate
+        if self.translation_qa_gate:
+            step_start = time.perf_counter()
+            run.qa_passed = self._check_translation_qa(
+                run, segments, source_language
+            )
+            run.timings["qa"] = time.perf_counter() - step_start
+        else:
+            run.qa_passed = True
+
+        if not run.qa_passed:
+            run.timings["total"] = time.perf_counter() - language_start
+            return run
+
+        if block_manifest is not None:
+            block_manifest.record(target_lang, segments, run.translated_segments)
+
+        # Экспорт
+        step_start = time.perf_counter()
+        for fmt in format_list:
+            ext = self._extension_for_format(fmt)
+            output_file = output_path / f"{input_path.stem}_{target_lang}.{ext}"
+
+            try:
+                export_warnings = self._export_translation_for_format(
+                    fmt=fmt,
+                    translated_doc=run.translated_document,
+                    translated_segments=run.translated_segments,
+                    output_file=output_file,
+                    source_lang=source_language,
+                    target_lang=target_lang,
+                    original_input=input_path,
+                    original_document=document,
+                    docling_document=run.docling_document,
+                )
+                run.output_files[fmt] = str(output_file)
+                run.warnings.extend(export_warnings)
+                logger.info("Exported %s for %s", fmt, target_lang)
+
+            except Exception as e:
+                run.errors.append(f"Export {fmt} to {target_lang} failed: {e}")
+                logger.error("Export error (%s/%s): %s", target_lang, fmt, e)
+        run.timings["export"] = time.perf_counter() - step_start
+        run.timings["total"] = time.perf_counter() - language_start
+
+        return run
+
+    def _translate_incremental(
+        self,
+        plan: IncrementalPlan,
+        target_lang: str,
+        source_language: str,
+    ) -> Tuple[TranslationResult, List[str]]:
+        """Перевести только изменённые сегменты; остальные взять из прошлой версии."""
+        pending = plan.pending_segments
+        pending_plan: Optional[DedupPlan] = None
+        if self.config.dedup_segments and pending:
+            pending_plan = deduplicate_segments(
+                pending,
+                ignore_placeholder_values=self.config.dedup_ignore_placeholder_values,
+            )
+
+        if pending:
+            result = self.translator.translate(
+                pending_plan.unique_segments if pending_plan else pending,
+                target_language=target_lang,
+                source_language=source_language,
+            )
+            translations = (
+                pending_plan.expand(result.segments) if pending_plan else result.segments
+            )
+        else:
+            result = TranslationResult(
+                source_language=source_language,
+                target_language=target_lang,
+                segments=[],
+                terms_found=0,
+                total_cost=0.0,
+            )
+            translations = []
+        return result, plan.merge(translations)
+
+    def _check_translation_qa(
+        self,
+        run: LanguageRun,
+        segments: List[TranslationSegment],
+        source_language: str,
+    ) -> bool:
+        """Прогнать fail-closed Translation QA gate для одного языка."""
+        target_lang = run.target_language
+        translated_segments = run.translated_segments or []
+        batch = [
+            {
+                "id": segment.segment_id,
+                "src": segment.text,
+                "tgt": translated_segments[i],
+                "src_lang": source_language,
+                "tgt_lang": target_lang,
+            }
+            for i, segment in enumerate(segments)
+        ]
+
+        qa_result = self.translation_qa_gate.check_batch(batch)
+        if qa_result.passed:
+            return True
+
+        sample = qa_result.findings[:3]
+        summary = ", ".join(f"{f.kind}:{f.segment_id}" for f in sample)
+        run.errors.append(
+            f"Translation QA failed for {target_lang} (pass_rate={qa_result.pass_rate:.2f}): {summary}"
+        )
+        logger.error("Translation QA failed for %s: %s", target_lang, summary)
+        return False
+
     def _extract_content(self, input_file: Path) -> KPSDocument:
         """
         Извлечь контент из файла.
@@ -857,6 +1262,10 @@ class UnifiedPipeline:
                 "processing_time": result.processing_time,
                 "total_input_tokens": result.total_input_tokens,
                 "total_output_tokens": result.total_output_tokens,
+                "segments_unique": result.segments_unique,
+                "dedup_ratio": result.dedup_ratio,
+                "blocks_reused": result.blocks_reused,
+                "language_timings": result.language_timings,
             },
         }
         manifest_path.write_text(
@@ -886,6 +1295,19 @@ class UnifiedPipeline:
                 return data
         return None
 
+    def _find_previous_block_manifest(self, run_context: RunContext) -> Optional[BlockManifest]:
+        """Блочный манифест последней опубликованной версии этого slug (кроме текущей)."""
+        slug_dir = self.publish_root / run_context.slug
+        if not slug_dir.exists():
+            return None
+        for manifest_path in reversed(sorted(slug_dir.glob(f"v*/{BLOCK_MANIFEST_NAME}"))):
+            if manifest_path.parent.name == run_context.version:
+                continue
+            manifest = BlockManifest.load(manifest_path)
+            if manifest:
+                return manifest
+        return None
+
     def _try_reuse_outputs(
         self,
         run_context: RunContext,
@@ -991,7 +1413,6 @@ class UnifiedPipeline:
         warnings: List[str] = []
         fmt_lower = fmt.lower()
         has_docling = docling_document is not None
-
         if fmt_lower == "docx":
             structure_builder = self._build_docx_fallback_builder(
                 translated_doc=translated_doc,
@@ -1007,7 +1428,9 @@ class UnifiedPipeline:
             except Exception as exc:
                 warnings.append(f"Structured DOCX renderer failed: {exc}")
                 if has_docling:
-                    docling_doc = cast(DoclingDocument, docling_document)
+                    from kps.export import export_docx_with_fallback
+
+                    docling_doc = cast("DoclingDocument", docling_document)
                     result = export_docx_with_fallback(
                         docling_doc,
                         output_path=output_file,
@@ -1024,7 +1447,9 @@ class UnifiedPipeline:
                 output_file=output_file,
             )
             if has_docling:
-                docling_doc = cast(DoclingDocument, docling_document)
+                from kps.export import export_pdf_with_fallback
+
+                docling_doc = cast("DoclingDocument", docling_document)
                 shadow_html = output_file.with_suffix(".html")
                 self._write_docling_html(docling_doc, shadow_html)
                 result = export_pdf_with_fallback(
@@ -1048,7 +1473,9 @@ class UnifiedPipeline:
                 output_file=output_file,
             )
             if has_docling:
-                docling_doc = cast(DoclingDocument, docling_document)
+                from kps.export import export_markdown_with_fallback
+
+                docling_doc = cast("DoclingDocument", docling_document)
                 result = export_markdown_with_fallback(
                     docling_doc,
                     output_path=output_file,
@@ -1066,7 +1493,7 @@ class UnifiedPipeline:
             if not has_docling:
                 warnings.append("HTML export skipped: Docling document unavailable")
                 return warnings
-            docling_doc = cast(DoclingDocument, docling_document)
+            docling_doc = cast("DoclingDocument", docling_document)
             self._write_docling_html(docling_doc, output_file)
             warnings.append(f"HTML snapshot saved: {output_file}")
             return warnings
@@ -1142,6 +1569,8 @@ class UnifiedPipeline:
         prefer_template: bool = False,
     ) -> Callable[[], Tuple[Path, str]]:
         def _builder() -> Tuple[Path, str]:
+            from kps.export import build_docx_from_structure, render_docx_inplace
+
             template_attempted = False
 
             if prefer_template and original_input.suffix.lower() == ".docx" and original_input.exists():
@@ -1187,6 +1616,8 @@ class UnifiedPipeline:
         output_file: Path,
     ) -> Callable[[], Tuple[Path, str]]:
         def _builder() -> Tuple[Path, str]:
+            from kps.export import export_pdf_browser, render_html, render_pdf
+
             html_content = render_html(translated_doc)
             css_path = self._resolve_pdf_css()
             try:
@@ -1217,6 +1648,8 @@ class UnifiedPipeline:
     def _write_docling_html(
         self, docling_document: DoclingDocument, html_path: Path
     ) -> Path:
+        from kps.export import write_html_document
+
         css_text = self._get_cached_css_text()
         write_html_document(docling_document, html_path, css_text)
         return html_path
@@ -1249,6 +1682,8 @@ class UnifiedPipeline:
             return {}
         if self._style_contract_cache is None:
             try:
+                from kps.export import load_pdf_style_map
+
                 self._style_contract_cache = load_pdf_style_map(self.style_map_path)
             except Exception as exc:
                 logger.warning("Failed to load style map %s: %s", self.style_map_path, exc)
@@ -1290,6 +1725,7 @@ __all__ = [
     "UnifiedPipeline",
     "PipelineConfig",
     "PipelineResult",
+    "LanguageRun",
     "ExtractionMethod",
     "MemoryType",
 ]
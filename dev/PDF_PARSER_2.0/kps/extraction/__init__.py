@@ -1,12 +1,15 @@
 """Extraction module for KPS v2.0."""
 
 from .docling_extractor import DoclingExtractor, DoclingExtractionError
+from .extraction_cache import ExtractionCache, ExtractionCacheStats
 from .pymupdf_extractor import PyMuPDFExtractor, PyMuPDFExtractorConfig
 from .segmenter import Segmenter, SegmenterConfig
 
 __all__ = [
     "DoclingExtractor",
     "DoclingExtractionError",
+    "ExtractionCache",
+    "ExtractionCacheStats",
     "PyMuPDFExtractor",
     "PyMuPDFExtractorConfig",
     "Segmenter",
@@ -3,18 +3,21 @@
 This module uses Docling's DocumentConverter API to extract semantic text structure
 from PDFs, converting it into KPSDocument format with proper section detection and
 block hierarchy preservation.
+
+Docling itself (layout and table models, torch) is imported on first use, so
+importing this module is cheap; call ``DoclingExtractor.warm_up`` in
+long-lived processes to pay that cost before the first document arrives.
 """
 
+from __future__ import annotations
+
 import logging
 import re
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata as importlib_metadata
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.document import ConversionResult
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling_core.types.doc.document import DoclingDocument
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from kps.core.bbox import BBox
 from kps.core.document import (
@@ -25,10 +28,66 @@ from kps.core.document import (
     Section,
     SectionType,
 )
+from kps.utils import page_chunks
 
+from .extraction_cache import ExtractionCache, extraction_cache_key, file_sha256
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+    from docling.document_converter import DocumentConverter
+    from docling_core.types.doc.document import DoclingDocument
 
 logger = logging.getLogger(__name__)
 
+# Bump when the KPS block mapping changes so cached extractions are rebuilt
+EXTRACTION_CACHE_FORMAT = 1
+
+
+def build_converter(ocr_enabled: bool) -> DocumentConverter:
+    """Docling converter for PDFs with the KPS pipeline options."""
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+
+    pipeline_options = PdfPipelineOptions(
+        do_ocr=ocr_enabled,
+        do_table_structure=True,
+    )
+    format_options = {
+        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+    }
+    return DocumentConverter(format_options=format_options)
+
+
+# Converter of a page-range worker process, built once by _init_page_worker
+_WORKER_CONVERTER: Optional[DocumentConverter] = None
+
+
+def _init_page_worker(ocr_enabled: bool) -> None:
+    from docling.datamodel.base_models import InputFormat
+
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = build_converter(ocr_enabled)
+    _WORKER_CONVERTER.initialize_pipeline(InputFormat.PDF)
+
+
+def _page_worker_ready(_: int) -> bool:
+    """No-op job used to start (and thereby initialize) page-range workers."""
+    return _WORKER_CONVERTER is not None
+
+
+def _convert_page_range(pdf_path: str, page_range: Tuple[int, int]) -> Dict[str, Any]:
+    """Worker: convert pages ``page_range`` (1-based, inclusive) to a Docling dict."""
+    result = _WORKER_CONVERTER.convert(pdf_path, page_range=page_range)
+    return result.document.export_to_dict()
+
+
+def _docling_version() -> str:
+    try:
+        return importlib_metadata.version("docling")
+    except importlib_metadata.PackageNotFoundError:
+        return "unknown"
+
 
 class DoclingExtractionError(Exception):
     """Raised when Docling extraction fails."""
@@ -54,6 +113,9 @@ class DoclingExtractor:
     - languages: List of document languages (default: ["ru", "en", "fr"])
     - ocr_enabled: Enable OCR fallback for scanned PDFs (default: True)
     - page_range: Optional (start, end) tuple to limit extraction
+    - cache: Optional ExtractionCache to skip repeated conversions
+    - workers: Processes converting page ranges in parallel (1 = one convert call)
+    - pages_per_chunk: Pages per parallel conversion job
     """
 
     # Russian section name patterns for detection
@@ -126,6 +188,9 @@ class DoclingExtractor:
         languages: Optional[List[str]] = None,
         ocr_enabled: bool = True,
         page_range: Optional[Tuple[int, int]] = None,
+        cache: Optional[ExtractionCache] = None,
+        workers: int = 1,
+        pages_per_chunk: int = 8,
     ):
         """
         Initialize Docling extractor.
@@ -134,13 +199,22 @@ class DoclingExtractor:
             languages: List of document languages (ISO 639-1 codes)
             ocr_enabled: Enable OCR fallback for scanned PDFs
             page_range: Optional (start_page, end_page) for partial extraction
+            cache: Persistent cache of conversions keyed by input bytes and options
+            workers: Processes for page-parallel conversion of long PDFs
+            pages_per_chunk: Pages per parallel conversion job
         """
         self.languages = languages or ["ru", "en", "fr"]
         self.ocr_enabled = ocr_enabled
         self.page_range = page_range
+        self.cache = cache
+        self.workers = max(1, int(workers))
+        self.pages_per_chunk = max(1, int(pages_per_chunk))
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        # Shuts the pool down if the extractor is dropped (or at exit) without close()
+        self._pool_finalizer: Optional[weakref.finalize] = None
 
-        # Initialize Docling converter with configuration
-        self.converter = self._create_converter()
+        # Docling converter, created on first use (see the converter property)
+        self._converter: Optional[DocumentConverter] = None
 
         # Section detection state
         self.current_section_type = SectionType.COVER
@@ -149,23 +223,42 @@ class DoclingExtractor:
         self.last_docling_document: Optional[DoclingDocument] = None
         self.last_block_map: Dict[str, object] = {}
 
-    def _create_converter(self) -> DocumentConverter:
-        """Create configured Docling DocumentConverter instance."""
-        # Configure PDF pipeline options
-        pipeline_options = PdfPipelineOptions(
-            do_ocr=self.ocr_enabled,
-            do_table_structure=True,
-        )
+    @property
+    def converter(self) -> DocumentConverter:
+        """Docling converter, built on first access."""
+        if self._converter is None:
+            self._converter = self._create_converter()
+        return self._converter
 
-        # Create format options
-        format_options = {
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }
+    @converter.setter
+    def converter(self, value: Optional[DocumentConverter]) -> None:
+        self._converter = value
 
-        # Create converter
-        converter = DocumentConverter(
-            format_options=format_options,
-        )
+    def warm_up(self) -> "DoclingExtractor":
+        """
+        Load Docling models now rather than on the first document.
+
+        Builds the converter and its PDF pipeline (layout and table models)
+        and, with ``workers > 1``, starts the page-range worker processes,
+        each of which loads its own converter. Meant for long-lived
+        processes (daemon, UI workers); one-shot runs can skip it.
+
+        Returns:
+            self, for chaining
+        """
+        from docling.datamodel.base_models import InputFormat
+
+        self.converter.initialize_pipeline(InputFormat.PDF)
+        if self.workers > 1:
+            pool = self._get_page_pool()
+            # One job per worker: the pool spawns a process for each pending job
+            list(pool.map(_page_worker_ready, range(self.workers)))
+        logger.info(f"Docling extractor warmed up ({self.workers} worker(s))")
+        return self
+
+    def _create_converter(self) -> DocumentConverter:
+        """Create configured Docling DocumentConverter instance."""
+        converter = build_converter(self.ocr_enabled)
 
         logger.info(
             f"Initialized Docling converter (OCR: {self.ocr_enabled}, "
@@ -196,14 +289,15 @@ class DoclingExtractor:
 
         logger.info(f"Extracting document from {pdf_path}")
 
+        cache_key = self._cache_key(pdf_path) if self.cache is not None else None
+        if cache_key:
+            cached = self._load_cached(cache_key, pdf_path, slug)
+            if cached is not None:
+                return cached
+
         try:
             # Convert document with Docling
-            result: ConversionResult = self.converter.convert(str(pdf_path))
-
-            if not result or not result.document:
-                raise DoclingExtractionError("Docling returned empty result")
-
-            docling_doc: DoclingDocument = result.document
+            docling_doc = self._convert(pdf_path)
             self.last_docling_document = docling_doc
             self.last_block_map = {}
 
@@ -233,12 +327,156 @@ class DoclingExtractor:
                 f"{sum(len(s.blocks) for s in sections)} total blocks"
             )
 
+            if cache_key:
+                self._store_cached(cache_key, kps_doc, docling_doc)
+
             return kps_doc
 
         except Exception as e:
             logger.error(f"Docling extraction failed for {pdf_path}: {e}")
             raise ExtractionError(f"Failed to extract {pdf_path}: {e}") from e
 
+    def _convert(self, pdf_path: Path) -> DoclingDocument:
+        """Run Docling on the whole file or, for long PDFs, on page ranges in parallel."""
+        chunks = self._page_chunks(pdf_path)
+        if len(chunks) > 1:
+            return self._convert_parallel(pdf_path, chunks)
+
+        if self.page_range:
+            result: ConversionResult = self.converter.convert(
+                str(pdf_path), page_range=self.page_range
+            )
+        else:
+            result = self.converter.convert(str(pdf_path))
+
+        if not result or not result.document:
+            raise DoclingExtractionError("Docling returned empty result")
+        return result.document
+
+    def _page_chunks(self, pdf_path: Path) -> List[Tuple[int, int]]:
+        """Page ranges for parallel conversion; a single range means serial."""
+        if self.workers <= 1 or pdf_path.suffix.lower() != ".pdf":
+            return []
+
+        import fitz  # PyMuPDF, only needed to count pages
+
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+        first, last = self.page_range or (1, page_count)
+        last = min(last, page_count)
+        if last - first + 1 <= self.pages_per_chunk:
+            return []
+        page_count = last - first + 1
+        parts = -(-page_count // self.pages_per_chunk)
+        return [(first + start, first + stop - 1) for start, stop in page_chunks(page_count, parts)]
+
+    def _convert_parallel(
+        self, pdf_path: Path, chunks: List[Tuple[int, int]]
+    ) -> DoclingDocument:
+        """
+        Convert page ranges in worker processes and stitch them in page order.
+
+        ``DoclingDocument.concatenate`` renumbers items in traversal order and
+        keeps the original page numbers of contiguous ranges, so the stitched
+        document is walked by ``_extract_sections`` exactly like a serial
+        conversion and yields the same block IDs, reading order and refs.
+        """
+        from docling_core.types.doc.document import DoclingDocument
+
+        pool = self._get_page_pool()
+        logger.info(
+            f"Converting {pdf_path.name} in {len(chunks)} page ranges "
+            f"with {self.workers} workers"
+        )
+        futures = [pool.submit(_convert_page_range, str(pdf_path), chunk) for chunk in chunks]
+        parts = [DoclingDocument.model_validate(future.result()) for future in futures]
+        return DoclingDocument.concatenate(parts)
+
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        if self._page_pool is None:
+            self._page_pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_page_worker,
+                initargs=(self.ocr_enabled,),
+            )
+            self._pool_finalizer = weakref.finalize(
+                self, self._page_pool.shutdown, wait=False, cancel_futures=True
+            )
+        return self._page_pool
+
+    def close(self) -> None:
+        """Stop page-range worker processes (if any were started)."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer.detach()
+            self._pool_finalizer = None
+        if self._page_pool is not None:
+            self._page_pool.shutdown()
+            self._page_pool = None
+
+    def __enter__(self) -> "DoclingExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cache_key(self, pdf_path: Path) -> str:
+        """Cache key: input bytes + Docling version + conversion options."""
+        options = {
+            "format": EXTRACTION_CACHE_FORMAT,
+            "ocr_enabled": self.ocr_enabled,
+            "table_structure": True,
+            "page_range": list(self.page_range) if self.page_range else None,
+        }
+        return extraction_cache_key(file_sha256(pdf_path), _docling_version(), options)
+
+    def _load_cached(self, cache_key: str, pdf_path: Path, slug: str) -> Optional[KPSDocument]:
+        """Rebuild KPSDocument, Docling document and block map from the cache."""
+        payload = self.cache.get(cache_key)
+        if payload is None:
+            return None
+
+        from docling_core.types.doc import RefItem
+        from docling_core.types.doc.document import DoclingDocument
+
+        try:
+            docling_doc = DoclingDocument.model_validate(payload["docling_document"])
+            kps_doc = KPSDocument.from_dict(payload["document"])
+        except Exception as exc:  # noqa: BLE001 - stale or foreign payload
+            logger.warning(f"Ignoring cached extraction for {pdf_path}: {exc}")
+            return None
+
+        kps_doc.slug = slug
+        kps_doc.metadata = self._extract_metadata(docling_doc, pdf_path)
+        kps_doc.docling_document = docling_doc
+        self.last_docling_document = docling_doc
+        self.last_block_map = {
+            block_id: self._resolve_docling_item(docling_doc, RefItem(cref=ref))
+            for block_id, ref in payload.get("block_map", {}).items()
+        }
+
+        logger.info(f"Loaded cached extraction for {pdf_path}")
+        return kps_doc
+
+    def _store_cached(
+        self, cache_key: str, kps_doc: KPSDocument, docling_doc: DoclingDocument
+    ) -> None:
+        block_map = {
+            block_id: item.self_ref
+            for block_id, item in self.last_block_map.items()
+            if getattr(item, "self_ref", None)
+        }
+        try:
+            self.cache.put(
+                cache_key,
+                {
+                    "docling_document": docling_doc.export_to_dict(),
+                    "document": kps_doc.to_dict(),
+                    "block_map": block_map,
+                },
+            )
+        except Exception as exc:  # noqa: BLE001 - cache must not fail extraction
+            logger.warning(f"Failed to cache extraction: {exc}")
+
     def extract(self, pdf_path: Path) -> KPSDocument:
         """Legacy alias used by tests."""
         return self.extract_document(pdf_path, slug=pdf_path.stem)
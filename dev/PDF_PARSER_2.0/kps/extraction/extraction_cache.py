@@ -0,0 +1,138 @@
+"""Persistent cache of Docling conversions.
+
+``DocumentConverter.convert`` (layout model, table structure, optional OCR)
+is the most expensive non-LLM step, and the same PDF bytes often come back
+through the daemon, the CLI and the UI service. Conversions are keyed by
+``(sha256 of input, Docling version, pipeline options)`` and stored as
+zlib-compressed JSON (serialized ``DoclingDocument``, KPS sections and the
+block map as Docling references) in a small SQLite file. The cache is
+bounded by total payload size; least recently used entries go first.
+
+Usage:
+    cache = ExtractionCache("data/extraction_cache.db", max_bytes=512 << 20)
+    extractor = DoclingExtractor(cache=cache)
+    extractor.extract_document(pdf_path, "gloves")  # converts and stores
+    extractor.extract_document(pdf_path, "gloves")  # served from disk
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from kps.metrics import record_extraction_cache
+from kps.storage import CacheStats, SQLiteLRUStore
+
+
+# Hits only buffer their last_used updates; the buffer is written with the
+# next put, prune or close, or once it holds this many keys
+TOUCH_FLUSH_SIZE = 64
+
+ExtractionCacheStats = CacheStats
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extraction_cache_key(input_hash: str, docling_version: str, options: Dict[str, Any]) -> str:
+    """Content address of one conversion of ``input_hash`` with ``options``."""
+    payload = json.dumps(
+        {"input": input_hash, "docling": docling_version, "options": options},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _decode_payload(blob: bytes) -> Dict[str, Any]:
+    try:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+    except zlib.error as exc:
+        raise ValueError(str(exc)) from exc
+
+
+class ExtractionCache:
+    """Compressed extraction payloads in a size-bounded ``SQLiteLRUStore``."""
+
+    def __init__(self, path: Union[str, Path], max_bytes: Optional[int] = 512 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite file (created with parent directories if missing)
+            max_bytes: Upper bound on stored (compressed) payloads; None disables eviction
+        """
+        self._store = SQLiteLRUStore(path, max_bytes=max_bytes, touch_flush_size=TOUCH_FLUSH_SIZE)
+
+    @property
+    def path(self) -> Path:
+        return self._store.path
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._store.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        self._store.max_bytes = value
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def total_bytes(self) -> int:
+        return self._store.total_bytes()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached payload for ``key`` or None on a miss (unreadable entries count as misses)."""
+        payload = self._store.get(key, _decode_payload)
+        record_extraction_cache("hit" if payload is not None else "miss")
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store ``payload`` (JSON-serializable) and evict if over capacity."""
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        record_extraction_cache("eviction", self._store.put_many([(key, blob)]))
+
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+    ) -> int:
+        """
+        Drop entries unused for ``max_age_seconds`` and shrink to ``max_bytes``.
+
+        Args:
+            max_bytes: Target size; defaults to the configured bound
+            max_age_seconds: Also drop entries not used for this long
+
+        Returns:
+            Number of evicted entries
+        """
+        evicted = self._store.prune(max_bytes=max_bytes, max_age_seconds=max_age_seconds)
+        record_extraction_cache("eviction", evicted)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all cached extractions."""
+        self._store.clear()
+
+    def stats(self) -> ExtractionCacheStats:
+        return self._store.stats()
+
+    def close(self) -> None:
+        self._store.close()
+
+
+__all__ = [
+    "ExtractionCache",
+    "ExtractionCacheStats",
+    "extraction_cache_key",
+    "file_sha256",
+]
@@ -24,6 +24,8 @@ except ImportError:
     PYMUPDF_AVAILABLE = False
     logging.warning("PyMuPDF not available - PDF validation will be limited")
 
+from kps.qa.pdf_inspection import PDFInspection
+
 logger = logging.getLogger(__name__)
 
 
@@ -176,12 +178,18 @@ class PDFValidator:
         available_tools = [k for k, v in self.tool_availability.items() if v]
         logger.info(f"PDF validation tools available: {', '.join(available_tools) or 'None'}")
 
-    def validate_pdfx4(self, pdf_path: Path) -> PDFValidationReport:
+    def validate_pdfx4(
+        self,
+        pdf_path: Path,
+        inspection: Optional[PDFInspection] = None,
+    ) -> PDFValidationReport:
         """
         Validate PDF meets PDF/X-4:2010 standards.
 
         Args:
             pdf_path: Path to PDF file to validate
+            inspection: Shared single-pass inspection of the PDF (optional).
+                Built here on first use when PyMuPDF is available.
 
         Returns:
             PDFValidationReport with validation results
@@ -222,13 +230,15 @@ class PDFValidator:
             if self.tool_availability.get('pdfimages'):
                 self._check_image_resolution(pdf_path, report)
             elif PYMUPDF_AVAILABLE:
-                self._check_image_resolution_pymupdf(pdf_path, report)
+                inspection = inspection or self._inspect(pdf_path)
+                self._check_image_resolution_pymupdf(pdf_path, report, inspection)
             else:
                 report.warnings.append("No tool available for image resolution checking")
 
             # Font embedding
             if PYMUPDF_AVAILABLE:
-                self._check_fonts_pymupdf(pdf_path, report)
+                inspection = inspection or self._inspect(pdf_path)
+                self._check_fonts_pymupdf(pdf_path, report, inspection)
             else:
                 report.warnings.append("PyMuPDF not available - font checking limited")
 
@@ -418,39 +428,38 @@ class PDFValidator:
         except Exception as e:
             logger.debug(f"pdfimages error: {e}")
 
-    def _check_image_resolution_pymupdf(self, pdf_path: Path, report: PDFValidationReport):
+    def _inspect(self, pdf_path: Path) -> Optional[PDFInspection]:
+        """Open the PDF once for the PyMuPDF-based checks"""
+        try:
+            return PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
+        except Exception as e:
+            logger.debug(f"PyMuPDF inspection error: {e}")
+            return None
+
+    def _check_image_resolution_pymupdf(
+        self,
+        pdf_path: Path,
+        report: PDFValidationReport,
+        inspection: Optional[PDFInspection] = None,
+    ):
         """Check image resolution using PyMuPDF"""
         try:
-            doc = fitz.open(pdf_path)
-
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                image_list = page.get_images()
-
-                for img_index, img in enumerate(image_list):
-                    xref = img[0]
-
-                    # Get image properties
-                    try:
-                        pix = fitz.Pixmap(doc, xref)
-                        width = pix.width
-                        height = pix.height
-
-                        # Get image position on page to calculate DPI
-                        # This is approximate - more accurate calculation would need transform matrix
-                        dpi = min(width, height) / 2  # Rough estimate
-
-                        if dpi < self.min_dpi:
-                            report.resolution_issues.append(
-                                f"Page {page_num + 1}: Image {width}x{height}px (estimated {dpi:.0f} DPI)"
-                            )
-
-                        pix = None  # Free memory
-                    except Exception as e:
-                        logger.debug(f"Could not analyze image {xref}: {e}")
-                        continue
-
-            doc.close()
+            if inspection is None:
+                inspection = PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
+
+            for page_num, width, height in zip(
+                inspection.images["page"].tolist(),
+                inspection.images["width"].tolist(),
+                inspection.images["height"].tolist(),
+            ):
+                # Get image position on page to calculate DPI
+                # This is approximate - more accurate calculation would need transform matrix
+                dpi = min(width, height) / 2  # Rough estimate
+
+                if dpi < self.min_dpi:
+                    report.resolution_issues.append(
+                        f"Page {page_num + 1}: Image {width}x{height}px (estimated {dpi:.0f} DPI)"
+                    )
 
             if report.resolution_issues:
                 report.warnings.append(
@@ -460,29 +469,31 @@ class PDFValidator:
         except Exception as e:
             logger.debug(f"PyMuPDF image checking error: {e}")
 
-    def _check_fonts_pymupdf(self, pdf_path: Path, report: PDFValidationReport):
+    def _check_fonts_pymupdf(
+        self,
+        pdf_path: Path,
+        report: PDFValidationReport,
+        inspection: Optional[PDFInspection] = None,
+    ):
         """Check font embedding using PyMuPDF"""
         try:
-            doc = fitz.open(pdf_path)
-
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                fonts = page.get_fonts()
+            if inspection is None:
+                inspection = PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
 
-                for font in fonts:
-                    font_name = font[3]  # Font name is at index 3
-                    font_type = font[1]  # Font type
+            for font in inspection.fonts:
+                font_name = font.basefont
+                font_type = font.ext  # Font file type
 
-                    # Check if embedded (Type0, Type1C, TrueType, etc. are usually embedded)
-                    # Non-embedded fonts typically have "Type3" or no subtype
-                    is_embedded = font_type not in ['Type3', '']
+                # Check if embedded (Type0, Type1C, TrueType, etc. are usually embedded)
+                # Non-embedded fonts typically have "Type3" or no subtype
+                is_embedded = font_type not in ['Type3', '']
 
-                    if is_embedded:
-                        if font_name not in report.embedded_fonts:
-                            report.embedded_fonts.append(font_name)
-                    else:
-                        if font_name not in report.unembedded_fonts:
-                            report.unembedded_fonts.append(font_name)
+                if is_embedded:
+                    if font_name not in report.embedded_fonts:
+                        report.embedded_fonts.append(font_name)
+                else:
+                    if font_name not in report.unembedded_fonts:
+                        report.unembedded_fonts.append(font_name)
 
             # PDF/X requires all fonts to be embedded
             if report.unembedded_fonts:
@@ -490,8 +501,6 @@ class PDFValidator:
                     f"{len(report.unembedded_fonts)} fonts not embedded (required for PDF/X-4)"
                 )
 
-            doc.close()
-
         except Exception as e:
             logger.debug(f"Font checking error: {e}")
 
@@ -9,9 +9,10 @@ import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from docling_core.types.doc.document import DoclingDocument
+if TYPE_CHECKING:
+    from docling_core.types.doc.document import DoclingDocument
 
 
 _SLUG_PATTERN = re.compile(r"[^\w-]+", re.UNICODE)
@@ -22,7 +22,6 @@ from __future__ import annotations
 import json
 import logging
 import re
-import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -38,6 +37,8 @@ except ImportError:
     NUMPY_AVAILABLE = False
     np = None
 
+from kps.storage import SQLiteDatabase
+
 # Import splitter for section-based ingestion
 from .splitter import DocumentSplitter, SplitStrategy, categorize_section
 
@@ -135,6 +136,7 @@ class KnowledgeBase:
         chunk_overlap: int = 200,  # Overlap между чанками
         chunking_strategy: ChunkingStrategy = ChunkingStrategy.SEMANTIC,
         model_preset: Optional[str] = "claude-3",  # Предустановка для модели
+        embedding_client=None,  # EmbeddingsClient (общий кэш embeddings)
     ):
         """
         Инициализация базы знаний.
@@ -149,9 +151,14 @@ class KnowledgeBase:
             chunk_overlap: Размер overlap между чанками
             chunking_strategy: Стратегия chunking (SEMANTIC, FIXED_SIZE, etc.)
             model_preset: Предустановка размера чанков для модели (gpt-4, claude-3, etc.)
+            embedding_client: EmbeddingsClient для настоящих embeddings
+                (None = локальная hash-симуляция). Векторы разных источников
+                несовместимы: при смене источника у существующей базы
+                вызовите reembed(), иначе старые записи выпадут из поиска.
         """
         self.db_path = Path(db_path)
         self.use_embeddings = use_embeddings and NUMPY_AVAILABLE
+        self.embedding_client = embedding_client
         self.split_sections = split_sections
         self.split_strategy = split_strategy
         self.use_chunking = use_chunking
@@ -170,8 +177,8 @@ class KnowledgeBase:
             self.chunk_size = chunk_size
             self.chunk_overlap = chunk_overlap
 
-        # Создать БД
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Создать БД (соединения на поток, WAL)
+        self._db = SQLiteDatabase(self.db_path)
         self._init_database()
 
         # Кэш для embeddings
@@ -209,57 +216,58 @@ class KnowledgeBase:
             f"embeddings={self.use_embeddings})"
         )
 
+    def close(self) -> None:
+        """Закрыть соединения с БД всех потоков."""
+        self._db.close()
+
     def _init_database(self):
         """Создать структуру БД."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        # Таблица знаний
-        cursor.execute(
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+
+            # Таблица знаний
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS knowledge (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    category TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    source_file TEXT,
+                    metadata TEXT,  -- JSON
+                    embedding BLOB,  -- Numpy array
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    keywords TEXT  -- JSON array
+                )
             """
-            CREATE TABLE IF NOT EXISTS knowledge (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                language TEXT NOT NULL,
-                source_file TEXT,
-                metadata TEXT,  -- JSON
-                embedding BLOB,  -- Numpy array
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                keywords TEXT  -- JSON array
             )
-        """
-        )
 
-        # Индексы
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_category ON knowledge(category)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_language ON knowledge(language)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_created ON knowledge(created_at DESC)"
-        )
+            # Индексы
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_category ON knowledge(category)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_language ON knowledge(language)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_created ON knowledge(created_at DESC)"
+            )
 
-        # Таблица связей (что с чем работает)
-        cursor.execute(
+            # Таблица связей (что с чем работает)
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS relationships (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entry1_id INTEGER,
+                    entry2_id INTEGER,
+                    relationship_type TEXT,  -- compatible, requires, alternative
+                    strength REAL,  -- 0.0-1.0
+                    FOREIGN KEY (entry1_id) REFERENCES knowledge(id),
+                    FOREIGN KEY (entry2_id) REFERENCES knowledge(id)
+                )
             """
-            CREATE TABLE IF NOT EXISTS relationships (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                entry1_id INTEGER,
-                entry2_id INTEGER,
-                relationship_type TEXT,  -- compatible, requires, alternative
-                strength REAL,  -- 0.0-1.0
-                FOREIGN KEY (entry1_id) REFERENCES knowledge(id),
-                FOREIGN KEY (entry2_id) REFERENCES knowledge(id)
             )
-        """
-        )
-
-        conn.commit()
-        conn.close()
 
     def ingest_folder(
         self,
@@ -302,9 +310,11 @@ class KnowledgeBase:
                 # Загрузить файл (может вернуть несколько записей если split_sections=True)
                 entries = self._load_file(file_path, category, language)
                 if entries:
-                    for entry in entries:
-                        self.add_entry(entry)
-                        count += 1
+                    # Один commit на файл
+                    with self._db.transaction(immediate=False):
+                        for entry in entries:
+                            self.add_entry(entry)
+                    count += len(entries)
 
             except Exception as e:
                 logger.error(f"Failed to load {file_path}: {e}")
@@ -600,33 +610,74 @@ class KnowledgeBase:
             entry.embedding = self._get_embedding(entry.content, entry.language)
 
         # Сохранить в БД
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO knowledge
-            (category, title, content, language, source_file, metadata, embedding, keywords)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                entry.category.value,
-                entry.title,
-                entry.content,
-                entry.language,
-                entry.source_file,
-                json.dumps(entry.metadata),
-                self._embedding_to_bytes(entry.embedding) if entry.embedding else None,
-                json.dumps(entry.keywords) if entry.keywords else None,
-            ),
-        )
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                INSERT INTO knowledge
+                (category, title, content, language, source_file, metadata, embedding, keywords)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    entry.category.value,
+                    entry.title,
+                    entry.content,
+                    entry.language,
+                    entry.source_file,
+                    json.dumps(entry.metadata),
+                    (
+                        self._embedding_to_bytes(entry.embedding)
+                        if entry.embedding is not None
+                        else None
+                    ),
+                    json.dumps(entry.keywords) if entry.keywords else None,
+                ),
+            )
 
-        entry_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            entry_id = cursor.lastrowid
 
         return entry_id
 
+    def reembed(self, batch_size: int = 64) -> int:
+        """
+        Пересчитать embeddings всех записей текущим источником.
+
+        Нужно после смены embedding_client у уже заполненной базы:
+        search() пропускает векторы другой размерности.
+
+        Returns:
+            Количество обновлённых записей
+        """
+        if not self.use_embeddings:
+            return 0
+
+        conn = self._db.connection()
+        rows = conn.execute("SELECT id, content, language FROM knowledge").fetchall()
+
+        updated = 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            if self.embedding_client is not None:
+                vectors = self.embedding_client.create_vectors([row[1] for row in batch])
+                embeddings = [np.asarray(vector, dtype=np.float32) for vector in vectors]
+            else:
+                embeddings = [self._get_embedding(row[1], row[2]) for row in batch]
+
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "UPDATE knowledge SET embedding = ? WHERE id = ?",
+                    [
+                        (self._embedding_to_bytes(embedding), row[0])
+                        for row, embedding in zip(batch, embeddings)
+                        if embedding is not None
+                    ],
+                )
+            updated += sum(embedding is not None for embedding in embeddings)
+
+        logger.info("Re-embedded %d knowledge entries", updated)
+        return updated
+
     def search(
         self,
         query: str,
@@ -655,7 +706,7 @@ class KnowledgeBase:
         # Semantic search
         query_emb = self._get_embedding(query, language or "en")
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         # Построить WHERE clause
@@ -692,12 +743,13 @@ class KnowledgeBase:
 
             # Вычислить сходство
             entry_emb = np.array(entry.embedding)
+            if query_emb is None or entry_emb.shape != query_emb.shape:
+                continue  # Записи другой модели embeddings
             similarity = self._cosine_similarity(query_emb, entry_emb)
 
             if similarity >= threshold:
                 results.append((entry, similarity))
 
-        conn.close()
 
         # Сортировать по сходству
         results.sort(key=lambda x: x[1], reverse=True)
@@ -712,7 +764,7 @@ class KnowledgeBase:
         limit: int,
     ) -> List[KnowledgeEntry]:
         """Простой текстовый поиск."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         where = ["content LIKE ?"]
@@ -739,7 +791,6 @@ class KnowledgeBase:
         )
 
         results = [self._row_to_entry(row) for row in cursor.fetchall()]
-        conn.close()
 
         return results
 
@@ -812,7 +863,7 @@ class KnowledgeBase:
 
     def get_category_stats(self) -> Dict[str, int]:
         """Получить статистику по категориям."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -824,7 +875,6 @@ class KnowledgeBase:
         )
 
         stats = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
 
         return stats
 
@@ -833,6 +883,14 @@ class KnowledgeBase:
         if not NUMPY_AVAILABLE:
             return None
 
+        if self.embedding_client is not None:
+            try:
+                vector = self.embedding_client.create_vectors([text])[0]
+            except Exception as exc:  # pragma: no cover - network failures
+                logger.warning("Embedding request failed: %s", exc)
+                return None
+            return np.asarray(vector, dtype=np.float32)
+
         # Простая симуляция (в продакшене использовать sentence-transformers)
         import hashlib
 
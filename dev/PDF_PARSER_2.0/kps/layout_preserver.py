@@ -3,8 +3,12 @@ from __future__ import annotations
 
 import logging
 import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 from langdetect import DetectorFactory, detect
@@ -16,6 +20,8 @@ DetectorFactory.seed = 0
 from argostranslate import package as argos_package
 from argostranslate import translate as argos_translate
 
+from kps.utils import page_chunks
+
 try:  # pragma: no cover - optional dependency
     import pymupdf_fonts  # noqa: F401
 
@@ -68,14 +74,129 @@ def ensure_argos_model(src: str, tgt: str) -> None:
     argos_package.install_from_path(matches[0].download())
 
 
+_ARGOS_TRANSLATIONS: Dict[Tuple[str, str], object] = {}
+_ARGOS_LOCK = threading.Lock()
+
+
+def load_argos_translation(src: str, tgt: str):
+    """Installed Argos translation for ``src -> tgt``, loaded once per pair."""
+    pair = (src, tgt)
+    translation = _ARGOS_TRANSLATIONS.get(pair)
+    if translation is not None:
+        return translation
+    with _ARGOS_LOCK:
+        translation = _ARGOS_TRANSLATIONS.get(pair)
+        if translation is None:
+            installed = argos_translate.get_installed_languages()
+            src_lang = next((lang for lang in installed if lang.code == src), None)
+            tgt_lang = next((lang for lang in installed if lang.code == tgt), None)
+            if not (src_lang and tgt_lang):
+                raise RuntimeError(f"Missing Argos languages for {src}->{tgt}")
+            translation = src_lang.get_translation(tgt_lang)
+            _ARGOS_TRANSLATIONS[pair] = translation
+    return translation
+
+
 def translate_text(text: str, src: str, tgt: str) -> str:
-    installed = argos_translate.get_installed_languages()
-    src_lang = next((lang for lang in installed if lang.code == src), None)
-    tgt_lang = next((lang for lang in installed if lang.code == tgt), None)
-    if not (src_lang and tgt_lang):
-        raise RuntimeError(f"Missing Argos languages for {src}->{tgt}")
-    translation = src_lang.get_translation(tgt_lang)
-    return translation.translate(text)
+    return load_argos_translation(src, tgt).translate(text)
+
+
+class LayoutTranslator:
+    """Memoizing block translator for one language pair.
+
+    Block texts of the whole document are translated up front with
+    :meth:`prefetch`: identical texts (running headers, footers, repeated
+    table labels) are translated once, and with a ``memory`` (e.g.
+    ``SemanticTranslationMemory``) known texts are read in one bulk lookup
+    and new translations are written back, so re-running the same pattern
+    does not call Argos at all.
+
+    Only memory I/O is batched: Argos still gets one call per new text.
+    Its ``translate`` splits the input into paragraphs and runs the model
+    on each one separately, so joining texts into one call would not batch
+    model work and would blur block boundaries at embedded newlines.
+
+    Args:
+        src: Source language code
+        tgt: Target language code
+        memory: Optional memory with ``get_translations_bulk`` and
+            ``add_translations_bulk``
+        batch_size: Texts translated between memory write-backs (one
+            ``add_translations_bulk`` per batch)
+        translate_fn: ``text -> translation`` (default: Argos via ``translate_text``)
+    """
+
+    MEMORY_MODEL = "argos"  # Model tag of layout translations in the memory
+
+    def __init__(
+        self,
+        src: str,
+        tgt: str,
+        memory=None,
+        batch_size: int = 64,
+        translate_fn: Optional[Callable[[str], str]] = None,
+    ):
+        self.src = src
+        self.tgt = tgt
+        self.memory = memory
+        self.batch_size = max(1, batch_size)
+        self.translate_fn = translate_fn
+        self.translations: Dict[str, str] = {}
+        self.memory_hits = 0
+        self.engine_calls = 0
+
+    def _translate_one(self, text: str) -> str:
+        self.engine_calls += 1
+        try:
+            if self.translate_fn is not None:
+                return self.translate_fn(text)
+            return translate_text(text, self.src, self.tgt)
+        except Exception:  # noqa: BLE001
+            logger.debug("Translation failed, keeping source text", exc_info=True)
+            return text
+
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """Translate every not yet known text (deduplicated, memory first)."""
+        pending = [
+            text
+            for text in dict.fromkeys(texts)
+            if text.strip() and text not in self.translations
+        ]
+        if not pending:
+            return
+
+        if self.memory is not None:
+            entries = self.memory.get_translations_bulk(
+                pending, self.src, self.tgt, model=self.MEMORY_MODEL
+            )
+            missing = []
+            for text, entry in zip(pending, entries):
+                cached = getattr(entry, "translated_text", None) if entry else None
+                if cached:
+                    self.translations[text] = cached
+                    self.memory_hits += 1
+                else:
+                    missing.append(text)
+            pending = missing
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            rows = []
+            for text in batch:
+                translated = self._translate_one(text)
+                self.translations[text] = translated
+                if translated != text:
+                    rows.append((text, translated, []))
+            if self.memory is not None and rows:
+                self.memory.add_translations_bulk(
+                    rows, self.src, self.tgt, model=self.MEMORY_MODEL
+                )
+
+    def translate(self, text: str) -> str:
+        """Translation of one block text (prefetched or translated now)."""
+        if text not in self.translations:
+            self.prefetch([text])
+        return self.translations.get(text, text)
 
 
 def clean_text(text: str) -> str:
@@ -85,12 +206,89 @@ def clean_text(text: str) -> str:
     return text.strip(" \t")
 
 
-def choose_font_for_page(page: fitz.Page, target_lang: str = "en") -> tuple[str, fitz.Font]:
+@lru_cache(maxsize=None)
+def _load_font(fontname: str = "helv", fontfile: Optional[str] = None) -> fitz.Font:
+    """Font object for a built-in name or font file, parsed once per process."""
+    if fontfile:
+        return fitz.Font(fontfile=fontfile)
+    return fitz.Font(fontname)
+
+
+def _font_resources(doc: fitz.Document, page: fitz.Page) -> Tuple[int, str]:
+    """(xref, key path) of the ``/Font`` dictionary in the resources of ``page``."""
+    xref, path = page.xref, "Resources/Font"
+    kind, value = doc.xref_get_key(xref, "Resources")
+    if kind == "xref":  # shared resources object
+        xref, path = int(value.split()[0]), "Font"
+    kind, value = doc.xref_get_key(xref, path)
+    if kind == "xref":
+        return int(value.split()[0]), ""
+    return xref, f"{path}/"
+
+
+class FontRegistry:
+    """Fonts of one destination document.
+
+    Each font is embedded into the document once: the first page gets it via
+    ``insert_font``, later pages only reference the same font object from
+    their resources. Text widths are memoized per (font alias, string) at
+    fontsize 1 and scaled on lookup.
+    """
+
+    def __init__(self, doc: fitz.Document):
+        self.doc = doc
+        self._xrefs: Dict[str, int] = {}
+        self._widths: Dict[Tuple[str, str], float] = {}
+
+    def embed(
+        self,
+        page: fitz.Page,
+        alias: str,
+        font: fitz.Font,
+        fontfile: Optional[str] = None,
+    ) -> int:
+        """Make ``font`` available on ``page`` as ``alias``; returns its xref."""
+        xref = self._xrefs.get(alias)
+        if xref is None:
+            if fontfile:
+                xref = page.insert_font(fontname=alias, fontfile=fontfile)
+            else:
+                xref = page.insert_font(fontname=alias, fontbuffer=font.buffer)
+            self._xrefs[alias] = xref
+        elif not any(entry[4] == alias for entry in page.get_fonts()):
+            fonts_xref, path = _font_resources(self.doc, page)
+            self.doc.xref_set_key(fonts_xref, f"{path}{alias}", f"{xref} 0 R")
+        return xref
+
+    def text_length(self, alias: str, font: fitz.Font, text: str, fontsize: float = 1.0) -> float:
+        """Width of ``text`` in ``font`` at ``fontsize``."""
+        key = (alias, text)
+        width = self._widths.get(key)
+        if width is None:
+            width = font.text_length(text, fontsize=1)
+            self._widths[key] = width
+        return width * fontsize
+
+
+def subset_fonts(doc: fitz.Document) -> None:
+    """Reduce embedded fonts of ``doc`` to the glyphs it uses (call once, before save)."""
+    try:
+        doc.subset_fonts()
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Font subsetting skipped: {e}")
+
+
+def choose_font_for_page(
+    page: fitz.Page,
+    target_lang: str = "en",
+    registry: Optional[FontRegistry] = None,
+) -> tuple[str, fitz.Font]:
     """Pick appropriate font with Cyrillic support and return both alias and Font object.
 
     Args:
         page: PDF page to insert font into
         target_lang: Target language code (e.g., 'ru', 'en', 'fr')
+        registry: Font registry of the destination document (embeds once)
 
     Returns:
         Tuple of (font_alias, Font object) for text measurement
@@ -104,8 +302,11 @@ def choose_font_for_page(page: fitz.Page, target_lang: str = "en") -> tuple[str,
     # Method 1: Try pymupdf-fonts (best option)
     if HAS_PYMUPDF_FONTS:
         try:
-            font = fitz.Font("notos")
-            page.insert_font(fontname=alias, fontbuffer=font.buffer)
+            font = _load_font("notos")
+            if registry is not None:
+                registry.embed(page, alias, font)
+            else:
+                page.insert_font(fontname=alias, fontbuffer=font.buffer)
             logger.info(f"✅ Using NotoSans font from pymupdf-fonts for {target_lang}")
             return alias, font
         except Exception as e:  # noqa: BLE001
@@ -125,8 +326,11 @@ def choose_font_for_page(page: fitz.Page, target_lang: str = "en") -> tuple[str,
     for candidate in system_fonts:
         if Path(candidate).exists():
             try:
-                font = fitz.Font(fontfile=candidate)
-                page.insert_font(fontname=alias, fontfile=candidate)
+                font = _load_font(fontfile=candidate)
+                if registry is not None:
+                    registry.embed(page, alias, font, fontfile=candidate)
+                else:
+                    page.insert_font(fontname=alias, fontfile=candidate)
                 logger.info(f"✅ Using system font: {candidate} for {target_lang}")
                 return alias, font
             except Exception as e:  # noqa: BLE001
@@ -145,7 +349,7 @@ def choose_font_for_page(page: fitz.Page, target_lang: str = "en") -> tuple[str,
 
     # For non-Cyrillic, use built-in Helvetica (but log warning)
     logger.warning(f"⚠️  Using built-in Helvetica for {target_lang} (no custom fonts found)")
-    font = fitz.Font("helv")
+    font = _load_font("helv")
     return "helv", font
 
 
@@ -165,30 +369,34 @@ def load_font_variant(is_bold: bool, is_italic: bool, target_lang: str) -> fitz.
         # Cyrillic support required - use Noto Sans variants
         if HAS_PYMUPDF_FONTS:
             if is_bold and is_italic:
-                return fitz.Font("notosbi")  # Noto Sans Bold Italic
+                return _load_font("notosbi")  # Noto Sans Bold Italic
             elif is_bold:
-                return fitz.Font("notosbo")  # Noto Sans Bold
+                return _load_font("notosbo")  # Noto Sans Bold
             elif is_italic:
-                return fitz.Font("notosit")  # Noto Sans Italic
+                return _load_font("notosit")  # Noto Sans Italic
             else:
-                return fitz.Font("notos")    # Noto Sans Regular
+                return _load_font("notos")    # Noto Sans Regular
         else:
             # Fallback to regular if pymupdf-fonts not available
             logger.warning(f"⚠️  pymupdf-fonts not available, using regular font for styled text")
-            return fitz.Font("notos") if HAS_PYMUPDF_FONTS else fitz.Font("helv")
+            return _load_font("notos") if HAS_PYMUPDF_FONTS else _load_font("helv")
     else:
         # English/French - use Helvetica variants
         if is_bold and is_italic:
-            return fitz.Font("hebi")  # Helvetica Bold Italic
+            return _load_font("hebi")  # Helvetica Bold Italic
         elif is_bold:
-            return fitz.Font("hebo")  # Helvetica Bold
+            return _load_font("hebo")  # Helvetica Bold
         elif is_italic:
-            return fitz.Font("heit")  # Helvetica Italic
+            return _load_font("heit")  # Helvetica Italic
         else:
-            return fitz.Font("helv")  # Helvetica Regular
+            return _load_font("helv")  # Helvetica Regular
 
 
-def insert_font_variants(page: fitz.Page, target_lang: str) -> dict:
+def insert_font_variants(
+    page: fitz.Page,
+    target_lang: str,
+    registry: Optional[FontRegistry] = None,
+) -> dict:
     """Insert all font variants needed for target language into page.
     
     Pre-loads all 4 variants (regular, bold, italic, bold-italic) to avoid
@@ -197,6 +405,7 @@ def insert_font_variants(page: fitz.Page, target_lang: str) -> dict:
     Args:
         page: PDF page to insert fonts into
         target_lang: Target language code
+        registry: Font registry of the destination document (embeds once)
         
     Returns:
         dict mapping (is_bold, is_italic) → (font_alias, Font object)
@@ -216,7 +425,10 @@ def insert_font_variants(page: fitz.Page, target_lang: str) -> dict:
         alias = f"Font_{style_name}"
         
         # Insert font into page
-        page.insert_font(fontname=alias, fontbuffer=font.buffer)
+        if registry is not None:
+            registry.embed(page, alias, font)
+        else:
+            page.insert_font(fontname=alias, fontbuffer=font.buffer)
         
         # Store mapping
         font_map[(is_bold, is_italic)] = (alias, font)
@@ -451,6 +663,7 @@ def insert_textbox_smart(
     base_fontsize: float,
     min_fontsize: float = 7.0,
     line_height_factor: float = 2.0,  # PyMuPDF needs 2.0x fontsize minimum!
+    registry: Optional[FontRegistry] = None,
 ) -> float:
     """Insert text with pre-calculated fontsize to avoid duplicate blocks.
 
@@ -466,6 +679,7 @@ def insert_textbox_smart(
         base_fontsize: Initial/preferred font size
         min_fontsize: Minimum acceptable font size (advisory, not enforced)
         line_height_factor: Line height multiplier (2.0 = PyMuPDF minimum requirement)
+        registry: Font registry memoizing text widths across blocks and pages
 
     Returns:
         Actual fontsize used for insertion
@@ -497,7 +711,10 @@ def insert_textbox_smart(
             continue
         # Measure width at fontsize=1, then scale
         try:
-            w_unit = font.text_length(line, fontsize=1)
+            if registry is not None:
+                w_unit = registry.text_length(fontname, font, line)
+            else:
+                w_unit = font.text_length(line, fontsize=1)
             logger.debug(f"   Line width at fs=1: {w_unit:.2f} for '{line[:30]}...'")
             if w_unit > 0:
                 fs_line = rect_width / w_unit
@@ -589,7 +806,8 @@ def insert_formatted_block(
     formatted_lines: list,
     translated_text: str,
     font_map: dict,
-    target_lang: str
+    target_lang: str,
+    registry: Optional[FontRegistry] = None,
 ) -> None:
     """Insert translated text with preserved formatting using insert_text().
     
@@ -607,6 +825,7 @@ def insert_formatted_block(
         translated_text: The translated text to insert
         font_map: Mapping of (is_bold, is_italic) → (font_alias, Font object)
         target_lang: Target language for font selection
+        registry: Font registry memoizing text widths across blocks and pages
     """
     # Split translated text into lines (preserve newlines)
     translated_lines = translated_text.split("\n")
@@ -663,7 +882,10 @@ def insert_formatted_block(
 
             # ✨ NEW: Scale fontsize if translated text exceeds available column width
             try:
-                text_width = font.text_length(text_part, fontsize=fontsize)
+                if registry is not None:
+                    text_width = registry.text_length(font_alias, font, text_part, fontsize)
+                else:
+                    text_width = font.text_length(text_part, fontsize=fontsize)
 
                 if text_width > available_width and available_width > 10.0:
                     # Calculate scale factor to fit text in available width
@@ -791,7 +1013,21 @@ def redraw_table_borders(page: fitz.Page, graphics: list) -> None:
     
     logger.debug(f"  ✅ Redrawn {len(graphics)} graphics elements (table borders/lines)")
 
-def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_lang: str, preserve_formatting: bool = False) -> None:
+def page_text_blocks(page_dict: dict) -> list:
+    """Text blocks (type 0) of a ``page.get_text("dict")`` result."""
+    return [block for block in page_dict.get("blocks", []) if block.get("type") == 0]
+
+
+def rebuild_page(
+    orig_page: fitz.Page,
+    dest_page: fitz.Page,
+    src_lang: str,
+    tgt_lang: str,
+    preserve_formatting: bool = False,
+    translator: Optional[LayoutTranslator] = None,
+    page_dict: Optional[dict] = None,
+    fonts: Optional[FontRegistry] = None,
+) -> None:
     """Clean rebuild: remove ALL text from dest_page and insert translated text.
 
     Uses page-level redaction to remove the entire text layer:
@@ -807,9 +1043,17 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
         src_lang: Source language code
         tgt_lang: Target language code
         preserve_formatting: If True, preserve fonts, colors, bold/italic (slower)
+        translator: Shared LayoutTranslator (default: a new one for this page)
+        page_dict: Pre-extracted ``orig_page.get_text("dict", sort=True)``
+        fonts: Font registry of the destination document (default: per page)
     
     No span-level redactions = no artifacts!
     """
+    if translator is None:
+        translator = LayoutTranslator(src_lang, tgt_lang)
+    if fonts is None:
+        fonts = FontRegistry(dest_page.parent)
+
     # STEP 0: Extract vector graphics BEFORE redaction
     logger.debug("Extracting vector graphics (table borders)...")
     table_graphics = extract_table_graphics(dest_page)
@@ -833,15 +1077,17 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
         logger.debug("✅ Page cleaned successfully - 0 text blocks after redaction")
 
     # STEP 2: Extract text blocks from original page
-    page_dict = orig_page.get_text("dict", sort=True)
-    text_blocks = [block for block in page_dict.get("blocks", []) if block.get("type") == 0]
+    if page_dict is None:
+        page_dict = orig_page.get_text("dict", sort=True)
+    text_blocks = page_text_blocks(page_dict)
+    translator.prefetch(block_text(block) for block in text_blocks)
 
     if preserve_formatting:
         # NEW: Formatting-preserving mode with insert_text()
         logger.info(f"Processing {len(text_blocks)} blocks with formatting preservation")
         
         # Pre-load all font variants
-        font_map = insert_font_variants(dest_page, tgt_lang)
+        font_map = insert_font_variants(dest_page, tgt_lang, registry=fonts)
         
         for block_idx, block in enumerate(text_blocks):
             original_text = block_text(block)
@@ -849,10 +1095,7 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
                 logger.debug(f"  Block {block_idx}: Empty, skipping")
                 continue
             
-            try:
-                translated = translate_text(original_text, src_lang, tgt_lang)
-            except Exception:
-                translated = original_text
+            translated = translator.translate(original_text)
             
             translated = clean_text(translated)
             
@@ -867,12 +1110,13 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
                 formatted_lines,
                 translated,
                 font_map,
-                tgt_lang
+                tgt_lang,
+                registry=fonts,
             )
         
     else:
         # OLD: Simple mode with insert_textbox_smart (0 overlaps, but loses formatting)
-        font_alias, font = choose_font_for_page(dest_page, target_lang=tgt_lang)
+        font_alias, font = choose_font_for_page(dest_page, target_lang=tgt_lang, registry=fonts)
         logger.info(f"Processing {len(text_blocks)} text blocks for translation (simple mode)")
         
         blocks_inserted = 0
@@ -882,10 +1126,7 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
                 logger.debug(f"  Block {block_idx}: Empty, skipping")
                 continue
 
-            try:
-                translated = translate_text(original_text, src_lang, tgt_lang)
-            except Exception:
-                translated = original_text
+            translated = translator.translate(original_text)
             translated = clean_text(translated)
 
             rect = fitz.Rect(block["bbox"]) & dest_page.rect
@@ -903,6 +1144,7 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
                 font_alias,
                 font,
                 average_font_size(block),
+                registry=fonts,
             )
             blocks_inserted += 1
     
@@ -919,19 +1161,157 @@ def rebuild_page(orig_page: fitz.Page, dest_page: fitz.Page, src_lang: str, tgt_
         logger.info("✅ Formatting preservation complete (fonts, sizes, colors)")
 
 
+def _rebuild_pages(
+    src_doc: fitz.Document,
+    dest_doc: fitz.Document,
+    page_indices: Iterable[int],
+    src_lang: str,
+    tgt_lang: str,
+    preserve_formatting: bool,
+    translator: LayoutTranslator,
+    page_dicts: Optional[List[dict]] = None,
+) -> None:
+    """Append rebuilt copies of ``page_indices`` of ``src_doc`` to ``dest_doc``."""
+    fonts = FontRegistry(dest_doc)
+    for page_index in page_indices:
+        src_page = src_doc.load_page(page_index)
+
+        # Create new blank page with same dimensions
+        dest_page = dest_doc.new_page(
+            width=src_page.rect.width,
+            height=src_page.rect.height
+        )
+
+        # Import page content as clean graphic layer (cleaner than insert_pdf)
+        dest_page.show_pdf_page(
+            dest_page.rect,  # Target rect
+            src_doc,          # Source document
+            page_index        # Source page number
+        )
+
+        # Apply redaction and insert translated text
+        rebuild_page(
+            src_page,
+            dest_page,
+            src_lang,
+            tgt_lang,
+            preserve_formatting=preserve_formatting,
+            translator=translator,
+            page_dict=page_dicts[page_index] if page_dicts else None,
+            fonts=fonts,
+        )
+
+
+def _rebuild_chunk(
+    input_path: str,
+    chunk_path: str,
+    start: int,
+    stop: int,
+    src_lang: str,
+    tgt_lang: str,
+    preserve_formatting: bool,
+    translations: Dict[str, str],
+) -> str:
+    """Worker: rebuild pages ``[start, stop)`` into their own PDF file."""
+    translator = LayoutTranslator(src_lang, tgt_lang)
+    translator.translations.update(translations)
+
+    src_doc = fitz.open(input_path)
+    dest_doc = fitz.open()
+    try:
+        _rebuild_pages(
+            src_doc,
+            dest_doc,
+            range(start, stop),
+            src_lang,
+            tgt_lang,
+            preserve_formatting,
+            translator,
+        )
+        dest_doc.save(chunk_path, deflate=True)
+    finally:
+        dest_doc.close()
+        src_doc.close()
+    return chunk_path
+
+
+def _process_pages_parallel(
+    input_path: Path,
+    output_dir: Path,
+    src_lang: str,
+    translators: Dict[str, LayoutTranslator],
+    page_count: int,
+    preserve_formatting: bool,
+    workers: int,
+) -> list[Path]:
+    """Rebuild page ranges of every target language in a process pool.
+
+    Each worker opens its own fitz handles and writes one chunk file; chunks
+    are merged with ``insert_pdf`` in page order. Every chunk embeds its own
+    copy of the fonts, so the merged file is saved with ``garbage=4``, which
+    folds identical font streams into one object; chunks are saved unsubset
+    so the streams stay identical and the merged file is subset once.
+    """
+    chunks = page_chunks(page_count, workers)
+    produced: list[Path] = []
+
+    with tempfile.TemporaryDirectory(prefix="kps-layout-") as tmp_dir:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures: Dict[str, List] = {}
+            for tgt, translator in translators.items():
+                futures[tgt] = [
+                    pool.submit(
+                        _rebuild_chunk,
+                        str(input_path),
+                        str(Path(tmp_dir) / f"{tgt}_{start:05d}.pdf"),
+                        start,
+                        stop,
+                        src_lang,
+                        tgt,
+                        preserve_formatting,
+                        translator.translations,
+                    )
+                    for start, stop in chunks
+                ]
+
+            for tgt, chunk_futures in futures.items():
+                dest_doc = fitz.open()
+                try:
+                    for future in chunk_futures:
+                        with fitz.open(future.result()) as chunk_doc:
+                            dest_doc.insert_pdf(chunk_doc)
+                    out_path = output_dir / f"{input_path.stem}_{tgt}.pdf"
+                    subset_fonts(dest_doc)
+                    dest_doc.save(out_path, deflate=True, garbage=4)
+                finally:
+                    dest_doc.close()
+                produced.append(out_path)
+
+    return produced
+
+
 def process_pdf(
     input_path: Path,
     output_dir: Path,
     target_langs: list[str] | None = None,
     preserve_formatting: bool = True,
+    memory=None,
+    workers: int = 1,
 ) -> list[Path]:
     """Process PDF with layout preservation.
     
+    Block texts of all pages are extracted once and translated per target
+    language in one deduplicated pass before the pages are rebuilt.
+
     Args:
         input_path: Path to input PDF
         output_dir: Directory to save translated PDFs
         target_langs: List of target language codes
         preserve_formatting: If True, preserve fonts, colors, bold/italic
+        memory: Optional translation memory for LayoutTranslator (reused
+            across runs of the same document)
+        workers: Worker processes for page rebuilding; with more than one,
+            page ranges of all target languages are rebuilt in parallel
         
     Returns:
         List of paths to generated PDFs
@@ -952,31 +1332,47 @@ def process_pdf(
 
         produced: list[Path] = []
 
+        page_dicts = [
+            src_doc.load_page(page_index).get_text("dict", sort=True)
+            for page_index in range(src_doc.page_count)
+        ]
+        document_texts = [
+            block_text(block) for page_dict in page_dicts for block in page_text_blocks(page_dict)
+        ]
+
+        translators: Dict[str, LayoutTranslator] = {}
         for tgt in targets:
             ensure_argos_model(src_lang, tgt)
-            dest_doc = fitz.open()  # Create empty document
-
-            # Create pages individually using show_pdf_page (cleaner than insert_pdf)
-            for page_index in range(src_doc.page_count):
-                src_page = src_doc.load_page(page_index)
-
-                # Create new blank page with same dimensions
-                dest_page = dest_doc.new_page(
-                    width=src_page.rect.width,
-                    height=src_page.rect.height
-                )
-
-                # Import page content as clean graphic layer
-                dest_page.show_pdf_page(
-                    dest_page.rect,  # Target rect
-                    src_doc,          # Source document
-                    page_index        # Source page number
-                )
+            translator = LayoutTranslator(src_lang, tgt, memory=memory)
+            translator.prefetch(document_texts)
+            translators[tgt] = translator
+
+        if workers > 1 and src_doc.page_count > 1:
+            return _process_pages_parallel(
+                input_path,
+                output_dir,
+                src_lang,
+                translators,
+                src_doc.page_count,
+                preserve_formatting,
+                workers,
+            )
 
-                # Apply redaction and insert translated text
-                rebuild_page(src_page, dest_page, src_lang, tgt, preserve_formatting=preserve_formatting)
+        for tgt in targets:
+            dest_doc = fitz.open()  # Create empty document
+            _rebuild_pages(
+                src_doc,
+                dest_doc,
+                range(src_doc.page_count),
+                src_lang,
+                tgt,
+                preserve_formatting,
+                translators[tgt],
+                page_dicts,
+            )
 
             out_path = output_dir / f"{input_path.stem}_{tgt}.pdf"
+            subset_fonts(dest_doc)
             dest_doc.save(out_path, deflate=True, garbage=3)
             dest_doc.close()
             produced.append(out_path)
@@ -119,6 +119,27 @@ cache_misses_total = Counter(
     ["src_lang", "tgt_lang"]
 )
 
+# Persistent embedding cache
+embedding_cache_total = Counter(
+    "kps_embedding_cache_total",
+    "Embedding cache lookups and evictions",
+    ["model", "result"]  # result: hit, miss, eviction
+)
+
+# In-process translation memory caches
+memory_cache_total = Counter(
+    "kps_memory_cache_total",
+    "Translation memory LRU cache lookups and evictions",
+    ["cache", "result"]  # result: hit, miss, eviction
+)
+
+# Persistent Docling extraction cache
+extraction_cache_total = Counter(
+    "kps_extraction_cache_total",
+    "Extraction cache lookups and evictions",
+    ["result"]  # result: hit, miss, eviction
+)
+
 # API calls
 api_calls_total = Counter(
     "kps_api_calls_total",
@@ -324,6 +345,44 @@ def record_cache_miss(src_lang: str, tgt_lang: str):
     ).inc()
 
 
+def record_embedding_cache(model: str, result: str, count: int = 1):
+    """
+    Record embedding cache events.
+
+    Args:
+        model: Embedding model
+        result: "hit", "miss" or "eviction"
+        count: Number of events
+    """
+    if count:
+        embedding_cache_total.labels(model=model, result=result).inc(count)
+
+
+def record_memory_cache(cache: str, result: str, count: int = 1):
+    """
+    Record translation memory cache events.
+
+    Args:
+        cache: Cache name (e.g., "semantic", "exact")
+        result: "hit", "miss" or "eviction"
+        count: Number of events
+    """
+    if count:
+        memory_cache_total.labels(cache=cache, result=result).inc(count)
+
+
+def record_extraction_cache(result: str, count: int = 1):
+    """
+    Record extraction cache events.
+
+    Args:
+        result: "hit", "miss" or "eviction"
+        count: Number of events
+    """
+    if count:
+        extraction_cache_total.labels(result=result).inc(count)
+
+
 def record_api_call(model: str, status: str = "success"):
     """
     Record API call.
@@ -433,6 +492,9 @@ __all__ = [
     "term_enforcements_total",
     "cache_hits_total",
     "cache_misses_total",
+    "embedding_cache_total",
+    "memory_cache_total",
+    "extraction_cache_total",
     "api_calls_total",
     "translation_cost_usd",
     "tokens_total",
@@ -458,6 +520,9 @@ __all__ = [
     "record_enforcement",
     "record_cache_hit",
     "record_cache_miss",
+    "record_embedding_cache",
+    "record_memory_cache",
+    "record_extraction_cache",
     "record_api_call",
     "record_cost",
     "record_tokens",
@@ -1,4 +1,10 @@
-"""Asset matching algorithms for comparing source and output assets."""
+"""Asset matching algorithms for comparing source and output assets.
+
+Output assets are indexed once per batch (``AssetIndex``): every image is
+decoded and downscaled a single time, SHA-256 digests go into a dict and
+64-bit perceptual hashes into a BK-tree. Visual matching scores only the
+nearest pHash candidates, with one vectorized MSE over their thumbnails.
+"""
 
 import hashlib
 from typing import Optional, List, Tuple, Dict
@@ -7,6 +13,7 @@ from PIL import Image
 import numpy as np
 
 from kps.core import Asset, AssetType
+from kps.search.bk_tree import BKTree
 from .qa_utils import (
     calculate_hash,
     load_image,
@@ -15,14 +22,128 @@ from .qa_utils import (
 from .constants import (
     VISUAL_SIMILARITY_THRESHOLD,
     VISUAL_SIMILARITY_STRICT,
+    VISUAL_MATCH_CANDIDATES,
     COMPARISON_RESIZE,
-    HIGH_RES_COMPARISON,
     HASH_MATCH_PRIORITY,
     VISUAL_MATCH_PRIORITY,
     CRITICAL_SIZE_THRESHOLD,
 )
 
 
+# Max MSE for RGB is 255^2 * 3 = 195075
+MAX_RGB_MSE = 255.0 ** 2 * 3
+
+
+def perceptual_hash(image: Image.Image, hash_size: int = 8) -> int:
+    """
+    Average-based perceptual hash of an image as an integer.
+
+    Args:
+        image: PIL Image
+        hash_size: Hash size (8 = 64-bit hash)
+
+    Returns:
+        Hash with one bit per pixel of the downscaled image, row-major
+    """
+    pixels = np.asarray(image.resize((hash_size, hash_size)).convert("L"), dtype=np.float32)
+    bits = np.packbits(pixels > pixels.mean())
+    return int.from_bytes(bits.tobytes(), "big") >> (bits.size * 8 - hash_size * hash_size)
+
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """Number of differing bits between two integer hashes."""
+    return (hash1 ^ hash2).bit_count()
+
+
+def _thumbnail(image: Image.Image, size: Tuple[int, int] = COMPARISON_RESIZE) -> np.ndarray:
+    return np.asarray(image.resize(size).convert("RGB"), dtype=np.uint8)
+
+
+def _similarity_from_mse(mse: float) -> float:
+    return max(0.0, min(1.0, 1.0 - mse / MAX_RGB_MSE))
+
+
+class AssetIndex:
+    """Output assets decoded once: SHA-256 lookup, pHash BK-tree and thumbnails."""
+
+    def __init__(
+        self,
+        output_assets: List[dict],
+        thumbnail_size: Tuple[int, int] = COMPARISON_RESIZE,
+    ):
+        self.assets = output_assets
+        self.thumbnail_size = thumbnail_size
+        self.by_sha256: Dict[str, dict] = {}
+        self.tree: BKTree[int, int] = BKTree(hamming_distance)
+        self._positions: List[int] = []  # thumbnail row → position in output_assets
+
+        thumbnails = []
+        for position, output_asset in enumerate(output_assets):
+            # Calculate hash if not already present
+            if "sha256" not in output_asset:
+                output_asset["sha256"] = calculate_hash(output_asset["data"])
+            self.by_sha256.setdefault(output_asset["sha256"], output_asset)
+
+            output_image = bytes_to_image(output_asset["data"])
+            if not output_image:
+                continue
+            try:
+                thumbnail = _thumbnail(output_image, thumbnail_size)
+                phash = perceptual_hash(output_image)
+            except Exception:
+                continue
+
+            self.tree.add(phash, len(thumbnails))
+            thumbnails.append(thumbnail)
+            self._positions.append(position)
+
+        self._key = self._asset_key(output_assets)
+
+        width, height = thumbnail_size
+        self.thumbnails = (
+            np.stack(thumbnails) if thumbnails else np.empty((0, height, width, 3), np.uint8)
+        )
+
+    @staticmethod
+    def _asset_key(output_assets: List[dict]) -> List[Tuple[int, Optional[str]]]:
+        return [(id(asset), asset.get("sha256")) for asset in output_assets]
+
+    def is_for(self, output_assets: List[dict]) -> bool:
+        """True while ``output_assets`` holds the indexed assets, in order.
+
+        Assets are compared by object and SHA-256 digest, so replacing an
+        entry in place (even with one of the same length) rebuilds the index.
+        """
+        return self._asset_key(output_assets) == self._key
+
+    def best_visual_match(
+        self, image: Image.Image, candidates: int = VISUAL_MATCH_CANDIDATES
+    ) -> Tuple[Optional[dict], float]:
+        """
+        Most similar output asset among the nearest pHash candidates.
+
+        Returns:
+            Tuple of (best_match, similarity_score)
+        """
+        if not len(self.tree):
+            return None, 0.0
+        try:
+            source_thumbnail = _thumbnail(image, self.thumbnail_size).astype(np.float32)
+            phash = perceptual_hash(image)
+        except Exception:
+            return None, 0.0
+
+        rows = sorted(row for _, row in self.tree.nearest(phash, candidates))
+        deltas = self.thumbnails[rows].astype(np.float32) - source_thumbnail
+        mse = np.mean(deltas * deltas, axis=(1, 2, 3))
+        best = int(np.argmin(mse))
+
+        similarity = _similarity_from_mse(float(mse[best]))
+        if similarity <= 0.0:
+            return None, 0.0
+        return self.assets[self._positions[rows[best]]], similarity
+
+
 class AssetMatch:
     """Result of asset matching operation."""
 
@@ -73,6 +194,7 @@ class AssetMatcher:
         self.visual_threshold = visual_threshold
         self.strict_mode = strict_mode
         self._match_cache: Dict[str, AssetMatch] = {}
+        self._index: Optional[AssetIndex] = None
 
     def find_match(
         self, source_asset: Asset, output_assets: List[dict]
@@ -157,6 +279,7 @@ class AssetMatcher:
         Returns:
             List of AssetMatch results
         """
+        self._index = AssetIndex(output_assets)
         matches = []
         for source_asset in source_assets:
             match = self.find_match(source_asset, output_assets)
@@ -176,15 +299,7 @@ class AssetMatcher:
         Returns:
             Matching output asset or None
         """
-        for output_asset in output_assets:
-            # Calculate hash if not already present
-            if "sha256" not in output_asset:
-                output_asset["sha256"] = calculate_hash(output_asset["data"])
-
-            if output_asset["sha256"] == source_asset.sha256:
-                return output_asset
-
-        return None
+        return self._get_index(output_assets).by_sha256.get(source_asset.sha256)
 
     def _find_by_visual_similarity(
         self, source_asset: Asset, output_assets: List[dict]
@@ -204,113 +319,13 @@ class AssetMatcher:
         if not source_image:
             return None, 0.0
 
-        best_match = None
-        best_similarity = 0.0
-
-        for output_asset in output_assets:
-            # Convert output asset to image
-            output_image = bytes_to_image(output_asset["data"])
-            if not output_image:
-                continue
-
-            # Calculate similarity
-            similarity = self._calculate_visual_similarity(source_image, output_image)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = output_asset
-
-        return best_match, best_similarity
-
-    def _calculate_visual_similarity(
-        self, img1: Image.Image, img2: Image.Image, use_high_res: bool = False
-    ) -> float:
-        """
-        Calculate visual similarity between two images.
-
-        Uses perceptual hash and pixel comparison:
-        1. Resize to standard size
-        2. Convert to RGB
-        3. Calculate mean squared error
-        4. Convert to similarity score (0.0-1.0)
-
-        Args:
-            img1: First image
-            img2: Second image
-            use_high_res: Use higher resolution for comparison
-
-        Returns:
-            Similarity score (0.0-1.0, 1.0 = identical)
-        """
-        # Choose comparison size
-        size = HIGH_RES_COMPARISON if use_high_res else COMPARISON_RESIZE
-
-        # Resize and convert to RGB
-        try:
-            img1_resized = img1.resize(size).convert("RGB")
-            img2_resized = img2.resize(size).convert("RGB")
-        except Exception:
-            return 0.0
-
-        # Convert to numpy arrays
-        arr1 = np.array(img1_resized, dtype=np.float32)
-        arr2 = np.array(img2_resized, dtype=np.float32)
-
-        # Calculate mean squared error
-        mse = np.mean((arr1 - arr2) ** 2)
-
-        # Convert MSE to similarity (0.0-1.0)
-        # Max MSE for RGB is 255^2 * 3 = 195075
-        max_mse = 255.0 ** 2 * 3
-        similarity = 1.0 - (mse / max_mse)
-
-        return max(0.0, min(1.0, similarity))
-
-    def _calculate_perceptual_hash(self, image: Image.Image, hash_size: int = 8) -> str:
-        """
-        Calculate perceptual hash (pHash) of image.
-
-        Args:
-            image: PIL Image
-            hash_size: Hash size (8 = 64-bit hash)
-
-        Returns:
-            Hex string of perceptual hash
-        """
-        # Resize and convert to grayscale
-        img_resized = image.resize((hash_size, hash_size)).convert("L")
-
-        # Get pixel data
-        pixels = np.array(img_resized, dtype=np.float32)
-
-        # Calculate average
-        avg = pixels.mean()
-
-        # Create hash (1 if pixel > avg, 0 otherwise)
-        hash_bits = (pixels > avg).flatten()
-
-        # Convert to hex string
-        hash_int = int("".join(["1" if bit else "0" for bit in hash_bits]), 2)
-        return f"{hash_int:016x}"
-
-    def _hamming_distance(self, hash1: str, hash2: str) -> int:
-        """
-        Calculate Hamming distance between two hashes.
-
-        Args:
-            hash1: First hash (hex string)
-            hash2: Second hash (hex string)
-
-        Returns:
-            Hamming distance (number of differing bits)
-        """
-        # Convert hex to int
-        int1 = int(hash1, 16)
-        int2 = int(hash2, 16)
+        return self._get_index(output_assets).best_visual_match(source_image)
 
-        # XOR and count set bits
-        xor = int1 ^ int2
-        return bin(xor).count("1")
+    def _get_index(self, output_assets: List[dict]) -> AssetIndex:
+        """Index of ``output_assets``, reused while the same list is matched."""
+        if self._index is None or not self._index.is_for(output_assets):
+            self._index = AssetIndex(output_assets)
+        return self._index
 
     def _is_critical(self, asset: Asset) -> bool:
         """
@@ -369,5 +384,6 @@ class AssetMatcher:
         }
 
     def clear_cache(self):
-        """Clear the match cache."""
+        """Clear the match cache and the output asset index."""
         self._match_cache.clear()
+        self._index = None
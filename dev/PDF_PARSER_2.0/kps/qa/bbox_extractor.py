@@ -18,6 +18,7 @@ from typing import Dict, List, Optional, Tuple
 import fitz  # PyMuPDF
 
 from ..core.bbox import BBox
+from .pdf_inspection import PDFInspection
 
 
 class BBoxExtractor:
@@ -86,7 +87,8 @@ class BBoxExtractor:
 
     def extract_from_page_objects(
         self,
-        pdf_path: Path
+        pdf_path: Path,
+        inspection: Optional[PDFInspection] = None
     ) -> Dict[int, List[BBox]]:
         """Extract all object bboxes from PDF, grouped by page.
 
@@ -95,19 +97,21 @@ class BBoxExtractor:
 
         Args:
             pdf_path: Path to output PDF
+            inspection: Shared inspection of ``pdf_path`` (optional)
 
         Returns:
             Dict mapping page_num -> list of BBoxes
         """
-        doc = fitz.open(pdf_path)
+        if inspection is None:
+            inspection = PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
+
         all_bboxes = {}
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+        for page_num in range(inspection.page_count):
             page_bboxes = []
 
             # Extract image bboxes
-            image_bboxes = self._extract_image_bboxes(page)
+            image_bboxes = self._extract_image_bboxes(inspection, page_num)
             page_bboxes.extend(image_bboxes)
 
             # Extract vector graphic bboxes (if needed)
@@ -115,7 +119,6 @@ class BBoxExtractor:
 
             all_bboxes[page_num] = page_bboxes
 
-        doc.close()
         return all_bboxes
 
     def extract_from_placed_labels(
@@ -153,7 +156,8 @@ class BBoxExtractor:
     def extract_with_verification(
         self,
         pdf_path: Path,
-        placed_labels: List[dict]
+        placed_labels: List[dict],
+        inspection: Optional[PDFInspection] = None
     ) -> Tuple[Dict[str, BBox], List[str]]:
         """Extract bboxes with cross-verification.
 
@@ -163,6 +167,7 @@ class BBoxExtractor:
         Args:
             pdf_path: Path to output PDF
             placed_labels: List of label dicts from InDesign
+            inspection: Shared inspection of ``pdf_path`` (optional)
 
         Returns:
             Tuple of (asset_bboxes, warnings)
@@ -173,7 +178,7 @@ class BBoxExtractor:
         label_bboxes = self.extract_from_placed_labels(placed_labels)
 
         # Verification: extract from PDF objects
-        page_bboxes = self.extract_from_page_objects(pdf_path)
+        page_bboxes = self.extract_from_page_objects(pdf_path, inspection)
 
         # Count mismatches
         total_from_labels = len(label_bboxes)
@@ -188,38 +193,31 @@ class BBoxExtractor:
         # Use label bboxes as primary (more accurate)
         return label_bboxes, warnings
 
-    def _extract_image_bboxes(self, page: fitz.Page) -> List[BBox]:
+    def _extract_image_bboxes(
+        self,
+        inspection: PDFInspection,
+        page_num: int
+    ) -> List[BBox]:
         """Extract bboxes of all images on a page.
 
         Args:
-            page: PyMuPDF Page object
+            inspection: Inspection of the output PDF
+            page_num: Page index
 
         Returns:
-            List of BBoxes for images
+            List of BBoxes for images (one per placed instance)
         """
-        bboxes = []
-
-        # Get all images with their transformation matrices
-        image_list = page.get_images(full=True)
-
-        for img_info in image_list:
-            xref = img_info[0]
-
-            # Get image locations (can be multiple instances)
-            locations = page.get_image_rects(xref)
-
-            for rect in locations:
-                # Convert fitz.Rect to BBox
-                # fitz uses (x0, y0, x1, y1) format which matches BBox
-                bbox = BBox(
-                    x0=rect.x0,
-                    y0=rect.y0,
-                    x1=rect.x1,
-                    y1=rect.y1
-                )
-                bboxes.append(bbox)
-
-        return bboxes
+        placements = inspection.placements_on_page(page_num)
+
+        return [
+            BBox(x0=x0, y0=y0, x1=x1, y1=y1)
+            for x0, y0, x1, y1 in zip(
+                placements["x0"].tolist(),
+                placements["y0"].tolist(),
+                placements["x1"].tolist(),
+                placements["y1"].tolist(),
+            )
+        ]
 
     def _extract_label_from_object(self, obj_string: str) -> Optional[dict]:
         """Extract KPS label JSON from PDF object string.
@@ -19,6 +19,7 @@ from .constants import (
     WARNING_COLORSPACE_CONVERSION,
     WARNING_MISSING_ICC_PROFILE,
 )
+from .pdf_inspection import PDFInspection
 
 
 _DEFAULT_ALLOWED_CONVERSIONS: Tuple[Tuple[str, str], ...] = (
@@ -96,6 +97,7 @@ class ColorAuditor:
         target_pdf: Path,
         *,
         pre_extracted: Optional[Sequence[dict]] = None,
+        inspection: Optional[PDFInspection] = None,
     ) -> ColorAuditReport:
         """Audit colorspace and ICC usage.
 
@@ -110,6 +112,8 @@ class ColorAuditor:
                 "has_icc": bool,
             }
 
+        Otherwise the records come from ``inspection`` (a shared
+        ``PDFInspection`` of ``target_pdf``) or, failing that, from the PDF itself.
         If neither ``pre_extracted`` nor PyMuPDF is available, the method returns
         an informational report explaining that the audit could not be executed.
         """
@@ -117,7 +121,7 @@ class ColorAuditor:
         if pre_extracted is not None:
             records = list(pre_extracted)
         else:
-            records = self._extract_from_pdf(target_pdf)
+            records = self._extract_from_pdf(target_pdf, inspection)
             if records is None:
                 return self._empty_report(
                     "PyMuPDF (fitz) is required for color auditing when no pre-extracted data is provided"
@@ -206,43 +210,33 @@ class ColorAuditor:
             summary=summary,
         )
 
-    def _extract_from_pdf(self, target_pdf: Path) -> Optional[List[dict]]:
-        """Attempt to extract colorspace data directly from the PDF."""
+    def _extract_from_pdf(
+        self, target_pdf: Path, inspection: Optional[PDFInspection] = None
+    ) -> Optional[List[dict]]:
+        """Extract colorspace data from the PDF's images, one record per page use."""
 
-        if fitz is None:
-            return None
+        if inspection is None:
+            if fitz is None:
+                return None
 
-        try:
-            doc = fitz.open(target_pdf)
-        except Exception:
-            return None
+            try:
+                inspection = PDFInspection.from_pdf(target_pdf, text=False, drawings=False)
+            except Exception:
+                return None
 
         records: List[dict] = []
-
-        try:
-            for page_index, page in enumerate(doc):
-                for img in page.get_images(full=True):
-                    xref = img[0]
-                    try:
-                        image_dict = doc.extract_image(xref)
-                    except Exception:
-                        continue
-
-                    colorspace_code = image_dict.get("colorspace", -1)
-                    colorspace = self._map_colorspace(colorspace_code)
-                    has_icc = bool(image_dict.get("icc_profile"))
-
-                    records.append(
-                        {
-                            "asset_id": f"image-xref-{xref}",
-                            "page": page_index,
-                            "source_colorspace": colorspace,
-                            "target_colorspace": colorspace,
-                            "has_icc": has_icc,
-                        }
-                    )
-        finally:
-            doc.close()
+        for image in inspection.images.tolist():
+            page_index, xref, _, _, colorspace_code, has_icc = image
+            colorspace = self._map_colorspace(colorspace_code)
+            records.append(
+                {
+                    "asset_id": f"image-xref-{xref}",
+                    "page": page_index,
+                    "source_colorspace": colorspace,
+                    "target_colorspace": colorspace,
+                    "has_icc": has_icc,
+                }
+            )
 
         return records
 
@@ -20,11 +20,14 @@ PROMINENT_AREA_THRESHOLD = 250000  # square pixels (e.g., 500x500)
 # Image comparison settings
 COMPARISON_RESIZE = (64, 64)  # Size for quick visual comparison
 HIGH_RES_COMPARISON = (256, 256)  # For detailed comparison
+VISUAL_MATCH_CANDIDATES = 8  # Nearest pHash candidates scored by MSE
 
 # Visual diff thresholds
 VISUAL_DIFF_PIXEL_THRESHOLD = 10  # Intensity delta considered a change (0-255)
 VISUAL_DIFF_MAX_RATIO = 0.02  # Maximum allowed ratio of differing pixels (2%)
 VISUAL_DIFF_MIN_COVERAGE = 0.001  # Minimum mask coverage to trust comparison
+VISUAL_DIFF_PREVIEW_DPI = 50  # Low-resolution pass; identical previews skip the full render
+VISUAL_DIFF_TILE_SIZE = 128  # Full-resolution tile (px) re-rendered when its preview differs
 
 # Visual diff warnings
 WARNING_LOW_MASK_COVERAGE = "Mask coverage below minimum threshold for reliable diff"
@@ -22,6 +22,8 @@ except ImportError:  # pragma: no cover
 
 from kps.core import Asset, AssetLedger, AssetType, BBox
 
+from .pdf_inspection import PDFInspection
+
 logger = logging.getLogger(__name__)
 
 
@@ -216,7 +218,9 @@ class DPIValidator:
         self,
         pdf_path: Path,
         source_ledger: AssetLedger,
-        placed_labels: Optional[List[dict]] = None
+        placed_labels: Optional[List[dict]] = None,
+        *,
+        inspection: Optional[PDFInspection] = None,
     ) -> DPIReport:
         """Validate DPI of all images in PDF.
 
@@ -224,6 +228,8 @@ class DPIValidator:
             pdf_path: Output PDF to check
             source_ledger: Original assets with dimensions
             placed_labels: Placed objects from InDesign (optional)
+            inspection: Shared ``PDFInspection`` of ``pdf_path`` (optional);
+                the PDF is inspected here when it is not supplied
 
         Returns:
             DPIReport with all issues and recommendations
@@ -239,17 +245,16 @@ class DPIValidator:
         if not image_assets:
             return self._empty_report("No images found in asset ledger")
 
-        # Open PDF to get actual placed dimensions
-        doc = None
-        if fitz is not None:
+        # Inspect PDF to get actual placed dimensions
+        if inspection is None and fitz is not None:
             try:
-                doc = fitz.open(pdf_path)
+                inspection = PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
             except Exception as e:
                 # If we have placed_labels, we can continue without PDF
                 if not placed_labels:
                     return self._empty_report(f"Failed to open PDF: {e}")
                 logger.warning(f"PDF not available, using placed_labels only: {e}")
-        elif not placed_labels:
+        elif inspection is None and not placed_labels:
             return self._empty_report(
                 "PyMuPDF (fitz) is required for DPI validation when placed labels are not provided"
             )
@@ -261,7 +266,7 @@ class DPIValidator:
 
             # Get placed dimensions from PDF
             placed_bbox = self._get_placed_bbox_from_pdf(
-                doc, asset, placed_labels
+                inspection, asset, placed_labels
             )
 
             if not placed_bbox:
@@ -315,22 +320,19 @@ class DPIValidator:
 
             issues.append(issue)
 
-        if doc is not None:
-            doc.close()
-
         # Generate report
         return self._generate_report(issues)
 
     def _get_placed_bbox_from_pdf(
         self,
-        doc,
+        inspection: Optional[PDFInspection],
         asset: Asset,
         placed_labels: Optional[List[dict]]
     ) -> Optional[BBox]:
         """Get placed bounding box from PDF or placed labels.
 
         Args:
-            doc: PyMuPDF document
+            inspection: Inspection of the output PDF
             asset: Asset to find
             placed_labels: Optional placed labels from InDesign
 
@@ -345,29 +347,22 @@ class DPIValidator:
                     if bbox_data:
                         return BBox(*bbox_data)
 
-        if doc is None or fitz is None:
+        if inspection is None:
             return None
 
-        try:
-            page = doc[asset.page_number]
-            image_list = page.get_images(full=True)
-
-            for img_info in image_list:
-                xref = img_info[0]
-                bbox_rect = page.get_image_bbox(img_info)
-
-                pix = fitz.Pixmap(doc, xref)
-                if pix.width == asset.image_width and pix.height == asset.image_height:
-                    return BBox(
-                        x0=bbox_rect.x0,
-                        y0=bbox_rect.y0,
-                        x1=bbox_rect.x1,
-                        y1=bbox_rect.y1
-                    )
-        except Exception:
+        # First image drawn on the asset's page with the asset's pixel size
+        placement = inspection.find_placement(
+            asset.page_number, asset.image_width, asset.image_height
+        )
+        if placement is None:
             return None
 
-        return None
+        return BBox(
+            x0=float(placement["x0"]),
+            y0=float(placement["y0"]),
+            x1=float(placement["x1"]),
+            y1=float(placement["y1"]),
+        )
 
     def _classify_dpi(
         self,
@@ -11,7 +11,7 @@ Part of Day 5: DPI Validator and Font Audit
 """
 
 from dataclasses import dataclass, field
-from typing import List, Set, Dict, Optional, TYPE_CHECKING
+from typing import List, Set, Dict, Optional
 from pathlib import Path
 
 try:  # pragma: no cover - optional dependency
@@ -19,8 +19,7 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover
     fitz = None
 
-if TYPE_CHECKING:  # pragma: no cover
-    from fitz import Document
+from .pdf_inspection import PDFInspection
 
 
 @dataclass
@@ -215,6 +214,7 @@ class FontAuditor:
         pdf_path: Path,
         *,
         pre_extracted: Optional[List[dict]] = None,
+        inspection: Optional[PDFInspection] = None,
     ) -> FontReport:
         """Audit all fonts in PDF.
 
@@ -222,6 +222,8 @@ class FontAuditor:
             pdf_path: Path to PDF file
             pre_extracted: Optional pre-parsed font metadata. When provided the
                 PDF will not be opened and the supplied data is used instead.
+            inspection: Optional shared ``PDFInspection`` of ``pdf_path``; the
+                PDF is only opened when neither this nor ``pre_extracted`` is given.
 
         Returns:
             FontReport with font details and issues
@@ -244,127 +246,43 @@ class FontAuditor:
             ]
             return self._generate_report(fonts)
 
-        if fitz is None:
-            return self._empty_report(
-                "PyMuPDF (fitz) is required to audit fonts unless pre_extracted data is supplied"
-            )
+        if inspection is None:
+            if fitz is None:
+                return self._empty_report(
+                    "PyMuPDF (fitz) is required to audit fonts unless pre_extracted data is supplied"
+                )
 
-        try:
-            doc = fitz.open(pdf_path)
-        except Exception as e:
-            return self._empty_report(f"Failed to open PDF: {e}")
+            try:
+                inspection = PDFInspection.from_pdf(pdf_path, text=False, drawings=False)
+            except Exception as e:
+                return self._empty_report(f"Failed to open PDF: {e}")
 
-        # Collect fonts from all pages
+        # Fonts are keyed by name; the first font object seen wins
         fonts_dict: Dict[str, FontInfo] = {}
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+        for record in inspection.fonts:
+            name = record.basefont or record.name or "Unknown"
+
+            if name not in fonts_dict:
+                fonts_dict[name] = FontInfo(
+                    name=name,
+                    base_name=name,  # Will be updated in __post_init__
+                    font_type=record.font_type,
+                    is_embedded=record.is_embedded,
+                    is_subset=False,  # Will be detected in __post_init__
+                    encoding=record.encoding,
+                    pages_used=set(),
+                    xref=record.xref,
+                    file_size=record.file_size,
+                )
 
-            # Get fonts on this page
-            try:
-                font_list = page.get_fonts(full=True)
-            except Exception as e:
-                continue
-
-            for font_tuple in font_list:
-                # Font tuple format (from PyMuPDF):
-                # (xref, ext, type, basefont, name, encoding, embedded)
-                if len(font_tuple) < 6:
-                    continue
-
-                xref = font_tuple[0]
-                font_type = font_tuple[2]
-                name = font_tuple[3] or font_tuple[4] or "Unknown"
-                encoding = font_tuple[5] if len(font_tuple) > 5 else "Unknown"
-
-                # Check if embedded
-                is_embedded = self._is_font_embedded(doc, xref)
-
-                # Create or update font info
-                if name not in fonts_dict:
-                    fonts_dict[name] = FontInfo(
-                        name=name,
-                        base_name=name,  # Will be updated in __post_init__
-                        font_type=font_type,
-                        is_embedded=is_embedded,
-                        is_subset=False,  # Will be detected in __post_init__
-                        encoding=encoding,
-                        pages_used=set(),
-                        xref=xref,
-                    )
-
-                    # Try to get font size
-                    try:
-                        fonts_dict[name].file_size = self._get_font_size(doc, xref)
-                    except:
-                        pass
-
-                fonts_dict[name].pages_used.add(page_num)
-
-        doc.close()
+            fonts_dict[name].pages_used.update(record.pages)
 
         fonts = list(fonts_dict.values())
 
         # Generate report
         return self._generate_report(fonts)
 
-    def _is_font_embedded(self, doc: "Document", xref: int) -> bool:
-        """Check if font is embedded in PDF.
-
-        Args:
-            doc: PyMuPDF document
-            xref: Font object reference
-
-        Returns:
-            True if font data is embedded
-        """
-        try:
-            # Check for font file streams
-            for key in ["FontFile", "FontFile2", "FontFile3"]:
-                font_file = doc.xref_get_key(xref, key)
-                if font_file and font_file != "null":
-                    return True
-
-            # Check if font descriptor has embedded data
-            desc_xref = doc.xref_get_key(xref, "FontDescriptor")
-            if desc_xref and desc_xref != "null":
-                # Extract xref number
-                desc_num = int(desc_xref.split()[0]) if ' ' in desc_xref else int(desc_xref)
-
-                for key in ["FontFile", "FontFile2", "FontFile3"]:
-                    font_file = doc.xref_get_key(desc_num, key)
-                    if font_file and font_file != "null":
-                        return True
-
-            return False
-        except:
-            # If we can't determine, assume not embedded (safer)
-            return False
-
-    def _get_font_size(self, doc: "Document", xref: int) -> Optional[int]:
-        """Get embedded font data size in bytes.
-
-        Args:
-            doc: PyMuPDF document
-            xref: Font object reference
-
-        Returns:
-            Size in bytes, or None
-        """
-        try:
-            # Try to get font stream length
-            for key in ["FontFile", "FontFile2", "FontFile3"]:
-                font_file = doc.xref_get_key(xref, key)
-                if font_file and font_file != "null":
-                    # Get stream object
-                    stream_xref = int(font_file.split()[0]) if ' ' in font_file else int(font_file)
-                    length_str = doc.xref_get_key(stream_xref, "Length")
-                    if length_str:
-                        return int(length_str.split()[0])
-            return None
-        except:
-            return None
-
     def _generate_report(self, fonts: List[FontInfo]) -> FontReport:
         """Generate comprehensive font report.
 
@@ -0,0 +1,371 @@
+"""Single-pass inspection of an output PDF shared by the QA auditors.
+
+The font, color and DPI auditors (and the PDF/X validator) used to open the
+output PDF on their own and walk every page's fonts and images again, in
+some cases decoding each image just to read its pixel size. ``PDFInspection``
+opens the document once, makes one pass over the pages and keeps what the
+auditors need in compact numpy record arrays:
+
+- ``fonts``: one ``FontRecord`` per font xref, with embedding status and pages
+- ``images``: one row per image listed on a page (``page.get_images``)
+- ``placements``: one row per drawn image instance with its rectangle
+- ``drawings``: one rectangle per vector path
+- ``spans``: one row per text span; text and font names are kept alongside
+
+Images are never decoded; pixel size and colorspace come from the placement
+info MuPDF reports while interpreting the page content.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover
+    fitz = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fitz import Document, Page
+
+
+IMAGE_DTYPE = np.dtype(
+    [
+        ("page", "i4"),
+        ("xref", "i4"),
+        ("width", "i4"),
+        ("height", "i4"),
+        ("colorspace", "i1"),  # Number of colour components (0 = unknown)
+        ("has_icc", "?"),
+    ]
+)
+
+PLACEMENT_DTYPE = np.dtype(
+    [
+        ("page", "i4"),
+        ("xref", "i4"),  # 0 for inline images
+        ("width", "i4"),
+        ("height", "i4"),
+        ("x0", "f8"),
+        ("y0", "f8"),
+        ("x1", "f8"),
+        ("y1", "f8"),
+    ]
+)
+
+DRAWING_DTYPE = np.dtype(
+    [("page", "i4"), ("x0", "f8"), ("y0", "f8"), ("x1", "f8"), ("y1", "f8")]
+)
+
+SPAN_DTYPE = np.dtype(
+    [
+        ("page", "i4"),
+        ("font", "i4"),  # Index into PDFInspection.span_fonts
+        ("size", "f4"),
+        ("flags", "i4"),
+        ("x0", "f8"),
+        ("y0", "f8"),
+        ("x1", "f8"),
+        ("y1", "f8"),
+    ]
+)
+
+_FONT_FILE_KEYS = ("FontFile", "FontFile2", "FontFile3")
+
+
+@dataclass
+class FontRecord:
+    """Font object referenced by at least one page."""
+
+    xref: int
+    ext: str  # Font file extension reported by PyMuPDF ("ttf", "cff", "n/a", ...)
+    font_type: str  # TrueType, Type1, Type0, Type3, ...
+    basefont: str
+    name: str  # Resource name on the page
+    encoding: str
+    is_embedded: bool
+    file_size: Optional[int] = None
+    pages: Set[int] = field(default_factory=set)
+
+
+def font_is_embedded(doc: "Document", xref: int) -> bool:
+    """Check if font is embedded in PDF.
+
+    Args:
+        doc: PyMuPDF document
+        xref: Font object reference
+
+    Returns:
+        True if font data is embedded
+    """
+    try:
+        # Check for font file streams
+        for key in _FONT_FILE_KEYS:
+            font_file = doc.xref_get_key(xref, key)
+            if font_file and font_file != "null":
+                return True
+
+        # Check if font descriptor has embedded data
+        desc_xref = doc.xref_get_key(xref, "FontDescriptor")
+        if desc_xref and desc_xref != "null":
+            # Extract xref number
+            desc_num = int(desc_xref.split()[0]) if ' ' in desc_xref else int(desc_xref)
+
+            for key in _FONT_FILE_KEYS:
+                font_file = doc.xref_get_key(desc_num, key)
+                if font_file and font_file != "null":
+                    return True
+
+        return False
+    except Exception:
+        # If we can't determine, assume not embedded (safer)
+        return False
+
+
+def font_file_size(doc: "Document", xref: int) -> Optional[int]:
+    """Get embedded font data size in bytes.
+
+    Args:
+        doc: PyMuPDF document
+        xref: Font object reference
+
+    Returns:
+        Size in bytes, or None
+    """
+    try:
+        # Try to get font stream length
+        for key in _FONT_FILE_KEYS:
+            font_file = doc.xref_get_key(xref, key)
+            if font_file and font_file != "null":
+                # Get stream object
+                stream_xref = int(font_file.split()[0]) if ' ' in font_file else int(font_file)
+                length_str = doc.xref_get_key(stream_xref, "Length")
+                if length_str:
+                    return int(length_str.split()[0])
+        return None
+    except Exception:
+        return None
+
+
+def _records(rows: List[tuple], dtype: np.dtype) -> np.ndarray:
+    return np.array(rows, dtype=dtype) if rows else np.empty(0, dtype=dtype)
+
+
+class PDFInspection:
+    """Fonts, images, drawings and text spans of a PDF, collected in one pass.
+
+    Example:
+        >>> inspection = PDFInspection.from_pdf(Path("output.pdf"))
+        >>> font_report = FontAuditor().audit_fonts(pdf, inspection=inspection)
+        >>> dpi_report = DPIValidator().validate_dpi(pdf, ledger, inspection=inspection)
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Optional[Path],
+        page_sizes: np.ndarray,
+        fonts: List[FontRecord],
+        images: np.ndarray,
+        placements: np.ndarray,
+        drawings: np.ndarray,
+        spans: np.ndarray,
+        span_texts: List[str],
+        span_fonts: List[str],
+    ) -> None:
+        self.path = path
+        self.page_sizes = page_sizes  # (page_count, 2) width/height in points
+        self.fonts = fonts
+        self.images = images
+        self.placements = placements
+        self.drawings = drawings
+        self.spans = spans
+        self.span_texts = span_texts
+        self.span_fonts = span_fonts
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_sizes)
+
+    @classmethod
+    def from_pdf(
+        cls,
+        pdf_path: Path,
+        *,
+        text: bool = True,
+        drawings: bool = True,
+    ) -> "PDFInspection":
+        """Open ``pdf_path`` once and inspect every page.
+
+        Args:
+            pdf_path: PDF to inspect
+            text: Collect text spans
+            drawings: Collect vector drawing rectangles
+
+        Raises:
+            RuntimeError: If PyMuPDF is not installed
+        """
+        if fitz is None:
+            raise RuntimeError("PyMuPDF (fitz) is required to inspect PDFs")
+
+        doc = fitz.open(pdf_path)
+        try:
+            return cls.from_document(doc, path=Path(pdf_path), text=text, drawings=drawings)
+        finally:
+            doc.close()
+
+    @classmethod
+    def from_document(
+        cls,
+        doc: "Document",
+        *,
+        path: Optional[Path] = None,
+        text: bool = True,
+        drawings: bool = True,
+    ) -> "PDFInspection":
+        """Inspect an already open document (it is left open)."""
+        page_sizes = np.zeros((doc.page_count, 2), dtype=np.float64)
+        fonts: Dict[int, FontRecord] = {}
+        image_rows: List[tuple] = []
+        placement_rows: List[tuple] = []
+        drawing_rows: List[tuple] = []
+        span_rows: List[tuple] = []
+        span_texts: List[str] = []
+        span_fonts: List[str] = []
+        span_font_index: Dict[str, int] = {}
+        # Colour components and ICC flag per image xref, from placement info
+        image_colors: Dict[int, Tuple[int, bool]] = {}
+
+        for page_index, page in enumerate(doc):
+            page_sizes[page_index] = (page.rect.width, page.rect.height)
+            cls._collect_fonts(doc, page, page_index, fonts)
+
+            for info in cls._image_info(page):
+                xref = int(info.get("xref", 0))
+                x0, y0, x1, y1 = info["bbox"]
+                placement_rows.append(
+                    (page_index, xref, info["width"], info["height"], x0, y0, x1, y1)
+                )
+                if xref and xref not in image_colors:
+                    image_colors[xref] = (
+                        int(info.get("colorspace", 0)),
+                        str(info.get("cs-name", "")).startswith("ICCBased"),
+                    )
+
+            for img in page.get_images(full=True):
+                xref = img[0]
+                if xref not in image_colors:
+                    image_colors[xref] = cls._image_color(doc, xref)
+                components, has_icc = image_colors[xref]
+                image_rows.append((page_index, xref, img[2], img[3], components, has_icc))
+
+            if drawings:
+                for path in page.get_cdrawings():
+                    x0, y0, x1, y1 = path["rect"]
+                    drawing_rows.append((page_index, x0, y0, x1, y1))
+
+            if text:
+                text_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+                for block in text_dict.get("blocks", []):
+                    for line in block.get("lines", []):
+                        for span in line.get("spans", []):
+                            font = span.get("font", "")
+                            font_index = span_font_index.setdefault(font, len(span_fonts))
+                            if font_index == len(span_fonts):
+                                span_fonts.append(font)
+                            x0, y0, x1, y1 = span["bbox"]
+                            span_rows.append(
+                                (page_index, font_index, span["size"], span["flags"], x0, y0, x1, y1)
+                            )
+                            span_texts.append(span.get("text", ""))
+
+        return cls(
+            path=path,
+            page_sizes=page_sizes,
+            fonts=list(fonts.values()),
+            images=_records(image_rows, IMAGE_DTYPE),
+            placements=_records(placement_rows, PLACEMENT_DTYPE),
+            drawings=_records(drawing_rows, DRAWING_DTYPE),
+            spans=_records(span_rows, SPAN_DTYPE),
+            span_texts=span_texts,
+            span_fonts=span_fonts,
+        )
+
+    # ------------------------------------------------------------------
+    # Per-page views
+    # ------------------------------------------------------------------
+
+    def images_on_page(self, page: int) -> np.ndarray:
+        return self.images[self.images["page"] == page]
+
+    def placements_on_page(self, page: int) -> np.ndarray:
+        return self.placements[self.placements["page"] == page]
+
+    def drawings_on_page(self, page: int) -> np.ndarray:
+        return self.drawings[self.drawings["page"] == page]
+
+    def spans_on_page(self, page: int) -> np.ndarray:
+        return self.spans[self.spans["page"] == page]
+
+    def find_placement(self, page: int, width: int, height: int) -> Optional[np.void]:
+        """First image drawn on ``page`` whose pixel size is ``width`` x ``height``."""
+        placements = self.placements
+        hits = np.flatnonzero(
+            (placements["page"] == page)
+            & (placements["width"] == width)
+            & (placements["height"] == height)
+        )
+        return placements[hits[0]] if hits.size else None
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _collect_fonts(
+        doc: "Document", page: "Page", page_index: int, fonts: Dict[int, FontRecord]
+    ) -> None:
+        try:
+            font_list = page.get_fonts(full=True)
+        except Exception:
+            return
+
+        for font_tuple in font_list:
+            # (xref, ext, type, basefont, name, encoding, referencer)
+            if len(font_tuple) < 6:
+                continue
+
+            xref = font_tuple[0]
+            record = fonts.get(xref)
+            if record is None:
+                record = fonts[xref] = FontRecord(
+                    xref=xref,
+                    ext=font_tuple[1],
+                    font_type=font_tuple[2],
+                    basefont=font_tuple[3],
+                    name=font_tuple[4],
+                    encoding=font_tuple[5],
+                    is_embedded=font_is_embedded(doc, xref),
+                    file_size=font_file_size(doc, xref),
+                )
+            record.pages.add(page_index)
+
+    @staticmethod
+    def _image_info(page: "Page") -> List[dict]:
+        try:
+            return page.get_image_info(xrefs=True)
+        except Exception:
+            return []
+
+    @staticmethod
+    def _image_color(doc: "Document", xref: int) -> Tuple[int, bool]:
+        """Colour info for an image that is listed but never drawn."""
+        try:
+            image = doc.extract_image(xref)
+        except Exception:
+            return 0, False
+        return int(image.get("colorspace", 0)), str(image.get("cs-name", "")).startswith("ICCBased")
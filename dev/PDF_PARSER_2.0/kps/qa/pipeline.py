@@ -14,6 +14,8 @@ from .completeness_checker import CompletenessChecker
 from .dpi_validator import DPIValidator
 from .font_audit import FontAuditor
 from .geometry_validator import GeometryValidator
+from .pdf_inspection import PDFInspection
+from .rasterizer import RasterizationCache
 from .visual_diff import VisualDiffer, VisualDiffReport
 
 
@@ -40,14 +42,23 @@ class QAPipeline:
         font_auditor: Optional[FontAuditor] = None,
         color_auditor: Optional[ColorAuditor] = None,
         audit_generator: Optional[AuditTrailGenerator] = None,
+        raster_cache: Optional[RasterizationCache] = None,
+        enable_visual_diff: bool = False,
     ) -> None:
         self.completeness_checker = completeness_checker or CompletenessChecker()
         self.geometry_validator = geometry_validator
+        # Pass/fail gate only: the tiered comparison's lower-bound pixel counts suffice
+        if visual_differ is None and enable_visual_diff:
+            visual_differ = VisualDiffer(tiered=True)
         self.visual_differ = visual_differ
         self.dpi_validator = dpi_validator
         self.font_auditor = font_auditor
         self.color_auditor = color_auditor
         self.audit_generator = audit_generator or AuditTrailGenerator()
+        # Rendered pages shared across runs (e.g. one reference PDF, several languages)
+        self.raster_cache = (
+            raster_cache if raster_cache is not None else RasterizationCache(max_cache_size_mb=256)
+        )
 
     def run(
         self,
@@ -115,6 +126,7 @@ class QAPipeline:
                 ledger=ledger,
                 page_dimensions=page_dimensions,
                 return_diff_images=False,
+                cache=self.raster_cache,
             )
             visual_report = self._summarise_visual_diff(visual_passed, page_reports)
             qa_reports["visual_diff"] = visual_report
@@ -132,12 +144,18 @@ class QAPipeline:
                     extra_metadata=extra_metadata,
                 )
 
+        # One pass over the output PDF, shared by the DPI, font and color audits
+        inspection = None
+        if any(check is not None for check in (self.dpi_validator, self.font_auditor, self.color_auditor)):
+            inspection = self._inspect(output_pdf)
+
         # DPI validation
         if self.dpi_validator is not None:
             dpi_report = self.dpi_validator.validate_dpi(
                 pdf_path=output_pdf,
                 source_ledger=ledger,
                 placed_labels=list(placed_labels),
+                inspection=inspection,
             )
             qa_reports["dpi"] = dpi_report
             if not dpi_report.passed:
@@ -155,7 +173,7 @@ class QAPipeline:
                 )
 
         if self.font_auditor is not None:
-            font_report = self.font_auditor.audit_fonts(output_pdf)
+            font_report = self.font_auditor.audit_fonts(output_pdf, inspection=inspection)
             qa_reports["font"] = font_report
             if not font_report.passed:
                 return self._finalise(
@@ -175,6 +193,7 @@ class QAPipeline:
             color_report = self.color_auditor.audit_colors(
                 source_ledger=ledger,
                 target_pdf=output_pdf,
+                inspection=inspection,
             )
             qa_reports["color"] = color_report
             if not color_report.passed:
@@ -209,6 +228,18 @@ class QAPipeline:
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _inspect(output_pdf: Path) -> Optional[PDFInspection]:
+        """Inspect the output PDF once; auditors fall back to their own reading.
+
+        The auditors only read fonts and images, so text spans and vector
+        drawings (the slow part of a page walk) are not collected.
+        """
+        try:
+            return PDFInspection.from_pdf(output_pdf, text=False, drawings=False)
+        except Exception:
+            return None
+
     def _summarise_visual_diff(
         self,
         passed: bool,
@@ -2,14 +2,28 @@
 
 This module handles conversion of PDF pages to raster images at configurable DPI
 for pixel-level comparison in the visual diff pipeline.
+
+A ``RasterizerSession`` keeps every PDF it touches open until it is closed
+and renders pages on demand, so comparing two 60-page documents opens each
+file once instead of once per page. Rendered pages can be shared across
+sessions through a byte-bounded ``RasterizationCache``.
+
+Usage:
+    rasterizer = PDFRasterizer(dpi=200, cache=RasterizationCache(256))
+    with rasterizer.session() as pages:
+        for image in pages.iter_pages(source_pdf):
+            ...
 """
 
 try:  # pragma: no cover - optional dependency
     import fitz  # PyMuPDF
 except ImportError:  # pragma: no cover - exercised when dependency missing
     fitz = None
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from PIL import Image
 import logging
 
@@ -21,6 +35,14 @@ class RasterizationError(Exception):
     pass
 
 
+def _file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class PDFRasterizer:
     """Rasterize PDF pages to high-quality images for visual comparison.
 
@@ -31,13 +53,15 @@ class PDFRasterizer:
         dpi: Dots per inch for rasterization (default: 150)
         colorspace: Color space for output images (default: RGB)
         alpha: Whether to include alpha channel (default: False)
+        cache: Optional RasterizationCache shared by all sessions
     """
 
     def __init__(
         self,
         dpi: int = 150,
         colorspace: str = "RGB",
-        alpha: bool = False
+        alpha: bool = False,
+        cache: Optional["RasterizationCache"] = None,
     ):
         """Initialize PDF rasterizer.
 
@@ -46,91 +70,92 @@ class PDFRasterizer:
                  Recommended: 150 for general use, 300 for high-quality comparison
             colorspace: PIL colorspace ('RGB', 'L' for grayscale, 'RGBA')
             alpha: Include alpha channel in output
+            cache: Rendered-page cache (keyed by file hash, page and DPI)
         """
         self.dpi = dpi
         self.colorspace = colorspace
         self.alpha = alpha
+        self.cache = cache
         self.zoom = dpi / 72.0  # PDF uses 72 DPI as base
 
         logger.info(f"Initialized PDFRasterizer: DPI={dpi}, colorspace={colorspace}")
 
-    def rasterize_pdf(
-        self,
-        pdf_path: Path,
-        page_range: Optional[Tuple[int, int]] = None
-    ) -> List[Image.Image]:
-        """Rasterize all pages (or range) of PDF to images.
+    def session(self, cache: Optional["RasterizationCache"] = None) -> "RasterizerSession":
+        """Open a session that keeps PDFs open until closed.
 
         Args:
-            pdf_path: Path to PDF file
-            page_range: Optional (start, end) page indices (0-based, inclusive)
-
-        Returns:
-            List of PIL Images, one per page
-
-        Raises:
-            RasterizationError: If PDF cannot be opened or rasterized
+            cache: Page cache for this session (default: the rasterizer's cache)
         """
-        if fitz is None:
-            raise RasterizationError(
-                "PyMuPDF (fitz) is required for rasterization but is not installed."
-            )
-        if not pdf_path.exists():
-            raise RasterizationError(f"PDF not found: {pdf_path}")
+        return RasterizerSession(self, cache=cache if cache is not None else self.cache)
 
-        try:
-            doc = fitz.open(pdf_path)
-            logger.info(f"Opened PDF: {pdf_path.name} ({len(doc)} pages)")
-        except Exception as e:
-            raise RasterizationError(f"Failed to open PDF {pdf_path}: {e}")
+    def matrix(self, dpi: Optional[int] = None):
+        """Page-to-pixel transform for ``dpi`` (default: the rasterizer's DPI)."""
+        zoom = (dpi or self.dpi) / 72.0
+        return fitz.Matrix(zoom, zoom)
 
-        images = []
+    def render_pixmap(self, page, dpi: Optional[int] = None, clip=None):
+        """Render one ``fitz.Page`` (or the ``clip`` rect of it, in points) to a pixmap."""
+        return page.get_pixmap(matrix=self.matrix(dpi), alpha=self.alpha, clip=clip)
 
-        # Determine page range
-        start_page = page_range[0] if page_range else 0
-        end_page = page_range[1] + 1 if page_range else len(doc)
+    def to_image(self, pix) -> Image.Image:
+        """Convert a pixmap to a PIL image in the configured colorspace."""
+        img = Image.frombytes(
+            "RGBA" if self.alpha else "RGB",
+            [pix.width, pix.height],
+            pix.samples
+        )
 
-        # Create transformation matrix for zoom
-        mat = fitz.Matrix(self.zoom, self.zoom)
+        # Convert to target colorspace if needed
+        if self.colorspace != img.mode:
+            img = img.convert(self.colorspace)
 
-        try:
-            for page_num in range(start_page, end_page):
-                if page_num >= len(doc):
-                    logger.warning(f"Page {page_num} out of range, stopping")
-                    break
+        return img
 
-                page = doc[page_num]
+    def render_page(self, page) -> Image.Image:
+        """Render one ``fitz.Page`` to a PIL image in the configured colorspace."""
+        return self.to_image(self.render_pixmap(page))
 
-                # Render page to pixmap
-                pix = page.get_pixmap(
-                    matrix=mat,
-                    alpha=self.alpha
-                )
+    def iter_pdf(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Image.Image]:
+        """Yield pages (or a range) of a PDF one at a time.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_range: Optional (start, end) page indices (0-based, inclusive)
 
-                # Convert to PIL Image
-                img = Image.frombytes(
-                    "RGBA" if self.alpha else "RGB",
-                    [pix.width, pix.height],
-                    pix.samples
-                )
+        Yields:
+            PIL Image per page
 
-                # Convert to target colorspace if needed
-                if self.colorspace != img.mode:
-                    img = img.convert(self.colorspace)
+        Raises:
+            RasterizationError: If PDF cannot be opened or rasterized
+        """
+        with self.session() as pages:
+            yield from pages.iter_pages(pdf_path, page_range)
 
-                images.append(img)
+    def rasterize_pdf(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None
+    ) -> List[Image.Image]:
+        """Rasterize all pages (or range) of PDF to images.
 
-                logger.debug(
-                    f"Rasterized page {page_num}: {img.size[0]}x{img.size[1]} "
-                    f"({img.mode})"
-                )
+        Prefer ``iter_pdf`` or a session for long documents: this keeps
+        every page in memory.
 
-        except Exception as e:
-            raise RasterizationError(f"Failed to rasterize page {page_num}: {e}")
+        Args:
+            pdf_path: Path to PDF file
+            page_range: Optional (start, end) page indices (0-based, inclusive)
 
-        finally:
-            doc.close()
+        Returns:
+            List of PIL Images, one per page
 
+        Raises:
+            RasterizationError: If PDF cannot be opened or rasterized
+        """
+        images = list(self.iter_pdf(pdf_path, page_range))
         logger.info(f"Rasterized {len(images)} pages from {pdf_path.name}")
         return images
 
@@ -148,12 +173,8 @@ class PDFRasterizer:
         Returns:
             PIL Image of the page
         """
-        images = self.rasterize_pdf(pdf_path, page_range=(page_num, page_num))
-
-        if not images:
-            raise RasterizationError(f"Failed to rasterize page {page_num}")
-
-        return images[0]
+        with self.session() as pages:
+            return pages.rasterize_page(pdf_path, page_num)
 
     def get_page_dimensions(self, pdf_path: Path) -> List[Tuple[float, float]]:
         """Get dimensions of all pages in PDF.
@@ -204,11 +225,152 @@ class PDFRasterizer:
             raise RasterizationError(f"Failed to get page count: {e}")
 
 
+class RasterizerSession:
+    """Render pages of several PDFs, opening each file only once.
+
+    Documents stay open until ``close()`` (or the end of a ``with`` block).
+    When a cache is attached, pages are looked up by the SHA-256 of the
+    file, so a rewritten file at the same path is never served stale pages.
+    """
+
+    def __init__(self, rasterizer: PDFRasterizer, cache: Optional["RasterizationCache"] = None):
+        self.rasterizer = rasterizer
+        self.cache = cache
+        self._documents: Dict[Path, object] = {}
+        self._hashes: Dict[Path, str] = {}
+
+    def __enter__(self) -> "RasterizerSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def document(self, pdf_path: Path):
+        """Open ``pdf_path`` (once per session) and return the ``fitz.Document``."""
+        key = Path(pdf_path).resolve()
+        doc = self._documents.get(key)
+        if doc is not None:
+            return doc
+
+        if fitz is None:
+            raise RasterizationError(
+                "PyMuPDF (fitz) is required for rasterization but is not installed."
+            )
+        if not key.exists():
+            raise RasterizationError(f"PDF not found: {pdf_path}")
+        try:
+            doc = fitz.open(key)
+        except Exception as e:
+            raise RasterizationError(f"Failed to open PDF {pdf_path}: {e}")
+
+        logger.info(f"Opened PDF: {key.name} ({len(doc)} pages)")
+        self._documents[key] = doc
+        return doc
+
+    def page_count(self, pdf_path: Path) -> int:
+        return len(self.document(pdf_path))
+
+    def rasterize_page(self, pdf_path: Path, page_num: int) -> Image.Image:
+        """Render page ``page_num`` (0-based), from the cache when possible."""
+        page = self._page(pdf_path, page_num)
+
+        cache_key = self._cache_key(pdf_path, page_num) if self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(*cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            img = self.rasterizer.render_page(page)
+        except Exception as e:
+            raise RasterizationError(f"Failed to rasterize page {page_num}: {e}")
+
+        logger.debug(
+            f"Rasterized page {page_num}: {img.size[0]}x{img.size[1]} "
+            f"({img.mode})"
+        )
+        if cache_key is not None:
+            self.cache.put(*cache_key, img)
+        return img
+
+    def page_pixel_size(
+        self, pdf_path: Path, page_num: int, dpi: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """(width, height) of the page rendered at ``dpi``, without rendering it."""
+        irect = (self._page(pdf_path, page_num).rect * self.rasterizer.matrix(dpi)).irect
+        return irect.width, irect.height
+
+    def rasterize_region(
+        self,
+        pdf_path: Path,
+        page_num: int,
+        *,
+        dpi: Optional[int] = None,
+        box: Optional[Tuple[int, int, int, int]] = None,
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Render a page, or the pixel ``box`` (x0, y0, x1, y1) of it, uncached.
+
+        ``box`` is in pixels at ``dpi``. MuPDF may round the region
+        outwards, so the offset of the returned image within the full page
+        is returned alongside it.
+
+        Returns:
+            (image, (x, y)) where (x, y) is the image's top-left pixel
+        """
+        page = self._page(pdf_path, page_num)
+        clip = None
+        if box is not None:
+            clip = fitz.Rect(box) * ~self.rasterizer.matrix(dpi)
+        try:
+            pix = self.rasterizer.render_pixmap(page, dpi=dpi, clip=clip)
+        except Exception as e:
+            raise RasterizationError(f"Failed to rasterize page {page_num}: {e}")
+        return self.rasterizer.to_image(pix), (pix.x, pix.y)
+
+    def iter_pages(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Image.Image]:
+        """Yield pages lazily; ``page_range`` is (start, end), 0-based and inclusive."""
+        page_count = self.page_count(pdf_path)
+        start_page = page_range[0] if page_range else 0
+        end_page = page_range[1] + 1 if page_range else page_count
+
+        for page_num in range(start_page, end_page):
+            if page_num >= page_count:
+                logger.warning(f"Page {page_num} out of range, stopping")
+                break
+            yield self.rasterize_page(pdf_path, page_num)
+
+    def close(self) -> None:
+        for doc in self._documents.values():
+            doc.close()
+        self._documents.clear()
+
+    def _page(self, pdf_path: Path, page_num: int):
+        doc = self.document(pdf_path)
+        if not 0 <= page_num < len(doc):
+            raise RasterizationError(
+                f"Page {page_num} out of range for {Path(pdf_path).name} ({len(doc)} pages)"
+            )
+        return doc[page_num]
+
+    def _cache_key(self, pdf_path: Path, page_num: int) -> Tuple[str, int, int, str]:
+        key = Path(pdf_path).resolve()
+        file_hash = self._hashes.get(key)
+        if file_hash is None:
+            file_hash = self._hashes[key] = _file_sha256(key)
+        mode = f"{self.rasterizer.colorspace}{'+alpha' if self.rasterizer.alpha else ''}"
+        return file_hash, page_num, self.rasterizer.dpi, mode
+
+
 class RasterizationCache:
-    """Cache for rasterized PDF pages to avoid repeated rendering.
+    """Byte-bounded LRU cache of rasterized PDF pages.
 
-    Useful when comparing the same PDF multiple times or when doing
-    incremental comparisons.
+    Entries are keyed by ``(file hash, page, dpi, mode)``; when a new page
+    does not fit, the least recently used pages are evicted one by one.
+    Safe to share between threads.
     """
 
     def __init__(self, max_cache_size_mb: int = 500):
@@ -217,58 +379,88 @@ class RasterizationCache:
         Args:
             max_cache_size_mb: Maximum cache size in megabytes
         """
-        self._cache = {}
+        self._cache: "OrderedDict[Tuple[str, int, int, str], Tuple[Image.Image, int]]" = OrderedDict()
         self._cache_size = 0
+        self._lock = threading.Lock()
         self.max_cache_size = max_cache_size_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._cache_size
 
     def get(
         self,
-        pdf_path: Path,
+        file_hash: str,
         page_num: int,
-        dpi: int
+        dpi: int,
+        mode: str = "RGB"
     ) -> Optional[Image.Image]:
         """Get cached image if available.
 
         Args:
-            pdf_path: Path to PDF
+            file_hash: SHA-256 of the PDF bytes
             page_num: Page number
             dpi: DPI used for rasterization
+            mode: Output colorspace of the rasterizer
 
         Returns:
             Cached image or None
         """
-        key = (str(pdf_path), page_num, dpi)
-        return self._cache.get(key)
+        key = (file_hash, page_num, dpi, mode)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[0]
 
     def put(
         self,
-        pdf_path: Path,
+        file_hash: str,
         page_num: int,
         dpi: int,
+        mode: str,
         image: Image.Image
     ):
-        """Add image to cache.
+        """Add image to cache, evicting least recently used pages if needed.
 
         Args:
-            pdf_path: Path to PDF
+            file_hash: SHA-256 of the PDF bytes
             page_num: Page number
             dpi: DPI used for rasterization
+            mode: Output colorspace of the rasterizer
             image: Rasterized image
         """
-        key = (str(pdf_path), page_num, dpi)
+        key = (file_hash, page_num, dpi, mode)
+        image_size = image.size[0] * image.size[1] * len(image.getbands())
+        if image_size > self.max_cache_size:
+            logger.debug(f"Page {page_num} ({image_size} bytes) exceeds raster cache size")
+            return
 
-        # Estimate image size in bytes
-        image_size = image.size[0] * image.size[1] * len(image.mode)
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_size -= previous[1]
 
-        # Check if adding would exceed cache size
-        if self._cache_size + image_size > self.max_cache_size:
-            self.clear()
+            while self._cache and self._cache_size + image_size > self.max_cache_size:
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self._cache_size -= evicted_size
+                self.evictions += 1
 
-        self._cache[key] = image
-        self._cache_size += image_size
+            self._cache[key] = (image, image_size)
+            self._cache_size += image_size
 
     def clear(self):
         """Clear entire cache."""
-        self._cache.clear()
-        self._cache_size = 0
+        with self._lock:
+            self._cache.clear()
+            self._cache_size = 0
         logger.debug("Rasterization cache cleared")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
@@ -10,18 +14,23 @@ import numpy as np
 from PIL import Image
 
 from kps.core import Asset, AssetLedger
+from kps.utils import page_chunks
 
 from .constants import (
     RECOMMEND_VISUAL_REVIEW,
     VISUAL_DIFF_MAX_RATIO,
     VISUAL_DIFF_MIN_COVERAGE,
     VISUAL_DIFF_PIXEL_THRESHOLD,
+    VISUAL_DIFF_PREVIEW_DPI,
+    VISUAL_DIFF_TILE_SIZE,
     WARNING_LOW_MASK_COVERAGE,
 )
 from .mask_generator import MaskGenerator
-from .rasterizer import PDFRasterizer
+from .rasterizer import PDFRasterizer, RasterizationCache
 from . import image_utils
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class VisualDiffMetrics:
@@ -44,10 +53,24 @@ class VisualDiffReport:
     warnings: List[str]
     recommendations: List[str]
     diff_image: Optional[Image.Image] = None
+    diff_path: Optional[Path] = None  # PNG written to diff_dir
 
 
 class VisualDiffer:
-    """Compare rendered PDF pages while focusing on asset regions."""
+    """Compare rendered PDF pages while focusing on asset regions.
+
+    With ``tiered=True`` PDF pages are first compared at
+    ``preview_dpi``; identical previews mean an unchanged page and no
+    full-resolution render. Otherwise only the ``tile_size`` tiles whose
+    preview differs are rendered at full DPI (same clip for both PDFs) and
+    diffed. Diff images always need the full comparison.
+
+    Tiered metrics are a lower bound of the full comparison: changes too
+    small to alter any preview pixel (e.g. sub-point text shifts) are not
+    counted. Such changes are spread thinly over the page, so pass/fail at
+    the usual thresholds is unaffected in practice, but pixel counts are not
+    exact; the default full comparison keeps them exact.
+    """
 
     def __init__(
         self,
@@ -57,12 +80,20 @@ class VisualDiffer:
         min_mask_coverage: float = VISUAL_DIFF_MIN_COVERAGE,
         rasterizer: Optional[PDFRasterizer] = None,
         mask_generator: Optional[MaskGenerator] = None,
+        workers: int = 1,
+        tiered: bool = False,
+        preview_dpi: int = VISUAL_DIFF_PREVIEW_DPI,
+        tile_size: int = VISUAL_DIFF_TILE_SIZE,
     ) -> None:
         self.pixel_threshold = pixel_threshold
         self.diff_threshold = diff_threshold
         self.min_mask_coverage = min_mask_coverage
         self.rasterizer = rasterizer or PDFRasterizer(dpi=200, colorspace="RGB")
         self.mask_generator = mask_generator or MaskGenerator()
+        self.workers = max(1, int(workers))
+        self.tiered = tiered
+        self.preview_dpi = preview_dpi
+        self.tile_size = max(1, int(tile_size))
 
     def compare_images(
         self,
@@ -96,11 +127,7 @@ class VisualDiffer:
             )
             return metrics, diff_image
 
-        src_arr = np.array(aligned_source.convert("RGB"), dtype=np.float32)
-        tgt_arr = np.array(aligned_target.convert("RGB"), dtype=np.float32)
-
-        pixel_deltas = np.abs(src_arr - tgt_arr)
-        channel_max = pixel_deltas.max(axis=2)
+        channel_max = _channel_delta(aligned_source, aligned_target)
 
         masked_deltas = channel_max[mask_bool]
         differing_pixels = int(
@@ -136,25 +163,54 @@ class VisualDiffer:
         *,
         return_diff_image: bool = False,
         mask_dilation: Optional[int] = None,
+        pages=None,
     ) -> VisualDiffReport:
-        """Rasterize and compare a single page from two PDFs."""
+        """Rasterize and compare a single page from two PDFs.
+
+        ``pages`` is an open rasterizer session (see ``compare_documents``);
+        without it a session is opened just for this page.
+        """
+
+        if pages is None:
+            with self._open_session(None) as session:
+                return self.compare_pdf_pages(
+                    source_pdf,
+                    target_pdf,
+                    page_index,
+                    assets,
+                    page_size,
+                    return_diff_image=return_diff_image,
+                    mask_dilation=mask_dilation,
+                    pages=session,
+                )
 
-        source_image = self.rasterizer.rasterize_page(source_pdf, page_index)
-        target_image = self.rasterizer.rasterize_page(target_pdf, page_index)
+        tiered = None
+        if self.tiered and not return_diff_image and hasattr(pages, "rasterize_region"):
+            tiered = self._compare_tiered(
+                source_pdf, target_pdf, page_index, assets, page_size, pages, mask_dilation
+            )
 
-        mask = self.mask_generator.generate_page_mask(
-            list(assets),
-            source_image.size,
-            page_size,
-            dilation=mask_dilation,
-        )
+        if tiered is not None:
+            metrics, image_size = tiered
+            diff_image = None
+        else:
+            source_image = pages.rasterize_page(source_pdf, page_index)
+            target_image = pages.rasterize_page(target_pdf, page_index)
+            image_size = source_image.size
 
-        metrics, diff_image = self.compare_images(
-            source_image,
-            target_image,
-            mask,
-            generate_diff_image=return_diff_image,
-        )
+            mask = self.mask_generator.generate_page_mask(
+                list(assets),
+                source_image.size,
+                page_size,
+                dilation=mask_dilation,
+            )
+
+            metrics, diff_image = self.compare_images(
+                source_image,
+                target_image,
+                mask,
+                generate_diff_image=return_diff_image,
+            )
 
         warnings: List[str] = []
         recommendations: List[str] = []
@@ -162,9 +218,7 @@ class VisualDiffer:
         if metrics.total_mask_pixels == 0:
             warnings.append("Mask contained no pixels; diff ratio set to 0.0")
         else:
-            coverage = metrics.total_mask_pixels / (
-                source_image.size[0] * source_image.size[1]
-            )
+            coverage = metrics.total_mask_pixels / (image_size[0] * image_size[1])
             if coverage < self.min_mask_coverage:
                 warnings.append(
                     f"{WARNING_LOW_MASK_COVERAGE}: {coverage:.4f} (min {self.min_mask_coverage:.4f})"
@@ -191,26 +245,230 @@ class VisualDiffer:
         *,
         return_diff_images: bool = False,
         mask_dilation: Optional[int] = None,
+        cache: Optional[RasterizationCache] = None,
+        diff_dir: Optional[Path] = None,
     ) -> Tuple[bool, List[VisualDiffReport]]:
-        """Run the visual diff across all pages described by a ledger."""
+        """Run the visual diff across all pages described by a ledger.
+
+        Both PDFs are opened once for the whole comparison and pages are
+        rendered one at a time; ``cache`` (or the rasterizer's own cache)
+        keeps rendered pages for later comparisons of the same files.
+
+        With ``workers > 1`` contiguous page ranges are compared in worker
+        processes, each opening its own copies of the PDFs. Workers send
+        back metrics only: diff images are then available solely as PNGs
+        in ``diff_dir`` (``report.diff_path``), never as ``diff_image``.
+        Reports are always in page order.
+        """
+
+        page_jobs = [
+            (page_index, list(ledger.by_page(page_index)), page_size)
+            for page_index, page_size in enumerate(page_dimensions)
+        ]
+
+        if self.workers > 1 and len(page_jobs) > 1:
+            if isinstance(self.rasterizer, PDFRasterizer):
+                reports = self._compare_parallel(
+                    source_pdf,
+                    target_pdf,
+                    page_jobs,
+                    write_diffs=return_diff_images,
+                    diff_dir=diff_dir,
+                    mask_dilation=mask_dilation,
+                )
+                return all(report.passed for report in reports), reports
+            logger.debug("Custom rasterizer cannot be shipped to workers; comparing serially")
 
-        reports: List[VisualDiffReport] = []
+        with self._open_session(cache) as pages:
+            reports = self._compare_page_jobs(
+                source_pdf,
+                target_pdf,
+                page_jobs,
+                pages,
+                return_diff_images=return_diff_images,
+                diff_dir=diff_dir,
+                mask_dilation=mask_dilation,
+            )
+
+        overall_passed = all(report.passed for report in reports)
+        return overall_passed, reports
 
-        for page_index, page_size in enumerate(page_dimensions):
-            page_assets = ledger.by_page(page_index)
+    def _compare_page_jobs(
+        self,
+        source_pdf: Path,
+        target_pdf: Path,
+        page_jobs: Sequence[Tuple[int, List[Asset], Tuple[float, float]]],
+        pages,
+        *,
+        return_diff_images: bool,
+        diff_dir: Optional[Path],
+        mask_dilation: Optional[int],
+    ) -> List[VisualDiffReport]:
+        reports: List[VisualDiffReport] = []
+        for page_index, page_assets, page_size in page_jobs:
             report = self.compare_pdf_pages(
                 source_pdf,
                 target_pdf,
                 page_index,
                 page_assets,
                 page_size,
-                return_diff_image=return_diff_images,
+                return_diff_image=return_diff_images or diff_dir is not None,
                 mask_dilation=mask_dilation,
+                pages=pages,
             )
+            if diff_dir is not None and report.diff_image is not None:
+                report.diff_path = _write_diff_png(report.diff_image, diff_dir, page_index)
+                if not return_diff_images:
+                    report.diff_image = None
             reports.append(report)
+        return reports
 
-        overall_passed = all(report.passed for report in reports)
-        return overall_passed, reports
+    def _compare_parallel(
+        self,
+        source_pdf: Path,
+        target_pdf: Path,
+        page_jobs: Sequence[Tuple[int, List[Asset], Tuple[float, float]]],
+        *,
+        write_diffs: bool,
+        diff_dir: Optional[Path],
+        mask_dilation: Optional[int],
+    ) -> List[VisualDiffReport]:
+        if write_diffs and diff_dir is None:
+            logger.warning("Parallel visual diff returns no diff images; pass diff_dir to keep them")
+
+        worker_differ = self._worker_copy()
+        chunks = page_chunks(len(page_jobs), self.workers)
+        logger.info(
+            f"Comparing {len(page_jobs)} pages in {len(chunks)} ranges "
+            f"with {self.workers} workers"
+        )
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(
+                    _compare_page_range,
+                    worker_differ,
+                    source_pdf,
+                    target_pdf,
+                    page_jobs[start:stop],
+                    diff_dir,
+                    mask_dilation,
+                )
+                for start, stop in chunks
+            ]
+            return [report for future in futures for report in future.result()]
+
+    def _worker_copy(self) -> "VisualDiffer":
+        """Picklable copy for worker processes (fresh rasterizer, no page cache)."""
+        worker = copy.copy(self)
+        worker.rasterizer = PDFRasterizer(
+            dpi=self.rasterizer.dpi,
+            colorspace=self.rasterizer.colorspace,
+            alpha=self.rasterizer.alpha,
+        )
+        worker.workers = 1
+        return worker
+
+    def _compare_tiered(
+        self,
+        source_pdf: Path,
+        target_pdf: Path,
+        page_index: int,
+        assets: Sequence[Asset],
+        page_size: Tuple[float, float],
+        pages,
+        mask_dilation: Optional[int],
+    ) -> Optional[Tuple[VisualDiffMetrics, Tuple[int, int]]]:
+        """Preview first, then full DPI inside dirty tiles; None when sizes differ."""
+
+        image_size = pages.page_pixel_size(source_pdf, page_index)
+        if pages.page_pixel_size(target_pdf, page_index) != image_size:
+            return None
+
+        mask = self.mask_generator.generate_page_mask(
+            list(assets), image_size, page_size, dilation=mask_dilation
+        )
+        mask_bool = self._prepare_mask(mask, image_size) > 0
+        total_mask_pixels = int(mask_bool.sum())
+
+        differing_pixels = 0
+        delta_sum = 0
+        max_difference = 0
+        if total_mask_pixels:
+            source_preview, _ = pages.rasterize_region(source_pdf, page_index, dpi=self.preview_dpi)
+            target_preview, _ = pages.rasterize_region(target_pdf, page_index, dpi=self.preview_dpi)
+            if source_preview.size != target_preview.size:
+                return None
+            preview_delta = _channel_delta(source_preview, target_preview)
+
+            for box in self._dirty_boxes(preview_delta, mask_bool):
+                source_region, offset = pages.rasterize_region(source_pdf, page_index, box=box)
+                target_region, _ = pages.rasterize_region(target_pdf, page_index, box=box)
+                delta = _channel_delta(source_region, target_region)
+                x0, y0 = max(offset[0], 0), max(offset[1], 0)
+                x1 = min(offset[0] + delta.shape[1], image_size[0])
+                y1 = min(offset[1] + delta.shape[0], image_size[1])
+                # Only the tile itself: MuPDF may round the clip outwards
+                x0, y0, x1, y1 = max(x0, box[0]), max(y0, box[1]), min(x1, box[2]), min(y1, box[3])
+                masked = delta[y0 - offset[1]:y1 - offset[1], x0 - offset[0]:x1 - offset[0]][
+                    mask_bool[y0:y1, x0:x1]
+                ]
+                if masked.size:
+                    differing_pixels += int(np.count_nonzero(masked > self.pixel_threshold))
+                    delta_sum += int(masked.sum(dtype=np.uint64))
+                    max_difference = max(max_difference, int(masked.max()))
+
+        metrics = VisualDiffMetrics(
+            diff_ratio=differing_pixels / total_mask_pixels if total_mask_pixels else 0.0,
+            differing_pixels=differing_pixels,
+            total_mask_pixels=total_mask_pixels,
+            pixel_threshold=self.pixel_threshold,
+            mean_difference=delta_sum / total_mask_pixels if total_mask_pixels else 0.0,
+            max_difference=float(max_difference),
+        )
+        return metrics, image_size
+
+    def _dirty_boxes(
+        self, preview_delta: np.ndarray, mask_bool: np.ndarray
+    ) -> List[Tuple[int, int, int, int]]:
+        """Full-resolution pixel boxes of masked tiles whose preview differs.
+
+        Adjacent dirty tiles of one tile row are merged into a single box.
+        """
+        if not preview_delta.any():
+            return []
+
+        height, width = mask_bool.shape
+        scale_y = preview_delta.shape[0] / height
+        scale_x = preview_delta.shape[1] / width
+        tile = self.tile_size
+        boxes: List[Tuple[int, int, int, int]] = []
+        for y0 in range(0, height, tile):
+            y1 = min(y0 + tile, height)
+            # One preview pixel of margin: antialiasing spreads changes
+            py0 = max(int(y0 * scale_y) - 1, 0)
+            py1 = int(np.ceil(y1 * scale_y)) + 1
+            run_start = None
+            for x0 in range(0, width + tile, tile):
+                dirty = False
+                if x0 < width:
+                    x1 = min(x0 + tile, width)
+                    px0 = max(int(x0 * scale_x) - 1, 0)
+                    px1 = int(np.ceil(x1 * scale_x)) + 1
+                    dirty = bool(
+                        mask_bool[y0:y1, x0:x1].any() and preview_delta[py0:py1, px0:px1].any()
+                    )
+                if dirty and run_start is None:
+                    run_start = x0
+                elif not dirty and run_start is not None:
+                    boxes.append((run_start, y0, min(x0, width), y1))
+                    run_start = None
+        return boxes
+
+    def _open_session(self, cache: Optional[RasterizationCache]):
+        # Rasterizers without sessions (e.g. test stubs) render page by page
+        if not hasattr(self.rasterizer, "session"):
+            return nullcontext(self.rasterizer)
+        return self.rasterizer.session(cache=cache)
 
     @staticmethod
     def _prepare_mask(mask: np.ndarray, image_size: Tuple[int, int]) -> np.ndarray:
@@ -243,3 +501,39 @@ class VisualDiffer:
         overlay[highlight_mask] = np.array([255, 0, 255], dtype=np.uint8)
 
         return Image.fromarray(overlay, mode="RGB")
+
+
+def _channel_delta(source: Image.Image, target: Image.Image) -> np.ndarray:
+    """Per-pixel max channel difference in uint8 (no float copies of the page)."""
+    src_arr = np.asarray(source.convert("RGB"), dtype=np.uint8)
+    tgt_arr = np.asarray(target.convert("RGB"), dtype=np.uint8)
+    return (np.maximum(src_arr, tgt_arr) - np.minimum(src_arr, tgt_arr)).max(axis=2)
+
+
+def _write_diff_png(image: Image.Image, diff_dir: Path, page_index: int) -> Path:
+    diff_dir = Path(diff_dir)
+    diff_dir.mkdir(parents=True, exist_ok=True)
+    path = diff_dir / f"page-{page_index + 1:04d}.png"
+    image.save(path, format="PNG")
+    return path
+
+
+def _compare_page_range(
+    differ: VisualDiffer,
+    source_pdf: Path,
+    target_pdf: Path,
+    page_jobs: Sequence[Tuple[int, List[Asset], Tuple[float, float]]],
+    diff_dir: Optional[Path],
+    mask_dilation: Optional[int],
+) -> List[VisualDiffReport]:
+    """Worker: compare a page range with its own open documents; no images are returned."""
+    with differ.rasterizer.session() as pages:
+        return differ._compare_page_jobs(
+            source_pdf,
+            target_pdf,
+            page_jobs,
+            pages,
+            return_diff_images=False,
+            diff_dir=diff_dir,
+            mask_dilation=mask_dilation,
+        )
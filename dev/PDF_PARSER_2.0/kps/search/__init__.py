@@ -4,12 +4,15 @@ Search module for hybrid retrieval and context compression.
 Provides:
 - Hybrid search (BM25 + vector similarity)
 - Context compression for LLM prompts
+- BK-tree index for metric nearest-neighbour lookups
 """
 
+from .bk_tree import BKTree
 from .hybrid import hybrid_search
 from .snippets import compress_segments
 
 __all__ = [
+    "BKTree",
     "hybrid_search",
     "compress_segments",
 ]
@@ -0,0 +1,131 @@
+"""
+Burkhard–Keller tree over any integer metric.
+
+A BK-tree arranges keys by their distance to each node, so range and
+nearest-neighbour queries only visit the branches allowed by the triangle
+inequality instead of comparing the query with every key. The glossary
+fuzzy index uses it with edit distance over terms, the QA asset index with
+Hamming distance over perceptual hashes.
+
+Example:
+    >>> tree = BKTree(lambda a, b: (a ^ b).bit_count())
+    >>> tree.add(0b1010, "a")
+    >>> tree.add(0b0110, "b")
+    >>> tree.nearest(0b1011, 1)
+    [(1, 'a')]
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _Node(Generic[K, V]):
+    __slots__ = ("key", "items", "children")
+
+    def __init__(self, key: K, item: V):
+        self.key = key
+        self.items: List[V] = [item]
+        self.children: Dict[int, _Node[K, V]] = {}
+
+
+class BKTree(Generic[K, V]):
+    """
+    BK-tree mapping keys to items under ``distance``.
+
+    ``distance`` must be a metric with integer values. Items whose keys are
+    at distance 0 share one node, in insertion order.
+    """
+
+    def __init__(self, distance: Callable[[K, K], int]):
+        self.distance = distance
+        self._root: Optional[_Node[K, V]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: K, item: V) -> None:
+        """Insert ``item`` under ``key``."""
+        self._size += 1
+        if self._root is None:
+            self._root = _Node(key, item)
+            return
+
+        node = self._root
+        while True:
+            distance = self.distance(key, node.key)
+            if distance == 0:
+                node.items.append(item)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(key, item)
+                return
+            node = child
+
+    def search(self, query: K, max_distance: int) -> List[Tuple[int, V]]:
+        """
+        Items whose keys are within ``max_distance`` of ``query``.
+
+        Returns:
+            (distance, item) pairs in tree order
+        """
+        if self._root is None:
+            return []
+
+        found: List[Tuple[int, V]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = self.distance(query, node.key)
+            if distance <= max_distance:
+                found.extend((distance, item) for item in node.items)
+            low, high = distance - max_distance, distance + max_distance
+            for edge, child in node.children.items():
+                if low <= edge <= high:
+                    stack.append(child)
+
+        return found
+
+    def nearest(self, query: K, k: int) -> List[Tuple[int, V]]:
+        """
+        The ``k`` items closest to ``query``.
+
+        Every subtree whose edge distance cannot beat the current k-th best
+        is pruned, so lookups touch a small part of the tree.
+
+        Returns:
+            (distance, item) pairs, closest first; ties in traversal order
+        """
+        if self._root is None or k <= 0:
+            return []
+
+        # Max-heap of the best k: (-distance, -order, item)
+        best: List[Tuple[int, int, V]] = []
+        order = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = self.distance(query, node.key)
+            for item in node.items:
+                entry = (-distance, -order, item)
+                order += 1
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+            bound = -best[0][0] if len(best) == k else None
+            for edge, child in node.children.items():
+                if bound is None or abs(edge - distance) <= bound:
+                    stack.append(child)
+
+        return [(-neg_distance, item) for neg_distance, _, item in sorted(best, reverse=True)]
+
+
+__all__ = ["BKTree"]
@@ -21,12 +21,14 @@ def _embedding(client, text: str) -> List[float]:
     Generate embedding for text using OpenAI.
 
     Args:
-        client: OpenAI client
+        client: EmbeddingsClient (uses its embedding cache) or raw OpenAI client
         text: Text to embed
 
     Returns:
         384-dimensional embedding vector
     """
+    if hasattr(client, "create_vectors"):
+        return client.create_vectors([text])[0]
     response = client.embeddings.create(model=EMB_MODEL, input=text)
     return response.data[0].embedding
 
@@ -36,6 +38,7 @@ def hybrid_search(
     query: str,
     k: int = 12,
     alpha: float = 0.5,
+    embedding_client=None,
 ) -> List[Dict]:
     """
     Hybrid search combining BM25 and vector similarity.
@@ -45,6 +48,8 @@ def hybrid_search(
         query: Search query
         k: Number of results to return
         alpha: Weight for BM25 (0.0 = pure vector, 1.0 = pure BM25, 0.5 = balanced)
+        embedding_client: Optional EmbeddingsClient; pass one with an
+            EmbeddingCache to reuse query vectors across searches
 
     Returns:
         List of search results with scores
@@ -65,14 +70,15 @@ def hybrid_search(
     except ImportError:
         raise RuntimeError("psycopg2 not installed. Install with: pip install psycopg2-binary")
 
-    try:
-        from openai import OpenAI
-    except ImportError:
-        raise RuntimeError("openai not installed. Install with: pip install openai")
+    if embedding_client is None:
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise RuntimeError("openai not installed. Install with: pip install openai")
+        embedding_client = OpenAI()
 
     # Generate query embedding
-    client = OpenAI()
-    qvec = _embedding(client, query)
+    qvec = _embedding(embedding_client, query)
 
     conn = psycopg2.connect(db_url)
     cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
@@ -0,0 +1,110 @@
+"""Startup profiling: import time per KPS subsystem and component init times.
+
+Heavy dependencies (Docling models, embeddings, semantic memory) are loaded
+on first use, so a cold ``kps translate`` of a cached document only pays
+for what it touches. This module makes that cost visible:
+
+    profile = profile_imports()  # in a fresh interpreter
+    print(profile.format())
+
+``UnifiedPipeline.startup_profile`` fills ``components`` with the time each
+lazily built component took on first access.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+
+# Subsystem → modules importing it; order matters, see profile_imports
+SUBSYSTEMS: Dict[str, Tuple[str, ...]] = {
+    "core": ("kps.core.document", "kps.core.bbox"),
+    "extraction": ("kps.extraction",),
+    "clients": ("kps.clients.embeddings", "kps.clients.embedding_cache"),
+    "translation": ("kps.translation",),
+    "knowledge": ("kps.knowledge",),
+    "qa": ("kps.qa.pipeline", "kps.qa.translation_qa"),
+    "export": ("kps.export",),
+    "indesign": ("kps.indesign.idml_handler", "kps.indesign.style_manager"),
+    "pipeline": ("kps.core.unified_pipeline",),
+    "docling": ("docling.document_converter",),
+}
+
+
+@dataclass
+class StartupProfile:
+    """Seconds spent importing subsystems and building pipeline components."""
+
+    imports: Dict[str, float] = field(default_factory=dict)  # subsystem → seconds
+    components: Dict[str, float] = field(default_factory=dict)  # component → seconds
+    errors: Dict[str, str] = field(default_factory=dict)  # subsystem → import error
+
+    @property
+    def import_seconds(self) -> float:
+        return sum(self.imports.values())
+
+    @property
+    def component_seconds(self) -> float:
+        return sum(self.components.values())
+
+    def record_component(self, name: str, seconds: float) -> None:
+        self.components[name] = self.components.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Dict[str, object]]:
+        return {
+            "imports": dict(self.imports),
+            "components": dict(self.components),
+            "errors": dict(self.errors),
+        }
+
+    def format(self) -> str:
+        """Human-readable table, slowest entries first."""
+        lines = []
+        for title, timings in (("Imports", self.imports), ("Components", self.components)):
+            if not timings:
+                continue
+            lines.append(f"{title} ({sum(timings.values()) * 1000:.0f} ms):")
+            for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+                lines.append(f"  {name:<14} {seconds * 1000:8.1f} ms")
+        for name, error in self.errors.items():
+            lines.append(f"  {name:<14} unavailable ({error})")
+        return "\n".join(lines)
+
+
+def profile_imports(
+    subsystems: Optional[Dict[str, Sequence[str]]] = None,
+    profile: Optional[StartupProfile] = None,
+) -> StartupProfile:
+    """
+    Import each subsystem in order and time it.
+
+    Times are incremental: a module shared by two subsystems is charged to
+    the first one, and modules already imported cost nothing. Run in a
+    fresh interpreter (``kps startup``) for meaningful numbers.
+
+    Args:
+        subsystems: Subsystem → module names (default: SUBSYSTEMS)
+        profile: Profile to fill (default: a new one)
+
+    Returns:
+        Profile with ``imports`` and ``errors`` filled
+    """
+    profile = profile or StartupProfile()
+    for name, modules in (subsystems or SUBSYSTEMS).items():
+        start = time.perf_counter()
+        try:
+            for module in modules:
+                if module not in sys.modules:
+                    importlib.import_module(module)
+        except Exception as exc:  # noqa: BLE001 - optional subsystems may be missing
+            profile.errors[name] = f"{type(exc).__name__}: {exc}"
+            continue
+        profile.imports[name] = time.perf_counter() - start
+    return profile
+
+
+__all__ = ["SUBSYSTEMS", "StartupProfile", "profile_imports"]
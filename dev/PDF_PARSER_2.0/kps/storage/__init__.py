@@ -0,0 +1,7 @@
+"""Shared storage helpers (pooled SQLite access, bounded caches)."""
+
+from .lru_cache import CacheStats, LRUCache
+from .sqlite import SQLiteDatabase
+from .sqlite_lru import SQLiteLRUStore
+
+__all__ = ["CacheStats", "LRUCache", "SQLiteDatabase", "SQLiteLRUStore"]
@@ -0,0 +1,218 @@
+"""
+Bounded in-process LRU cache with optional TTL.
+
+Used for the hot entries of the translation memories: long-running services
+(``DocumentDaemon``, the UI backend) keep one memory open for days, so the
+cache is capped by entry count and by an estimated byte size, and entries
+can expire after ``ttl_seconds``. Hits, misses and evictions are exported
+through :mod:`kps.metrics` under the cache ``name``.
+
+Usage:
+    cache = LRUCache("semantic", max_entries=10_000, max_bytes=64 << 20)
+    cache[key] = entry
+    entry = cache.get(key)  # refreshes recency
+    print(cache.stats().hit_rate)
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from kps.metrics import record_memory_cache
+
+
+@dataclass
+class CacheStats:
+    """Counters of one cache instance plus its current size."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(MutableMapping):
+    """
+    Dict-like LRU cache bounded by entries, bytes and age.
+
+    Reads through ``cache[key]`` / ``get`` count as hits or misses and
+    refresh recency; ``in``, ``pop`` and iteration (keys, values, items)
+    do neither. Expired entries are
+    dropped lazily and counted as evictions.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Args:
+            name: Metrics label of the cache (e.g. "semantic", "exact")
+            max_entries: Upper bound on entries; None = unbounded
+            max_bytes: Upper bound on estimated size; None = unbounded
+            ttl_seconds: Entry lifetime since it was stored; None = no expiry
+            sizeof: Size estimate of one value (default: ``sys.getsizeof``)
+        """
+        for label, limit in (
+            ("max_entries", max_entries),
+            ("max_bytes", max_bytes),
+            ("ttl_seconds", ttl_seconds),
+        ):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{label} must be positive")
+
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof or sys.getsizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> (value, size, stored_at)
+        self._data: "OrderedDict[Any, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _drop(self, key: Any) -> None:
+        _value, size, _stored_at = self._data.pop(key)
+        self._bytes -= size
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and self._expired(item[2], time.monotonic()):
+                self._drop(key)
+                self.evictions += 1
+                record_memory_cache(self.name, "eviction")
+                item = None
+            if item is None:
+                self.misses += 1
+                record_memory_cache(self.name, "miss")
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            self.hits += 1
+            record_memory_cache(self.name, "hit")
+            return item[0]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (value, size, time.monotonic())
+            self._bytes += size
+            self._evict()
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Remove ``key`` without counting a lookup."""
+        with self._lock:
+            if key in self._data:
+                value = self._data[key][0]
+                self._drop(key)
+                return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and not self._expired(item[2], time.monotonic())
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            self.purge_expired()
+            keys: List[Any] = list(self._data)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until all bounds hold."""
+        evicted = 0
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._data)))
+            evicted += 1
+        if evicted:
+            self.evictions += evicted
+            record_memory_cache(self.name, "eviction", evicted)
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry now; returns how many were dropped."""
+        if self.ttl_seconds is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, item in self._data.items() if self._expired(item[2], now)]
+            for key in expired:
+                self._drop(key)
+            if expired:
+                self.evictions += len(expired)
+                record_memory_cache(self.name, "eviction", len(expired))
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def values(self) -> List[Any]:  # type: ignore[override]
+        """Live values without counting lookups or touching recency."""
+        return list(self.as_dict().values())
+
+    def items(self) -> List[Tuple[Any, Any]]:  # type: ignore[override]
+        """Live (key, value) pairs without counting lookups or touching recency."""
+        return list(self.as_dict().items())
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._data),
+                bytes=self._bytes,
+            )
+
+    def as_dict(self) -> Dict[Any, Any]:
+        """Snapshot of the live (non-expired) entries, LRU first."""
+        with self._lock:
+            self.purge_expired()
+            return {key: item[0] for key, item in self._data.items()}
+
+
+__all__ = ["CacheStats", "LRUCache"]
@@ -0,0 +1,131 @@
+"""
+Pooled SQLite access for the translation memory and the knowledge base.
+
+Instead of ``sqlite3.connect`` / ``close`` around every call, each thread
+keeps one long-lived connection per database file:
+
+- WAL journal mode, so readers never block on a writer (concurrent UI jobs)
+- ``synchronous=NORMAL`` - no fsync per commit, still crash-safe under WAL
+- a per-connection statement cache, so repeated queries are prepared once
+- explicit, nestable transaction scopes: inner scopes join the outer one and
+  only the outermost scope commits
+
+Usage:
+    db = SQLiteDatabase("data/translation_memory.db")
+    row = db.connection().execute("SELECT ...", params).fetchone()
+
+    with db.transaction() as conn:
+        conn.executemany("INSERT ...", rows)
+        conn.execute("UPDATE ...")
+    # one commit here
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteDatabase:
+    """Thread-local connections to one SQLite file with transaction scopes."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        timeout: float = 30.0,
+        synchronous: str = "NORMAL",
+        cached_statements: int = 256,
+    ):
+        """
+        Args:
+            path: Database file (parent directories are created)
+            timeout: Seconds to wait for another writer's lock
+            synchronous: ``PRAGMA synchronous`` value for every connection
+            cached_statements: Prepared statements kept per connection
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.synchronous = synchronous
+        self.cached_statements = cached_statements
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread (opened on first use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        Transaction scope; nested scopes join the outermost one.
+
+        Args:
+            immediate: Take the write lock at BEGIN (``BEGIN IMMEDIATE``).
+                Use False when the scope starts with a write but may spend
+                time before it (e.g. fetching embeddings), so the lock is
+                only held from the first write on.
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        if depth == 0:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth = depth
+            if depth == 0:
+                conn.rollback()
+            raise
+        self._local.depth = depth
+        if depth == 0:
+            conn.commit()
+
+    @property
+    def in_transaction(self) -> bool:
+        """True inside a ``transaction()`` scope of the calling thread."""
+        return getattr(self._local, "depth", 0) > 0
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:  # pragma: no cover - already closed
+                logger.debug("Failed to close SQLite connection", exc_info=True)
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.path),
+            timeout=self.timeout,
+            isolation_level=None,  # explicit BEGIN via transaction()
+            check_same_thread=False,  # close() may run on another thread
+            cached_statements=self.cached_statements,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+
+
+__all__ = ["SQLiteDatabase"]
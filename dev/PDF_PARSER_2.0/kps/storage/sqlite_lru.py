@@ -0,0 +1,293 @@
+"""
+Persistent key -> blob store with LRU eviction on top of ``SQLiteDatabase``.
+
+Backs the on-disk caches (embedding vectors, Docling conversions): each
+entry is an opaque payload with its size and last-use time, and the store
+is bounded by entry count and/or total payload bytes. Reads do not write:
+hits only buffer their ``last_used`` update, which is written with the next
+insert, prune or close, or once ``touch_flush_size`` keys are pending.
+
+Usage:
+    store = SQLiteLRUStore("data/embedding_cache.db", max_entries=200_000)
+    store.put_many([("key", b"payload")])
+    [payload] = store.get_many(["key"])
+    print(store.stats().hit_rate)
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .lru_cache import CacheStats
+from .sqlite import SQLiteDatabase
+
+
+logger = logging.getLogger(__name__)
+
+# Share of the bound freed when the store overflows, so eviction is not
+# triggered again by the very next insert
+EVICTION_HEADROOM = 0.1
+
+# SQLite limit on host parameters per statement is 999 in older builds
+_QUERY_CHUNK = 500
+
+
+class SQLiteLRUStore:
+    """
+    SQLite table of (key, payload, size, last_used) with size-bounded LRU eviction.
+
+    Hit/miss counters cover lookups since the store was opened. A payload
+    that ``decode`` rejects with ``ValueError`` is deleted and counted as a
+    miss.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        touch_flush_size: int = 256,
+    ):
+        """
+        Args:
+            path: SQLite file (created with parent directories if missing)
+            max_entries: Upper bound on stored entries; None = unbounded
+            max_bytes: Upper bound on total payload size; None = unbounded
+            touch_flush_size: Buffered last_used updates written at once
+        """
+        for label, limit in (("max_entries", max_entries), ("max_bytes", max_bytes)):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{label} must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.touch_flush_size = touch_flush_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db = SQLiteDatabase(path)
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}  # key -> last_used not yet written
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used)")
+
+    @property
+    def path(self) -> Path:
+        return self.db.path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count_locked()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def get_many(
+        self, keys: Sequence[str], decode: Callable[[bytes], Any] = bytes
+    ) -> List[Optional[Any]]:
+        """
+        Decoded payloads of ``keys`` (same order, None on a miss).
+
+        Every position counts as one lookup, so repeated keys count repeatedly.
+        """
+        if not keys:
+            return []
+
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        with self._lock:
+            conn = self.db.connection()
+            rows: List[Tuple[str, bytes]] = []
+            for start in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT key, payload FROM entries WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+
+            corrupt = []
+            for key, blob in rows:
+                try:
+                    found[key] = decode(blob)
+                except ValueError as exc:
+                    logger.warning("Dropping unreadable entry %s from %s: %s", key, self.path, exc)
+                    corrupt.append((key,))
+            if corrupt:
+                with self.db.transaction() as tx:
+                    tx.executemany("DELETE FROM entries WHERE key = ?", corrupt)
+
+            if found:
+                self._touched.update(dict.fromkeys(found, time.time()))
+                if len(self._touched) >= self.touch_flush_size:
+                    with self.db.transaction():
+                        self._flush_touched_locked()
+
+            results = [found.get(key) for key in keys]
+            hits = sum(1 for value in results if value is not None)
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def get(self, key: str, decode: Callable[[bytes], Any] = bytes) -> Optional[Any]:
+        return self.get_many([key], decode)[0]
+
+    def put_many(self, items: Sequence[Tuple[str, bytes]]) -> int:
+        """
+        Store (key, payload) pairs and evict if over a bound.
+
+        Returns:
+            Number of evicted entries
+        """
+        if not items:
+            return 0
+
+        now = time.time()
+        rows = [(key, payload, len(payload), now) for key, payload in items]
+        with self._lock, self.db.transaction() as conn:
+            self._flush_touched_locked()
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return self._evict_locked(self.max_entries, self.max_bytes, EVICTION_HEADROOM)
+
+    def prune(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+    ) -> int:
+        """
+        Drop entries unused for ``max_age_seconds`` and shrink to the bounds.
+
+        Args:
+            max_entries: Target entry count; defaults to the configured bound
+            max_bytes: Target size; defaults to the configured bound
+            max_age_seconds: Also drop entries not used for this long
+
+        Returns:
+            Number of evicted entries
+        """
+        with self._lock, self.db.transaction() as conn:
+            self._flush_touched_locked()
+            evicted = 0
+            if max_age_seconds is not None:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE last_used < ?", (time.time() - max_age_seconds,)
+                )
+                evicted += cursor.rowcount
+                self.evictions += cursor.rowcount
+            evicted += self._evict_locked(
+                self.max_entries if max_entries is None else max_entries,
+                self.max_bytes if max_bytes is None else max_bytes,
+                headroom=0.0,
+            )
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self.db.transaction() as conn:
+            self._touched.clear()
+            conn.execute("DELETE FROM entries")
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=self._count_locked(),
+                bytes=self._total_bytes_locked(),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._touched:
+                with self.db.transaction():
+                    self._flush_touched_locked()
+            self.db.close()
+
+    # ------------------------------------------------------------------
+    def _flush_touched_locked(self) -> None:
+        """Write buffered last_used updates (best effort: recency only steers eviction)."""
+        if not self._touched:
+            return
+
+        touched, self._touched = self._touched, {}
+        try:
+            self.db.connection().executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(last_used, key) for key, last_used in touched.items()],
+            )
+        except sqlite3.Error as exc:
+            logger.debug("Skipped last_used update in %s: %s", self.path, exc)
+
+    def _count_locked(self) -> int:
+        return self.db.connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _total_bytes_locked(self) -> int:
+        return (
+            self.db.connection()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM entries")
+            .fetchone()[0]
+        )
+
+    def _evict_locked(
+        self, max_entries: Optional[int], max_bytes: Optional[int], headroom: float
+    ) -> int:
+        conn = self.db.connection()
+        evicted = 0
+
+        if max_entries is not None:
+            count = self._count_locked()
+            if count > max_entries:
+                excess = count - int(max_entries * (1.0 - headroom))
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY last_used, rowid LIMIT ?)",
+                    (excess,),
+                )
+                evicted += excess
+
+        if max_bytes is not None:
+            total = self._total_bytes_locked()
+            if total > max_bytes:
+                target = int(max_bytes * (1.0 - headroom))
+                victims = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM entries ORDER BY last_used, rowid"
+                ).fetchall():
+                    if total <= target:
+                        break
+                    victims.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+                evicted += len(victims)
+
+        if evicted:
+            self.evictions += evicted
+            logger.debug("Evicted %s entries from %s", evicted, self.path)
+        return evicted
+
+
+__all__ = ["EVICTION_HEADROOM", "SQLiteLRUStore"]
@@ -31,6 +31,9 @@ from .structured_translator import (
     StructuredTranslator,
     StructuredTranslationResult,
 )
+from .segment_dedup import DedupPlan, deduplicate_segments
+from .block_manifest import BlockManifest, IncrementalPlan
+from .term_miner import PhraseCandidate, PhraseMiner
 
 # Advanced: Semantic memory with embeddings
 try:
@@ -102,6 +105,15 @@ __all__ = [
     "load_rules_from_glossary",
     "StructuredTranslator",
     "StructuredTranslationResult",
+    # Segment deduplication
+    "DedupPlan",
+    "deduplicate_segments",
+    # Incremental re-translation
+    "BlockManifest",
+    "IncrementalPlan",
+    # Glossary suggestion mining
+    "PhraseCandidate",
+    "PhraseMiner",
     # Core components
     "TranslationOrchestrator",
     "TranslationSegment",
@@ -0,0 +1,216 @@
+"""
+Block-level manifest for incremental re-translation.
+
+A corrected re-upload of a pattern usually changes one or two paragraphs,
+so the whole-file hash of ``manifest.json`` misses. The block manifest
+(``blocks.json`` next to ``manifest.json``) stores a hash per
+``ContentBlock`` and per segment together with the published translations;
+the next version of the same slug copies translations of unchanged blocks
+verbatim and sends only the changed ones to the translator.
+
+Translations are reused only when the source language and translation
+model match the previous version.
+
+Usage:
+    manifest = BlockManifest.build(document, segments, "ru", model="gpt-4o-mini")
+    plan = previous.plan(manifest, segments, "en")
+    result = translator.translate(plan.pending_segments, target_language="en")
+    translations = plan.merge(result.segments)
+    manifest.record("en", segments, translations)
+    manifest.save(published_dir / BLOCK_MANIFEST_NAME)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from kps.core.document import ContentBlock, KPSDocument
+
+from .orchestrator import TranslationSegment
+
+logger = logging.getLogger(__name__)
+
+BLOCK_MANIFEST_NAME = "blocks.json"
+BLOCK_MANIFEST_VERSION = 1
+
+
+def block_hash(block: ContentBlock) -> str:
+    """Content hash of one block (type + text)."""
+    payload = f"{block.block_type.value}\x00{block.content}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def segment_hash(segment: TranslationSegment) -> str:
+    """Content hash of one segment (encoded text + placeholder values)."""
+    placeholders = json.dumps(segment.placeholders or {}, sort_keys=True, ensure_ascii=False)
+    payload = f"{segment.text}\x00{placeholders}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _owner_block(segment_id: str) -> str:
+    """Block id of a segment id in the ``{block_id}.seg{n}`` format."""
+    return segment_id.rsplit(".seg", 1)[0]
+
+
+@dataclass
+class IncrementalPlan:
+    """Segments of one language split into reused translations and pending work."""
+
+    segments: List[TranslationSegment]  # Document order
+    reused: Dict[int, str]  # Segment index → translation from the previous version
+    pending: List[int]  # Segment indices to translate
+    blocks_reused: int = 0
+    blocks_total: int = 0
+
+    @property
+    def pending_segments(self) -> List[TranslationSegment]:
+        return [self.segments[i] for i in self.pending]
+
+    def merge(self, pending_translations: List[str]) -> List[str]:
+        """
+        Combine reused and new translations in document order.
+
+        Args:
+            pending_translations: Translations in ``pending`` order
+
+        Returns:
+            Translations for every segment
+        """
+        if len(pending_translations) != len(self.pending):
+            raise ValueError(
+                f"Expected {len(self.pending)} translations, got {len(pending_translations)}"
+            )
+        merged = dict(self.reused)
+        merged.update(zip(self.pending, pending_translations))
+        return [merged[index] for index in range(len(self.segments))]
+
+
+@dataclass
+class BlockManifest:
+    """Block and segment hashes of one document version plus its translations."""
+
+    source_language: str
+    model: Optional[str] = None
+    blocks: Dict[str, str] = field(default_factory=dict)  # block_id → hash
+    segments: Dict[str, str] = field(default_factory=dict)  # segment_id → hash
+    translations: Dict[str, Dict[str, str]] = field(default_factory=dict)  # lang → {segment hash → text}
+
+    @classmethod
+    def build(
+        cls,
+        document: KPSDocument,
+        segments: List[TranslationSegment],
+        source_language: str,
+        model: Optional[str] = None,
+    ) -> "BlockManifest":
+        """Hash every block of ``document`` and every segment."""
+        return cls(
+            source_language=source_language,
+            model=model,
+            blocks={
+                block.block_id: block_hash(block)
+                for section in document.sections
+                for block in section.blocks
+            },
+            segments={segment.segment_id: segment_hash(segment) for segment in segments},
+        )
+
+    def record(
+        self,
+        target_language: str,
+        segments: List[TranslationSegment],
+        translations: List[str],
+    ) -> None:
+        """Remember the published translations of one language."""
+        self.translations[target_language] = {
+            self.segments.get(segment.segment_id) or segment_hash(segment): translation
+            for segment, translation in zip(segments, translations)
+            if translation is not None
+        }
+
+    def plan(
+        self,
+        current: "BlockManifest",
+        segments: List[TranslationSegment],
+        target_language: str,
+    ) -> IncrementalPlan:
+        """
+        Decide which segments of ``current`` can reuse translations from this manifest.
+
+        A segment is reused when its block hash occurs in this (previous)
+        version and its own hash has a recorded translation; every other
+        segment is pending. Blocks are matched by content, so moved blocks
+        are reused too.
+        """
+        known = self.translations.get(target_language, {})
+        compatible = (
+            self.source_language == current.source_language and self.model == current.model
+        )
+        previous_blocks = set(self.blocks.values()) if compatible else set()
+
+        reused: Dict[int, str] = {}
+        pending: List[int] = []
+        pending_blocks = set()
+        for index, segment in enumerate(segments):
+            block_id = _owner_block(segment.segment_id)
+            digest = current.segments.get(segment.segment_id) or segment_hash(segment)
+            translation = known.get(digest)
+            if current.blocks.get(block_id) in previous_blocks and translation is not None:
+                reused[index] = translation
+            else:
+                pending.append(index)
+                pending_blocks.add(block_id)
+
+        blocks_total = len(current.blocks)
+        return IncrementalPlan(
+            segments=list(segments),
+            reused=reused,
+            pending=pending,
+            blocks_reused=len(set(current.blocks) - pending_blocks) if reused else 0,
+            blocks_total=blocks_total,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "version": BLOCK_MANIFEST_VERSION,
+            "source_language": self.source_language,
+            "model": self.model,
+            "blocks": self.blocks,
+            "segments": self.segments,
+            "translations": self.translations,
+        }
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BlockManifest"]:
+        """Read a manifest; None when missing, unreadable or of another format version."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != BLOCK_MANIFEST_VERSION:
+            logger.debug("Ignoring block manifest %s of version %s", path, data.get("version"))
+            return None
+        return cls(
+            source_language=data.get("source_language", ""),
+            model=data.get("model"),
+            blocks=dict(data.get("blocks", {})),
+            segments=dict(data.get("segments", {})),
+            translations={lang: dict(items) for lang, items in data.get("translations", {}).items()},
+        )
+
+
+__all__ = [
+    "BLOCK_MANIFEST_NAME",
+    "BlockManifest",
+    "IncrementalPlan",
+    "block_hash",
+    "segment_hash",
+]
@@ -2,6 +2,7 @@
 
 from .manager import GlossaryEntry, GlossaryManager, GlossaryMatch
 from .selector import extract_protected_tokens, select_glossary_terms
+from .term_index import TermHit, TermIndex, glossary_term_index
 
 __all__ = [
     "GlossaryManager",
@@ -9,4 +10,7 @@ __all__ = [
     "GlossaryMatch",
     "select_glossary_terms",
     "extract_protected_tokens",
+    "TermIndex",
+    "TermHit",
+    "glossary_term_index",
 ]
@@ -12,11 +12,12 @@ This module provides sophisticated term matching capabilities including:
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 
+from .fuzzy_index import BKTree, levenshtein_distance
 from .manager import GlossaryEntry, GlossaryManager
+from .term_index import glossary_term_index
 
 
 @dataclass
@@ -113,6 +114,23 @@ class AdvancedGlossaryMatcher:
                         if entry not in self._indices[lang][word_lower]:
                             self._indices[lang][word_lower].append(entry)
 
+        # BK-trees for fuzzy matching; term ids are glossary entry positions
+        self._fuzzy_indices: Dict[str, BKTree] = {}
+        for lang in ["ru", "en", "fr"]:
+            self._fuzzy_index(lang)
+
+    def _fuzzy_index(self, lang: str) -> BKTree:
+        """BK-tree over lowercased ``lang`` terms of at least 3 characters."""
+        tree = self._fuzzy_indices.get(lang)
+        if tree is None:
+            terms = []
+            for entry in self.glossary.get_all_entries():
+                term = getattr(entry, lang, "") or ""
+                terms.append(term.lower() if len(term) >= 3 else "")
+            tree = BKTree(terms)
+            self._fuzzy_indices[lang] = tree
+        return tree
+
     def find_terms(
         self,
         text: str,
@@ -170,42 +188,7 @@ class AdvancedGlossaryMatcher:
         self, text: str, source_lang: str, target_lang: str, min_confidence: float
     ) -> List[TermOccurrence]:
         """Find exact term matches."""
-        occurrences = []
-        text_lower = text.lower() if not self.strategy.case_sensitive else text
-
-        # Search for each glossary entry
-        for entry in self.glossary.get_all_entries():
-            source_term = getattr(entry, source_lang, "")
-            if not source_term:
-                continue
-
-            term_to_search = (
-                source_term.lower() if not self.strategy.case_sensitive else source_term
-            )
-
-            # Use word boundaries for better matching
-            pattern = r"\b" + re.escape(term_to_search) + r"\b"
-            for match in re.finditer(pattern, text_lower):
-                position = match.start()
-                length = match.end() - match.start()
-
-                # Get context
-                context_before = text[max(0, position - 20) : position]
-                context_after = text[position + length : position + length + 20]
-
-                occurrence = TermOccurrence(
-                    entry=entry,
-                    matched_text=text[position : position + length],
-                    position=position,
-                    length=length,
-                    confidence=1.0,  # Exact match
-                    strategy="exact",
-                    context_before=context_before,
-                    context_after=context_after,
-                )
-                occurrences.append(occurrence)
-
-        return occurrences
+        return self._indexed_matches(text, source_lang, 1.0, "exact")
 
     def _fuzzy_match(
         self, text: str, source_lang: str, target_lang: str, min_confidence: float
@@ -213,6 +196,10 @@ class AdvancedGlossaryMatcher:
         """Find fuzzy term matches using edit distance."""
         occurrences = []
         words = text.split()
+        text_lower = text.lower()
+        entries = self.glossary.get_all_entries()
+        tree = self._fuzzy_index(source_lang)
+        candidates_by_word: Dict[str, List[Tuple[int, int]]] = {}
 
         for i, word in enumerate(words):
             word_lower = word.lower()
@@ -221,44 +208,41 @@ class AdvancedGlossaryMatcher:
             if len(word_lower) < 3:
                 continue
 
-            # Find candidate entries
-            for entry in self.glossary.get_all_entries():
-                source_term = getattr(entry, source_lang, "")
-                if not source_term or len(source_term) < 3:
-                    continue
-
-                term_lower = source_term.lower()
-
-                # Calculate edit distance
-                distance = self._levenshtein_distance(word_lower, term_lower)
-
-                # Check if within threshold
-                if distance <= self.strategy.max_edit_distance:
-                    # Calculate confidence based on distance
-                    max_len = max(len(word_lower), len(term_lower))
-                    confidence = 1.0 - (distance / max_len)
-
-                    if confidence >= min_confidence:
-                        # Find position in original text
-                        position = text.lower().find(word_lower)
-                        if position == -1:
-                            continue
-
-                        length = len(word)
-                        context_before = text[max(0, position - 20) : position]
-                        context_after = text[position + length : position + length + 20]
-
-                        occurrence = TermOccurrence(
-                            entry=entry,
-                            matched_text=word,
-                            position=position,
-                            length=length,
-                            confidence=confidence,
-                            strategy="fuzzy",
-                            context_before=context_before,
-                            context_after=context_after,
-                        )
-                        occurrences.append(occurrence)
+            # Find candidate entries within max_edit_distance
+            candidates = candidates_by_word.get(word_lower)
+            if candidates is None:
+                candidates = tree.search(word_lower, self.strategy.max_edit_distance)
+                candidates_by_word[word_lower] = candidates
+
+            for term_id, distance in candidates:
+                entry = entries[term_id]
+                term_lower = getattr(entry, source_lang).lower()
+
+                # Calculate confidence based on distance
+                max_len = max(len(word_lower), len(term_lower))
+                confidence = 1.0 - (distance / max_len)
+
+                if confidence >= min_confidence:
+                    # Find position in original text
+                    position = text_lower.find(word_lower)
+                    if position == -1:
+                        continue
+
+                    length = len(word)
+                    context_before = text[max(0, position - 20) : position]
+                    context_after = text[position + length : position + length + 20]
+
+                    occurrence = TermOccurrence(
+                        entry=entry,
+                        matched_text=word,
+                        position=position,
+                        length=length,
+                        confidence=confidence,
+                        strategy="fuzzy",
+                        context_before=context_before,
+                        context_after=context_after,
+                    )
+                    occurrences.append(occurrence)
 
         return occurrences
 
@@ -266,41 +250,9 @@ class AdvancedGlossaryMatcher:
         self, text: str, source_lang: str, target_lang: str, min_confidence: float
     ) -> List[TermOccurrence]:
         """Find multi-word term matches."""
-        occurrences = []
-        text_lower = text.lower() if not self.strategy.case_sensitive else text
-
-        # Look for multi-word terms
-        for entry in self.glossary.get_all_entries():
-            source_term = getattr(entry, source_lang, "")
-            if not source_term or " " not in source_term:
-                continue
-
-            term_to_search = (
-                source_term.lower() if not self.strategy.case_sensitive else source_term
-            )
-
-            # Use word boundaries
-            pattern = r"\b" + re.escape(term_to_search) + r"\b"
-            for match in re.finditer(pattern, text_lower):
-                position = match.start()
-                length = match.end() - match.start()
-
-                context_before = text[max(0, position - 20) : position]
-                context_after = text[position + length : position + length + 20]
-
-                occurrence = TermOccurrence(
-                    entry=entry,
-                    matched_text=text[position : position + length],
-                    position=position,
-                    length=length,
-                    confidence=1.0,  # Exact multi-word match
-                    strategy="multi_word",
-                    context_before=context_before,
-                    context_after=context_after,
-                )
-                occurrences.append(occurrence)
-
-        return occurrences
+        return self._indexed_matches(
+            text, source_lang, 1.0, "multi_word", multi_word_only=True
+        )
 
     def _bidirectional_match(
         self, text: str, source_lang: str, target_lang: str, min_confidence: float
@@ -310,39 +262,52 @@ class AdvancedGlossaryMatcher:
 
         This is useful for detecting untranslated terms.
         """
-        occurrences = []
-        text_lower = text.lower() if not self.strategy.case_sensitive else text
+        # Lower confidence for reverse matches
+        return self._indexed_matches(text, target_lang, 0.9, "bidirectional")
 
-        # Search for target language terms in source text
-        for entry in self.glossary.get_all_entries():
-            target_term = getattr(entry, target_lang, "")
-            if not target_term:
-                continue
+    def _indexed_matches(
+        self,
+        text: str,
+        lang: str,
+        confidence: float,
+        strategy: str,
+        multi_word_only: bool = False,
+    ) -> List[TermOccurrence]:
+        """
+        Whole-word occurrences of ``lang`` terms via the glossary term automaton.
 
-            term_to_search = (
-                target_term.lower() if not self.strategy.case_sensitive else target_term
-            )
+        Occurrences are ordered by glossary entry, then by position.
+        """
+        entries = self.glossary.get_all_entries()
+        index = glossary_term_index(
+            self.glossary, lang, case_sensitive=self.strategy.case_sensitive
+        )
+
+        occurrences = []
+        for hit in index.find(text):
+            entry = entries[hit.term_id]
+            if multi_word_only and " " not in getattr(entry, lang, ""):
+                continue
 
-            pattern = r"\b" + re.escape(term_to_search) + r"\b"
-            for match in re.finditer(pattern, text_lower):
-                position = match.start()
-                length = match.end() - match.start()
+            position = hit.start
+            length = hit.end - hit.start
 
-                context_before = text[max(0, position - 20) : position]
-                context_after = text[position + length : position + length + 20]
+            # Get context
+            context_before = text[max(0, position - 20) : position]
+            context_after = text[position + length : position + length + 20]
 
-                # Lower confidence for reverse matches
-                occurrence = TermOccurrence(
+            occurrences.append(
+                TermOccurrence(
                     entry=entry,
                     matched_text=text[position : position + length],
                     position=position,
                     length=length,
-                    confidence=0.9,  # Slightly lower confidence
-                    strategy="bidirectional",
+                    confidence=confidence,
+                    strategy=strategy,
                     context_before=context_before,
                     context_after=context_after,
                 )
-                occurrences.append(occurrence)
+            )
 
         return occurrences
 
@@ -400,24 +365,7 @@ class AdvancedGlossaryMatcher:
         Returns:
             Edit distance
         """
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions, or substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        return levenshtein_distance(s1, s2)
 
     def get_term_statistics(
         self, text: str, source_lang: str, target_lang: str
@@ -0,0 +1,86 @@
+"""
+BK-tree index for fuzzy glossary lookups.
+
+A BK-tree (``kps.search.bk_tree``) arranges terms by edit distance so that
+a query only computes distances for the branches allowed by the triangle
+inequality, instead of comparing every word with every glossary term.
+
+Example:
+    >>> tree = BKTree(["петля", "петли", "ряд"])
+    >>> sorted(tree.search("петлю", 1))
+    [(0, 1), (1, 1)]
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+from kps.search.bk_tree import BKTree as _BKTree
+
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """
+    Calculate Levenshtein distance between two strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+
+    Returns:
+        Edit distance
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if len(s2) == 0:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            # Cost of insertions, deletions, or substitutions
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+class BKTree(_BKTree[str, int]):
+    """
+    BK-tree over a term sequence with Levenshtein distance.
+
+    Term ids are positions in the sequence passed to the constructor;
+    identical terms share one node. Empty terms are skipped.
+    """
+
+    def __init__(self, terms: Sequence[str]):
+        super().__init__(levenshtein_distance)
+        for term_id, term in enumerate(terms):
+            if term:
+                self.add(term, term_id)
+
+    @property
+    def size(self) -> int:
+        return len(self)
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        Find terms within ``max_distance`` edits of ``word``.
+
+        Args:
+            word: Query string
+            max_distance: Maximum Levenshtein distance (inclusive)
+
+        Returns:
+            (term_id, distance) pairs sorted by term id
+        """
+        return sorted(
+            (term_id, distance) for distance, term_id in super().search(word, max_distance)
+        )
+
+
+__all__ = ["BKTree", "levenshtein_distance"]
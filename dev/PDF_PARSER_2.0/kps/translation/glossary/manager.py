@@ -9,10 +9,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import yaml
 
+from .term_index import TermIndex, terms_checksum
+
 
 @dataclass
 class GlossaryEntry:
@@ -50,6 +52,8 @@ class GlossaryManager:
     multi-language lookups (ru → en, ru → fr).
     """
 
+    INDEXED_LANGUAGES = ("ru", "en", "fr")
+
     def __init__(self, glossary_paths: Optional[List[Path]] = None):
         """
         Initialize glossary manager.
@@ -128,6 +132,46 @@ class GlossaryManager:
                 self._by_category[entry.category] = []
             self._by_category[entry.category].append(entry)
 
+        # Term automata keyed by (lang, checksum, case_sensitive); term ids are
+        # positions in self.entries.
+        self.checksum = terms_checksum(
+            "\x1f".join((e.key, e.ru or "", e.en or "", e.fr or "")) for e in self.entries
+        )
+        self._term_indices: Dict[Tuple[str, str, bool], TermIndex] = {}
+        for lang in self.INDEXED_LANGUAGES:
+            self.term_index(lang)
+
+    def term_index(self, lang: str, case_sensitive: bool = False) -> TermIndex:
+        """
+        Compiled term automaton for one language column.
+
+        Built once per (language, glossary checksum); term ids match
+        positions in ``get_all_entries()``.
+
+        Args:
+            lang: Language code whose terms are indexed (e.g., "ru")
+            case_sensitive: Match case exactly instead of lowercasing
+
+        Returns:
+            TermIndex over the glossary terms
+        """
+        cache_key = (lang, self.checksum, case_sensitive)
+        index = self._term_indices.get(cache_key)
+        if index is None:
+            terms = [getattr(entry, lang, "") or "" for entry in self.entries]
+            index = TermIndex(terms, case_sensitive=case_sensitive)
+            self._term_indices[cache_key] = index
+        return index
+
+    def find_term_keys(self, text: str, source_lang: str = "ru") -> List[str]:
+        """
+        Keys of all entries whose source term occurs in ``text`` as whole words.
+
+        Single pass over the text; keys are returned in glossary order.
+        """
+        index = self.term_index(source_lang)
+        return [self.entries[term_id].key for term_id in index.find_ids(text)]
+
     def lookup(
         self,
         key: str,
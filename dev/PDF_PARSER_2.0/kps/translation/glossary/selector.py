@@ -6,7 +6,9 @@ Enhanced from PDF_parser with multi-language support for KPS v2.0.
 
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .term_index import NGRAM_SIZE, TermIndex, index_for_terms
 
 
 def select_glossary_terms(
@@ -14,6 +16,7 @@ def select_glossary_terms(
     glossary_entries: List[Dict],
     source_lang: str = "ru",
     max_terms: int = 50,
+    term_index: Optional[TermIndex] = None,
 ) -> List[Dict]:
     """
     Select relevant glossary entries based on text content.
@@ -28,6 +31,9 @@ def select_glossary_terms(
         glossary_entries: Full glossary entry list
         source_lang: Source language code (e.g., "ru")
         max_terms: Maximum entries to return
+        term_index: Prebuilt index over ``glossary_entries`` source terms
+                    (e.g. ``GlossaryManager.term_index``); built and cached
+                    by content when omitted
 
     Returns:
         List of selected glossary entries, sorted by relevance
@@ -39,26 +45,32 @@ def select_glossary_terms(
     if not normalized_terms:
         return []
 
-    # Score each glossary entry
-    candidates: List[Tuple[int, int, Dict]] = []
-    for index, entry in enumerate(glossary_entries):
-        source_value = str(entry.get(source_lang, ""))
-        if not source_value:
-            continue
-
-        source_lower = source_value.lower()
-        best_score = 0
-
-        for term in normalized_terms:
-            if source_lower == term:
-                best_score = max(best_score, 3)  # Exact match
-            elif source_lower.startswith(term) or term.startswith(source_lower):
-                best_score = max(best_score, 2)  # Prefix match
-            elif term in source_lower and len(term) >= 4:
-                best_score = max(best_score, 1)  # Substring match
-
-        if best_score:
-            candidates.append((best_score, index, entry))
+    if term_index is None:
+        term_index = index_for_terms(
+            [str(entry.get(source_lang, "")) for entry in glossary_entries]
+        )
+
+    # Score each glossary entry via trie lookups instead of comparing
+    # every term with every entry
+    scores: Dict[int, int] = {}
+
+    def _score(term_ids: Sequence[int], score: int) -> None:
+        for term_id in term_ids:
+            if scores.get(term_id, 0) < score:
+                scores[term_id] = score
+
+    for term in dict.fromkeys(normalized_terms):
+        _score(term_index.exact(term), 3)  # Exact match
+        _score(term_index.prefixes_of(term), 2)  # Prefix match
+        _score(term_index.extensions_of(term), 2)
+        if len(term) >= NGRAM_SIZE:
+            _score(term_index.containing(term), 1)  # Substring match
+
+    candidates: List[Tuple[int, int, Dict]] = [
+        (score, index, glossary_entries[index])
+        for index, score in sorted(scores.items())
+        if index < len(glossary_entries)
+    ]
 
     if not candidates:
         return []
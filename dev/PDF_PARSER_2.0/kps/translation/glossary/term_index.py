@@ -0,0 +1,248 @@
+"""
+Multi-pattern glossary term index (Aho–Corasick automaton).
+
+Replaces per-entry ``\\bterm\\b`` regex scans: all source terms of a glossary
+are compiled into one automaton, and a single linear pass over the text
+reports every occurrence. Word-boundary semantics follow Python ``re``
+(``\\b`` between a word and a non-word character), and occurrences of one
+term never overlap, exactly like ``re.finditer``.
+
+Example:
+    >>> index = TermIndex(["лиц", "2 петли вместе"])
+    >>> [(h.term_id, h.start, h.end) for h in index.find("Провяжите 2 петли вместе")]
+    [(1, 10, 24)]
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Fragments shorter than this are not indexed for substring lookups
+NGRAM_SIZE = 4
+
+
+@dataclass(frozen=True)
+class TermHit:
+    """Single term occurrence found by :class:`TermIndex`."""
+
+    term_id: int  # Position of the term in the indexed sequence
+    start: int  # Start offset in the (normalized) text
+    end: int  # End offset in the (normalized) text
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def terms_checksum(terms: Iterable[str]) -> str:
+    """Stable checksum of a term sequence (order-sensitive)."""
+    digest = hashlib.sha1()
+    for term in terms:
+        digest.update(term.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class TermIndex:
+    """
+    Aho–Corasick automaton over glossary terms.
+
+    Term ids are positions in the sequence passed to the constructor, so
+    callers can map hits straight back to their glossary entries. Empty
+    terms are skipped.
+    """
+
+    def __init__(self, terms: Sequence[str], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.size = len(terms)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._lengths: Dict[int, int] = {}
+        self._terms: Dict[int, str] = {}
+        self._ngrams: Optional[Dict[str, Set[int]]] = None
+
+        for term_id, term in enumerate(terms):
+            if not term:
+                continue
+            normalized = self.normalize(term)
+            self._insert(term_id, normalized)
+
+        self._dict_link: List[int] = [0] * len(self._goto)
+        self._build_links()
+
+    def normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _insert(self, term_id: int, term: str) -> None:
+        node = 0
+        for char in term:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(term_id)
+        self._lengths[term_id] = len(term)
+        self._terms[term_id] = term
+
+    def _build_links(self) -> None:
+        """Breadth-first construction of failure and output (dictionary) links."""
+        queue: List[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                state = self._fail[node]
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                fallback = self._goto[state].get(char, 0)
+                self._fail[child] = fallback if fallback != child else 0
+                target = self._fail[child]
+                self._dict_link[child] = target if self._out[target] else self._dict_link[target]
+
+    # ------------------------------------------------------------------
+    # Text scanning
+    # ------------------------------------------------------------------
+
+    def find(self, text: str, whole_words: bool = True) -> List[TermHit]:
+        """
+        Find all term occurrences in one pass over ``text``.
+
+        Args:
+            text: Text to search (normalized the same way as the terms)
+            whole_words: Require ``re``-style word boundaries at both ends
+
+        Returns:
+            Hits ordered by term id, then by position
+        """
+        haystack = self.normalize(text)
+        size = len(haystack)
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+
+        def boundary(pos: int) -> bool:
+            before = pos > 0 and _is_word_char(haystack[pos - 1])
+            after = pos < size and _is_word_char(haystack[pos])
+            return before != after
+
+        hits: List[TermHit] = []
+        last_end: Dict[int, int] = {}
+        state = 0
+        for pos, char in enumerate(haystack):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            node = state if out[state] else dict_link[state]
+            while node:
+                end = pos + 1
+                for term_id in out[node]:
+                    start = end - self._lengths[term_id]
+                    if start < last_end.get(term_id, 0):
+                        continue
+                    if whole_words and not (boundary(start) and boundary(end)):
+                        continue
+                    last_end[term_id] = end
+                    hits.append(TermHit(term_id, start, end))
+                node = dict_link[node]
+
+        hits.sort(key=lambda hit: (hit.term_id, hit.start))
+        return hits
+
+    def find_ids(self, text: str, whole_words: bool = True) -> List[int]:
+        """Ids of all terms occurring in ``text``, in ascending order."""
+        return sorted({hit.term_id for hit in self.find(text, whole_words)})
+
+    # ------------------------------------------------------------------
+    # Word lookups (trie walks)
+    # ------------------------------------------------------------------
+
+    def _walk(self, word: str) -> Tuple[int, List[int]]:
+        """Follow trie edges for ``word``; return end node and prefix term ids."""
+        node = 0
+        prefixes: List[int] = []
+        for char in word:
+            node = self._goto[node].get(char, -1)
+            if node < 0:
+                return -1, prefixes
+            prefixes.extend(self._out[node])
+        return node, prefixes
+
+    def exact(self, word: str) -> List[int]:
+        """Ids of terms equal to ``word``."""
+        node, _ = self._walk(self.normalize(word))
+        return list(self._out[node]) if node > 0 else []
+
+    def prefixes_of(self, word: str) -> List[int]:
+        """Ids of terms that ``word`` starts with (including ``word`` itself)."""
+        _, prefixes = self._walk(self.normalize(word))
+        return prefixes
+
+    def extensions_of(self, word: str) -> List[int]:
+        """Ids of terms that start with ``word`` (including ``word`` itself)."""
+        node, _ = self._walk(self.normalize(word))
+        if node <= 0:
+            return []
+        found: List[int] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.extend(self._out[current])
+            stack.extend(self._goto[current].values())
+        return found
+
+    def containing(self, fragment: str) -> List[int]:
+        """Ids of terms containing ``fragment`` (at least ``NGRAM_SIZE`` chars)."""
+        fragment = self.normalize(fragment)
+        if len(fragment) < NGRAM_SIZE:
+            raise ValueError(f"fragment must have at least {NGRAM_SIZE} characters")
+        if self._ngrams is None:
+            self._ngrams = {}
+            for term_id, term in self._terms.items():
+                for i in range(len(term) - NGRAM_SIZE + 1):
+                    self._ngrams.setdefault(term[i : i + NGRAM_SIZE], set()).add(term_id)
+        candidates = self._ngrams.get(fragment[:NGRAM_SIZE], ())
+        return sorted(term_id for term_id in candidates if fragment in self._terms[term_id])
+
+
+@lru_cache(maxsize=32)
+def _cached_index(terms: Tuple[str, ...], case_sensitive: bool) -> TermIndex:
+    return TermIndex(terms, case_sensitive=case_sensitive)
+
+
+def index_for_terms(terms: Sequence[str], case_sensitive: bool = False) -> TermIndex:
+    """Shared index for an ad-hoc term list (cached by content)."""
+    return _cached_index(tuple(terms), case_sensitive)
+
+
+def glossary_term_index(glossary, lang: str, case_sensitive: bool = False) -> TermIndex:
+    """
+    Term index for a glossary's ``lang`` column.
+
+    Uses ``GlossaryManager.term_index`` when available; other glossary-like
+    objects (anything with ``get_all_entries``) get a content-cached index.
+    Term ids match positions in ``glossary.get_all_entries()``.
+    """
+    term_index = getattr(glossary, "term_index", None)
+    if callable(term_index):
+        return term_index(lang, case_sensitive=case_sensitive)
+    terms = [getattr(entry, lang, "") or "" for entry in glossary.get_all_entries()]
+    return index_for_terms(terms, case_sensitive=case_sensitive)
+
+
+__all__ = [
+    "TermHit",
+    "TermIndex",
+    "glossary_term_index",
+    "index_for_terms",
+    "terms_checksum",
+]
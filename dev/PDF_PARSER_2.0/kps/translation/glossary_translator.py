@@ -17,17 +17,22 @@ from __future__ import annotations
 
 import re
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from .glossary.manager import GlossaryEntry, GlossaryManager
+from .glossary.term_index import glossary_term_index
 from .glossary_seed import compute_glossary_checksum, seed_memory_with_entries
 from .orchestrator import (
     BatchTranslationResult,
     TranslationOrchestrator,
     TranslationSegment,
 )
+from .term_miner import PhraseCandidate, PhraseMiner
 from .translation_memory import TranslationMemory
 from kps.core.placeholders import decode_placeholders
 
@@ -90,6 +95,7 @@ class GlossaryTranslator:
         enable_few_shot: bool = True,
         enable_auto_suggestions: bool = True,
         config: Optional[object] = None,  # PipelineConfig for RAG params
+        defer_suggestions: bool = False,
     ):
         """
         Initialize translator.
@@ -102,6 +108,8 @@ class GlossaryTranslator:
             enable_few_shot: Use few-shot examples in prompts (default: True)
             enable_auto_suggestions: Auto-suggest new glossary terms (default: True)
             config: PipelineConfig with RAG parameters (optional)
+            defer_suggestions: Write mined term suggestions from a background
+                thread after translate() returns (default: False)
         """
         self.orchestrator = orchestrator
         self.glossary = glossary_manager
@@ -110,6 +118,12 @@ class GlossaryTranslator:
         self.enable_few_shot = enable_few_shot
         self.enable_auto_suggestions = enable_auto_suggestions
         self.config = config
+        self.defer_suggestions = defer_suggestions
+        self._suggestion_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_suggestions: List[Future] = []
+        # Memory backends are not thread-safe; serialize access when the
+        # pipeline translates several languages concurrently.
+        self._memory_lock = threading.RLock()
         self._glossary_checksum = None
         try:
             if hasattr(self.glossary, "glossary_paths"):
@@ -151,22 +165,23 @@ class GlossaryTranslator:
         segment_indices = []  # Индексы сегментов для перевода
         cached_count = 0
 
-        for i, segment in enumerate(segments):
-            cached_entry = None
+        cached_entries = self._lookup_cached_translations(
+            segments, source_language, target_language
+        )
+        for i, (segment, cached_entry) in enumerate(zip(segments, cached_entries)):
             cached_text: Optional[str] = None
-            if self.memory:
-                cached_entry = self.memory.get_translation(
-                    segment.text, source_language, target_language
-                )
-                if cached_entry:
-                    cached_text = getattr(cached_entry, "translated_text", None)
+            if cached_entry:
+                cached_text = getattr(cached_entry, "translated_text", None)
 
             if cached_entry and cached_text:
                 if not self._looks_like_source_language(cached_text, source_language):
                     cached_entry.usage_count += 1
                     if hasattr(cached_entry, "timestamp"):
                         cached_entry.timestamp = time.time()
-                    translated_segments.append(cached_text)
+                    # Entries stored with placeholders still encoded decode per segment
+                    translated_segments.append(
+                        decode_placeholders(cached_text, segment.placeholders)
+                    )
                     cached_count += 1
                     continue
 
@@ -199,7 +214,8 @@ class GlossaryTranslator:
                 cached_segments=cached_count,
             )
 
-        self._maybe_seed_glossary(source_language, target_language)
+        with self._memory_lock:
+            self._maybe_seed_glossary(source_language, target_language)
 
         # Find all glossary terms in source text
         all_text = " ".join([s.text for s in segments_to_translate])
@@ -238,9 +254,10 @@ class GlossaryTranslator:
 
         # Add few-shot examples if enabled
         if self.memory and self.enable_few_shot:
-            few_shot_examples = self.memory.get_few_shot_examples(
-                source_language, target_language, limit=3
-            )
+            with self._memory_lock:
+                few_shot_examples = self.memory.get_few_shot_examples(
+                    source_language, target_language, limit=3
+                )
             if few_shot_examples:
                 glossary_context += "\n\nПримеры хороших переводов:\n"
                 for source, target in few_shot_examples:
@@ -298,6 +315,12 @@ class GlossaryTranslator:
         # Save to memory
         new_suggestions = 0
         if self.memory:
+            to_store: List[tuple] = []
+            miner = (
+                PhraseMiner(glossary_term_index(self.glossary, source_language).exact)
+                if self.enable_auto_suggestions
+                else None
+            )
             for segment, translation in zip(segments_to_translate, decoded_batch):
                 if self._looks_like_source_language(translation, source_language):
                     logger.warning(
@@ -313,37 +336,23 @@ class GlossaryTranslator:
                     continue
                 # Найти термины для этого сегмента
                 segment_terms = segment_term_map.get(segment.segment_id, [])
-
-                # Сохранить в память
-                self.memory.add_translation(
-                    source_text=segment.text,
-                    translated_text=translation,
-                    source_lang=source_language,
-                    target_lang=target_language,
-                    glossary_terms=segment_terms,
-                )
-
-                # Автоматически предлагать новые термины
-                if self.enable_auto_suggestions:
-                    # Найти короткие фразы для предложения
-                    words = segment.text.split()
-                    for i in range(len(words)):
-                        for j in range(i + 1, min(i + 4, len(words) + 1)):
-                            phrase = " ".join(words[i:j])
-                            # Пропустить если уже в глоссарии
-                            if phrase.lower() not in [
-                                getattr(e, source_language, "").lower()
-                                for e in self.glossary.get_all_entries()
-                            ]:
-                                # Попробовать найти перевод этой фразы
-                                self.memory.suggest_glossary_term(
-                                    source_text=phrase,
-                                    translated_text="",  # Will be filled by analysis
-                                    source_lang=source_language,
-                                    target_lang=target_language,
-                                    context=segment.text[:50],
-                                )
-                                new_suggestions += 1
+                to_store.append((segment.text, translation, segment_terms))
+
+                # Автоматически предлагать новые термины (частоты копятся в памяти)
+                if miner is not None:
+                    new_suggestions += miner.add(segment.text, context=segment.text[:50])
+
+            # Сохранить в память: переводы одним батчем, все записи прогона
+            # одним commit (если память поддерживает транзакции)
+            candidates = miner.candidates() if miner is not None else []
+            deferred = self.defer_suggestions
+            if to_store or (candidates and not deferred):
+                with self._memory_lock, self._memory_transaction(immediate=not to_store):
+                    self._store_translations(to_store, source_language, target_language)
+                    if not deferred:
+                        self._store_suggestions(candidates, source_language, target_language)
+            if candidates and deferred:
+                self._defer_suggestions(candidates, source_language, target_language)
 
         return TranslationResult(
             source_language=source_language,
@@ -357,6 +366,128 @@ class GlossaryTranslator:
             total_output_tokens=getattr(batch_result, "total_output_tokens", 0),
         )
 
+    def _lookup_cached_translations(
+        self,
+        segments: List[TranslationSegment],
+        source_language: str,
+        target_language: str,
+    ) -> List[Optional[object]]:
+        """Exact cache entries per segment, one bulk query when supported."""
+        if not self.memory:
+            return [None] * len(segments)
+
+        texts = [segment.text for segment in segments]
+        bulk_get = getattr(self.memory, "get_translations_bulk", None)
+        with self._memory_lock:
+            if bulk_get is not None:
+                return list(bulk_get(texts, source_language, target_language))
+            return [
+                self.memory.get_translation(text, source_language, target_language)
+                for text in texts
+            ]
+
+    def _store_suggestions(
+        self,
+        candidates: List[PhraseCandidate],
+        source_language: str,
+        target_language: str,
+    ) -> None:
+        """Persist mined phrase frequencies, one upsert batch when supported."""
+        if not candidates:
+            return
+
+        bulk_suggest = getattr(self.memory, "suggest_glossary_terms_bulk", None)
+        with self._memory_lock:
+            if bulk_suggest is not None:
+                bulk_suggest(
+                    [candidate.as_row() for candidate in candidates],
+                    source_language,
+                    target_language,
+                )
+                return
+            for candidate in candidates:
+                for occurrence in range(candidate.frequency):
+                    contexts = candidate.contexts
+                    self.memory.suggest_glossary_term(
+                        source_text=candidate.phrase,
+                        translated_text="",  # Will be filled by analysis
+                        source_lang=source_language,
+                        target_lang=target_language,
+                        context=contexts[occurrence] if occurrence < len(contexts) else "",
+                    )
+
+    def _defer_suggestions(
+        self,
+        candidates: List[PhraseCandidate],
+        source_language: str,
+        target_language: str,
+    ) -> None:
+        """Queue a suggestion flush on the background writer thread."""
+        with self._memory_lock:
+            if self._suggestion_executor is None:
+                self._suggestion_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="kps-suggest"
+                )
+            self._pending_suggestions = [f for f in self._pending_suggestions if not f.done()]
+            future = self._suggestion_executor.submit(
+                self._store_suggestions, candidates, source_language, target_language
+            )
+            future.add_done_callback(self._log_suggestion_failure)
+            self._pending_suggestions.append(future)
+
+    @staticmethod
+    def _log_suggestion_failure(future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(
+                "Failed to store glossary suggestions: %s", future.exception()
+            )
+
+    def wait_for_suggestions(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for deferred suggestion writes to finish.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if nothing is pending any more
+        """
+        pending = list(self._pending_suggestions)
+        _done, not_done = wait(pending, timeout=timeout)
+        self._pending_suggestions = list(not_done)
+        return not not_done
+
+    def _memory_transaction(self, immediate: bool = True):
+        """Transaction scope of the memory backend, or a no-op context."""
+        transaction = getattr(self.memory, "transaction", None)
+        if transaction is None:
+            return nullcontext()
+        return transaction(immediate=immediate)
+
+    def _store_translations(
+        self,
+        translations: List[tuple],
+        source_language: str,
+        target_language: str,
+    ) -> None:
+        """Persist (source, translation, terms) rows, batched when supported."""
+        if not translations:
+            return
+
+        bulk_add = getattr(self.memory, "add_translations_bulk", None)
+        with self._memory_lock:
+            if bulk_add is not None:
+                bulk_add(translations, source_language, target_language)
+                return
+            for source_text, translation, segment_terms in translations:
+                self.memory.add_translation(
+                    source_text=source_text,
+                    translated_text=translation,
+                    source_lang=source_language,
+                    target_lang=target_language,
+                    glossary_terms=segment_terms,
+                )
+
     def _maybe_seed_glossary(self, source_language: str, target_language: str) -> None:
         if not self.memory:
             return
@@ -419,25 +550,21 @@ class GlossaryTranslator:
         groups = self._group_segments_by_terms(segments, segment_term_map)
         sections: List[str] = []
 
-        for signature, cluster in groups.items():
-            query_text = " ".join([s.text[:100] for s in cluster[:2]])
-            threshold = (
-                symbol_similarity
-                if self._is_symbol_signature(signature, source_language, target_language)
-                else default_similarity
-            )
-            try:
-                rag_examples = self.memory.get_rag_examples(
-                    query_text,
-                    source_language,
-                    target_language,
-                    limit=rag_limit,
-                    min_similarity=threshold,
-                )
-            except Exception as exc:  # pragma: no cover
-                logger.warning("RAG lookup failed: %s", exc)
-                continue
+        signatures = list(groups)
+        queries = [" ".join([s.text[:100] for s in groups[sig][:2]]) for sig in signatures]
+        thresholds = [
+            symbol_similarity
+            if self._is_symbol_signature(signature, source_language, target_language)
+            else default_similarity
+            for signature in signatures
+        ]
+        examples_per_group = self._lookup_rag_examples(
+            queries, thresholds, source_language, target_language, rag_limit
+        )
 
+        for signature, threshold, rag_examples in zip(
+            signatures, thresholds, examples_per_group
+        ):
             if rag_examples:
                 if signature == ("__no_terms__",):
                     header = "без терминов"
@@ -464,6 +591,48 @@ class GlossaryTranslator:
             sections
         )
 
+    def _lookup_rag_examples(
+        self,
+        queries: List[str],
+        thresholds: List[float],
+        source_language: str,
+        target_language: str,
+        limit: int,
+    ) -> List[list]:
+        """RAG examples for every group; one batched call when the memory supports it."""
+        bulk_lookup = getattr(self.memory, "get_rag_examples_bulk", None)
+        if bulk_lookup is not None:
+            try:
+                with self._memory_lock:
+                    return bulk_lookup(
+                        queries,
+                        source_language,
+                        target_language,
+                        limit=limit,
+                        min_similarity=thresholds,
+                    )
+            except Exception as exc:  # pragma: no cover
+                logger.warning("RAG lookup failed: %s", exc)
+                return [[] for _ in queries]
+
+        examples: List[list] = []
+        for query_text, threshold in zip(queries, thresholds):
+            try:
+                with self._memory_lock:
+                    examples.append(
+                        self.memory.get_rag_examples(
+                            query_text,
+                            source_language,
+                            target_language,
+                            limit=limit,
+                            min_similarity=threshold,
+                        )
+                    )
+            except Exception as exc:  # pragma: no cover
+                logger.warning("RAG lookup failed: %s", exc)
+                examples.append([])
+        return examples
+
     def _group_segments_by_terms(
         self,
         segments: List[TranslationSegment],
@@ -508,7 +677,8 @@ class GlossaryTranslator:
         """
         Find glossary term keys in text.
 
-        Uses simple and fast exact matching (case-insensitive).
+        Uses the glossary's compiled term automaton: one linear pass over
+        the text (case-insensitive, whole words).
 
         Args:
             text: Text to search
@@ -518,24 +688,16 @@ class GlossaryTranslator:
         Returns:
             List of glossary entry keys found
         """
-        found_keys = []
-        text_lower = text.lower()
+        entries = self.glossary.get_all_entries()
+        index = glossary_term_index(self.glossary, source_lang)
 
-        # Search for each glossary entry
-        for entry in self.glossary.get_all_entries():
-            source_term = getattr(entry, source_lang, "")
-            target_term = getattr(entry, target_lang, "")
-
-            # Skip if no terms for this language pair
-            if not source_term or not target_term:
+        found_keys = []
+        for term_id in index.find_ids(text):
+            entry = entries[term_id]
+            # Skip if no translation for this language pair
+            if not getattr(entry, target_lang, ""):
                 continue
-
-            # Check if term appears in text (case-insensitive, word boundaries)
-            term_lower = source_term.lower()
-            pattern = r"\b" + re.escape(term_lower) + r"\b"
-
-            if re.search(pattern, text_lower):
-                found_keys.append(entry.key)
+            found_keys.append(entry.key)
 
         return found_keys
 
@@ -594,9 +756,19 @@ class GlossaryTranslator:
         return self.memory.get_statistics()
 
     def save_memory(self):
-        """Сохранить память переводов на диск."""
+        """Сохранить память переводов на диск (после отложенных предложений)."""
+        self.wait_for_suggestions()
         if self.memory:
-            self.memory.save()
+            with self._memory_lock:
+                self.memory.save()
+
+    def close(self) -> None:
+        """Дождаться отложенных записей предложений и остановить их поток."""
+        self.wait_for_suggestions()
+        with self._memory_lock:
+            executor, self._suggestion_executor = self._suggestion_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     # --- Internal helpers -------------------------------------------------
 
@@ -610,11 +782,12 @@ class GlossaryTranslator:
             return
 
         try:
-            self.memory.delete_translation(
-                source_text=source_text,
-                source_lang=source_language,
-                target_lang=target_language,
-            )
+            with self._memory_lock:
+                self.memory.delete_translation(
+                    source_text=source_text,
+                    source_lang=source_language,
+                    target_lang=target_language,
+                )
         except Exception:  # pragma: no cover - best effort eviction
             logger.debug("Failed to evict cached translation", exc_info=True)
 
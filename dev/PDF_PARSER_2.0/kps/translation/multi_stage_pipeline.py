@@ -26,6 +26,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
 from .glossary.manager import GlossaryEntry, GlossaryManager
+from .glossary.term_index import glossary_term_index
 from .orchestrator import (
     BatchTranslationResult,
     TranslationOrchestrator,
@@ -284,58 +285,56 @@ class MultiStageTranslationPipeline:
             List of matched terms
         """
         matches = []
-        text_lower = text.lower()
+        entries = self.glossary.get_all_entries()
+        index = glossary_term_index(self.glossary, source_lang)
 
-        # Get all glossary entries
-        for entry in self.glossary.get_all_entries():
-            source_text = getattr(entry, source_lang, None)
-            target_text = getattr(entry, target_lang, None)
+        def _usable(entry) -> bool:
+            return bool(getattr(entry, source_lang, None)) and bool(
+                getattr(entry, target_lang, None)
+            )
 
-            if not source_text or not target_text:
+        # Exact match (case-insensitive, whole words) in one automaton pass
+        for hit in index.find(text):
+            entry = entries[hit.term_id]
+            if not _usable(entry):
                 continue
-
-            # Try exact match (case-insensitive)
-            pattern = re.compile(r"\b" + re.escape(source_text.lower()) + r"\b")
-            for match in pattern.finditer(text_lower):
-                confidence = 1.0  # Exact match
-
-                term_match = TermMatch(
+            matches.append(
+                TermMatch(
                     term_key=entry.key,
-                    source_text=source_text,
-                    target_text=target_text,
-                    start_pos=match.start(),
-                    end_pos=match.end(),
+                    source_text=getattr(entry, source_lang),
+                    target_text=getattr(entry, target_lang),
+                    start_pos=hit.start,
+                    end_pos=hit.end,
                     category=entry.category,
-                    confidence=confidence,
+                    confidence=1.0,  # Exact match
                 )
-                matches.append(term_match)
-
-            # Try fuzzy match if enabled
-            if self.config.enable_fuzzy_matching:
-                # Match partial words (e.g., "лиц" in "лицевая")
-                if len(source_text) >= 3:
-                    partial_pattern = re.compile(re.escape(source_text.lower()))
-                    for match in partial_pattern.finditer(text_lower):
-                        # Check if already matched exactly
-                        if any(
-                            m.start_pos == match.start() and m.end_pos == match.end()
-                            for m in matches
-                        ):
-                            continue
-
-                        confidence = 0.8  # Fuzzy match
-
-                        if confidence >= self.config.min_term_confidence:
-                            term_match = TermMatch(
-                                term_key=entry.key,
-                                source_text=source_text,
-                                target_text=target_text,
-                                start_pos=match.start(),
-                                end_pos=match.end(),
-                                category=entry.category,
-                                confidence=confidence,
-                            )
-                            matches.append(term_match)
+            )
+
+        # Try fuzzy match if enabled
+        if self.config.enable_fuzzy_matching:
+            exact_spans = {(m.start_pos, m.end_pos) for m in matches}
+            confidence = 0.8  # Fuzzy match
+
+            # Match partial words (e.g., "лиц" in "лицевая")
+            for hit in index.find(text, whole_words=False):
+                entry = entries[hit.term_id]
+                if not _usable(entry) or len(getattr(entry, source_lang)) < 3:
+                    continue
+                # Check if already matched exactly
+                if (hit.start, hit.end) in exact_spans:
+                    continue
+                if confidence >= self.config.min_term_confidence:
+                    matches.append(
+                        TermMatch(
+                            term_key=entry.key,
+                            source_text=getattr(entry, source_lang),
+                            target_text=getattr(entry, target_lang),
+                            start_pos=hit.start,
+                            end_pos=hit.end,
+                            category=entry.category,
+                            confidence=confidence,
+                        )
+                    )
 
         # Sort by position and remove overlaps
         matches.sort(key=lambda m: (m.start_pos, -m.confidence))
@@ -5,8 +5,9 @@ Handles OpenAI API calls with glossary integration and placeholder protection.
 Enhanced from PDF_parser with multi-language batch support.
 
 Production Features:
-- Configurable batch processing
+- Configurable, token-aware batch packing (model context/output limits)
 - Exponential backoff retry logic
+- Bounded number of in-flight batch requests
 - Progress tracking with callbacks
 - Token counting and cost estimation
 - Glossary integration with smart term selection
@@ -20,9 +21,10 @@ import math
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:  # pragma: no cover - optional dependency
     import openai
@@ -37,6 +39,11 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover
     load_dotenv = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None  # type: ignore
+
 from ..core.placeholders import decode_placeholders, encode_placeholders
 
 # Import term validator for glossary compliance
@@ -50,6 +57,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# (translated_segments, input_tokens, output_tokens, model_used)
+BatchOutcome = Tuple[List[str], int, int, str]
+
 
 def _candidate_env_paths() -> List[Path]:
     paths: List[Path] = []
@@ -147,6 +157,7 @@ class TranslationOrchestrator:
     - Newline preservation
     - Production batch processing with configurable limits
     - Retry logic with exponential backoff
+    - Concurrent batch dispatch (``max_in_flight`` requests at a time)
     - Progress tracking and cost estimation
     """
 
@@ -158,6 +169,29 @@ class TranslationOrchestrator:
         "gpt-4-turbo": {"input": 10.00, "output": 30.00},
     }
 
+    # Context window and max completion tokens per model family
+    MODEL_LIMITS = {
+        "gpt-5-nano": {"context": 400_000, "output": 128_000},
+        "gpt-4o-mini": {"context": 128_000, "output": 16_384},
+        "gpt-4o": {"context": 128_000, "output": 16_384},
+        "gpt-4-turbo": {"context": 128_000, "output": 4_096},
+    }
+
+    # Calibrated chars-per-token ratios (o200k/cl100k) used without tiktoken
+    CHARS_PER_TOKEN = {"latin": 4.0, "cyrillic": 2.6, "other": 1.6}
+
+    # Translated tokens per source token, with headroom for expansion
+    OUTPUT_EXPANSION = 1.4
+    # Upper bound on expected completion tokens per batch request; keeps
+    # latency per request reasonable and delimiter parsing reliable
+    MAX_BATCH_OUTPUT_TOKENS = 6_000
+    # Fixed per-request cost of the user prompt instructions
+    PROMPT_OVERHEAD_TOKENS = 150
+    # Segments using at least this share of the batch budget go alone
+    LONG_SEGMENT_RATIO = 0.5
+    # Minimum completion allowance (previous hard-coded value)
+    MIN_COMPLETION_TOKENS = 8_000
+
     def __init__(
         self,
         model: str = "gpt-5-nano",
@@ -168,6 +202,8 @@ class TranslationOrchestrator:
         retry_delay: float = 1.0,
         term_validator: Optional["TermValidator"] = None,
         strict_glossary: bool = False,
+        max_in_flight: int = 1,
+        max_batch_tokens: Optional[int] = None,
     ):
         """
         Initialize orchestrator.
@@ -180,6 +216,9 @@ class TranslationOrchestrator:
             retry_delay: Initial retry delay in seconds (default: 1.0)
             term_validator: Optional TermValidator for glossary compliance (P2)
             strict_glossary: If True, enforce 100% glossary compliance (default: False)
+            max_in_flight: Maximum batch requests sent concurrently (default: 1)
+            max_batch_tokens: Source-token budget per batch request. ``None``
+                derives it from the model's context and output limits.
         """
         self.model = model
         self.fallback_model = fallback_model if fallback_model != model else None
@@ -188,6 +227,8 @@ class TranslationOrchestrator:
         self.retry_delay = retry_delay
         self.term_validator = term_validator
         self.strict_glossary = strict_glossary
+        self.max_in_flight = max(1, int(max_in_flight or 1))
+        self.max_batch_tokens = max_batch_tokens
 
         _ensure_env_loaded()
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -196,6 +237,7 @@ class TranslationOrchestrator:
 
         # Token counting cache
         self._token_cache: Dict[str, int] = {}
+        self._encodings: Dict[str, object] = {}
 
         # Metrics for term validation
         self.validation_metrics = {
@@ -343,7 +385,13 @@ Language code:"""
             deduped_targets.append(lang)
         target_languages = deduped_targets
 
-        batches = self._split_into_batches(segments, self.max_batch_size)
+        batches = self._split_into_batches(
+            segments,
+            self.max_batch_size,
+            token_budget=self._batch_token_budget(
+                source_lang, target_languages[0] if target_languages else "en", glossary_context
+            ),
+        )
         translations: Dict[str, TranslationResult] = {}
         total_input_tokens = 0
         total_output_tokens = 0
@@ -351,17 +399,14 @@ Language code:"""
 
         for target_lang in target_languages:
             translated_segments: List[str] = []
+            outcomes = self._dispatch_batches(
+                batches,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                glossary_context=glossary_context,
+            )
 
-            for batch in batches:
-                translated_batch, input_tokens, output_tokens, batch_model = self._retry_with_backoff(
-                    lambda b=batch: self._translate_batch_with_tokens(
-                        segments=b,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        glossary_context=glossary_context,
-                    )
-                )
-
+            for translated_batch, input_tokens, output_tokens, batch_model in outcomes:
                 translated_segments.extend(translated_batch)
                 total_input_tokens += input_tokens
                 total_output_tokens += output_tokens
@@ -440,7 +485,7 @@ Translated segments:"""
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.3,
-            max_tokens=8000,
+            max_tokens=self._completion_token_limit(segments),
             operation=f"translation:{target_lang}",
         )
 
@@ -556,7 +601,13 @@ Critical rules:
             )
 
         # Split into batches
-        batches = self._split_into_batches(segments, self.max_batch_size)
+        batches = self._split_into_batches(
+            segments,
+            self.max_batch_size,
+            token_budget=self._batch_token_budget(
+                source_lang, target_languages[0] if target_languages else "en", glossary_context
+            ),
+        )
         total_batches = len(batches) * len(target_languages)
 
         # Track costs
@@ -567,24 +618,19 @@ Critical rules:
         # Translate to each target language
         translations: Dict[str, TranslationResult] = {}
         batch_counter = 0
+        segments_completed = 0
 
         for target_lang in target_languages:
-            all_translated_segments = []
 
-            for batch_idx, batch in enumerate(batches):
-                batch_counter += 1
+            def on_batch_complete(batch_idx: int, outcome: BatchOutcome) -> None:
+                # Runs on the calling thread in completion order, so the
+                # counters below never race even with several batches in flight.
+                nonlocal batch_counter, segments_completed
+                nonlocal total_input_tokens, total_output_tokens, total_cost
 
-                # Translate batch with retry
-                translated_batch, input_tokens, output_tokens, batch_model = self._retry_with_backoff(
-                    lambda: self._translate_batch_with_tokens(
-                        segments=batch,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        glossary_context=glossary_context,
-                    )
-                )
-
-                all_translated_segments.extend(translated_batch)
+                _translated, input_tokens, output_tokens, batch_model = outcome
+                batch_counter += 1
+                segments_completed += len(batches[batch_idx])
 
                 # Update cost tracking
                 total_input_tokens += input_tokens
@@ -602,7 +648,7 @@ Critical rules:
                     progress = TranslationProgress(
                         current_batch=batch_counter,
                         total_batches=total_batches,
-                        segments_completed=len(all_translated_segments),
+                        segments_completed=segments_completed,
                         total_segments=len(segments) * len(target_languages),
                         current_language=target_lang,
                         estimated_cost=total_cost,
@@ -611,6 +657,18 @@ Critical rules:
                     )
                     progress_callback(progress)
 
+            outcomes = self._dispatch_batches(
+                batches,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                glossary_context=glossary_context,
+                on_batch_complete=on_batch_complete,
+            )
+
+            all_translated_segments: List[str] = []
+            for translated_batch, *_usage in outcomes:
+                all_translated_segments.extend(translated_batch)
+
             if self.term_validator:
                 all_translated_segments = self._validate_and_enforce_terms(
                     segments=segments,
@@ -633,14 +691,23 @@ Critical rules:
         )
 
     def _split_into_batches(
-        self, segments: List[TranslationSegment], max_batch_size: Optional[int]
+        self,
+        segments: List[TranslationSegment],
+        max_batch_size: Optional[int],
+        token_budget: Optional[int] = None,
     ) -> List[List[TranslationSegment]]:
         """
         Split segments into batches.
 
+        Without ``token_budget`` batches are cut by segment count only. With a
+        budget, consecutive segments are packed until their estimated tokens
+        would exceed it (or ``max_batch_size`` is reached), and long segments
+        are isolated into their own request. Segment order is preserved.
+
         Args:
             segments: Segments to split
-            max_batch_size: Maximum segments per batch
+            max_batch_size: Maximum segments per batch (``None`` = no cap)
+            token_budget: Optional source-token budget per batch
 
         Returns:
             List of segment batches
@@ -648,15 +715,163 @@ Critical rules:
         if not segments:
             return []
 
-        if not max_batch_size or max_batch_size <= 0:
-            return [segments]
+        if max_batch_size is not None and max_batch_size <= 0:
+            max_batch_size = None
+
+        if token_budget is None:
+            if not max_batch_size:
+                return [segments]
+
+            batches: List[List[TranslationSegment]] = []
+            for i in range(0, len(segments), max_batch_size):
+                batch = segments[i : i + max_batch_size]
+                batches.append(batch)
+            return batches
+
+        batches = []
+        current: List[TranslationSegment] = []
+        current_tokens = 0
+        # "\n---\n" delimiter between segments
+        delimiter_tokens = 2
+
+        for segment in segments:
+            segment_tokens = self._count_tokens(segment.text, self.model) + delimiter_tokens
+
+            if segment_tokens >= token_budget * self.LONG_SEGMENT_RATIO:
+                if current:
+                    batches.append(current)
+                    current, current_tokens = [], 0
+                batches.append([segment])
+                continue
+
+            full = current_tokens + segment_tokens > token_budget or (
+                max_batch_size is not None and len(current) >= max_batch_size
+            )
+            if current and full:
+                batches.append(current)
+                current, current_tokens = [], 0
+
+            current.append(segment)
+            current_tokens += segment_tokens
 
-        batches: List[List[TranslationSegment]] = []
-        for i in range(0, len(segments), max_batch_size):
-            batch = segments[i : i + max_batch_size]
-            batches.append(batch)
+        if current:
+            batches.append(current)
         return batches
 
+    def _model_limits(self) -> Dict[str, int]:
+        """Context/output limits shared by the primary and fallback model."""
+
+        def lookup(model_name: str) -> Dict[str, int]:
+            for key in sorted(self.MODEL_LIMITS, key=len, reverse=True):
+                if model_name.startswith(key):
+                    return self.MODEL_LIMITS[key]
+            return self.MODEL_LIMITS["gpt-4o-mini"]
+
+        models = [self.model] + ([self.fallback_model] if self.fallback_model else [])
+        limits = [lookup(name) for name in models]
+        return {
+            "context": min(item["context"] for item in limits),
+            "output": min(item["output"] for item in limits),
+        }
+
+    def _batch_token_budget(
+        self,
+        source_lang: str,
+        target_lang: str,
+        glossary_context: Optional[str],
+    ) -> int:
+        """
+        Source-token budget for one batch request.
+
+        The system prompt (with glossary context) is repeated in every batch,
+        so the budget is what fits beside it in the context window while the
+        expected translation stays within the completion limit.
+        """
+        if self.max_batch_tokens:
+            return self.max_batch_tokens
+
+        limits = self._model_limits()
+        system_prompt = self._build_system_prompt(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            glossary_context=glossary_context,
+        )
+        prompt_tokens = self._count_tokens(system_prompt, self.model) + self.PROMPT_OVERHEAD_TOKENS
+
+        output_budget = min(int(limits["output"] * 0.75), self.MAX_BATCH_OUTPUT_TOKENS)
+        by_output = int(output_budget / self.OUTPUT_EXPANSION)
+        by_context = limits["context"] - prompt_tokens - limits["output"]
+        return max(1, min(by_output, by_context))
+
+    def _completion_token_limit(self, segments: List[TranslationSegment]) -> int:
+        """Completion allowance for a request, sized to the batch contents."""
+
+        limits = self._model_limits()
+        source_tokens = sum(self._count_tokens(s.text, self.model) for s in segments)
+        wanted = max(self.MIN_COMPLETION_TOKENS, int(source_tokens * self.OUTPUT_EXPANSION * 2))
+        return min(wanted, limits["output"])
+
+    def _dispatch_batches(
+        self,
+        batches: List[List[TranslationSegment]],
+        source_lang: str,
+        target_lang: str,
+        glossary_context: Optional[str],
+        on_batch_complete: Optional[Callable[[int, BatchOutcome], None]] = None,
+    ) -> List[BatchOutcome]:
+        """
+        Translate batches with at most ``max_in_flight`` requests at a time.
+
+        Each batch retries with its own backoff inside its worker, so a
+        rate-limited batch does not stall the others.
+
+        Args:
+            batches: Segment batches from ``_split_into_batches``
+            source_lang: Source language code
+            target_lang: Target language code
+            glossary_context: Optional glossary context
+            on_batch_complete: Called on the calling thread as
+                ``(batch_index, outcome)`` whenever a batch finishes
+
+        Returns:
+            Batch outcomes in the same order as ``batches``
+        """
+
+        def run(batch: List[TranslationSegment]) -> BatchOutcome:
+            return self._retry_with_backoff(
+                lambda: self._translate_batch_with_tokens(
+                    segments=batch,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    glossary_context=glossary_context,
+                )
+            )
+
+        outcomes: List[Optional[BatchOutcome]] = [None] * len(batches)
+        workers = min(self.max_in_flight, len(batches))
+
+        if workers <= 1:
+            for idx, batch in enumerate(batches):
+                outcomes[idx] = run(batch)
+                if on_batch_complete:
+                    on_batch_complete(idx, outcomes[idx])
+            return outcomes  # type: ignore[return-value]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kps-llm") as pool:
+            futures = {pool.submit(run, batch): idx for idx, batch in enumerate(batches)}
+            try:
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    outcomes[idx] = future.result()
+                    if on_batch_complete:
+                        on_batch_complete(idx, outcomes[idx])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return outcomes  # type: ignore[return-value]
+
     def _retry_with_backoff(self, func: Callable, max_retries: Optional[int] = None):
         """
         Retry function with exponential backoff.
@@ -757,7 +972,7 @@ Translated segments:"""
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.3,
-            max_tokens=8000,
+            max_tokens=self._completion_token_limit(segments),
             operation=f"translation_batch:{target_lang}",
         )
         response_model = getattr(response, "_kps_model_used", getattr(response, "model", self.model))
@@ -835,32 +1050,63 @@ Translated segments:"""
 
     def _count_tokens(self, text: str, model: str) -> int:
         """
-        Estimate token count for text.
+        Count tokens for text.
 
-        Uses simple heuristic: ~4 characters per token for most models.
-        For production, consider using tiktoken library for exact counting.
+        Uses tiktoken when installed; otherwise falls back to a per-script
+        estimate (Latin, Cyrillic and other characters tokenize differently).
 
         Args:
             text: Text to count tokens for
             model: Model name
 
         Returns:
-            Estimated token count
+            Token count (exact with tiktoken, estimated otherwise)
         """
         # Check cache
         cache_key = f"{model}:{hash(text)}"
         if cache_key in self._token_cache:
             return self._token_cache[cache_key]
 
-        # Simple heuristic: 4 chars per token
-        # For Cyrillic/Asian languages, adjust slightly
-        estimated_tokens = math.ceil(len(text) / 4)
+        encoding = self._get_encoding(model)
+        if encoding is not None:
+            estimated_tokens = len(encoding.encode(text, disallowed_special=()))
+        else:
+            estimated_tokens = self._estimate_tokens(text)
 
         # Cache result
         self._token_cache[cache_key] = estimated_tokens
 
         return estimated_tokens
 
+    def _get_encoding(self, model: str):
+        """Return a cached tiktoken encoding for ``model`` (None without tiktoken)."""
+
+        if tiktoken is None:
+            return None
+        if model not in self._encodings:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except Exception:
+                try:
+                    encoding = tiktoken.get_encoding("o200k_base")
+                except Exception:  # pragma: no cover - encoding files unavailable
+                    encoding = None
+            self._encodings[model] = encoding
+        return self._encodings[model]
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Calibrated token estimate by script when no tokenizer is available."""
+
+        if not text:
+            return 0
+        cyrillic = len(re.findall(r"[\u0400-\u04FF]", text))
+        latin = sum(1 for ch in text if ch.isascii())
+        other = len(text) - cyrillic - latin
+        ratios = self.CHARS_PER_TOKEN
+        return math.ceil(
+            latin / ratios["latin"] + cyrillic / ratios["cyrillic"] + other / ratios["other"]
+        )
+
     def _calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
         """
         Calculate estimated cost for API call.
@@ -901,6 +1147,7 @@ Translated segments:"""
         """
         # Import selector here to avoid circular dependency
         from .glossary.selector import select_glossary_terms
+        from .glossary.term_index import glossary_term_index
 
         # Extract all text from segments
         all_text = " ".join([s.text for s in segments])
@@ -927,6 +1174,7 @@ Translated segments:"""
             glossary_entries=glossary_entries,
             source_lang=source_lang,
             max_terms=50,
+            term_index=glossary_term_index(glossary_manager, source_lang),
         )
 
         # Convert back to GlossaryEntry objects
@@ -1201,6 +1449,7 @@ Translated segments:"""
 
 
 __all__ = [
+    "BatchOutcome",
     "TranslationOrchestrator",
     "TranslationSegment",
     "TranslationResult",
@@ -0,0 +1,134 @@
+"""
+In-document segment deduplication before translation.
+
+Knitting patterns repeat the same lines ("Repeat rows 1–4", abbreviations,
+size-table headers) many times. Numbers, URLs and asset markers are already
+encoded as ``<ph id="PH001" />`` by the segmenter, so repeats usually share
+the same encoded text and differ at most in placeholder values.
+
+Usage:
+    plan = deduplicate_segments(segments)
+    result = translator.translate(plan.unique_segments, target_language="en")
+    translations = plan.expand(result.segments)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from kps.core.placeholders import decode_placeholders
+
+from .orchestrator import TranslationSegment
+
+
+@dataclass
+class DedupPlan:
+    """Mapping between document segments and the unique texts to translate."""
+
+    segments: List[TranslationSegment]  # Original segments, document order
+    unique_segments: List[TranslationSegment]  # One representative per group
+    assignments: List[int]  # Original index → index in unique_segments
+    decode_per_segment: List[bool]  # Per unique: decode with each member's values
+
+    @property
+    def total(self) -> int:
+        return len(self.segments)
+
+    @property
+    def unique(self) -> int:
+        return len(self.unique_segments)
+
+    @property
+    def ratio(self) -> float:
+        """Share of segments that did not need their own translation (0.0-1.0)."""
+        if not self.segments:
+            return 0.0
+        return 1.0 - self.unique / self.total
+
+    def expand(self, unique_translations: List[str]) -> List[str]:
+        """
+        Fan translations of unique segments back out to every segment.
+
+        Args:
+            unique_translations: Translations in ``unique_segments`` order
+
+        Returns:
+            Translations in original document order
+        """
+        if len(unique_translations) != self.unique:
+            raise ValueError(
+                f"Expected {self.unique} unique translations, got {len(unique_translations)}"
+            )
+
+        expanded: List[str] = []
+        for segment, unique_idx in zip(self.segments, self.assignments):
+            translation = unique_translations[unique_idx]
+            if self.decode_per_segment[unique_idx] and translation is not None:
+                translation = decode_placeholders(translation, segment.placeholders)
+            expanded.append(translation)
+        return expanded
+
+
+def deduplicate_segments(
+    segments: List[TranslationSegment],
+    ignore_placeholder_values: bool = False,
+) -> DedupPlan:
+    """
+    Collapse segments with identical encoded text.
+
+    By default segments are merged only when their placeholder values match
+    too, so the shared translation can be copied verbatim. With
+    ``ignore_placeholder_values`` segments that differ only in numbers, URLs
+    or asset markers are merged as well; their representative is translated
+    with placeholders left encoded and each segment decodes its own values.
+
+    Args:
+        segments: Segments from ``Segmenter.segment_document``
+        ignore_placeholder_values: Merge texts identical modulo placeholders
+
+    Returns:
+        DedupPlan describing unique segments and how to fan results out
+    """
+    groups: Dict[object, int] = {}
+    members: List[List[TranslationSegment]] = []
+    assignments: List[int] = []
+
+    for segment in segments:
+        placeholders: Tuple[Tuple[str, str], ...] = tuple(
+            sorted((segment.placeholders or {}).items())
+        )
+        key = segment.text if ignore_placeholder_values else (segment.text, placeholders)
+        unique_idx = groups.get(key)
+        if unique_idx is None:
+            unique_idx = len(members)
+            groups[key] = unique_idx
+            members.append([])
+        members[unique_idx].append(segment)
+        assignments.append(unique_idx)
+
+    unique_segments: List[TranslationSegment] = []
+    decode_per_segment: List[bool] = []
+    for group in members:
+        first = group[0]
+        mixed_values = any(member.placeholders != first.placeholders for member in group[1:])
+        if mixed_values:
+            # Keep placeholders encoded; each member decodes its own values.
+            first = TranslationSegment(
+                segment_id=first.segment_id,
+                text=first.text,
+                placeholders={},
+                doc_ref=first.doc_ref,
+            )
+        unique_segments.append(first)
+        decode_per_segment.append(mixed_values)
+
+    return DedupPlan(
+        segments=list(segments),
+        unique_segments=unique_segments,
+        assignments=assignments,
+        decode_per_segment=decode_per_segment,
+    )
+
+
+__all__ = ["DedupPlan", "deduplicate_segments"]
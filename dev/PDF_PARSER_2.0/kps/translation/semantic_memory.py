@@ -13,6 +13,7 @@ Semantic Translation Memory - умная память переводов с embe
 - Cosine similarity для поиска похожих
 - SQLite + JSON для хранения
 - In-memory cache для скорости
+- In-process vector index (float matrix / HNSW) для RAG по всей памяти
 """
 
 from __future__ import annotations
@@ -21,11 +22,12 @@ import hashlib
 import json
 import logging
 import sqlite3
+import sys
 import time
 from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 # Опциональный импорт для embeddings
 try:
@@ -37,6 +39,9 @@ except ImportError:
     np = None
 
 from kps.clients.embeddings import EmbeddingsClient
+from kps.storage import LRUCache, SQLiteDatabase
+
+from .vector_index import create_vector_index
 
 
 logger = logging.getLogger(__name__)
@@ -54,7 +59,7 @@ class SemanticEntry:
     timestamp: float
     usage_count: int = 1
     quality_score: float = 1.0
-    embedding: Optional[List[float]] = None  # Векторное представление
+    embedding: Optional[Union[List[float], "np.ndarray"]] = None  # Векторное представление
     context: str = ""  # Контекст использования
 
 
@@ -105,6 +110,15 @@ class SemanticTranslationMemory:
         ... )
     """
 
+    # Кандидатов сверх limit для точного пересчёта сходства
+    VECTOR_SEARCH_OVERFETCH = 8
+    # Допуск по косинусу на погрешность float16 (embedding_q16)
+    VECTOR_SEARCH_TOLERANCE = 0.01
+    # Максимум параметров в одном IN (...) (лимит SQLite - 999)
+    BULK_LOOKUP_CHUNK = 500
+    # Оценка накладных расходов одной записи кэша (объект, dict, ссылки), байт
+    CACHE_ENTRY_OVERHEAD = 400
+
     def __init__(
         self,
         db_path: str,
@@ -112,6 +126,11 @@ class SemanticTranslationMemory:
         embedding_cache_size: int = 1000,
         embedding_client: Optional[EmbeddingsClient] = None,
         embedding_dimensions: Optional[int] = 1536,
+        vector_index_backend: str = "auto",
+        cache_max_entries: Optional[int] = 10_000,
+        cache_max_bytes: Optional[int] = 64 * 1024 * 1024,
+        cache_ttl_seconds: Optional[float] = None,
+        cache_embeddings: bool = True,
     ):
         """
         Инициализация семантической памяти.
@@ -120,6 +139,11 @@ class SemanticTranslationMemory:
             db_path: Путь к базе данных SQLite
             use_embeddings: Использовать embeddings для семантического поиска
             embedding_cache_size: Размер кэша embeddings в памяти
+            vector_index_backend: "flat", "hnsw" или "auto" (см. vector_index)
+            cache_max_entries: Максимум записей в LRU-кэше (None - без лимита)
+            cache_max_bytes: Максимальный оценочный размер кэша в байтах
+            cache_ttl_seconds: Время жизни записи в кэше (None - бессрочно)
+            cache_embeddings: Хранить embeddings в кэше (float16) или отбрасывать
         """
         self.db_path = Path(db_path)
         self.embedding_client = embedding_client
@@ -138,109 +162,130 @@ class SemanticTranslationMemory:
         )
         self.embedding_cache_size = embedding_cache_size
 
-        # In-memory кэш для быстрого доступа
-        self.cache: Dict[str, SemanticEntry] = {}
+        # In-memory LRU-кэш для быстрого доступа (ограничен по числу,
+        # размеру и возрасту записей)
+        self.cache_embeddings = cache_embeddings
+        self.cache = LRUCache(
+            "semantic",
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            ttl_seconds=cache_ttl_seconds,
+            sizeof=self._entry_size,
+        )
         self.embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
-        # Инициализация БД
+        # Векторные индексы по языковым парам (загружаются лениво из БД)
+        self.vector_index_backend = vector_index_backend
+        self._vector_indices: Dict[Tuple[str, str], object] = {}
+
+        # Инициализация БД (соединения на поток, WAL)
+        self._db = SQLiteDatabase(self.db_path)
         self._init_database()
 
         # Загрузить популярные записи в кэш
         self._warm_up_cache()
 
+    def transaction(self, immediate: bool = True):
+        """
+        Общая транзакция для серии записей (один commit на весь scope).
+
+        Вложенные вызовы add_translation/suggest_glossary_term/set_metadata
+        присоединяются к ней, например на весь прогон перевода.
+        """
+        return self._db.transaction(immediate=immediate)
+
+    def close(self) -> None:
+        """Закрыть соединения с БД всех потоков."""
+        self._db.close()
+
     def _init_database(self) -> None:
         """Создать структуру базы данных."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
 
-        # Таблица переводов
-        cursor.execute(
+            # Таблица переводов
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    hash TEXT UNIQUE NOT NULL,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    glossary_terms TEXT,  -- JSON array
+                    timestamp REAL NOT NULL,
+                    usage_count INTEGER DEFAULT 1,
+                    quality_score REAL DEFAULT 1.0,
+                    embedding BLOB,  -- Numpy array as bytes
+                    embedding_q16 BLOB,  -- Quantized embedding
+                    embedding_version INTEGER DEFAULT 0,
+                    context TEXT,
+                    created_at REAL DEFAULT (datetime('now'))
+                )
             """
-            CREATE TABLE IF NOT EXISTS translations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                hash TEXT UNIQUE NOT NULL,
-                source_text TEXT NOT NULL,
-                translated_text TEXT NOT NULL,
-                source_lang TEXT NOT NULL,
-                target_lang TEXT NOT NULL,
-                glossary_terms TEXT,  -- JSON array
-                timestamp REAL NOT NULL,
-                usage_count INTEGER DEFAULT 1,
-                quality_score REAL DEFAULT 1.0,
-                embedding BLOB,  -- Numpy array as bytes
-                embedding_q16 BLOB,  -- Quantized embedding
-                embedding_version INTEGER DEFAULT 0,
-                context TEXT,
-                created_at REAL DEFAULT (datetime('now'))
             )
-        """
-        )
 
-        cursor.execute(
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
             """
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT
             )
-        """
-        )
 
-        self._ensure_column(
-            cursor,
-            "translations",
-            "embedding_q16",
-            "ALTER TABLE translations ADD COLUMN embedding_q16 BLOB",
-        )
-        self._ensure_column(
-            cursor,
-            "translations",
-            "embedding_version",
-            "ALTER TABLE translations ADD COLUMN embedding_version INTEGER DEFAULT 0",
-        )
+            self._ensure_column(
+                cursor,
+                "translations",
+                "embedding_q16",
+                "ALTER TABLE translations ADD COLUMN embedding_q16 BLOB",
+            )
+            self._ensure_column(
+                cursor,
+                "translations",
+                "embedding_version",
+                "ALTER TABLE translations ADD COLUMN embedding_version INTEGER DEFAULT 0",
+            )
 
-        # Индексы для быстрого поиска
-        cursor.execute(
+            # Индексы для быстрого поиска
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_hash ON translations(hash)
             """
-            CREATE INDEX IF NOT EXISTS idx_hash ON translations(hash)
-        """
-        )
-        cursor.execute(
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_lang_pair ON translations(source_lang, target_lang)
             """
-            CREATE INDEX IF NOT EXISTS idx_lang_pair ON translations(source_lang, target_lang)
-        """
-        )
-        cursor.execute(
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_usage ON translations(usage_count DESC)
             """
-            CREATE INDEX IF NOT EXISTS idx_usage ON translations(usage_count DESC)
-        """
-        )
-        cursor.execute(
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_quality ON translations(quality_score DESC)
             """
-            CREATE INDEX IF NOT EXISTS idx_quality ON translations(quality_score DESC)
-        """
-        )
+            )
 
-        # Таблица предложений терминов
-        cursor.execute(
+            # Таблица предложений терминов
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS term_suggestions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    frequency INTEGER DEFAULT 1,
+                    confidence REAL DEFAULT 0.5,
+                    contexts TEXT,  -- JSON array
+                    UNIQUE(source_text, source_lang, target_lang)
+                )
             """
-            CREATE TABLE IF NOT EXISTS term_suggestions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_text TEXT NOT NULL,
-                translated_text TEXT,
-                source_lang TEXT NOT NULL,
-                target_lang TEXT NOT NULL,
-                frequency INTEGER DEFAULT 1,
-                confidence REAL DEFAULT 0.5,
-                contexts TEXT,  -- JSON array
-                UNIQUE(source_text, source_lang, target_lang)
             )
-        """
-        )
-
-        conn.commit()
-        conn.close()
 
     def _ensure_column(
         self, cursor: sqlite3.Cursor, table: str, column: str, ddl: str
@@ -254,7 +299,7 @@ class SemanticTranslationMemory:
 
     def _warm_up_cache(self) -> None:
         """Загрузить популярные записи в кэш."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         # Загрузить топ-N по usage_count
@@ -270,9 +315,7 @@ class SemanticTranslationMemory:
         for row in cursor.fetchall():
             entry = self._row_to_entry(row)
             key = self._make_key(entry.source_text, entry.source_lang, entry.target_lang)
-            self.cache[key] = entry
-
-        conn.close()
+            self._cache_entry(key, entry)
 
     def add_translation(
         self,
@@ -300,84 +343,142 @@ class SemanticTranslationMemory:
             glossary_version: Версия глоссария (NEW - для правильного кэширования)
             model: Название модели (NEW - для правильного кэширования)
         """
-        # IMPROVED: Include glossary_version and model in cache key
-        key = self._make_key(
-            source_text,
+        self.add_translations_bulk(
+            [(source_text, translated_text, glossary_terms)],
             source_lang,
             target_lang,
+            quality_score=quality_score,
+            context=context,
             glossary_version=glossary_version,
             model=model,
         )
 
-        # Вычислить embedding
-        embedding = None
-        embedding_bytes = None
-        embedding_q16 = None
-        embedding_version_value = 0
+    def add_translations_bulk(
+        self,
+        translations: Sequence[Tuple[str, str, List[str]]],
+        source_lang: str,
+        target_lang: str,
+        quality_score: float = 1.0,
+        context: str = "",
+        glossary_version: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> int:
+        """
+        Добавить пачку переводов одной транзакцией.
+
+        Embeddings для всех текстов запрашиваются одним вызовом
+        ``create_vectors`` (батчи по ``max_batch``), вместо запроса на сегмент.
+
+        Args:
+            translations: Список (source_text, translated_text, glossary_terms)
+            source_lang: Исходный язык
+            target_lang: Целевой язык
+            quality_score: Оценка качества (0.0-1.0)
+            context: Контекст использования
+            glossary_version: Версия глоссария
+            model: Название модели
+
+        Returns:
+            Количество новых записей
+        """
+        if not translations:
+            return 0
+
+        # Вычислить embeddings
+        embeddings: List[Optional[np.ndarray]] = [None] * len(translations)
         if self.use_embeddings:
-            embedding = self._get_embedding(source_text, source_lang)
-            if embedding is not None:
-                embedding_bytes = self._embedding_to_bytes(embedding)
-                embedding_q16 = self._quantize_embedding(embedding)
-                embedding_version_value = 1
+            embeddings = self._get_embeddings([item[0] for item in translations], source_lang)
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        entries: List[Tuple[str, SemanticEntry, Optional[np.ndarray]]] = []
+        inserted: List[Tuple[str, np.ndarray]] = []
 
-        try:
-            # Попробовать вставить
-            cursor.execute(
-                """
-                INSERT INTO translations
-                (hash, source_text, translated_text, source_lang, target_lang,
-                 glossary_terms, timestamp, quality_score, embedding, embedding_q16,
-                 embedding_version, context)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    key,
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+
+            for (source_text, translated_text, glossary_terms), embedding in zip(
+                translations, embeddings
+            ):
+                # IMPROVED: Include glossary_version and model in cache key
+                key = self._make_key(
                     source_text,
-                    translated_text,
                     source_lang,
                     target_lang,
-                    json.dumps(glossary_terms),
-                    time.time(),
-                    quality_score,
-                    embedding_bytes,
-                    embedding_q16,
-                    embedding_version_value,
-                    context,
-                ),
-            )
-        except sqlite3.IntegrityError:
-            # Уже существует - обновить
-            cursor.execute(
-                """
-                UPDATE translations
-                SET usage_count = usage_count + 1,
-                    quality_score = (quality_score + ?) / 2,
-                    timestamp = ?
-                WHERE hash = ?
-            """,
-                (quality_score, time.time(), key),
-            )
+                    glossary_version=glossary_version,
+                    model=model,
+                )
 
-        conn.commit()
-        conn.close()
+                embedding_bytes = None
+                embedding_q16 = None
+                embedding_version_value = 0
+                if embedding is not None:
+                    embedding_bytes = self._embedding_to_bytes(embedding)
+                    embedding_q16 = self._quantize_embedding(embedding)
+                    embedding_version_value = 1
+
+                try:
+                    # Попробовать вставить
+                    cursor.execute(
+                        """
+                        INSERT INTO translations
+                        (hash, source_text, translated_text, source_lang, target_lang,
+                         glossary_terms, timestamp, quality_score, embedding, embedding_q16,
+                         embedding_version, context)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                        (
+                            key,
+                            source_text,
+                            translated_text,
+                            source_lang,
+                            target_lang,
+                            json.dumps(glossary_terms),
+                            time.time(),
+                            quality_score,
+                            embedding_bytes,
+                            embedding_q16,
+                            embedding_version_value,
+                            context,
+                        ),
+                    )
+                    if embedding is not None:
+                        inserted.append((key, embedding))
+                except sqlite3.IntegrityError:
+                    # Уже существует - обновить
+                    cursor.execute(
+                        """
+                        UPDATE translations
+                        SET usage_count = usage_count + 1,
+                            quality_score = (quality_score + ?) / 2,
+                            timestamp = ?
+                        WHERE hash = ?
+                    """,
+                        (quality_score, time.time(), key),
+                    )
+
+                entry = SemanticEntry(
+                    source_text=source_text,
+                    translated_text=translated_text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    glossary_terms=glossary_terms,
+                    timestamp=time.time(),
+                    quality_score=quality_score,
+                    embedding=embedding,
+                    context=context,
+                )
+                entries.append((key, entry, embedding))
+
+        index = self._vector_indices.get((source_lang, target_lang))
+        if index is not None:
+            for key, embedding in inserted:
+                if index.dimensions == len(embedding):
+                    index.add(key, embedding)
 
         # Обновить кэш
-        entry = SemanticEntry(
-            source_text=source_text,
-            translated_text=translated_text,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            glossary_terms=glossary_terms,
-            timestamp=time.time(),
-            quality_score=quality_score,
-            embedding=embedding.tolist() if embedding is not None else None,
-            context=context,
-        )
-        self.cache[key] = entry
+        for key, entry, _embedding in entries:
+            self._cache_entry(key, entry)
+
+        return len(inserted)
 
     def get_translation(
         self,
@@ -410,11 +511,12 @@ class SemanticTranslationMemory:
         )
 
         # Сначала проверить in-memory кэш
-        if key in self.cache:
-            return self.cache[key]
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
 
         # Поискать в БД
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -425,15 +527,87 @@ class SemanticTranslationMemory:
         )
 
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             entry = self._row_to_entry(row)
-            self.cache[key] = entry  # Добавить в кэш
+            self._cache_entry(key, entry)  # Добавить в кэш
             return entry
 
         return None
 
+    def get_translations_bulk(
+        self,
+        texts: Sequence[str],
+        source_lang: str,
+        target_lang: str,
+        glossary_version: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> List[Optional[SemanticEntry]]:
+        """
+        Точные переводы для списка текстов.
+
+        Промахи in-memory кэша разрешаются одним запросом
+        ``WHERE hash IN (...)`` вместо запроса на сегмент.
+
+        Returns:
+            Список той же длины, что ``texts`` (None - нет в памяти)
+        """
+        keys = [
+            self._make_key(
+                text,
+                source_lang,
+                target_lang,
+                glossary_version=glossary_version,
+                model=model,
+            )
+            for text in texts
+        ]
+
+        found: Dict[str, SemanticEntry] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get(key)
+            if cached is not None:
+                found[key] = cached
+            else:
+                missing.append(key)
+
+        if missing:
+            conn = self._db.connection()
+            for start in range(0, len(missing), self.BULK_LOOKUP_CHUNK):
+                chunk = missing[start : start + self.BULK_LOOKUP_CHUNK]
+                rows = conn.execute(
+                    f"SELECT * FROM translations WHERE hash IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    entry = self._row_to_entry(row)
+                    self._cache_entry(row[1], entry)
+                    found[row[1]] = entry
+
+        return [found.get(key) for key in keys]
+
+    def _cache_entry(self, key: str, entry: SemanticEntry) -> None:
+        """Положить запись в LRU-кэш; embedding ужимается до float16."""
+        if entry.embedding is not None:
+            if self.cache_embeddings and NUMPY_AVAILABLE:
+                entry.embedding = np.asarray(entry.embedding, dtype=np.float16)
+            else:
+                entry.embedding = None
+        self.cache[key] = entry
+
+    @classmethod
+    def _entry_size(cls, entry: SemanticEntry) -> int:
+        """Оценка памяти, занимаемой записью кэша (байт)."""
+        size = cls.CACHE_ENTRY_OVERHEAD
+        size += sys.getsizeof(entry.source_text) + sys.getsizeof(entry.translated_text)
+        size += sys.getsizeof(entry.context)
+        size += sum(sys.getsizeof(term) for term in entry.glossary_terms)
+        embedding = entry.embedding
+        if embedding is not None:
+            size += getattr(embedding, "nbytes", None) or 32 * len(embedding)
+        return size
+
     def delete_translation(
         self,
         source_text: str,
@@ -452,15 +626,17 @@ class SemanticTranslationMemory:
             model=model,
         )
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM translations WHERE hash = ?", (key,))
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM translations WHERE hash = ?", (key,))
 
         self.cache.pop(key, None)
         self.embedding_cache.pop(key, None)
 
+        index = self._vector_indices.get((source_lang, target_lang))
+        if index is not None:
+            index.remove(key)
+
     def find_similar(
         self,
         source_text: str,
@@ -499,23 +675,46 @@ class SemanticTranslationMemory:
         if query_embedding is None:
             return []
 
-        # Получить все записи для языковой пары
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        return self._search_similar(
+            query_embedding, source_lang, target_lang, threshold, limit
+        )
+
+    def _search_similar(
+        self,
+        query_embedding: np.ndarray,
+        source_lang: str,
+        target_lang: str,
+        threshold: float,
+        limit: int,
+    ) -> List[SimilarTranslation]:
+        """Семантический поиск по готовому embedding запроса."""
+        index = self._get_vector_index(source_lang, target_lang)
+        if index is None or len(query_embedding) != index.dimensions:
+            return []
+
+        # Кандидаты из индекса по всей памяти (с запасом на погрешность
+        # float16), затем точный пересчёт по float32 embedding
+        min_cosine = 2.0 * threshold - 1.0 - self.VECTOR_SEARCH_TOLERANCE
+        candidates = index.search(
+            query_embedding, k=limit + self.VECTOR_SEARCH_OVERFETCH, min_cosine=min_cosine
+        )
+        if not candidates:
+            return []
 
+        hashes = [key for key, _ in candidates]
+        conn = self._db.connection()
+        cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT * FROM translations
-            WHERE source_lang = ? AND target_lang = ?
-            AND embedding IS NOT NULL
-            ORDER BY usage_count DESC, quality_score DESC
-            LIMIT 1000
-        """,
-            (source_lang, target_lang),
+            f"SELECT * FROM translations WHERE hash IN ({','.join('?' * len(hashes))})",
+            hashes,
         )
+        rows = {row[1]: row for row in cursor.fetchall()}
 
         results = []
-        for row in cursor.fetchall():
+        for key in hashes:
+            row = rows.get(key)
+            if row is None:
+                continue
             entry = self._row_to_entry(row)
 
             if entry.embedding is None:
@@ -532,13 +731,67 @@ class SemanticTranslationMemory:
                     )
                 )
 
-        conn.close()
-
         # Сортировать по сходству
         results.sort(key=lambda x: x.similarity, reverse=True)
 
         return results[:limit]
 
+    def _get_vector_index(self, source_lang: str, target_lang: str):
+        """
+        Векторный индекс языковой пары; при первом обращении строится из БД.
+
+        Читает компактный embedding_q16 (float16), для старых строк без него -
+        полный float32 embedding.
+        """
+        pair = (source_lang, target_lang)
+        index = self._vector_indices.get(pair)
+        if index is not None:
+            return index
+        if not NUMPY_AVAILABLE:
+            return None
+
+        conn = self._db.connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT hash, embedding_q16, embedding FROM translations
+            WHERE source_lang = ? AND target_lang = ?
+            AND embedding IS NOT NULL
+        """,
+            (source_lang, target_lang),
+        )
+        rows = cursor.fetchall()
+
+        keys: List[str] = []
+        vectors: List[np.ndarray] = []
+        dimensions = self.embedding_dimensions
+        for key, q16_bytes, embedding_bytes in rows:
+            if q16_bytes:
+                vector = np.frombuffer(q16_bytes, dtype=np.float16)
+            else:
+                vector = self._bytes_to_embedding(embedding_bytes)
+            if dimensions is None:
+                dimensions = len(vector)
+            if len(vector) != dimensions:
+                continue
+            keys.append(key)
+            vectors.append(vector)
+
+        if dimensions is None:
+            # Пустая память без известной размерности - построим позже
+            return None
+
+        index = create_vector_index(
+            dimensions, backend=self.vector_index_backend, expected_size=len(keys)
+        )
+        if keys:
+            index.add_many(keys, np.vstack(vectors))
+        self._vector_indices[pair] = index
+        logger.debug(
+            "Vector index %s→%s loaded: %d embeddings", source_lang, target_lang, len(keys)
+        )
+        return index
+
     def get_rag_examples(
         self,
         query_text: str,
@@ -573,6 +826,57 @@ class SemanticTranslationMemory:
 
         return examples
 
+    def get_rag_examples_bulk(
+        self,
+        query_texts: Sequence[str],
+        source_lang: str,
+        target_lang: str,
+        limit: int = 5,
+        min_similarity: Union[float, Sequence[float]] = 0.7,
+    ) -> List[List[Tuple[str, str, float]]]:
+        """
+        RAG для нескольких запросов: все embeddings одним батчем.
+
+        Args:
+            query_texts: Тексты запросов
+            source_lang: Исходный язык
+            target_lang: Целевой язык
+            limit: Максимум примеров на запрос
+            min_similarity: Порог сходства (общий или по запросу)
+
+        Returns:
+            Для каждого запроса список (source, target, similarity)
+        """
+        if isinstance(min_similarity, (int, float)):
+            thresholds = [float(min_similarity)] * len(query_texts)
+        else:
+            thresholds = list(min_similarity)
+
+        results: List[List[Tuple[str, str, float]]] = [[] for _ in query_texts]
+        pending: List[int] = []
+        for position, query_text in enumerate(query_texts):
+            exact = self.get_translation(query_text, source_lang, target_lang)
+            if exact:
+                results[position] = [(exact.source_text, exact.translated_text, 1.0)]
+            else:
+                pending.append(position)
+
+        if not pending or not self.use_embeddings:
+            return results
+
+        embeddings = self._get_embeddings([query_texts[i] for i in pending], source_lang)
+        for position, query_embedding in zip(pending, embeddings):
+            if query_embedding is None:
+                continue
+            similar = self._search_similar(
+                query_embedding, source_lang, target_lang, thresholds[position], limit
+            )
+            results[position] = [
+                (s.entry.source_text, s.entry.translated_text, s.similarity) for s in similar
+            ]
+
+        return results
+
     # Compatibility helpers -------------------------------------------------
     def get_few_shot_examples(
         self,
@@ -587,7 +891,7 @@ class SemanticTranslationMemory:
         so higher-level translators can reuse semantic memory transparently.
         """
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -601,14 +905,13 @@ class SemanticTranslationMemory:
         )
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [(row[0], row[1]) for row in rows]
 
     def save(self) -> None:
         """API compatibility shim (data is committed eagerly)."""
 
-        # SQLite writes happen eagerly on add_translation, so nothing to do.
+        # Writes commit at the end of their transaction scope, so nothing to do.
         return None
 
     def suggest_glossary_term(
@@ -623,62 +926,117 @@ class SemanticTranslationMemory:
         """Store candidate glossary term for later review."""
 
         contexts: List[str] = []
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT contexts, frequency FROM term_suggestions
-            WHERE source_text=? AND source_lang=? AND target_lang=?
-        """,
-            (source_text, source_lang, target_lang),
-        )
-        row = cursor.fetchone()
-        if row:
-            stored_contexts = json.loads(row[0]) if row[0] else []
-            contexts = stored_contexts
-            frequency = row[1] + 1
-            if context:
-                contexts.append(context)
-                contexts = contexts[-5:]
             cursor.execute(
                 """
-                UPDATE term_suggestions
-                SET translated_text=?, frequency=?, confidence=?, contexts=?
+                SELECT contexts, frequency FROM term_suggestions
                 WHERE source_text=? AND source_lang=? AND target_lang=?
             """,
-                (
-                    translated_text,
-                    frequency,
-                    confidence,
-                    json.dumps(contexts, ensure_ascii=False),
-                    source_text,
-                    source_lang,
-                    target_lang,
-                ),
+                (source_text, source_lang, target_lang),
             )
-        else:
-            if context:
-                contexts.append(context)
-            cursor.execute(
+            row = cursor.fetchone()
+            if row:
+                stored_contexts = json.loads(row[0]) if row[0] else []
+                contexts = stored_contexts
+                frequency = row[1] + 1
+                if context:
+                    contexts.append(context)
+                    contexts = contexts[-5:]
+                cursor.execute(
+                    """
+                    UPDATE term_suggestions
+                    SET translated_text=?, frequency=?, confidence=?, contexts=?
+                    WHERE source_text=? AND source_lang=? AND target_lang=?
+                """,
+                    (
+                        translated_text,
+                        frequency,
+                        confidence,
+                        json.dumps(contexts, ensure_ascii=False),
+                        source_text,
+                        source_lang,
+                        target_lang,
+                    ),
+                )
+            else:
+                if context:
+                    contexts.append(context)
+                cursor.execute(
+                    """
+                    INSERT INTO term_suggestions
+                    (source_text, translated_text, source_lang, target_lang, frequency, confidence, contexts)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        source_text,
+                        translated_text,
+                        source_lang,
+                        target_lang,
+                        1,
+                        confidence,
+                        json.dumps(contexts, ensure_ascii=False),
+                    ),
+                )
+
+    def suggest_glossary_terms_bulk(
+        self,
+        suggestions: Sequence[Tuple[str, int, List[str]]],
+        source_lang: str,
+        target_lang: str,
+        translated_text: str = "",
+        confidence: float = 0.5,
+    ) -> int:
+        """
+        Сохранить пачку кандидатов одним upsert.
+
+        Частоты складываются в БД (``frequency + excluded.frequency``),
+        контексты заменяются последними (не более 5).
+
+        Args:
+            suggestions: Список (source_text, frequency, contexts)
+            source_lang: Исходный язык
+            target_lang: Целевой язык
+            translated_text: Перевод (обычно пустой до анализа)
+            confidence: Уверенность
+
+        Returns:
+            Количество записанных фраз
+        """
+        rows = [
+            (
+                source_text,
+                translated_text,
+                source_lang,
+                target_lang,
+                frequency,
+                confidence,
+                json.dumps(list(contexts)[-5:], ensure_ascii=False),
+            )
+            for source_text, frequency, contexts in suggestions
+        ]
+        if not rows:
+            return 0
+
+        with self._db.transaction() as conn:
+            conn.executemany(
                 """
                 INSERT INTO term_suggestions
                 (source_text, translated_text, source_lang, target_lang, frequency, confidence, contexts)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source_text, source_lang, target_lang) DO UPDATE SET
+                    translated_text = excluded.translated_text,
+                    frequency = term_suggestions.frequency + excluded.frequency,
+                    confidence = excluded.confidence,
+                    contexts = CASE
+                        WHEN excluded.contexts = '[]' THEN term_suggestions.contexts
+                        ELSE excluded.contexts
+                    END
             """,
-                (
-                    source_text,
-                    translated_text,
-                    source_lang,
-                    target_lang,
-                    1,
-                    confidence,
-                    json.dumps(contexts, ensure_ascii=False),
-                ),
+                rows,
             )
-
-        conn.commit()
-        conn.close()
+        return len(rows)
 
     def get_glossary_suggestions(
         self,
@@ -687,7 +1045,7 @@ class SemanticTranslationMemory:
     ) -> List[Dict]:
         """Return aggregated glossary suggestions."""
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -714,39 +1072,62 @@ class SemanticTranslationMemory:
                 }
             )
 
-        conn.close()
         return suggestions
 
     def _get_embedding(self, text: str, lang: str) -> Optional[np.ndarray]:
         """Получить embedding для текста через EmbeddingsClient."""
 
-        if not self.use_embeddings or not NUMPY_AVAILABLE:
-            return None
-
-        cache_key = f"{lang}:{text}"
-        cached = self.embedding_cache.get(cache_key)
-        if cached is not None:
-            self.embedding_cache.move_to_end(cache_key)
-            return cached
+        return self._get_embeddings([text], lang)[0]
 
-        if not self.embedding_client:
-            return None
+    def _get_embeddings(
+        self, texts: Sequence[str], lang: str
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Embeddings для списка текстов: кэш + один вызов ``create_vectors``
+        для всех промахов (повторяющиеся тексты запрашиваются один раз).
+        """
 
-        vectors = self.embedding_client.create_vectors([text])
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.use_embeddings or not NUMPY_AVAILABLE:
+            return results
+
+        missing: Dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            cache_key = f"{lang}:{text}"
+            cached = self.embedding_cache.get(cache_key)
+            if cached is not None:
+                self.embedding_cache.move_to_end(cache_key)
+                results[position] = cached
+            else:
+                missing.setdefault(text, []).append(position)
+
+        if not missing or not self.embedding_client:
+            return results
+
+        pending = list(missing)
+        vectors = self.embedding_client.create_vectors(pending)
         if not vectors:
-            return None
-
-        vector = np.asarray(vectors[0], dtype=np.float32)
-
-        if self.embedding_dimensions is None:
-            self.embedding_dimensions = len(vector)
-        elif len(vector) != self.embedding_dimensions:
+            return results
+        if len(vectors) != len(pending):
             raise ValueError(
-                f"Embedding dimension mismatch: expected {self.embedding_dimensions}, got {len(vector)}"
+                f"Embedding count mismatch: expected {len(pending)}, got {len(vectors)}"
             )
 
-        self._cache_embedding(cache_key, vector)
-        return vector
+        for text, raw_vector in zip(pending, vectors):
+            vector = np.asarray(raw_vector, dtype=np.float32)
+
+            if self.embedding_dimensions is None:
+                self.embedding_dimensions = len(vector)
+            elif len(vector) != self.embedding_dimensions:
+                raise ValueError(
+                    f"Embedding dimension mismatch: expected {self.embedding_dimensions}, got {len(vector)}"
+                )
+
+            self._cache_embedding(f"{lang}:{text}", vector)
+            for position in missing[text]:
+                results[position] = vector
+
+        return results
 
     def _cache_embedding(self, key: str, value: np.ndarray) -> None:
         if self.embedding_cache_size <= 0:
@@ -760,26 +1141,23 @@ class SemanticTranslationMemory:
             self.embedding_cache.popitem(last=False)
 
     def get_metadata(self, key: str) -> Optional[str]:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
         cursor.execute("SELECT value FROM metadata WHERE key = ?", (key,))
         row = cursor.fetchone()
-        conn.close()
         return row[0] if row else None
 
     def set_metadata(self, key: str, value: str) -> None:
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO metadata(key, value)
-            VALUES(?, ?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value
-            """,
-            (key, value),
-        )
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO metadata(key, value)
+                VALUES(?, ?)
+                ON CONFLICT(key) DO UPDATE SET value=excluded.value
+                """,
+                (key, value),
+            )
 
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -842,7 +1220,7 @@ class SemanticTranslationMemory:
 
         embedding = None
         if embedding_bytes and NUMPY_AVAILABLE:
-            embedding = self._bytes_to_embedding(embedding_bytes).tolist()
+            embedding = self._bytes_to_embedding(embedding_bytes)
 
         return SemanticEntry(
             source_text=source_text,
@@ -857,8 +1235,8 @@ class SemanticTranslationMemory:
             context=context or "",
         )
 
+    @staticmethod
     def _make_key(
-        self,
         text: str,
         source_lang: str,
         target_lang: str,
@@ -905,7 +1283,7 @@ class SemanticTranslationMemory:
 
     def get_statistics(self) -> Dict:
         """Получить статистику."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM translations")
@@ -926,8 +1304,6 @@ class SemanticTranslationMemory:
         )
         lang_pairs = {f"{row[0]} → {row[1]}": row[2] for row in cursor.fetchall()}
 
-        conn.close()
-
         return {
             "total_entries": total,
             "total_usage": total_usage,
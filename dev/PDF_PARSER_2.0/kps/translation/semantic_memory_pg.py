@@ -6,7 +6,7 @@ import json
 import logging
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 try:  # pragma: no cover - imported lazily in runtime environments
     import psycopg2
@@ -160,6 +160,72 @@ class SemanticTranslationMemoryPG:
             )
             conn.commit()
 
+    def add_translations_bulk(
+        self,
+        translations: Sequence[Tuple[str, str, List[str]]],
+        source_lang: str,
+        target_lang: str,
+        quality_score: float = 1.0,
+        context: str = "",
+        glossary_version: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> int:
+        """Insert many (source, translation, terms) rows in one transaction."""
+        if not translations:
+            return 0
+
+        embeddings: List[Optional[List[float]]] = [None] * len(translations)
+        if self._embedding_client:
+            vectors = self._embedding_client.create_vectors([t[0] for t in translations])
+            if vectors:
+                if len(vectors) != len(translations):
+                    raise ValueError(
+                        f"Embedding count mismatch: expected {len(translations)}, got {len(vectors)}"
+                    )
+                embeddings = list(vectors)
+
+        rows = []
+        for (source_text, translated_text, glossary_terms), embedding in zip(
+            translations, embeddings
+        ):
+            key = SQLiteSemanticMemory._make_key(
+                source_text,
+                source_lang,
+                target_lang,
+                glossary_version=glossary_version,
+                model=model,
+            )
+            rows.append(
+                (
+                    key,
+                    source_text,
+                    translated_text,
+                    source_lang,
+                    target_lang,
+                    json.dumps(glossary_terms),
+                    quality_score,
+                    embedding,
+                    context,
+                )
+            )
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.executemany(
+                """
+                INSERT INTO semantic_translations
+                    (hash, source_text, translated_text, source_lang, target_lang,
+                     glossary_terms, quality_score, embedding, context)
+                VALUES(%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (hash) DO UPDATE SET
+                    usage_count = semantic_translations.usage_count + 1,
+                    quality_score = (semantic_translations.quality_score + EXCLUDED.quality_score) / 2
+                """,
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
     # ------------------------------------------------------------------
     def get_translation(
         self,
@@ -186,6 +252,43 @@ class SemanticTranslationMemoryPG:
             if not row:
                 return None
 
+        return self._row_to_entry(row)
+
+    def get_translations_bulk(
+        self,
+        texts: Sequence[str],
+        source_lang: str,
+        target_lang: str,
+        glossary_version: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> List[Optional[SemanticEntry]]:
+        """Exact matches for many texts in one ``hash = ANY(%s)`` round trip."""
+        keys = [
+            SQLiteSemanticMemory._make_key(
+                text,
+                source_lang,
+                target_lang,
+                glossary_version=glossary_version,
+                model=model,
+            )
+            for text in texts
+        ]
+        if not keys:
+            return []
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT hash, source_text, translated_text, source_lang, target_lang, glossary_terms, usage_count, quality_score, context FROM semantic_translations WHERE hash = ANY(%s)",
+                (list(dict.fromkeys(keys)),),
+            )
+            rows = cur.fetchall()
+
+        found = {row[0]: self._row_to_entry(row[1:]) for row in rows}
+        return [found.get(key) for key in keys]
+
+    @staticmethod
+    def _row_to_entry(row: Sequence) -> SemanticEntry:
         glossary_terms = json.loads(row[4]) if row[4] else []
         return SemanticEntry(
             source_text=row[0],
@@ -236,14 +339,8 @@ class SemanticTranslationMemoryPG:
             return []
         query_vector = vectors[0]
 
-        query, params = self._build_similarity_query(limit)
-        params = (
-            source_lang,
-            target_lang,
-            query_vector,
-            query_vector,
-            limit,
-        )
+        query, _ = self._build_similarity_query(limit)
+        params = self._similarity_params(source_lang, target_lang, query_vector, limit)
 
         with self._connection() as conn:
             cur = conn.cursor()
@@ -282,6 +379,13 @@ class SemanticTranslationMemoryPG:
         )
         return query, ()
 
+    @staticmethod
+    def _similarity_params(
+        source_lang: str, target_lang: str, query_vector: List[float], limit: int
+    ) -> tuple:
+        # Placeholder order of _build_similarity_query: vector, filters, vector, limit
+        return (query_vector, source_lang, target_lang, query_vector, limit)
+
     def get_rag_examples(
         self,
         query_text: str,
@@ -301,6 +405,43 @@ class SemanticTranslationMemoryPG:
             (s.entry.source_text, s.entry.translated_text, s.similarity) for s in similar
         ]
 
+    def get_rag_examples_bulk(
+        self,
+        query_texts: Sequence[str],
+        source_lang: str,
+        target_lang: str,
+        limit: int = 5,
+        min_similarity: Union[float, Sequence[float]] = 0.7,
+    ) -> List[List[Tuple[str, str, float]]]:
+        """RAG for several queries: one embeddings request, one connection."""
+        if isinstance(min_similarity, (int, float)):
+            thresholds = [float(min_similarity)] * len(query_texts)
+        else:
+            thresholds = list(min_similarity)
+
+        results: List[List[Tuple[str, str, float]]] = [[] for _ in query_texts]
+        if not self._embedding_client or not query_texts:
+            return results
+        vectors = self._embedding_client.create_vectors(list(query_texts))
+        if not vectors:
+            return results
+
+        query, _ = self._build_similarity_query(limit)
+        with self._connection() as conn:
+            cur = conn.cursor()
+            for position, query_vector in enumerate(vectors):
+                cur.execute(
+                    query,
+                    self._similarity_params(source_lang, target_lang, query_vector, limit),
+                )
+                for row in cur.fetchall():
+                    similarity = float(row[6])
+                    if similarity >= thresholds[position]:
+                        results[position].append((row[0], row[1], similarity))
+                results[position] = results[position][:limit]
+
+        return results
+
     def get_few_shot_examples(
         self,
         source_lang: str,
@@ -358,6 +499,46 @@ class SemanticTranslationMemoryPG:
             )
             conn.commit()
 
+    def suggest_glossary_terms_bulk(
+        self,
+        suggestions: Sequence[Tuple[str, int, List[str]]],
+        source_lang: str,
+        target_lang: str,
+        translated_text: str = "",
+        confidence: float = 0.5,
+    ) -> int:
+        """Upsert (source_text, frequency, contexts) rows, summing frequencies."""
+        rows = [
+            (
+                source_text,
+                translated_text,
+                source_lang,
+                target_lang,
+                frequency,
+                confidence,
+                json.dumps(list(contexts)[-5:]),
+            )
+            for source_text, frequency, contexts in suggestions
+        ]
+        if not rows:
+            return 0
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.executemany(
+                """
+                INSERT INTO term_suggestions
+                    (source_text, translated_text, source_lang, target_lang, frequency, confidence, contexts)
+                VALUES(%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (source_text, source_lang, target_lang) DO UPDATE
+                SET frequency = term_suggestions.frequency + EXCLUDED.frequency,
+                    confidence = (term_suggestions.confidence + EXCLUDED.confidence)/2
+                """,
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
     def get_glossary_suggestions(
         self,
         min_frequency: int = 3,
@@ -0,0 +1,108 @@
+"""
+Single-pass n-gram miner for automatic glossary suggestions.
+
+Every 1-3 word phrase of a translated segment is a glossary candidate unless
+it already is a glossary term. Phrases are counted in memory over the whole
+run and written once through ``suggest_glossary_terms_bulk`` instead of one
+``suggest_glossary_term`` call per occurrence.
+
+Usage:
+    miner = PhraseMiner(glossary_term_index(glossary, "ru").exact)
+    for segment in segments:
+        miner.add(segment.text, context=segment.text[:50])
+    memory.suggest_glossary_terms_bulk(miner.candidates(), "ru", "en")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class PhraseCandidate:
+    """Aggregated occurrences of one candidate phrase."""
+
+    phrase: str
+    frequency: int = 0
+    contexts: List[str] = field(default_factory=list)  # Last max_contexts distinct, oldest first
+
+    def as_row(self) -> Tuple[str, int, List[str]]:
+        """(source_text, frequency, contexts) row for bulk suggestion writes."""
+        return self.phrase, self.frequency, self.contexts
+
+
+class PhraseMiner:
+    """
+    Collects n-gram phrase frequencies across segments.
+
+    Args:
+        is_known_term: Returns truthy for phrases already in the glossary
+            (e.g. ``TermIndex.exact``); such phrases are not counted
+        max_words: Longest phrase, in words (default: 3)
+        max_contexts: Most recent distinct contexts kept per phrase (default: 5)
+    """
+
+    def __init__(
+        self,
+        is_known_term: Optional[Callable[[str], object]] = None,
+        max_words: int = 3,
+        max_contexts: int = 5,
+    ):
+        self.is_known_term = is_known_term
+        self.max_words = max_words
+        self.max_contexts = max_contexts
+        self.occurrences = 0  # Counted phrase occurrences (with repeats)
+        self._phrases: Dict[str, PhraseCandidate] = {}
+        self._known: Dict[str, bool] = {}
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def add(self, text: str, context: str = "") -> int:
+        """
+        Count every phrase of ``text`` that is not a glossary term.
+
+        Returns:
+            Number of phrase occurrences counted for this text
+        """
+        words = text.split()
+        counted = 0
+        for i in range(len(words)):
+            for j in range(i + 1, min(i + self.max_words, len(words)) + 1):
+                phrase = " ".join(words[i:j])
+                if self._is_known(phrase):
+                    continue
+                candidate = self._phrases.get(phrase)
+                if candidate is None:
+                    candidate = PhraseCandidate(phrase)
+                    self._phrases[phrase] = candidate
+                candidate.frequency += 1
+                if context and self.max_contexts > 0:
+                    self._remember_context(candidate.contexts, context)
+                counted += 1
+        self.occurrences += counted
+        return counted
+
+    def _remember_context(self, contexts: List[str], context: str) -> None:
+        # Like the per-occurrence memory writes: newest last, only the last few kept
+        if context in contexts:
+            contexts.remove(context)
+        contexts.append(context)
+        del contexts[: -self.max_contexts]
+
+    def _is_known(self, phrase: str) -> bool:
+        if self.is_known_term is None:
+            return False
+        known = self._known.get(phrase)
+        if known is None:
+            known = bool(self.is_known_term(phrase))
+            self._known[phrase] = known
+        return known
+
+    def candidates(self) -> List[PhraseCandidate]:
+        """Collected phrases in first-seen order."""
+        return list(self._phrases.values())
+
+
+__all__ = ["PhraseCandidate", "PhraseMiner"]
@@ -15,7 +15,9 @@ import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from kps.storage.lru_cache import LRUCache
 
 
 @dataclass
@@ -73,15 +75,32 @@ class TranslationMemory:
         >>> suggestions = memory.get_glossary_suggestions(min_frequency=3)
     """
 
-    def __init__(self, cache_file: Optional[str] = None):
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
         """
         Инициализация памяти переводов.
 
         Args:
             cache_file: Путь к файлу кэша (если None - только в памяти)
+            max_entries: Максимум переводов в памяти процесса; самые давно
+                использованные вытесняются (None - без лимита)
+            ttl_seconds: Время жизни перевода в памяти (None - бессрочно)
+
+        Лимиты ограничивают только оперативную память: вытесненные переводы
+        остаются в файле кэша (несохранённые ждут ближайшего save()),
+        save() объединяет их с записями в памяти.
         """
         self.cache_file = Path(cache_file) if cache_file else None
-        self.entries: Dict[str, TranslationMemoryEntry] = {}
+        self.entries: LRUCache = LRUCache(
+            "exact", max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._added = 0  # Добавлено переводов с момента создания
+        self._unsaved: Dict[str, TranslationMemoryEntry] = {}  # Изменены после save()
+        self._deleted: Set[str] = set()  # Удалены после последнего save()
         self.suggested_terms: Dict[str, SuggestedGlossaryTerm] = {}
 
         # Загрузить существующий кэш
@@ -110,15 +129,15 @@ class TranslationMemory:
         """
         key = self._make_key(source_text, source_lang, target_lang)
 
-        if key in self.entries:
+        entry = self.entries.pop(key, None) or self._unsaved.get(key)
+        if entry is not None:
             # Обновить существующую запись
-            entry = self.entries[key]
             entry.usage_count += 1
             entry.quality_score = (entry.quality_score + quality_score) / 2
             entry.timestamp = time.time()
         else:
             # Создать новую запись
-            self.entries[key] = TranslationMemoryEntry(
+            entry = TranslationMemoryEntry(
                 source_text=source_text,
                 translated_text=translated_text,
                 source_lang=source_lang,
@@ -127,9 +146,14 @@ class TranslationMemory:
                 timestamp=time.time(),
                 quality_score=quality_score,
             )
+        self.entries[key] = entry
+        if self.cache_file:
+            self._unsaved[key] = entry
+            self._deleted.discard(key)
 
         # Автоматически сохранять периодически
-        if len(self.entries) % 100 == 0:
+        self._added += 1
+        if self._added % 100 == 0:
             self.save()
 
     def get_translation(
@@ -149,13 +173,37 @@ class TranslationMemory:
         key = self._make_key(source_text, source_lang, target_lang)
         return self.entries.get(key)
 
+    def get_translations_bulk(
+        self,
+        texts: Sequence[str],
+        source_lang: str,
+        target_lang: str,
+        glossary_version: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> List[Optional[TranslationMemoryEntry]]:
+        """
+        Получить переводы для списка текстов.
+
+        ``glossary_version`` и ``model`` принимаются для совместимости с
+        семантической памятью; JSON-кэш их не различает.
+
+        Returns:
+            Список той же длины, что ``texts`` (None - нет в кэше)
+        """
+        return [
+            self.entries.get(self._make_key(text, source_lang, target_lang))
+            for text in texts
+        ]
+
     def delete_translation(
         self, source_text: str, source_lang: str, target_lang: str
     ) -> None:
         """Удалить запись перевода из кэша, если она существует."""
 
         key = self._make_key(source_text, source_lang, target_lang)
-        removed = self.entries.pop(key, None)
+        removed = self.entries.pop(key, None) or self._unsaved.pop(key, None)
+        if self.cache_file:
+            self._deleted.add(key)  # Запись могла быть вытеснена, но остаться в файле
         if removed and self.cache_file:
             try:
                 self.save()
@@ -251,6 +299,53 @@ class TranslationMemory:
                 contexts=[context] if context else [],
             )
 
+    def suggest_glossary_terms_bulk(
+        self,
+        suggestions: Sequence[Tuple[str, int, List[str]]],
+        source_lang: str,
+        target_lang: str,
+        translated_text: str = "",
+        confidence: float = 0.5,
+    ) -> int:
+        """
+        Предложить пачку терминов с уже подсчитанными частотами.
+
+        Args:
+            suggestions: Список (source_text, frequency, contexts)
+            source_lang: Исходный язык
+            target_lang: Целевой язык
+            translated_text: Перевод (обычно пустой до анализа)
+            confidence: Начальная уверенность новых предложений
+
+        Returns:
+            Количество учтенных фраз
+        """
+        stored = 0
+        for source_text, frequency, contexts in suggestions:
+            if len(source_text.split()) > 5:
+                continue
+
+            key = self._make_key(source_text, source_lang, target_lang)
+            term = self.suggested_terms.get(key)
+            if term is None:
+                term = SuggestedGlossaryTerm(
+                    source_text=source_text,
+                    translated_text=translated_text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    frequency=0,
+                    confidence=confidence,
+                    contexts=[],
+                )
+                self.suggested_terms[key] = term
+            term.frequency += frequency
+            for context in contexts:
+                if context and context not in term.contexts:
+                    term.contexts.append(context)
+            stored += 1
+
+        return stored
+
     def get_glossary_suggestions(
         self, min_frequency: int = 3, min_confidence: float = 0.7
     ) -> List[SuggestedGlossaryTerm]:
@@ -316,21 +411,33 @@ class TranslationMemory:
         if not self.cache_file:
             return
 
+        live = self.entries.items()
+        entries: Dict[str, Dict] = {}
+        if self.entries.evictions:
+            # Вытесненные из памяти переводы сохраняются из текущего файла
+            for entry_data in self._read_file().get("entries", []):
+                key = self._make_key(
+                    entry_data["source_text"],
+                    entry_data["source_lang"],
+                    entry_data["target_lang"],
+                )
+                if key not in self._deleted:
+                    entries[key] = entry_data
+        for key, e in [*self._unsaved.items(), *live]:
+            entries[key] = {
+                "source_text": e.source_text,
+                "translated_text": e.translated_text,
+                "source_lang": e.source_lang,
+                "target_lang": e.target_lang,
+                "glossary_terms": e.glossary_terms,
+                "timestamp": e.timestamp,
+                "usage_count": e.usage_count,
+                "quality_score": e.quality_score,
+            }
+
         # Подготовить данные
         data = {
-            "entries": [
-                {
-                    "source_text": e.source_text,
-                    "translated_text": e.translated_text,
-                    "source_lang": e.source_lang,
-                    "target_lang": e.target_lang,
-                    "glossary_terms": e.glossary_terms,
-                    "timestamp": e.timestamp,
-                    "usage_count": e.usage_count,
-                    "quality_score": e.quality_score,
-                }
-                for e in self.entries.values()
-            ],
+            "entries": list(entries.values()),
             "suggestions": [
                 {
                     "source_text": s.source_text,
@@ -351,12 +458,20 @@ class TranslationMemory:
         # Сохранить
         with open(self.cache_file, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        self._unsaved.clear()
+        self._deleted.clear()
+
+    def _read_file(self) -> Dict:
+        """Содержимое файла кэша (пустой словарь, если файла нет)."""
+        if not self.cache_file.exists():
+            return {}
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
 
     def _load_from_file(self) -> None:
         """Загрузить кэш из файла."""
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_file()
 
             # Загрузить записи
             for entry_data in data.get("entries", []):
@@ -0,0 +1,290 @@
+"""
+In-process vector index for semantic translation memory.
+
+Keeps all embeddings of one language pair in a contiguous matrix of unit
+vectors (normalized once, on insert), so a top-k cosine query is a single
+matrix-vector product instead of a Python loop over rows.
+
+Backends:
+- ``FlatVectorIndex`` - exact search over the whole matrix (NumPy only)
+- ``HNSWVectorIndex`` - approximate search via ``hnswlib`` (optional) for
+  very large memories
+
+Usage:
+    index = create_vector_index(dimensions=1536)
+    index.add("hash1", vector)
+    hits = index.search(query, k=5, min_cosine=0.4)  # [(key, cosine), ...]
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+logger = logging.getLogger(__name__)
+
+# Memories larger than this switch to HNSW when backend="auto" and hnswlib is installed
+HNSW_AUTO_THRESHOLD = 50_000
+
+# Rows converted per step when the matrix is stored as float16
+_FLOAT16_CHUNK_ROWS = 8192
+
+
+class FlatVectorIndex:
+    """
+    Exact cosine search over a contiguous matrix of unit vectors.
+
+    Rows are normalized when added, and queries only look up the keys of
+    their top-k rows, so a search copies nothing per stored entry.
+    float32 storage gives a single BLAS product per query; float16 halves
+    memory for very large memories at the cost of chunked conversion.
+    """
+
+    def __init__(self, dimensions: int, initial_capacity: int = 1024, dtype: str = "float32"):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for the vector index")
+
+        self.dimensions = dimensions
+        self.dtype = np.dtype(dtype)
+        self._matrix = np.zeros((max(initial_capacity, 1), dimensions), dtype=self.dtype)
+        self._live = np.zeros(max(initial_capacity, 1), dtype=bool)  # Row holds a searchable vector
+        self._keys: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    def add(self, key: str, vector: "np.ndarray") -> None:
+        """Insert or replace the vector stored under ``key``."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dimensions:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimensions}, got {vector.shape[0]}"
+            )
+        norm = float(np.linalg.norm(vector))
+
+        with self._lock:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._allocate()
+                self._positions[key] = position
+                self._keys[position] = key
+            self._matrix[position] = vector / norm if norm > 0.0 else 0.0
+            self._live[position] = norm > 0.0
+
+    def add_many(self, keys: Sequence[str], vectors: "np.ndarray") -> None:
+        """Bulk insert; ``vectors`` is an (n, dimensions) array."""
+        for key, vector in zip(keys, vectors):
+            self.add(key, vector)
+
+    def remove(self, key: str) -> bool:
+        """Drop ``key``; returns False when it was not indexed."""
+        with self._lock:
+            position = self._positions.pop(key, None)
+            if position is None:
+                return False
+            self._keys[position] = None
+            self._live[position] = False
+            self._free.append(position)
+            return True
+
+    def search(
+        self, query: "np.ndarray", k: int, min_cosine: float = -1.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k keys by cosine similarity.
+
+        Args:
+            query: Query vector
+            k: Maximum number of results
+            min_cosine: Drop results below this cosine (-1.0..1.0)
+
+        Returns:
+            (key, cosine) pairs, most similar first
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        query_norm = float(np.linalg.norm(query))
+        if k <= 0 or query_norm == 0.0:
+            return []
+
+        with self._lock:
+            used = len(self._keys)
+            if not self._positions:
+                return []
+            scores = self._dot(self._matrix[:used], query / query_norm)
+            scores[~self._live[:used]] = -np.inf
+
+            k = min(k, used)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [
+                (self._keys[position], float(scores[position]))
+                for position in top
+                if self._live[position] and scores[position] >= min_cosine
+            ]
+
+    def _dot(self, matrix: "np.ndarray", query: "np.ndarray") -> "np.ndarray":
+        if matrix.dtype == np.float32:
+            return matrix @ query
+        dots = np.empty(matrix.shape[0], dtype=np.float32)
+        for start in range(0, matrix.shape[0], _FLOAT16_CHUNK_ROWS):
+            block = matrix[start : start + _FLOAT16_CHUNK_ROWS].astype(np.float32)
+            dots[start : start + block.shape[0]] = block @ query
+        return dots
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+
+        position = len(self._keys)
+        if position >= self._matrix.shape[0]:
+            capacity = self._matrix.shape[0] * 2
+            matrix = np.zeros((capacity, self.dimensions), dtype=self.dtype)
+            matrix[:position] = self._matrix[:position]
+            live = np.zeros(capacity, dtype=bool)
+            live[:position] = self._live[:position]
+            self._matrix, self._live = matrix, live
+        self._keys.append(None)
+        return position
+
+
+class HNSWVectorIndex:
+    """Approximate cosine search backed by ``hnswlib`` (optional dependency)."""
+
+    def __init__(
+        self,
+        dimensions: int,
+        initial_capacity: int = 1024,
+        ef_construction: int = 200,
+        m: int = 16,
+        ef_search: int = 64,
+    ):
+        if hnswlib is None:
+            raise RuntimeError("hnswlib is not installed")
+
+        self.dimensions = dimensions
+        self.ef_search = ef_search
+        self._index = hnswlib.Index(space="cosine", dim=dimensions)
+        self._index.init_index(
+            max_elements=max(initial_capacity, 1), ef_construction=ef_construction, M=m
+        )
+        self._index.set_ef(ef_search)
+        self._labels: Dict[str, int] = {}
+        self._keys: Dict[int, str] = {}
+        self._next_label = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._labels
+
+    def add(self, key: str, vector: "np.ndarray") -> None:
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        if vector.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimensions}, got {vector.shape[1]}"
+            )
+        with self._lock:
+            if key in self._labels:
+                self.remove(key)
+            if self._index.get_current_count() >= self._index.get_max_elements():
+                self._index.resize_index(self._index.get_max_elements() * 2)
+            label = self._next_label
+            self._next_label += 1
+            self._index.add_items(vector, np.array([label]))
+            self._labels[key] = label
+            self._keys[label] = key
+
+    def add_many(self, keys: Sequence[str], vectors: "np.ndarray") -> None:
+        for key, vector in zip(keys, vectors):
+            self.add(key, vector)
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            label = self._labels.pop(key, None)
+            if label is None:
+                return False
+            self._keys.pop(label, None)
+            self._index.mark_deleted(label)
+            return True
+
+    def search(
+        self, query: "np.ndarray", k: int, min_cosine: float = -1.0
+    ) -> List[Tuple[str, float]]:
+        with self._lock:
+            if k <= 0 or not self._labels:
+                return []
+            k = min(k, len(self._labels))
+            self._index.set_ef(max(self.ef_search, k))
+            labels, distances = self._index.knn_query(
+                np.asarray(query, dtype=np.float32).reshape(1, -1), k=k
+            )
+            keys = dict(self._keys)
+
+        results = []
+        for label, distance in zip(labels[0], distances[0]):
+            key = keys.get(int(label))
+            cosine = 1.0 - float(distance)
+            if key is not None and cosine >= min_cosine:
+                results.append((key, cosine))
+        return results
+
+
+def create_vector_index(
+    dimensions: int,
+    backend: str = "auto",
+    expected_size: int = 0,
+    dtype: str = "float32",
+):
+    """
+    Build a vector index.
+
+    Args:
+        dimensions: Embedding size
+        backend: "flat", "hnsw" or "auto" (HNSW for large memories when available)
+        expected_size: Number of vectors about to be loaded (sizes the index)
+        dtype: Storage type of the flat backend ("float32" or "float16")
+
+    Returns:
+        FlatVectorIndex or HNSWVectorIndex
+    """
+    capacity = max(expected_size, 1024)
+    if backend == "hnsw" or (
+        backend == "auto" and hnswlib is not None and expected_size >= HNSW_AUTO_THRESHOLD
+    ):
+        if hnswlib is None:
+            logger.warning("hnswlib not installed; falling back to flat vector index")
+        else:
+            return HNSWVectorIndex(dimensions, initial_capacity=capacity)
+    return FlatVectorIndex(dimensions, initial_capacity=capacity, dtype=dtype)
+
+
+__all__ = [
+    "FlatVectorIndex",
+    "HNSWVectorIndex",
+    "create_vector_index",
+    "HNSW_AUTO_THRESHOLD",
+]
@@ -0,0 +1,26 @@
+"""Small helpers shared by the extraction, layout and QA stages."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+
+def page_chunks(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split ``range(page_count)`` into at most ``parts`` contiguous ranges.
+
+    Ranges are half-open ``(start, stop)`` pairs whose lengths differ by at
+    most one page, so parallel workers get balanced shares.
+    """
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    chunks = []
+    start = 0
+    for part in range(parts):
+        stop = start + size + (1 if part < extra else 0)
+        chunks.append((start, stop))
+        start = stop
+    return chunks
+
+
+__all__ = ["page_chunks"]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark indexed vs brute-force fuzzy glossary matching on config/glossaries."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from kps.translation.glossary.advanced_matcher import (
+    AdvancedGlossaryMatcher,
+    MatchStrategy,
+    TermOccurrence,
+)
+from kps.translation.glossary.manager import GlossaryManager
+
+FILLER = ["и", "в", "до", "конца", "ряда", "повторите", "каждый", "следующий", "край"]
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--glossary-dir", type=Path, default=None, help="Defaults to config/glossaries")
+    parser.add_argument("--words", type=int, default=2000, help="Words in the synthetic page")
+    parser.add_argument("--lang", default="ru", help="Source language")
+    parser.add_argument("--max-edit-distance", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    if len(word) < 4:
+        return word
+    pos = rng.randrange(len(word))
+    return word[:pos] + word[pos + 1 :]
+
+
+def build_page(manager: GlossaryManager, lang: str, words: int, seed: int) -> str:
+    """Synthetic pattern page: glossary terms, typos of terms and filler words."""
+    rng = random.Random(seed)
+    terms = [getattr(e, lang, "") for e in manager.get_all_entries() if getattr(e, lang, "")]
+    out: List[str] = []
+    while len(out) < words:
+        roll = rng.random()
+        if roll < 0.3:
+            out.extend(rng.choice(terms).split())
+        elif roll < 0.5:
+            out.append(_typo(rng.choice(terms).split()[0], rng))
+        else:
+            out.append(rng.choice(FILLER))
+    return " ".join(out[:words])
+
+
+def brute_force_fuzzy(
+    matcher: AdvancedGlossaryMatcher, text: str, lang: str, min_confidence: float
+) -> List[TermOccurrence]:
+    """Reference implementation: every word against every entry."""
+    occurrences = []
+    for word in text.split():
+        word_lower = word.lower()
+        if len(word_lower) < 3:
+            continue
+        for entry in matcher.glossary.get_all_entries():
+            source_term = getattr(entry, lang, "")
+            if not source_term or len(source_term) < 3:
+                continue
+            term_lower = source_term.lower()
+            distance = matcher._levenshtein_distance(word_lower, term_lower)
+            if distance > matcher.strategy.max_edit_distance:
+                continue
+            confidence = 1.0 - distance / max(len(word_lower), len(term_lower))
+            if confidence < min_confidence:
+                continue
+            position = text.lower().find(word_lower)
+            if position == -1:
+                continue
+            occurrences.append(
+                TermOccurrence(
+                    entry=entry,
+                    matched_text=word,
+                    position=position,
+                    length=len(word),
+                    confidence=confidence,
+                    strategy="fuzzy",
+                    context_before=text[max(0, position - 20) : position],
+                    context_after=text[position + len(word) : position + len(word) + 20],
+                )
+            )
+    return occurrences
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    paths = sorted(args.glossary_dir.glob("*.yaml")) if args.glossary_dir else None
+    manager = GlossaryManager(paths)
+    matcher = AdvancedGlossaryMatcher(
+        manager, MatchStrategy(max_edit_distance=args.max_edit_distance)
+    )
+    text = build_page(manager, args.lang, args.words, args.seed)
+
+    start = time.perf_counter()
+    expected = brute_force_fuzzy(matcher, text, args.lang, 0.7)
+    brute_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = matcher._fuzzy_match(text, args.lang, "en", 0.7)
+    indexed_seconds = time.perf_counter() - start
+
+    identical = actual == expected
+    print(f"entries:        {len(manager.get_all_entries())}")
+    print(f"words:          {len(text.split())}")
+    print(f"occurrences:    {len(actual)} (identical: {identical})")
+    print(f"brute force:    {brute_seconds * 1000:.1f} ms")
+    print(f"BK-tree index:  {indexed_seconds * 1000:.1f} ms")
+    print(f"speedup:        {brute_seconds / max(indexed_seconds, 1e-9):.1f}x")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,20 @@ def main() -> None:
         default=None,
         help="Comma-separated ISO codes (ru,en,fr). Defaults to remaining languages",
     )
+    parser.add_argument(
+        "--memory",
+        dest="memory_path",
+        default=None,
+        type=Path,
+        help="SQLite translation memory reused across runs (skips Argos for known blocks)",
+    )
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        default=1,
+        type=int,
+        help="Worker processes for page rebuilding (pages and languages run in parallel)",
+    )
     args = parser.parse_args()
 
     if not args.input_path.exists():
@@ -26,7 +40,23 @@ def main() -> None:
     if args.langs:
         targets = [code.strip() for code in args.langs.split(",") if code.strip()]
 
-    produced = process_pdf(args.input_path, args.output_dir, target_langs=targets)
+    memory = None
+    if args.memory_path:
+        from kps.translation.semantic_memory import SemanticTranslationMemory
+
+        memory = SemanticTranslationMemory(str(args.memory_path), use_embeddings=False)
+
+    try:
+        produced = process_pdf(
+            args.input_path,
+            args.output_dir,
+            target_langs=targets,
+            memory=memory,
+            workers=args.workers,
+        )
+    finally:
+        if memory is not None:
+            memory.close()
     for path in produced:
         print(f"[OK] {path}")
 
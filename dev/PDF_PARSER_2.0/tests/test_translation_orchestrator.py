@@ -677,3 +677,174 @@ Glossary:
 
         assert "| --- | --- |" in result[0]
         assert result[1] == "Next paragraph"
+
+
+def _echo_completion(delays=None, failures=None):
+    """Build a fake ``chat.completions.create`` that echoes segments back."""
+
+    import threading
+    import time as _time
+
+    from kps.translation.orchestrator import OpenAIError
+
+    delays = delays or {}
+    failures = dict(failures or {})
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def create(**kwargs):
+        content = kwargs["messages"][-1]["content"]
+        if "Language code:" in content:
+            return Mock(choices=[Mock(message=Mock(content="ru"))], usage=None)
+
+        body = content.split("Segments:\n", 1)[1].rsplit("\n\nTranslated segments:", 1)[0]
+        texts = body.split("\n---\n")
+        first = texts[0]
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            should_fail = failures.get(first, 0) > 0
+            if should_fail:
+                failures[first] -= 1
+        try:
+            _time.sleep(delays.get(first, 0.01))
+            if should_fail:
+                raise OpenAIError("503 Service Unavailable")
+            payload = "\n---\n".join(f"EN {t}" for t in texts)
+            return Mock(
+                choices=[Mock(message=Mock(content=payload))],
+                usage=Mock(prompt_tokens=10, completion_tokens=5),
+            )
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return create, state
+
+
+class TestConcurrentBatchDispatch:
+    """Bounded-concurrency batch dispatch (max_in_flight)."""
+
+    @staticmethod
+    def _segments(count):
+        return [
+            TranslationSegment(segment_id=f"s{i}", text=f"Текст {i}", placeholders={})
+            for i in range(count)
+        ]
+
+    @patch('kps.translation.orchestrator.openai')
+    def test_batches_run_in_parallel_and_keep_order(self, mock_openai):
+        # First batch is the slowest so completion order differs from input order
+        create, state = _echo_completion(delays={"Текст 0": 0.2})
+        mock_openai.chat.completions.create.side_effect = create
+
+        orchestrator = TranslationOrchestrator(max_batch_size=2, max_in_flight=3)
+        segments = self._segments(7)
+
+        result = orchestrator.translate_batch(segments, ["en"])
+
+        assert result.translations["en"].segments == [f"EN Текст {i}" for i in range(7)]
+        assert state["peak"] == 3
+        assert result.total_input_tokens == 40
+
+    @patch('kps.translation.orchestrator.openai')
+    def test_backoff_is_per_batch(self, mock_openai):
+        create, _state = _echo_completion(failures={"Текст 2": 1})
+        mock_openai.chat.completions.create.side_effect = create
+
+        orchestrator = TranslationOrchestrator(
+            max_batch_size=2, max_in_flight=2, retry_delay=0.01
+        )
+        result = orchestrator.translate_batch(self._segments(4), ["en"])
+
+        assert result.translations["en"].segments == [f"EN Текст {i}" for i in range(4)]
+
+    @patch('kps.translation.orchestrator.openai')
+    def test_progress_callbacks_with_in_flight_batches(self, mock_openai):
+        create, _state = _echo_completion(delays={"Текст 0": 0.1})
+        mock_openai.chat.completions.create.side_effect = create
+
+        orchestrator = TranslationOrchestrator(max_batch_size=2, max_in_flight=3)
+        progress = []
+
+        result = orchestrator.translate_with_batching(
+            self._segments(6), ["en", "fr"], progress_callback=progress.append
+        )
+
+        assert [p.current_batch for p in progress] == list(range(1, 7))
+        assert all(p.total_batches == 6 for p in progress)
+        assert progress[-1].segments_completed == progress[-1].total_segments == 12
+        assert [p.current_language for p in progress] == ["en"] * 3 + ["fr"] * 3
+        assert result.translations["fr"].segments == [f"EN Текст {i}" for i in range(6)]
+
+
+class TestTokenAwarePacking:
+    """Token-budget batch packing (_split_into_batches with token_budget)."""
+
+    @staticmethod
+    def _segment(idx, text):
+        return TranslationSegment(segment_id=f"s{idx}", text=text, placeholders={})
+
+    def test_small_segments_fill_one_request(self):
+        orchestrator = TranslationOrchestrator(max_batch_size=None)
+        segments = [self._segment(i, f"Ряд {i}") for i in range(30)]
+
+        batches = orchestrator._split_into_batches(segments, None, token_budget=500)
+
+        assert len(batches) == 1
+        assert batches[0] == segments
+
+    def test_budget_and_count_cap_are_respected(self):
+        orchestrator = TranslationOrchestrator()
+        segments = [self._segment(i, "Провяжите петли лицевой гладью " * 3) for i in range(25)]
+        budget = 200
+
+        batches = orchestrator._split_into_batches(segments, 10, token_budget=budget)
+
+        assert [seg for batch in batches for seg in batch] == segments
+        for batch in batches:
+            assert len(batch) <= 10
+            assert sum(orchestrator._count_tokens(s.text, orchestrator.model) + 2 for s in batch) <= budget
+
+    def test_long_segment_is_isolated(self):
+        orchestrator = TranslationOrchestrator()
+        short = [self._segment(i, "Ряд 1") for i in range(4)]
+        long_segment = self._segment(99, "| Размер | Обхват груди |\n" * 80)
+        segments = short[:2] + [long_segment] + short[2:]
+
+        batches = orchestrator._split_into_batches(segments, 10, token_budget=400)
+
+        assert batches == [short[:2], [long_segment], short[2:]]
+
+    def test_count_only_split_without_budget(self):
+        orchestrator = TranslationOrchestrator()
+        segments = [self._segment(i, "x") for i in range(25)]
+
+        batches = orchestrator._split_into_batches(segments, 10)
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+
+    def test_estimator_accounts_for_script(self):
+        orchestrator = TranslationOrchestrator()
+
+        latin = orchestrator._estimate_tokens("a" * 40)
+        cyrillic = orchestrator._estimate_tokens("я" * 40)
+
+        assert latin == 10
+        assert cyrillic > latin
+
+    def test_budget_derived_from_model_limits(self):
+        orchestrator = TranslationOrchestrator(model="gpt-4-turbo", fallback_model=None)
+
+        budget = orchestrator._batch_token_budget("ru", "en", "Glossary: " * 50)
+
+        assert 0 < budget <= int(4_096 * 0.75 / orchestrator.OUTPUT_EXPANSION)
+        assert TranslationOrchestrator(max_batch_tokens=123)._batch_token_budget("ru", "en", None) == 123
+
+    def test_completion_limit_scales_and_is_capped(self):
+        orchestrator = TranslationOrchestrator(model="gpt-4o-mini", fallback_model=None)
+        small = [self._segment(0, "Ряд 1")]
+        huge = [self._segment(1, "Провяжите петли " * 5000)]
+
+        assert orchestrator._completion_token_limit(small) == 8_000
+        assert orchestrator._completion_token_limit(huge) == 16_384
@@ -11,6 +11,7 @@ Tests:
 """
 
 import json
+import numpy as np
 import pytest
 import sqlite3
 import tempfile
@@ -26,6 +27,7 @@ from kps.translation import (
 )
 from kps.translation.semantic_memory_pg import SemanticTranslationMemoryPG
 from kps.core.unified_pipeline import PipelineConfig, MemoryType, SemanticMemoryBackend
+from kps.clients.embedding_cache import EmbeddingCache
 from kps.clients.embeddings import EmbeddingsClient
 from scripts.reindex_semantic_memory import reindex_semantic_memory as run_reindex
 from scripts.seed_glossary_memory import seed_glossary_memory as run_seed_glossary
@@ -111,6 +113,93 @@ class TestEmbeddingsClient:
         # First call failed, second succeeded
         assert len(events) == 2
 
+    def test_embedding_client_concurrent_batches_keep_order(self):
+        events = []
+        fake_endpoint = _FakeEmbeddingsEndpoint(events, dimension=2)
+        client = EmbeddingsClient(
+            model="text-embedding-3-small",
+            max_batch=2,
+            client=_FakeOpenAIClient(fake_endpoint),
+            max_concurrency=3,
+        )
+
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        vectors = client.create_vectors(texts)
+
+        # Vector value encodes position-in-batch + text length
+        assert [vec[0] for vec in vectors] == [1.0, 3.0, 3.0, 5.0, 5.0]
+        assert sorted(batch for _model, batch in events) == [
+            ("a", "bb"),
+            ("ccc", "dddd"),
+            ("eeeee",),
+        ]
+
+    def test_embedding_client_uses_persistent_cache(self, tmp_path):
+        events = []
+        fake_client = _FakeOpenAIClient(_FakeEmbeddingsEndpoint(events, dimension=3))
+        cache_path = tmp_path / "embeddings.db"
+
+        client = EmbeddingsClient(
+            model="text-embedding-3-small",
+            max_batch=4,
+            client=fake_client,
+            cache=EmbeddingCache(cache_path),
+        )
+        first = client.create_vectors(["foo", "bar"])
+        assert events == [("text-embedding-3-small", ("foo", "bar"))]
+
+        # Fresh process: same file, only the unseen text goes to the API
+        reopened = EmbeddingsClient(
+            model="text-embedding-3-small",
+            client=fake_client,
+            cache=EmbeddingCache(cache_path),
+        )
+        vectors = reopened.create_vectors(["bar ", "baz", "foo", "baz"])
+
+        assert events[1:] == [("text-embedding-3-small", ("baz",))]
+        assert vectors[0] == first[1]
+        assert vectors[2] == first[0]
+        assert vectors[1] == vectors[3]
+        stats = reopened.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 2, 3)
+
+    def test_embedding_cache_keys_include_model_and_dimensions(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+        cache.put_many("m1", ["петля"], [[1.0, 2.0]])
+
+        assert cache.get_many("m1", ["петля"]) == [[1.0, 2.0]]
+        assert cache.get_many("m2", ["петля"]) == [None]
+        assert cache.get_many("m1", ["петля"], dimensions=256) == [None]
+
+    def test_embedding_cache_evicts_least_recently_used(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=3)
+        cache.put_many("m", ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        cache.get_many("m", ["a"])  # "b" becomes the oldest entry
+
+        cache.put_many("m", ["d"], [[4.0]])
+
+        assert cache.get_many("m", ["a", "b", "c", "d"]) == [[1.0], None, None, [4.0]]
+        assert cache.stats().evictions == 2
+        assert cache.prune(1) == 1
+        assert len(cache) == 1
+
+    def test_embedding_cache_reads_do_not_write(self, tmp_path):
+        cache_path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(cache_path, max_entries=3)
+        cache.put_many("m", ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        conn = cache._store.db.connection()
+        changes = conn.total_changes
+
+        assert cache.get_many("m", ["a", "b"]) == [[1.0], [2.0]]
+        assert conn.total_changes == changes
+        cache.get_many("m", ["a"])
+        cache.close()
+
+        # Buffered recency survives close: "c" is now the oldest entry
+        reopened = EmbeddingCache(cache_path, max_entries=3)
+        reopened.prune(2)
+        assert reopened.get_many("m", ["a", "b", "c"]) == [[1.0], [2.0], None]
+
 
 class _StubEmbeddingsClient:
     def __init__(self, dimension=8):
@@ -224,6 +313,25 @@ class TestSemanticMemoryEmbeddings:
         assert row[0] is not None
         assert len(row[0]) == 6 * 4  # float32 bytes per dim
 
+    def test_entry_cache_is_bounded_and_compact(self, tmp_path):
+        memory = SemanticTranslationMemory(
+            str(tmp_path / "bounded.db"),
+            use_embeddings=True,
+            embedding_client=_StubEmbeddingsClient(dimension=6),
+            embedding_dimensions=None,
+            cache_max_entries=2,
+        )
+
+        for text in ["один", "два", "три"]:
+            memory.add_translation(text, text.upper(), "ru", "en", [])
+
+        assert len(memory.cache) == 2
+        assert memory.cache.stats().evictions == 1
+        entry = memory.get_translation("один", "ru", "en")  # served from SQLite
+        assert entry.translated_text == "ОДИН"
+        assert entry.embedding.dtype == np.float16
+        memory.close()
+
     def test_embedding_cache_eviction(self, tmp_path):
         db_path = tmp_path / "semantic_cache.db"
         client = _StubEmbeddingsClient(dimension=3)
@@ -249,6 +357,101 @@ class TestSemanticMemoryEmbeddings:
 
         assert client.calls == ["alpha", "beta", "gamma", "alpha"]
 
+    def test_bulk_add_embeds_once_and_commits_once(self, tmp_path):
+        client = _StubEmbeddingsClient(dimension=3)
+        memory = SemanticTranslationMemory(
+            str(tmp_path / "bulk.db"),
+            embedding_client=client,
+            embedding_dimensions=None,
+        )
+        calls = []
+        original = client.create_vectors
+        client.create_vectors = lambda texts: calls.append(list(texts)) or original(texts)
+
+        inserted = memory.add_translations_bulk(
+            [("один", "one", []), ("два", "two", ["k"]), ("один", "one", [])],
+            "ru",
+            "en",
+        )
+
+        assert inserted == 2  # repeated text updates the existing row
+        assert calls == [["один", "два"]]
+        conn = sqlite3.connect(str(tmp_path / "bulk.db"))
+        rows = dict(conn.execute("SELECT source_text, usage_count FROM translations"))
+        conn.close()
+        assert rows == {"один": 2, "два": 1}
+
+    def test_get_translations_bulk_matches_single_lookups(self, tmp_path):
+        db_path = tmp_path / "bulk_get.db"
+        writer = SemanticTranslationMemory(str(db_path), use_embeddings=False)
+        writer.add_translation("один", "one", "ru", "en", [])
+        writer.add_translation("два", "two", "ru", "en", [], model="gpt")
+
+        memory = SemanticTranslationMemory(str(db_path), use_embeddings=False)
+        memory.cache.clear()
+        texts = ["один", "два", "три", "один"]
+
+        entries = memory.get_translations_bulk(texts, "ru", "en")
+
+        assert [e.translated_text if e else None for e in entries] == ["one", None, None, "one"]
+        assert [
+            e.translated_text if e else None
+            for e in memory.get_translations_bulk(texts, "ru", "en", model="gpt")
+        ] == [None, "two", None, None]
+        single = [memory.get_translation(text, "ru", "en") for text in texts]
+        assert entries == single
+
+    def test_transaction_scope_groups_memory_writes(self, tmp_path):
+        memory = SemanticTranslationMemory(str(tmp_path / "tx.db"), use_embeddings=False)
+        observer = sqlite3.connect(str(tmp_path / "tx.db"))
+
+        with memory.transaction():
+            memory.add_translation("один", "one", "ru", "en", [])
+            memory.suggest_glossary_term("один", "", "ru", "en", context="один")
+            memory.set_metadata("run", "1")
+            assert observer.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 0
+
+        assert observer.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 1
+        assert observer.execute("SELECT COUNT(*) FROM term_suggestions").fetchone()[0] == 1
+        assert memory.get_metadata("run") == "1"
+        observer.close()
+        memory.close()
+
+    def test_suggest_glossary_terms_bulk_sums_frequencies(self, tmp_path):
+        memory = SemanticTranslationMemory(str(tmp_path / "suggest.db"), use_embeddings=False)
+
+        memory.suggest_glossary_term("лицевая", "", "ru", "en", context="a")
+        memory.suggest_glossary_terms_bulk(
+            [("лицевая", 3, ["b"]), ("изнаночная", 2, [])], "ru", "en"
+        )
+
+        suggestions = {
+            s["source_text"]: (s["frequency"], s["contexts"])
+            for s in memory.get_glossary_suggestions(min_frequency=1)
+        }
+        assert suggestions == {"лицевая": (4, ["b"]), "изнаночная": (2, [])}
+        memory.close()
+
+    def test_rag_examples_bulk_matches_single_lookups(self, tmp_path):
+        client = _StubEmbeddingsClient(dimension=3)
+        memory = SemanticTranslationMemory(
+            str(tmp_path / "rag.db"),
+            embedding_client=client,
+            embedding_dimensions=None,
+        )
+        memory.add_translation("петля", "stitch", "ru", "en", [])
+        client.calls.clear()
+
+        bulk = memory.get_rag_examples_bulk(
+            ["петля", "ряды", "ряд"], "ru", "en", limit=2, min_similarity=[0.9, 0.9, 1.1]
+        )
+
+        assert bulk[0] == [("петля", "stitch", 1.0)]
+        assert bulk[1] == memory.get_rag_examples("ряды", "ru", "en", limit=2, min_similarity=0.9)
+        assert bulk[2] == []
+        # Exact hit needs no embedding; the rest share one request
+        assert client.calls[:2] == ["ряды", "ряд"]
+
 
 class TestSemanticMemoryCLI:
     def test_reindex_semantic_memory_cli(self, tmp_path):
@@ -353,6 +556,42 @@ class TestPostgresSemanticMemory:
         assert similar[0].entry.translated_text == "tgt"
         assert client.calls  # ensure embeddings queried
 
+    def test_get_translations_bulk_uses_single_any_query(self):
+        key = SemanticTranslationMemory._make_key("src", "ru", "en")
+        conn = _FakePGConnection(
+            rows=[(key, "src", "tgt", "ru", "en", json.dumps(["k2tog"]), 3, 0.9, None)]
+        )
+        pg = _DummySemanticMemoryPG(
+            "postgresql://dummy",
+            embedding_client=None,
+            connection_factory=lambda: conn,
+        )
+
+        entries = pg.get_translations_bulk(["src", "missing", "src"], "ru", "en")
+
+        assert [e.translated_text if e else None for e in entries] == ["tgt", None, "tgt"]
+        queries = [item for item in conn.executed if item != "commit"]
+        assert len(queries) == 1
+        query, params = queries[0]
+        assert "= ANY(%s)" in query
+        assert len(params[0]) == 2  # duplicate text resolved once
+
+    def test_add_translations_bulk_rejects_missing_embeddings(self):
+        class _ShortClient(_StubEmbeddingsClient):
+            def create_vectors(self, texts):
+                return super().create_vectors(texts)[:-1]
+
+        conn = _FakePGConnection()
+        pg = _DummySemanticMemoryPG(
+            "postgresql://dummy",
+            embedding_client=_ShortClient(dimension=4),
+            connection_factory=lambda: conn,
+        )
+
+        with pytest.raises(ValueError, match="expected 2, got 1"):
+            pg.add_translations_bulk([("a", "A", []), ("b", "B", [])], "ru", "en")
+        assert conn.executed == []
+
 
 class TestRAGScoping:
     def test_rag_threshold_adjusts_for_symbol_terms(self):
@@ -385,6 +624,80 @@ class TestRAGScoping:
         translator.translate(segments, target_language="en", source_language="ru")
 
         assert memory.rag_calls == [0.5, 0.8]
+
+    def test_translator_uses_bulk_memory_api(self):
+        class _BulkMemory(_FakeSemanticMemoryForRAG):
+            def __init__(self):
+                super().__init__()
+                self.bulk_queries = []
+                self.stored = []
+                self.lookups = []
+
+            def get_translations_bulk(self, texts, source_lang, target_lang):
+                self.lookups.append(list(texts))
+                return [None] * len(texts)
+
+            def get_rag_examples_bulk(
+                self, query_texts, source_lang, target_lang, limit, min_similarity
+            ):
+                self.bulk_queries.append((list(query_texts), list(min_similarity)))
+                return [[] for _ in query_texts]
+
+            def add_translations_bulk(self, translations, source_lang, target_lang):
+                self.stored.append(list(translations))
+                return len(translations)
+
+        memory = _BulkMemory()
+        config = type("Cfg", (object,), {"rag_enabled": True})()
+        translator = GlossaryTranslator(
+            MockOrchestrator(),
+            MockGlossary(),
+            memory=memory,
+            config=config,
+            enable_auto_suggestions=False,
+        )
+
+        segments = [
+            TranslationSegment("1", "Закройте все петли", {}),
+            TranslationSegment("2", "Провяжите 2 петли вместе", {}),
+        ]
+        translator.translate(segments, target_language="en", source_language="ru")
+
+        assert memory.lookups == [["Закройте все петли", "Провяжите 2 петли вместе"]]
+        assert memory.rag_calls == []
+        assert len(memory.bulk_queries) == 1
+        assert [len(batch) for batch in memory.stored] == [2]
+
+    @pytest.mark.parametrize("defer", [False, True])
+    def test_translator_writes_suggestions_in_one_batch(self, defer):
+        class _SuggestionMemory(_FakeSemanticMemoryForRAG):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def suggest_glossary_terms_bulk(self, suggestions, source_lang, target_lang):
+                self.batches.append(list(suggestions))
+                return len(suggestions)
+
+        memory = _SuggestionMemory()
+        translator = GlossaryTranslator(
+            MockOrchestrator(),
+            MockGlossary(),
+            memory=memory,
+            defer_suggestions=defer,
+        )
+
+        segments = [
+            TranslationSegment("1", "Закройте все петли", {}),
+            TranslationSegment("2", "Закройте все петли", {}),
+        ]
+        result = translator.translate(segments, target_language="en", source_language="ru")
+        assert translator.wait_for_suggestions(timeout=5)
+
+        assert len(memory.batches) == 1
+        frequencies = {phrase: freq for phrase, freq, _contexts in memory.batches[0]}
+        assert frequencies["Закройте все петли"] == 2
+        assert result.new_term_suggestions == sum(frequencies.values())
 from kps.translation.orchestrator import TranslationSegment
 
 
@@ -617,6 +930,21 @@ class TestTranslationMemory:
 
         assert result.cached_segments == 1  # Should use saved cache
 
+    def test_bounded_memory_keeps_evicted_entries_on_disk(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        memory = TranslationMemory(str(cache_file), max_entries=2)
+        for source, target in [("ряд", "row"), ("петля", "stitch"), ("край", "edge")]:
+            memory.add_translation(source, target, "ru", "en", [])
+        assert memory.get_translation("ряд", "ru", "en") is None  # Evicted from RAM
+        memory.save()
+
+        memory.delete_translation("петля", "ru", "en")
+        memory.add_translation("спица", "needle", "ru", "en", [])  # Evicts "край"
+        memory.save()
+
+        reopened = TranslationMemory(str(cache_file))
+        assert {e.source_text for e in reopened.entries.values()} == {"ряд", "край", "спица"}
+
     def test_cached_source_language_entries_are_invalidated(self, tmp_path):
         """Ensure cached Russian text is evicted and retranslated."""
 
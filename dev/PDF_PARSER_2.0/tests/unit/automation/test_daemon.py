@@ -37,6 +37,20 @@ def temp_dirs():
         }
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_files(tmp_path, monkeypatch):
+    """Keep SQLite memory and caches of real pipelines out of the repo's data/."""
+    from kps.core import unified_pipeline
+
+    for name in (
+        "DEFAULT_MEMORY_PATH",
+        "DEFAULT_EMBEDDING_CACHE_PATH",
+        "DEFAULT_EXTRACTION_CACHE_PATH",
+    ):
+        default = getattr(unified_pipeline, name)
+        monkeypatch.setattr(unified_pipeline, name, tmp_path / default.name)
+
+
 @pytest.fixture
 def mock_pipeline():
     """Mock UnifiedPipeline."""
@@ -339,6 +353,19 @@ class TestDocumentDaemon:
         assert daemon.stats["total_processed"] == 1
         assert daemon.stats["total_errors"] == 0
 
+    def test_start_closes_pipeline_on_stop(self, temp_dirs, mock_pipeline):
+        """Test that stopping the loop releases pipeline resources."""
+        daemon = DocumentDaemon(
+            inbox_dir=str(temp_dirs["to_translate"]),
+            output_dir=str(temp_dirs["translations"]),
+        )
+
+        with patch.object(daemon, "run_once", side_effect=KeyboardInterrupt):
+            daemon.start()
+
+        mock_pipeline.preload.assert_called_once()
+        mock_pipeline.close.assert_called_once()
+
 
 class TestDocumentDaemonIntegration:
     """Integration tests for DocumentDaemon."""
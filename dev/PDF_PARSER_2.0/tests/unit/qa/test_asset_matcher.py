@@ -0,0 +1,92 @@
+"""Unit tests for asset matching and the output asset index."""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from kps.core import Asset, AssetType, BBox
+from kps.qa import asset_matcher as asset_matcher_module
+from kps.qa.asset_matcher import AssetIndex, AssetMatcher
+from kps.qa.qa_utils import image_to_bytes
+
+
+def _image(seed: int) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, size=(8, 8, 3), dtype=np.uint8)
+    return Image.fromarray(blocks).resize((96, 96), Image.NEAREST)
+
+
+def _source_asset(tmp_path: Path, image: Image.Image, asset_id: str) -> Asset:
+    data = image_to_bytes(image)
+    path = tmp_path / f"{asset_id}.png"
+    path.write_bytes(data)
+    return Asset(
+        asset_id=asset_id,
+        asset_type=AssetType.IMAGE,
+        sha256=hashlib.sha256(data).hexdigest(),
+        page_number=0,
+        bbox=BBox(0, 0, 96, 96),
+        ctm=(1, 0, 0, 1, 0, 0),
+        file_path=path,
+        occurrence=1,
+        anchor_to="p.001",
+        image_width=96,
+        image_height=96,
+    )
+
+
+def test_exact_bytes_match_by_hash(tmp_path):
+    image = _image(1)
+    source = _source_asset(tmp_path, image, "img-hash")
+    outputs = [{"data": image_to_bytes(_image(2))}, {"data": image_to_bytes(image)}]
+
+    match = AssetMatcher().find_match(source, outputs)
+
+    assert match.matched and match.match_method == "hash"
+    assert match.output_asset is outputs[1]
+
+
+def test_reencoded_asset_matches_visually_among_distractors(tmp_path):
+    image = _image(3)
+    source = _source_asset(tmp_path, image, "img-visual")
+    outputs = [{"data": image_to_bytes(_image(seed))} for seed in range(10, 30)]
+    outputs.insert(7, {"data": image_to_bytes(image.convert("RGB"), format="JPEG")})
+
+    match = AssetMatcher().find_match(source, outputs)
+
+    assert match.matched and match.match_method == "visual"
+    assert match.output_asset is outputs[7]
+
+
+def test_batch_match_decodes_each_output_once(tmp_path, monkeypatch):
+    images = [_image(seed) for seed in range(40, 46)]
+    sources = [_source_asset(tmp_path, image, f"img-{i}") for i, image in enumerate(images)]
+    outputs = [
+        {"data": image_to_bytes(image.convert("RGB"), format="JPEG")} for image in images
+    ]
+
+    decoded = []
+    real_bytes_to_image = asset_matcher_module.bytes_to_image
+
+    def counting_bytes_to_image(data):
+        decoded.append(data)
+        return real_bytes_to_image(data)
+
+    monkeypatch.setattr(asset_matcher_module, "bytes_to_image", counting_bytes_to_image)
+    matches = AssetMatcher().batch_match(sources, outputs)
+
+    assert len(decoded) == len(outputs)
+    assert [match.output_asset for match in matches] == outputs
+
+
+def test_index_is_rebuilt_when_an_asset_is_replaced():
+    outputs = [{"data": image_to_bytes(_image(seed))} for seed in range(50, 53)]
+    index = AssetIndex(outputs)
+
+    assert index.is_for(outputs)
+    assert not index.is_for(list(reversed(outputs)))
+
+    outputs[1] = {"data": image_to_bytes(_image(60))}
+    assert not index.is_for(outputs)
@@ -0,0 +1,114 @@
+"""Unit tests for the shared single-pass PDF inspection."""
+
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from kps.core import Asset, AssetLedger, AssetType, BBox
+from kps.qa import pdf_inspection as pdf_inspection_module
+from kps.qa.bbox_extractor import BBoxExtractor
+from kps.qa.color_audit import ColorAuditor
+from kps.qa.dpi_validator import DPIValidator
+from kps.qa.font_audit import FontAuditor
+from kps.qa.pdf_inspection import PDFInspection
+
+fitz = pytest.importorskip("fitz")
+
+
+def _image_bytes(mode: str, size, color, format: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def output_pdf(tmp_path: Path) -> Path:
+    rgb = _image_bytes("RGB", (40, 30), (200, 10, 10), "PNG")
+    cmyk = _image_bytes("CMYK", (20, 20), (0, 100, 0, 0), "JPEG")
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(10, 10, 110, 85), stream=rgb)
+    page.insert_image(fitz.Rect(200, 10, 300, 85), stream=rgb)
+    page.insert_text((50, 400), "Hello", fontname="helv")
+    page.draw_rect(fitz.Rect(5, 5, 50, 50))
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(10, 200, 60, 250), stream=cmyk)
+    path = tmp_path / "output.pdf"
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _asset(asset_id: str, page: int, width: int, height: int) -> Asset:
+    return Asset(
+        asset_id=asset_id,
+        asset_type=AssetType.IMAGE,
+        sha256=(asset_id.encode("utf-8").hex() * 32)[:64],
+        page_number=page,
+        bbox=BBox(0, 0, 10, 10),
+        ctm=(1.0, 0.0, 0.0, 1.0, 0.0, 0.0),
+        file_path=Path("assets") / f"{asset_id}.png",
+        occurrence=1,
+        anchor_to="p.test.001",
+        image_width=width,
+        image_height=height,
+    )
+
+
+def test_inspection_collects_page_contents(output_pdf: Path):
+    inspection = PDFInspection.from_pdf(output_pdf)
+
+    assert inspection.page_count == 2
+    assert [font.basefont for font in inspection.fonts] == ["Helvetica"]
+    assert inspection.fonts[0].pages == {0}
+
+    placements = inspection.placements
+    assert placements["page"].tolist() == [0, 0, 1]
+    assert placements[["x0", "y0", "x1", "y1"]].tolist()[1] == (200.0, 10.0, 300.0, 85.0)
+    assert inspection.images_on_page(1)[["width", "height", "colorspace"]].tolist() == [(20, 20, 4)]
+
+    assert len(inspection.drawings_on_page(0)) == 1
+    assert inspection.span_texts == ["Hello"]
+    assert inspection.span_fonts[inspection.spans["font"][0]] == "Helvetica"
+
+
+def test_inspection_can_skip_text_and_drawings(output_pdf: Path):
+    inspection = PDFInspection.from_pdf(output_pdf, text=False, drawings=False)
+
+    assert len(inspection.spans) == 0 and inspection.span_texts == []
+    assert len(inspection.drawings) == 0
+    assert len(inspection.placements) == 3
+
+
+def test_auditors_share_one_open(output_pdf: Path, monkeypatch):
+    inspection = PDFInspection.from_pdf(output_pdf)
+    monkeypatch.setattr(
+        pdf_inspection_module.fitz, "open", lambda *_, **__: pytest.fail("PDF reopened")
+    )
+    ledger = AssetLedger(
+        assets=[_asset("img-rgb", 0, 40, 30), _asset("img-cmyk", 1, 20, 20)],
+        source_pdf=output_pdf,
+        total_pages=2,
+    )
+
+    font_report = FontAuditor().audit_fonts(output_pdf, inspection=inspection)
+    color_report = ColorAuditor().audit_colors(ledger, output_pdf, inspection=inspection)
+    dpi_report = DPIValidator().validate_dpi(output_pdf, ledger, inspection=inspection)
+    page_bboxes = BBoxExtractor().extract_from_page_objects(output_pdf, inspection)
+
+    assert font_report.total_fonts == 1
+    assert color_report.total_assets == 3  # One record per image listed on a page
+    assert not color_report.missing_icc  # MuPDF stores inserted images as ICCBased
+    placed = {issue.asset_id: issue.placed_dimensions for issue in dpi_report.issues}
+    assert placed == {"img-rgb": (100.0, 75.0), "img-cmyk": (50.0, 50.0)}
+    assert [len(page_bboxes[page]) for page in (0, 1)] == [2, 1]
+
+
+def test_auditors_inspect_path_when_not_shared(output_pdf: Path):
+    shared = FontAuditor().audit_fonts(output_pdf, inspection=PDFInspection.from_pdf(output_pdf))
+    own = FontAuditor().audit_fonts(output_pdf)
+
+    assert own.to_dict() == shared.to_dict()
@@ -3,7 +3,10 @@
 from types import SimpleNamespace
 from pathlib import Path
 
+import pytest
+
 from kps.core import Asset, AssetLedger, AssetType, BBox
+from kps.qa.pdf_inspection import PDFInspection
 from kps.qa.pipeline import QAPipeline
 from kps.qa.completeness_checker import CompletenessReport
 
@@ -78,8 +81,9 @@ class StubDPIValidator:
         self.called = False
         self.passed = passed
 
-    def validate_dpi(self, *_, **__):
+    def validate_dpi(self, *_, inspection=None, **__):
         self.called = True
+        self.inspection = inspection
         return SimpleNamespace(
             passed=self.passed,
             warnings=[],
@@ -93,8 +97,9 @@ class StubFontAuditor:
         self.called = False
         self.passed = passed
 
-    def audit_fonts(self, *_):
+    def audit_fonts(self, *_, inspection=None, **__):
         self.called = True
+        self.inspection = inspection
         return SimpleNamespace(
             passed=self.passed,
             warnings=[],
@@ -108,8 +113,9 @@ class StubColorAuditor:
         self.called = False
         self.passed = passed
 
-    def audit_colors(self, *_ , **__):
+    def audit_colors(self, *_, inspection=None, **__):
         self.called = True
+        self.inspection = inspection
         return SimpleNamespace(
             passed=self.passed,
             warnings=[],
@@ -226,3 +232,57 @@ def test_pipeline_handles_completeness_failure(tmp_path: Path):
     assert not result.passed
     assert result.failed_check == "completeness"
     assert set(result.qa_reports.keys()) == {"completeness"}
+
+
+def test_pipeline_shares_one_inspection_between_auditors(tmp_path: Path):
+    fitz = pytest.importorskip("fitz")
+    ledger = _ledger(tmp_path)
+    _, output_pdf, output_dir = _setup_files(tmp_path)
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Output", fontname="helv")
+    doc.save(output_pdf)
+    doc.close()
+
+    dpi = StubDPIValidator(passed=True)
+    font = StubFontAuditor(passed=True)
+    color = StubColorAuditor(passed=True)
+    pipeline = QAPipeline(
+        completeness_checker=StubCompletenessChecker(passed=True),
+        dpi_validator=dpi,
+        font_auditor=font,
+        color_auditor=color,
+    )
+
+    result = pipeline.run(
+        source_pdf=ledger.source_pdf,
+        reference_pdf=None,
+        output_pdf=output_pdf,
+        output_dir=output_dir,
+        ledger=ledger,
+        placed_labels=[],
+    )
+
+    assert result.passed
+    assert isinstance(dpi.inspection, PDFInspection)
+    assert font.inspection is dpi.inspection
+    assert color.inspection is dpi.inspection
+    assert [record.basefont for record in dpi.inspection.fonts] == ["Helvetica"]
+    assert len(dpi.inspection.spans) == 0 and len(dpi.inspection.drawings) == 0
+
+
+def test_pipeline_keeps_supplied_empty_raster_cache():
+    from kps.qa.rasterizer import RasterizationCache
+
+    cache = RasterizationCache(max_cache_size_mb=1)
+
+    assert QAPipeline(raster_cache=cache).raster_cache is cache
+
+
+def test_pipeline_visual_diff_is_opt_in_and_tiered():
+    from kps.qa.visual_diff import VisualDiffer
+
+    assert QAPipeline().visual_differ is None
+    assert VisualDiffer().tiered is False
+
+    differ = QAPipeline(enable_visual_diff=True).visual_differ
+    assert isinstance(differ, VisualDiffer) and differ.tiered is True
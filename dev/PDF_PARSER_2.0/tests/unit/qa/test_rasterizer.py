@@ -0,0 +1,119 @@
+"""Unit tests for the PDF rasterizer session and page cache."""
+
+from pathlib import Path
+
+import fitz
+import pytest
+from PIL import Image
+
+from kps.core import AssetLedger
+from kps.qa import rasterizer as rasterizer_module
+from kps.qa.rasterizer import (
+    PDFRasterizer,
+    RasterizationCache,
+    RasterizationError,
+)
+from kps.qa.visual_diff import VisualDiffer
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page(width=72, height=72)
+        page.insert_text((10, 40), str(index), fontsize=20)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def open_calls(monkeypatch):
+    calls = []
+    real_open = fitz.open
+
+    def counting_open(*args, **kwargs):
+        if args:  # fitz.open() without a path creates the test PDFs
+            calls.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(rasterizer_module.fitz, "open", counting_open)
+    return calls
+
+
+def test_session_opens_each_pdf_once(tmp_path, open_calls):
+    pdf = _make_pdf(tmp_path / "doc.pdf", pages=3)
+    rasterizer = PDFRasterizer(dpi=36)
+
+    with rasterizer.session() as pages:
+        images = [pages.rasterize_page(pdf, index) for index in (0, 1, 2, 1)]
+
+    assert len(open_calls) == 1
+    assert all(image.size == (36, 36) for image in images)
+
+
+def test_iter_pages_is_lazy_and_respects_range(tmp_path, open_calls):
+    pdf = _make_pdf(tmp_path / "doc.pdf", pages=4)
+    rasterizer = PDFRasterizer(dpi=36)
+
+    with rasterizer.session() as pages:
+        pending = pages.iter_pages(pdf, page_range=(1, 5))
+        assert open_calls == []
+        images = list(pending)
+
+    assert len(images) == 3
+    assert len(rasterizer.rasterize_pdf(pdf)) == 4
+
+
+def test_rasterize_page_out_of_range(tmp_path):
+    pdf = _make_pdf(tmp_path / "doc.pdf", pages=1)
+
+    with pytest.raises(RasterizationError):
+        PDFRasterizer(dpi=36).rasterize_page(pdf, 3)
+
+
+def test_cache_serves_pages_by_file_hash(tmp_path, open_calls):
+    pdf = _make_pdf(tmp_path / "doc.pdf", pages=2)
+    cache = RasterizationCache(max_cache_size_mb=1)
+    rasterizer = PDFRasterizer(dpi=36, cache=cache)
+
+    first = rasterizer.rasterize_page(pdf, 1)
+    second = rasterizer.rasterize_page(pdf, 1)
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    third = rasterizer.rasterize_page(copy, 1)
+
+    assert second is first and third is first
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    page_bytes = 100 * 100 * 3
+    cache = RasterizationCache(max_cache_size_mb=1)
+    cache.max_cache_size = 2 * page_bytes
+    images = [Image.new("RGB", (100, 100), (i, i, i)) for i in range(3)]
+
+    cache.put("a", 0, 72, "RGB", images[0])
+    cache.put("a", 1, 72, "RGB", images[1])
+    assert cache.get("a", 0, 72, "RGB") is images[0]
+    cache.put("a", 2, 72, "RGB", images[2])
+
+    assert cache.get("a", 1, 72, "RGB") is None
+    assert cache.get("a", 0, 72, "RGB") is images[0]
+    assert cache.get("a", 2, 72, "RGB") is images[2]
+    assert cache.size_bytes == 2 * page_bytes
+    assert cache.evictions == 1
+
+
+def test_compare_documents_opens_each_pdf_once(tmp_path, open_calls):
+    source = _make_pdf(tmp_path / "source.pdf", pages=5)
+    target = _make_pdf(tmp_path / "target.pdf", pages=5)
+    ledger = AssetLedger(assets=[], source_pdf=source, total_pages=5)
+
+    differ = VisualDiffer(rasterizer=PDFRasterizer(dpi=36))
+    passed, reports = differ.compare_documents(
+        source, target, ledger, page_dimensions=[(72.0, 72.0)] * 5
+    )
+
+    assert passed
+    assert len(reports) == 5
+    assert len(open_calls) == 2
@@ -1,5 +1,6 @@
 """Unit tests for the visual diff module."""
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, List, Sequence, Tuple
 
@@ -163,3 +164,142 @@ def test_compare_documents_aggregates_results(tmp_path):
     assert passed
     assert len(reports) == 1
     assert reports[0].metrics.diff_ratio == 0.0
+
+
+def _write_pdf(path: Path, marks: Sequence[bool]) -> Path:
+    import fitz
+
+    doc = fitz.open()
+    for marked in marks:
+        page = doc.new_page(width=72, height=72)
+        if marked:
+            page.draw_rect(fitz.Rect(10, 10, 40, 40), color=(1, 0, 0), fill=(1, 0, 0))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_parallel_compare_matches_serial_and_writes_diff_pngs(tmp_path):
+    from kps.qa.rasterizer import PDFRasterizer
+
+    changed = [False, True, False, False, True]
+    source_pdf = _write_pdf(tmp_path / "source.pdf", [False] * len(changed))
+    target_pdf = _write_pdf(tmp_path / "target.pdf", changed)
+    assets = [
+        replace(_make_asset(page, (0, 0, 72, 72)), page_number=page)
+        for page in range(len(changed))
+    ]
+    ledger = AssetLedger(assets=assets, source_pdf=source_pdf, total_pages=len(changed))
+    page_dimensions = [(72.0, 72.0)] * len(changed)
+
+    def differ(workers: int) -> VisualDiffer:
+        return VisualDiffer(rasterizer=PDFRasterizer(dpi=36), workers=workers)
+
+    _, serial = differ(1).compare_documents(source_pdf, target_pdf, ledger, page_dimensions)
+    passed, parallel = differ(3).compare_documents(
+        source_pdf,
+        target_pdf,
+        ledger,
+        page_dimensions,
+        return_diff_images=True,
+        diff_dir=tmp_path / "diffs",
+    )
+
+    assert not passed
+    assert [r.metrics for r in parallel] == [r.metrics for r in serial]
+    assert [not r.passed for r in parallel] == changed
+    assert all(r.diff_image is None for r in parallel)
+    assert [r.diff_path.name for r in parallel] == [f"page-{i:04d}.png" for i in range(1, 6)]
+    assert all(r.diff_path.exists() for r in parallel)
+
+
+def test_tiered_compare_matches_full_and_skips_unchanged_pages(tmp_path):
+    from kps.qa.rasterizer import PDFRasterizer, RasterizerSession
+
+    changed = [False, True, False]
+    source_pdf = _write_pdf(tmp_path / "source.pdf", [False] * len(changed))
+    target_pdf = _write_pdf(tmp_path / "target.pdf", changed)
+    assets = [
+        replace(_make_asset(page, (0, 0, 72, 72)), page_number=page)
+        for page in range(len(changed))
+    ]
+    ledger = AssetLedger(assets=assets, source_pdf=source_pdf, total_pages=len(changed))
+    page_dimensions = [(72.0, 72.0)] * len(changed)
+
+    full_renders = []
+    region_boxes = []
+    rasterize_page = RasterizerSession.rasterize_page
+    rasterize_region = RasterizerSession.rasterize_region
+
+    class CountingRasterizer(PDFRasterizer):
+        def session(self, cache=None):
+            session = super().session(cache)
+            session.rasterize_page = lambda pdf, page: (
+                full_renders.append(page) or rasterize_page(session, pdf, page)
+            )
+            session.rasterize_region = lambda pdf, page, **kw: (
+                region_boxes.append((page, kw.get("box"))) or rasterize_region(session, pdf, page, **kw)
+            )
+            return session
+
+    def compare(tiered: bool):
+        differ = VisualDiffer(
+            rasterizer=CountingRasterizer(dpi=144), tiered=tiered, tile_size=16
+        )
+        return differ.compare_documents(source_pdf, target_pdf, ledger, page_dimensions)[1]
+
+    full = compare(tiered=False)
+    assert sorted(full_renders) == [0, 0, 1, 1, 2, 2]
+    full_renders.clear()
+
+    tiered = compare(tiered=True)
+
+    assert [r.metrics for r in tiered] == [r.metrics for r in full]
+    assert full_renders == []
+    dirty = [box for page, box in region_boxes if box is not None]
+    assert dirty and all(page == 1 for page, box in region_boxes if box is not None)
+    # The red square covers (10, 10)-(40, 40) pt = (20, 20)-(80, 80) px at 144 DPI
+    assert min(box[0] for box in dirty) <= 20 and max(box[2] for box in dirty) >= 80
+    assert max(box[3] for box in dirty) < 144  # the bottom tile rows stay clean
+
+
+def test_tiered_compare_undercounts_subpreview_shifts_only(tmp_path):
+    import fitz
+
+    from kps.qa.rasterizer import PDFRasterizer
+
+    def write(path: Path, dx: float) -> Path:
+        doc = fitz.open()
+        page = doc.new_page(width=300, height=300)
+        for row in range(12):
+            page.insert_text((20 + dx, 30 + row * 20), "Knit two together, purl one " * 2, fontsize=9)
+        doc.save(path)
+        doc.close()
+        return path
+
+    source_pdf = write(tmp_path / "source.pdf", 0.0)
+    target_pdf = write(tmp_path / "target.pdf", 0.05)
+    ledger = AssetLedger(
+        assets=[_make_asset(0, (0, 0, 300, 300))], source_pdf=source_pdf, total_pages=1
+    )
+
+    def compare(tiered: bool):
+        differ = VisualDiffer(rasterizer=PDFRasterizer(dpi=200), tiered=tiered)
+        return differ.compare_documents(source_pdf, target_pdf, ledger, [(300.0, 300.0)])[1][0]
+
+    full, tiered = compare(tiered=False), compare(tiered=True)
+
+    assert 0 < tiered.metrics.differing_pixels <= full.metrics.differing_pixels
+    assert tiered.metrics.total_mask_pixels == full.metrics.total_mask_pixels
+    assert tiered.passed == full.passed
+
+
+def test_compare_images_uses_uint8_deltas():
+    base = _solid_image((250, 0, 0), (4, 4))
+    other = _solid_image((5, 0, 0), (4, 4))
+    mask = np.ones((4, 4), dtype=np.uint8)
+
+    metrics, _ = VisualDiffer(pixel_threshold=10).compare_images(base, other, mask)
+
+    assert metrics.max_difference == 245.0
+    assert metrics.mean_difference == 245.0
@@ -0,0 +1,49 @@
+import random
+
+from kps.search.bk_tree import BKTree
+
+
+def _hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _tree(values):
+    tree = BKTree(_hamming)
+    for index, value in enumerate(values):
+        tree.add(value, index)
+    return tree
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(7)
+    values = [rng.getrandbits(64) for _ in range(300)]
+    tree = _tree(values)
+
+    query = rng.getrandbits(64)
+    expected = sorted((_hamming(value, query), index) for index, value in enumerate(values))
+
+    assert len(tree) == 300
+    assert tree.nearest(query, 5) == expected[:5]
+
+
+def test_search_matches_brute_force():
+    rng = random.Random(11)
+    values = [rng.getrandbits(16) for _ in range(500)]
+    tree = _tree(values)
+
+    for _ in range(20):
+        query = rng.getrandbits(16)
+        expected = sorted(
+            (_hamming(value, query), index)
+            for index, value in enumerate(values)
+            if _hamming(value, query) <= 3
+        )
+        assert sorted(tree.search(query, 3)) == expected
+
+
+def test_equal_keys_share_a_node():
+    tree = _tree([5, 5, 7])
+
+    assert len(tree) == 3
+    assert tree.search(5, 0) == [(0, 0), (0, 1)]
+    assert tree.nearest(1, 0) == [] and BKTree(_hamming).nearest(1, 3) == []
@@ -20,3 +20,27 @@ def test_extractor_retains_docling_document(tmp_path):
     kps_doc = extractor.extract_document(sample, slug="sample")
     assert getattr(kps_doc, "docling_document", None) is not None
     assert extractor.last_docling_document is kps_doc.docling_document
+
+
+def test_extractor_reuses_cached_conversion(tmp_path, monkeypatch):
+    from kps.extraction.extraction_cache import ExtractionCache
+
+    sample = _make_docx(tmp_path)
+    cache = ExtractionCache(tmp_path / "extraction_cache.db")
+    first = DoclingExtractor(cache=cache).extract_document(sample, slug="sample")
+
+    extractor = DoclingExtractor(cache=cache)
+
+    def fail_to_convert():
+        raise AssertionError("cached document was converted again")
+
+    monkeypatch.setattr(extractor, "_create_converter", fail_to_convert)
+    second = extractor.extract_document(sample, slug="again")
+
+    assert second.slug == "again"
+    assert second.to_dict()["sections"] == first.to_dict()["sections"]
+    assert extractor.last_docling_document is second.docling_document
+    assert set(extractor.last_block_map) == {
+        block.block_id for section in second.sections for block in section.blocks
+    }
+    assert cache.stats().hits == 1
@@ -357,8 +357,8 @@ class TestDoclingExtractor:
         with pytest.raises(FileNotFoundError):
             extractor.extract_document(Path("/nonexistent/file.pdf"), "test-slug")
 
-    @patch("kps.extraction.docling_extractor.DocumentConverter")
-    def test_extract_document_empty_result(self, mock_converter_class):
+    @patch("kps.extraction.docling_extractor.build_converter")
+    def test_extract_document_empty_result(self, mock_build_converter):
         """Test extraction with empty Docling result."""
         # Create a temporary file
         import tempfile
@@ -370,7 +370,7 @@ class TestDoclingExtractor:
             # Mock converter to return empty result
             mock_converter = Mock()
             mock_converter.convert.return_value = None
-            mock_converter_class.return_value = mock_converter
+            mock_build_converter.return_value = mock_converter
 
             extractor = DoclingExtractor()
             extractor.converter = mock_converter
@@ -380,8 +380,8 @@ class TestDoclingExtractor:
         finally:
             pdf_path.unlink()
 
-    @patch("kps.extraction.docling_extractor.DocumentConverter")
-    def test_extract_document_empty_body(self, mock_converter_class):
+    @patch("kps.extraction.docling_extractor.build_converter")
+    def test_extract_document_empty_body(self, mock_build_converter):
         """Test extraction with empty document body."""
         import tempfile
 
@@ -398,7 +398,7 @@ class TestDoclingExtractor:
 
             mock_converter = Mock()
             mock_converter.convert.return_value = mock_result
-            mock_converter_class.return_value = mock_converter
+            mock_build_converter.return_value = mock_converter
 
             extractor = DoclingExtractor()
             extractor.converter = mock_converter
@@ -463,6 +463,201 @@ class TestDoclingExtractor:
             ), f"Missing prefix for {block_type.value}"
 
 
+class _ImmediateFuture:
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+
+class _InlinePool:
+    """Executor stand-in that runs page-range jobs against prepared documents."""
+
+    def __init__(self, documents_by_range):
+        self.documents_by_range = documents_by_range
+        self.calls = []
+
+    def submit(self, _fn, pdf_path, page_range):
+        self.calls.append(page_range)
+        return _ImmediateFuture(self.documents_by_range[page_range].export_to_dict())
+
+
+def _docling_pages(texts_by_page):
+    """DoclingDocument with one text item per entry, on the given page numbers."""
+    from docling_core.types.doc import DocItemLabel, DoclingDocument, ProvenanceItem, Size
+    from docling_core.types.doc.base import BoundingBox
+
+    doc = DoclingDocument(name="pattern")
+    for page_no, texts in texts_by_page.items():
+        doc.add_page(page_no=page_no, size=Size(width=595, height=842))
+        for index, (label, text) in enumerate(texts):
+            prov = ProvenanceItem(
+                page_no=page_no,
+                bbox=BoundingBox(l=50, t=100 + 40 * index, r=500, b=120 + 40 * index),
+                charspan=(0, len(text)),
+            )
+            if label == "heading":
+                doc.add_heading(text=text, prov=prov)
+            else:
+                doc.add_text(label=DocItemLabel.TEXT, text=text, prov=prov)
+    return doc
+
+
+class TestPageParallelExtraction:
+    """Page-range conversion in worker processes."""
+
+    def test_page_chunks_only_for_long_pdfs(self, tmp_path):
+        import fitz
+
+        pdf_path = tmp_path / "book.pdf"
+        doc = fitz.open()
+        for _ in range(20):
+            doc.new_page()
+        doc.save(pdf_path)
+        doc.close()
+
+        assert DoclingExtractor(workers=1)._page_chunks(pdf_path) == []
+        assert DoclingExtractor(workers=2, pages_per_chunk=8)._page_chunks(pdf_path) == [
+            (1, 7),
+            (8, 14),
+            (15, 20),
+        ]
+        assert DoclingExtractor(workers=2, pages_per_chunk=30)._page_chunks(pdf_path) == []
+        assert DoclingExtractor(
+            workers=2, pages_per_chunk=4, page_range=(5, 12)
+        )._page_chunks(pdf_path) == [(5, 8), (9, 12)]
+
+    def test_parallel_conversion_matches_serial_blocks(self, tmp_path):
+        pages = {
+            1: [("heading", "Материалы"), ("text", "Пряжа: 200 г")],
+            2: [("text", "Спицы 4 мм"), ("heading", "Описание работы")],
+            3: [("text", "Набрать 40 петель")],
+        }
+        serial_doc = _docling_pages(pages)
+        pool = _InlinePool(
+            {
+                (1, 2): _docling_pages({1: pages[1], 2: pages[2]}),
+                (3, 3): _docling_pages({3: pages[3]}),
+            }
+        )
+
+        extractor = DoclingExtractor(workers=2, pages_per_chunk=2)
+        extractor._page_pool = pool
+        stitched = extractor._convert_parallel(tmp_path / "book.pdf", [(1, 2), (3, 3)])
+
+        def blocks(docling_doc):
+            sections = DoclingExtractor()._extract_sections(docling_doc)
+            return [
+                (b.block_id, b.content, b.reading_order, b.doc_ref, b.page_number)
+                for section in sections
+                for b in section.blocks
+            ]
+
+        assert pool.calls == [(1, 2), (3, 3)]
+        assert sorted(stitched.pages) == [1, 2, 3]
+        assert blocks(stitched) == blocks(serial_doc)
+
+    def test_serial_conversion_honours_page_range(self, tmp_path):
+        pdf_path = tmp_path / "pattern.pdf"
+        document = _docling_pages({2: [("text", "Спицы 4 мм")]})
+        converter = Mock()
+        converter.convert.return_value = Mock(document=document)
+
+        extractor = DoclingExtractor(page_range=(2, 3))
+        extractor.converter = converter
+        assert extractor._convert(pdf_path) is document
+        converter.convert.assert_called_once_with(str(pdf_path), page_range=(2, 3))
+
+        converter.convert.reset_mock()
+        extractor.page_range = None
+        extractor._convert(pdf_path)
+        converter.convert.assert_called_once_with(str(pdf_path))
+
+    def test_page_pool_is_shut_down_without_close(self, monkeypatch):
+        import gc
+
+        from kps.extraction import docling_extractor
+
+        shutdowns = []
+
+        class RecordingPool:
+            def __init__(self, **kwargs):
+                pass
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                shutdowns.append(wait)
+
+        monkeypatch.setattr(docling_extractor, "ProcessPoolExecutor", RecordingPool)
+
+        with DoclingExtractor(workers=2) as extractor:
+            extractor._get_page_pool()
+        assert shutdowns == [True] and extractor._page_pool is None
+
+        extractor._get_page_pool()
+        del extractor
+        gc.collect()
+        assert shutdowns == [True, False]
+
+
+class TestLazyConverter:
+    """Docling models are loaded on first use or by warm_up."""
+
+    @patch("kps.extraction.docling_extractor.build_converter")
+    def test_converter_built_on_first_access(self, mock_build_converter):
+        extractor = DoclingExtractor()
+
+        mock_build_converter.assert_not_called()
+        assert extractor.converter is mock_build_converter.return_value
+        assert extractor.converter is mock_build_converter.return_value
+        mock_build_converter.assert_called_once_with(extractor.ocr_enabled)
+
+    @patch("kps.extraction.docling_extractor.build_converter")
+    def test_warm_up_initializes_pipeline_and_workers(self, mock_build_converter):
+        extractor = DoclingExtractor(workers=3)
+        pool = Mock()
+        pool.map.return_value = iter([True, True, True])
+        extractor._page_pool = pool
+
+        assert extractor.warm_up() is extractor
+
+        mock_build_converter.return_value.initialize_pipeline.assert_called_once()
+        assert list(pool.map.call_args.args[1]) == [0, 1, 2]
+
+
+class TestExtractionCache:
+    """Conversions are served from the extraction cache."""
+
+    def test_empty_cache_is_filled_and_reused(self, tmp_path, monkeypatch):
+        from kps.extraction.extraction_cache import ExtractionCache
+
+        pdf_path = tmp_path / "pattern.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 pattern")
+        cache = ExtractionCache(tmp_path / "extraction_cache.db")
+        assert len(cache) == 0
+
+        first_extractor = DoclingExtractor(cache=cache)
+        monkeypatch.setattr(
+            first_extractor,
+            "_convert",
+            lambda _path: _docling_pages({1: [("heading", "Материалы"), ("text", "Пряжа: 200 г")]}),
+        )
+        first = first_extractor.extract_document(pdf_path, "pattern")
+
+        extractor = DoclingExtractor(cache=cache)
+
+        def fail_to_convert():
+            raise AssertionError("cached document was converted again")
+
+        monkeypatch.setattr(extractor, "_create_converter", fail_to_convert)
+        second = extractor.extract_document(pdf_path, "again")
+
+        assert second.slug == "again"
+        assert second.to_dict()["sections"] == first.to_dict()["sections"]
+        stats = cache.stats()
+        assert (stats.hits, stats.entries) == (1, 1)
+
+
 class TestDoclingExtractorIntegration:
     """Integration tests requiring Docling setup."""
 
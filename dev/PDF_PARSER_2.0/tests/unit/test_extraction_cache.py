@@ -0,0 +1,114 @@
+"""Tests for the persistent Docling extraction cache."""
+
+import os
+import time
+
+import pytest
+
+from kps.extraction.extraction_cache import (
+    ExtractionCache,
+    extraction_cache_key,
+    file_sha256,
+)
+
+
+def _payload(size: int) -> dict:
+    # Random text so zlib cannot shrink entries to nothing
+    return {"document": {"text": os.urandom(size).hex()}}
+
+
+def test_roundtrip_and_stats(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache.db")
+
+    assert cache.get("missing") is None
+    cache.put("key", {"document": {"slug": "gloves"}, "block_map": {"p.cover.001": "#/texts/0"}})
+
+    assert cache.get("key") == {"document": {"slug": "gloves"}, "block_map": {"p.cover.001": "#/texts/0"}}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.bytes > 0
+    cache.close()
+
+
+def test_key_depends_on_input_version_and_options(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 a")
+    digest = file_sha256(pdf)
+
+    base = extraction_cache_key(digest, "2.5.0", {"ocr_enabled": False, "page_range": None})
+
+    assert base == extraction_cache_key(digest, "2.5.0", {"page_range": None, "ocr_enabled": False})
+    assert base != extraction_cache_key(digest, "2.6.0", {"ocr_enabled": False, "page_range": None})
+    assert base != extraction_cache_key(digest, "2.5.0", {"ocr_enabled": True, "page_range": None})
+    assert base != extraction_cache_key(digest, "2.5.0", {"ocr_enabled": False, "page_range": [1, 2]})
+
+    pdf.write_bytes(b"%PDF-1.4 b")
+    assert file_sha256(pdf) != digest
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache.db")
+    cache.put("a", _payload(1_500))
+    cache.max_bytes = int(cache.total_bytes() * 2.5)
+    cache.put("b", _payload(1_500))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", _payload(1_500))
+
+    assert cache.total_bytes() <= cache.max_bytes
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats().evictions >= 1
+    cache.close()
+
+
+def test_prune_by_size_and_age(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache.db", max_bytes=None)
+    for key in ("a", "b", "c"):
+        cache.put(key, _payload(1_000))
+        time.sleep(0.01)
+
+    assert cache.prune(max_bytes=cache.total_bytes() - 1) == 1
+    assert cache.get("a") is None
+
+    time.sleep(0.05)
+    cache.get("c")
+    assert cache.prune(max_age_seconds=0.03) == 1
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_hits_do_not_write_until_close(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = ExtractionCache(path, max_bytes=None)
+    for key in ("a", "b"):
+        cache.put(key, _payload(1_000))
+    conn = cache._store.db.connection()
+    changes = conn.total_changes
+
+    assert cache.get("a") is not None
+    assert conn.total_changes == changes
+    cache.close()
+
+    # The buffered hit was written on close: "b" is now least recently used
+    reopened = ExtractionCache(path, max_bytes=None)
+    assert reopened.prune(max_bytes=reopened.total_bytes() - 1) == 1
+    assert reopened.get("b") is None and reopened.get("a") is not None
+    reopened.close()
+
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache.db")
+    cache.put("key", {"document": {}})
+    cache._store.db.connection().execute(
+        "UPDATE entries SET payload = ? WHERE key = ?", (b"garbage", "key")
+    )
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_rejects_non_positive_bound(tmp_path):
+    with pytest.raises(ValueError):
+        ExtractionCache(tmp_path / "cache.db", max_bytes=0)
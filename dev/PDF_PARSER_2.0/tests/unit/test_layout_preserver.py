@@ -77,6 +77,149 @@ def test_process_pdf_filters_source_language(tmp_path, monkeypatch):
     assert outputs[0].name.endswith("_fr.pdf")
 
 
+def test_process_pdf_translates_repeated_blocks_once(tmp_path, monkeypatch):
+    """Running headers repeated on every page reach the engine only once."""
+
+    sample_pdf = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for number in range(3):
+        page = doc.new_page(width=420, height=595)
+        page.insert_text((72, 40), "Knitting Pattern Header", fontsize=12)
+        page.insert_text((72, 300), f"Row {number}", fontsize=12)
+    doc.save(sample_pdf)
+    doc.close()
+
+    calls = []
+
+    def fake_translate(text, src, tgt):
+        calls.append(text)
+        return f"[{tgt}] {text}"
+
+    monkeypatch.setattr(lp, "detect_language", lambda _: "en")
+    monkeypatch.setattr(lp, "ensure_argos_model", lambda src, tgt: None)
+    monkeypatch.setattr(lp, "translate_text", fake_translate)
+
+    lp.process_pdf(sample_pdf, tmp_path / "out", target_langs=["fr"], preserve_formatting=False)
+
+    assert calls.count("Knitting Pattern Header") == 1
+    assert sorted(set(calls)) == sorted(calls)
+
+
+def test_process_pdf_parallel_workers_keep_page_order(tmp_path, monkeypatch):
+    """Chunks rebuilt in worker processes are merged back in page order."""
+
+    sample_pdf = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for number in range(5):
+        page = doc.new_page(width=420, height=595)
+        page.insert_text((72, 300), f"Row {number}", fontsize=12)
+    doc.save(sample_pdf)
+    doc.close()
+
+    monkeypatch.setattr(lp, "detect_language", lambda _: "en")
+    monkeypatch.setattr(lp, "ensure_argos_model", lambda src, tgt: None)
+    monkeypatch.setattr(lp, "translate_text", lambda text, src, tgt: f"{tgt} {text}")
+
+    outputs = lp.process_pdf(
+        sample_pdf,
+        tmp_path / "out",
+        target_langs=["fr", "ru"],
+        preserve_formatting=False,
+        workers=2,
+    )
+
+    assert [path.name for path in outputs] == ["pages_fr.pdf", "pages_ru.pdf"]
+    for path, tgt in zip(outputs, ["fr", "ru"]):
+        with fitz.open(path) as result:
+            assert result.page_count == 5
+            texts = [page.get_text() for page in result]
+            fonts = {font[3] for page in result for font in page.get_fonts()}
+            font_xrefs = {font[0] for page in result for font in page.get_fonts()}
+        for number, text in enumerate(texts):
+            assert f"{tgt} Row {number}" in text
+            assert "Row" not in text.replace(f"{tgt} Row {number}", "")
+        assert len(font_xrefs) == len(fonts)
+
+
+def test_font_registry_embeds_each_font_once():
+    doc = fitz.open()
+    registry = lp.FontRegistry(doc)
+    font = lp._load_font("helv")
+    xrefs = set()
+    for _ in range(3):
+        page = doc.new_page()
+        xrefs.add(registry.embed(page, "Body", font))
+        page.insert_text((72, 72), "Hello", fontname="Body", fontsize=12)
+
+    assert len(xrefs) == 1
+    for page in doc:
+        assert [entry[0] for entry in page.get_fonts() if entry[4] == "Body"] == list(xrefs)
+        assert "Hello" in page.get_text()
+
+    width = registry.text_length("Body", font, "Hello", fontsize=10)
+    assert width == pytest.approx(font.text_length("Hello", fontsize=10))
+    assert registry.text_length("Body", font, "Hello", fontsize=20) == pytest.approx(2 * width)
+    assert len(registry._widths) == 1
+    doc.close()
+
+
+@pytest.mark.parametrize("preserve_formatting", [False, True])
+def test_process_pdf_shares_fonts_across_pages(tmp_path, monkeypatch, preserve_formatting):
+    sample_pdf = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for number in range(4):
+        page = doc.new_page(width=420, height=595)
+        page.insert_text((72, 300), f"Row {number}", fontsize=12)
+    doc.save(sample_pdf)
+    doc.close()
+
+    monkeypatch.setattr(lp, "detect_language", lambda _: "en")
+    monkeypatch.setattr(lp, "ensure_argos_model", lambda src, tgt: None)
+    monkeypatch.setattr(lp, "translate_text", lambda text, src, tgt: f"Ряд {text[-1]}")
+
+    (output,) = lp.process_pdf(
+        sample_pdf,
+        tmp_path / "out",
+        target_langs=["ru"],
+        preserve_formatting=preserve_formatting,
+    )
+
+    with fitz.open(output) as result:
+        fonts_by_alias = {}
+        for page in result:
+            for xref, _ext, _type, _name, alias, _enc in page.get_fonts():
+                fonts_by_alias.setdefault(alias, set()).add(xref)
+        texts = [page.get_text() for page in result]
+
+    assert all(len(xrefs) == 1 for xrefs in fonts_by_alias.values())
+    for number, text in enumerate(texts):
+        assert f"Ряд {number}" in text
+
+
+def test_layout_translator_reads_and_writes_memory(tmp_path):
+    from kps.translation.semantic_memory import SemanticTranslationMemory
+
+    memory = SemanticTranslationMemory(str(tmp_path / "layout.db"), use_embeddings=False)
+    calls = []
+
+    def engine(text):
+        calls.append(text)
+        return text.upper()
+
+    first = lp.LayoutTranslator("en", "fr", memory=memory, translate_fn=engine)
+    first.prefetch(["header", "row", "header", "  "])
+    assert calls == ["header", "row"]
+
+    second = lp.LayoutTranslator("en", "fr", memory=memory, translate_fn=engine)
+    second.prefetch(["header", "row"])
+    assert calls == ["header", "row"]  # served from memory, engine not called
+    assert second.memory_hits == 2
+    assert second.translate("header") == "HEADER"
+    # LLM translations of the same text are kept apart (different model tag)
+    assert memory.get_translation("header", "en", "fr") is None
+    memory.close()
+
+
 def test_split_translation_by_spans_respects_word_boundaries():
     """Word boundaries should be preserved when splitting translations across spans."""
 
@@ -0,0 +1,61 @@
+"""Tests for the bounded in-process LRU cache."""
+
+import pytest
+
+from kps.storage import LRUCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache("test", max_entries=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert set(cache) == {"a", "c"}
+    assert cache.stats().evictions == 1
+
+
+def test_byte_bound_uses_sizeof():
+    cache = LRUCache("test", max_bytes=10, sizeof=len)
+    cache["a"] = "xxxx"
+    cache["b"] = "yyyy"
+    cache["c"] = "zzzz"
+
+    assert list(cache) == ["b", "c"]
+    assert cache.stats().bytes == 8
+
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("kps.storage.lru_cache.time.monotonic", lambda: now[0])
+    cache = LRUCache("test", ttl_seconds=5)
+    cache["a"] = 1
+
+    now[0] += 6
+
+    assert "a" not in cache
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats.misses, stats.evictions, stats.entries) == (1, 1, 0)
+
+
+def test_membership_and_iteration_do_not_count_lookups():
+    cache = LRUCache("test")
+    cache["a"] = 1
+
+    assert "a" in cache
+    assert cache.values() == [1]
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (0, 1)
+    assert stats.hit_rate == 0.0
+
+
+def test_rejects_non_positive_bounds():
+    with pytest.raises(ValueError):
+        LRUCache("test", max_entries=0)
@@ -30,9 +30,9 @@ def test_pdf_fallback_builder_uses_browser(tmp_path: Path):
 
     builder = pipeline._build_pdf_fallback_builder(translated_doc, output_file)
 
-    with patch("kps.core.unified_pipeline.render_html", return_value="<html></html>"):
-        with patch("kps.core.unified_pipeline.render_pdf", side_effect=RuntimeError("Weasy unavailable")):
-            with patch("kps.core.unified_pipeline.export_pdf_browser") as mock_browser:
+    with patch("kps.export.render_html", return_value="<html></html>"):
+        with patch("kps.export.render_pdf", side_effect=RuntimeError("Weasy unavailable")):
+            with patch("kps.export.export_pdf_browser") as mock_browser:
                 result_path, label = builder()
 
     assert result_path == output_file
@@ -0,0 +1,101 @@
+import sqlite3
+import threading
+
+import pytest
+
+from kps.storage import SQLiteDatabase, SQLiteLRUStore
+
+
+def _make_table(db):
+    with db.transaction() as conn:
+        conn.execute("CREATE TABLE items (name TEXT PRIMARY KEY)")
+
+
+def test_connection_is_reused_per_thread_and_uses_wal(tmp_path):
+    db = SQLiteDatabase(tmp_path / "nested" / "db.sqlite")
+    conn = db.connection()
+
+    assert db.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(db.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+    db.close()
+
+
+def test_nested_transactions_commit_once(tmp_path):
+    db = SQLiteDatabase(tmp_path / "db.sqlite")
+    _make_table(db)
+    observer = sqlite3.connect(str(db.path))
+
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('a')")
+        with db.transaction() as inner:
+            inner.execute("INSERT INTO items VALUES ('b')")
+        assert db.in_transaction
+        # Inner scope did not commit
+        assert observer.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    assert not db.in_transaction
+    assert observer.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+    observer.close()
+    db.close()
+
+
+def test_failed_transaction_rolls_back_outer_scope(tmp_path):
+    db = SQLiteDatabase(tmp_path / "db.sqlite")
+    _make_table(db)
+
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+            with db.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('b')")
+                raise RuntimeError("boom")
+
+    assert db.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+    # Connection is usable for the next scope
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('c')")
+    assert db.connection().execute("SELECT name FROM items").fetchall() == [("c",)]
+    db.close()
+
+
+def test_lru_store_bounds_entries_and_bytes(tmp_path):
+    store = SQLiteLRUStore(tmp_path / "store.db", max_entries=3, max_bytes=10)
+    store.put_many([("a", b"xxxx"), ("b", b"yy")])
+    assert store.get_many(["a", "missing", "a"]) == [b"xxxx", None, b"xxxx"]
+
+    store.put_many([("c", b"zzzz"), ("d", b"w")])  # Over both bounds: "b" is LRU
+
+    assert store.get("b") is None
+    assert store.total_bytes() <= 10 and len(store) <= 3
+    stats = store.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.evictions >= 1
+    store.close()
+
+
+def test_lru_store_buffers_recency_and_drops_undecodable(tmp_path):
+    store = SQLiteLRUStore(tmp_path / "store.db", touch_flush_size=2)
+    store.put_many([("a", b"1"), ("b", b"2"), ("bad", b"?")])
+    conn = store.db.connection()
+    changes = conn.total_changes
+
+    assert store.get("a") == b"1"
+    assert conn.total_changes == changes  # Buffered
+    assert store.get("b") == b"2"
+    assert conn.total_changes == changes + 2  # Buffer full: both written at once
+
+    def decode(blob):
+        if blob == b"?":
+            raise ValueError("unreadable")
+        return blob.decode()
+
+    assert store.get("bad", decode) is None
+    assert len(store) == 2
+    store.close()
@@ -0,0 +1,75 @@
+from kps.core import MemoryType, PipelineConfig, UnifiedPipeline
+from kps.startup import StartupProfile, profile_imports
+
+
+def _make_pipeline(**overrides) -> UnifiedPipeline:
+    config = PipelineConfig(
+        memory_type=MemoryType.NONE,
+        glossary_path=None,
+        enable_knowledge_base=False,
+        export_formats=["json"],
+        publish_outputs=False,
+        extraction_cache_enabled=False,
+        **overrides,
+    )
+    return UnifiedPipeline(config)
+
+
+def test_profile_imports_times_each_subsystem_and_records_failures():
+    profile = profile_imports(
+        {"stdlib": ("json", "sqlite3"), "missing": ("kps_no_such_module",)}
+    )
+
+    assert set(profile.imports) == {"stdlib"}
+    assert profile.imports["stdlib"] >= 0.0
+    assert "ModuleNotFoundError" in profile.errors["missing"]
+    assert "stdlib" in profile.format()
+
+
+def test_startup_profile_accumulates_component_times():
+    profile = StartupProfile()
+    profile.record_component("translator", 0.5)
+    profile.record_component("translator", 0.25)
+
+    assert profile.components == {"translator": 0.75}
+    assert profile.component_seconds == 0.75
+
+
+def test_pipeline_builds_heavy_components_on_first_use():
+    pipeline = _make_pipeline()
+
+    lazy = ("docling_extractor", "glossary", "orchestrator", "memory", "translator", "qa_pipeline")
+    assert not any(name in vars(pipeline) for name in lazy)
+
+    translator = pipeline.translator
+
+    assert pipeline.translator is translator
+    assert translator.orchestrator is pipeline.orchestrator
+    assert pipeline.memory is None
+    assert {"translator", "orchestrator", "glossary"} <= set(pipeline.startup_profile.components)
+    assert "docling_extractor" not in vars(pipeline)
+
+
+def test_assigned_component_skips_factory():
+    pipeline = _make_pipeline()
+    sentinel = object()
+
+    pipeline.translator = sentinel
+
+    assert pipeline.translator is sentinel
+    assert "orchestrator" not in vars(pipeline)
+    assert "translator" not in pipeline.startup_profile.components
+
+
+def test_preload_warms_docling_extractor(monkeypatch):
+    pipeline = _make_pipeline(extraction_workers=2)
+    warmed = []
+    monkeypatch.setattr(
+        type(pipeline.docling_extractor), "warm_up", lambda extractor: warmed.append(extractor)
+    )
+
+    pipeline.preload(translation=False)
+
+    assert warmed == [pipeline.docling_extractor]
+    assert pipeline.docling_extractor.workers == 2
+    assert "translator" not in vars(pipeline)
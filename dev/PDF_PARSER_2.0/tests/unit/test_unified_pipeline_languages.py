@@ -0,0 +1,255 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from kps.core import MemoryType, PipelineConfig, UnifiedPipeline
+from kps.core.document import (
+    BlockType,
+    ContentBlock,
+    DocumentMetadata,
+    KPSDocument,
+    Section,
+    SectionType,
+)
+from kps.translation.glossary_translator import GlossaryTranslator, TranslationResult
+from kps.translation.term_miner import PhraseCandidate
+
+
+def _make_document() -> KPSDocument:
+    metadata = DocumentMetadata(title="test", language="ru")
+    blocks = [
+        ContentBlock(block_id=f"p.cover.{i:03d}", block_type=BlockType.PARAGRAPH, content=f"Текст {i}")
+        for i in range(3)
+    ]
+    section = Section(section_type=SectionType.COVER, title="Cover", blocks=blocks)
+    return KPSDocument(slug="test", metadata=metadata, sections=[section])
+
+
+def _make_pipeline(tmp_path: Path, workers: int) -> UnifiedPipeline:
+    config = PipelineConfig(
+        memory_type=MemoryType.NONE,
+        glossary_path=None,
+        enable_knowledge_base=False,
+        export_formats=["json"],
+        publish_outputs=False,
+        language_workers=workers,
+    )
+    pipeline = UnifiedPipeline(config)
+    document = _make_document()
+    pipeline._extract_content = lambda _path: document
+    pipeline._detect_language = lambda _segments: "ru"
+    pipeline._translate_table_blocks = lambda *args, **kwargs: None
+    return pipeline
+
+
+class _SlowTranslator:
+    """Translator stub that records how many languages run at once."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def translate(self, segments, target_language, source_language=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays[target_language])
+        with self._lock:
+            self.active -= 1
+        if target_language == "de":
+            raise RuntimeError("boom")
+        return TranslationResult(
+            source_language=source_language,
+            target_language=target_language,
+            segments=[f"{target_language}:{s.segment_id}" for s in segments],
+            terms_found=1,
+            total_cost=0.5,
+            cached_segments=1,
+        )
+
+    def save_memory(self):
+        pass
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_language_results_are_ordered(tmp_path, workers):
+    pipeline = _make_pipeline(tmp_path, workers)
+    translator = _SlowTranslator({"en": 0.2, "fr": 0.05, "de": 0.01})
+    pipeline.translator = translator
+
+    input_file = tmp_path / "doc.pdf"
+    input_file.write_bytes(b"%PDF-1.4")
+
+    result = pipeline.process(input_file, ["en", "fr", "de"], output_dir=tmp_path / "out")
+
+    assert result.target_languages == ["en", "fr"]
+    assert list(result.output_files) == ["en", "fr"]
+    assert list(result.language_timings) == ["en", "fr", "de"]
+    assert result.language_timings["en"]["translate"] >= 0.2
+    assert "export" in result.language_timings["fr"]
+    assert "export" not in result.language_timings["de"]
+    assert result.errors == ["Translation to de failed: boom"]
+    assert result.translation_cost == pytest.approx(1.0)
+    assert result.cache_hit_rate == pytest.approx(2 / 6)
+    if workers == 1:
+        assert translator.peak == 1
+    else:
+        # Overlap is what matters; how many threads start at once is up to the scheduler
+        assert 1 < translator.peak <= workers
+
+
+def test_repeated_segments_are_translated_once(tmp_path):
+    pipeline = _make_pipeline(tmp_path, workers=1)
+    document = _make_document()
+    repeated = document.sections[0].blocks[0]
+    document.sections[0].blocks.append(
+        ContentBlock(block_id="p.cover.099", block_type=BlockType.PARAGRAPH, content=repeated.content)
+    )
+    pipeline._extract_content = lambda _path: document
+    translator = _SlowTranslator({"en": 0.0})
+    calls = []
+    original = translator.translate
+
+    def recording_translate(segments, target_language, source_language=None):
+        calls.append(len(segments))
+        return original(segments, target_language, source_language)
+
+    translator.translate = recording_translate
+    pipeline.translator = translator
+
+    input_file = tmp_path / "doc.pdf"
+    input_file.write_bytes(b"%PDF-1.4")
+    result = pipeline.process(input_file, ["en"], output_dir=tmp_path / "out")
+
+    assert calls == [3]
+    assert result.segments_extracted == 4
+    assert result.segments_unique == 3
+    assert result.dedup_ratio == pytest.approx(0.25)
+
+
+class _SlowSuggestionMemory:
+    """Memory stub whose suggestion writes finish after translate() returns."""
+
+    def __init__(self):
+        self.events = []
+
+    def suggest_glossary_terms_bulk(self, suggestions, source_lang, target_lang):
+        time.sleep(0.2)
+        self.events.append(("suggest", [row[0] for row in suggestions]))
+        return len(suggestions)
+
+    def save(self):
+        self.events.append(("save", None))
+
+
+class _DeferringTranslator(GlossaryTranslator):
+    def translate(self, segments, target_language, source_language=None):
+        self._defer_suggestions([PhraseCandidate("лицевая петля", 2)], source_language, target_language)
+        return TranslationResult(
+            source_language=source_language,
+            target_language=target_language,
+            segments=[s.text for s in segments],
+            terms_found=0,
+            total_cost=0.0,
+        )
+
+
+def test_deferred_suggestions_are_saved_before_process_returns(tmp_path):
+    pipeline = _make_pipeline(tmp_path, workers=2)
+    memory = _SlowSuggestionMemory()
+    pipeline.memory = memory
+    pipeline.translator = _DeferringTranslator(None, None, memory=memory, defer_suggestions=True)
+
+    input_file = tmp_path / "doc.pdf"
+    input_file.write_bytes(b"%PDF-1.4")
+    pipeline.process(input_file, ["en", "fr"], output_dir=tmp_path / "out")
+
+    assert memory.events == [
+        ("suggest", ["лицевая петля"]),
+        ("suggest", ["лицевая петля"]),
+        ("save", None),
+    ]
+    pipeline.close()
+    assert pipeline.translator._suggestion_executor is None
+
+
+def test_new_version_retranslates_only_changed_blocks(tmp_path):
+    from kps.io.layout import RunContext
+
+    config = PipelineConfig(
+        memory_type=MemoryType.NONE,
+        glossary_path=None,
+        enable_knowledge_base=False,
+        export_formats=["json"],
+        publish_root=str(tmp_path / "published"),
+    )
+    pipeline = UnifiedPipeline(config)
+    pipeline._detect_language = lambda _segments: "ru"
+    pipeline._translate_table_blocks = lambda *args, **kwargs: None
+    translator = _SlowTranslator({"en": 0.0})
+    calls = []
+    original = translator.translate
+
+    def recording_translate(segments, target_language, source_language=None):
+        calls.append([s.segment_id for s in segments])
+        return original(segments, target_language, source_language)
+
+    translator.translate = recording_translate
+    pipeline.translator = translator
+
+    input_file = tmp_path / "doc.pdf"
+    input_file.write_bytes(b"%PDF-1.4")
+
+    def run(version, document):
+        pipeline._extract_content = lambda _path: document
+        context = RunContext(
+            slug="doc",
+            version=version,
+            staged_input=input_file,
+            output_dir=tmp_path / "out" / version,
+            inter_json_path=tmp_path / f"{version}.json",
+            inter_markdown_path=tmp_path / f"{version}.md",
+            input_hash=version,
+        )
+        context.output_dir.mkdir(parents=True)
+        return pipeline.process(input_file, ["en"], context.output_dir, run_context=context)
+
+    first = run("v001", _make_document())
+    corrected = _make_document()
+    corrected.sections[0].blocks[1].content = "Исправленный текст"
+    second = run("v002", corrected)
+
+    assert calls == [["p.cover.000.seg0", "p.cover.001.seg0", "p.cover.002.seg0"], ["p.cover.001.seg0"]]
+    assert first.blocks_reused == 0
+    assert second.blocks_reused == 2
+    # Hit rate covers only segments sent to the translator, not reused blocks
+    assert first.cache_hit_rate == pytest.approx(1 / 3)
+    assert second.cache_hit_rate == pytest.approx(1.0)
+    assert (tmp_path / "published" / "doc" / "v002" / "blocks.json").exists()
+
+
+class _ClosableStub:
+    def __init__(self, name, closed):
+        self.name = name
+        self.closed = closed
+
+    def close(self):
+        self.closed.append(self.name)
+
+
+def test_close_releases_created_components(tmp_path):
+    closed = []
+    with _make_pipeline(tmp_path, workers=1) as pipeline:
+        pipeline.memory = _ClosableStub("memory", closed)
+        pipeline.knowledge_base = _ClosableStub("knowledge_base", closed)
+        pipeline.embedding_client = type("Client", (), {"cache": _ClosableStub("embedding_cache", closed)})()
+        pipeline.extraction_cache = _ClosableStub("extraction_cache", closed)
+
+    assert closed == ["memory", "knowledge_base", "embedding_cache", "extraction_cache"]
+    # Components that were never accessed are not built just to be closed
+    assert "translator" not in pipeline.__dict__
+    assert "docling_extractor" not in pipeline.__dict__
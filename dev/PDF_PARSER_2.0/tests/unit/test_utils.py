@@ -0,0 +1,13 @@
+"""Tests for shared helpers."""
+
+from kps.utils import page_chunks
+
+
+def test_page_chunks_balances_contiguous_ranges():
+    assert page_chunks(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert page_chunks(20, 3) == [(0, 7), (7, 14), (14, 20)]
+
+
+def test_page_chunks_never_exceeds_page_count():
+    assert page_chunks(2, 8) == [(0, 1), (1, 2)]
+    assert page_chunks(5, 0) == [(0, 5)]
@@ -0,0 +1,90 @@
+"""Tests for the block manifest used by incremental re-translation."""
+
+import pytest
+
+from kps.core.document import (
+    BlockType,
+    ContentBlock,
+    DocumentMetadata,
+    KPSDocument,
+    Section,
+    SectionType,
+)
+from kps.extraction.segmenter import Segmenter
+from kps.translation.block_manifest import BlockManifest
+
+
+def _document(*texts):
+    blocks = [
+        ContentBlock(block_id=f"p.steps.{i:03d}", block_type=BlockType.PARAGRAPH, content=text)
+        for i, text in enumerate(texts)
+    ]
+    return KPSDocument(
+        slug="pattern",
+        metadata=DocumentMetadata(title="t", language="ru"),
+        sections=[Section(section_type=SectionType.INSTRUCTIONS, title="Steps", blocks=blocks)],
+    )
+
+
+def _manifest(*texts, model="gpt-4o-mini"):
+    document = _document(*texts)
+    segments = Segmenter().segment_document(document)
+    return BlockManifest.build(document, segments, "ru", model=model), segments
+
+
+def _published(*texts, **kwargs):
+    manifest, segments = _manifest(*texts, **kwargs)
+    manifest.record("en", segments, [f"EN[{s.text}]" for s in segments])
+    return manifest
+
+
+def test_only_changed_blocks_are_pending(tmp_path):
+    previous = _published("Набрать 20 петель", "Лицевая гладь", "Закрыть петли")
+    path = tmp_path / "blocks.json"
+    previous.save(path)
+
+    current, segments = _manifest("Набрать 20 петель", "Изнаночная гладь", "Закрыть петли")
+    plan = BlockManifest.load(path).plan(current, segments, "en")
+
+    assert plan.pending == [1]
+    assert plan.blocks_reused == 2
+    assert plan.blocks_total == 3
+    merged = plan.merge(["EN[new]"])
+    assert merged[1] == "EN[new]"
+    assert merged[0] == f"EN[{segments[0].text}]"
+
+
+def test_changed_placeholder_values_are_retranslated():
+    previous = _published("Набрать 20 петель")
+    current, segments = _manifest("Набрать 24 петель")
+
+    plan = previous.plan(current, segments, "en")
+
+    assert plan.pending == [0]
+    assert plan.blocks_reused == 0
+
+
+def test_no_reuse_for_other_language_or_model():
+    previous = _published("Лицевая гладь")
+
+    current, segments = _manifest("Лицевая гладь")
+    assert previous.plan(current, segments, "fr").pending == [0]
+
+    current, segments = _manifest("Лицевая гладь", model="other-model")
+    assert previous.plan(current, segments, "en").pending == [0]
+
+
+def test_merge_rejects_wrong_count():
+    current, segments = _manifest("Лицевая гладь")
+    plan = BlockManifest(source_language="ru").plan(current, segments, "en")
+
+    with pytest.raises(ValueError):
+        plan.merge([])
+
+
+def test_load_ignores_unreadable_manifest(tmp_path):
+    path = tmp_path / "blocks.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert BlockManifest.load(path) is None
+    assert BlockManifest.load(tmp_path / "missing.json") is None
@@ -0,0 +1,43 @@
+import random
+
+from kps.translation.glossary.advanced_matcher import AdvancedGlossaryMatcher
+from kps.translation.glossary.fuzzy_index import BKTree, levenshtein_distance
+from kps.translation.glossary.manager import GlossaryManager
+
+
+def test_bk_tree_matches_linear_scan():
+    rng = random.Random(3)
+    alphabet = "абвгдеж"
+    terms = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7))) for _ in range(200)]
+    tree = BKTree(terms + [""])
+
+    for _ in range(50):
+        word = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7)))
+        for max_distance in (0, 1, 2):
+            expected = [
+                (term_id, levenshtein_distance(word, term))
+                for term_id, term in enumerate(terms)
+                if levenshtein_distance(word, term) <= max_distance
+            ]
+            assert tree.search(word, max_distance) == expected
+
+
+def test_fuzzy_match_uses_entry_order(tmp_path):
+    path = tmp_path / "g.yaml"
+    path.write_text(
+        "terms:\n"
+        "  loop:\n    ru: петля\n    en: stitch\n    fr: maille\n"
+        "  loops:\n    ru: петли\n    en: stitches\n    fr: mailles\n"
+        "  row:\n    ru: ряд\n    en: row\n    fr: rang\n",
+        encoding="utf-8",
+    )
+    matcher = AdvancedGlossaryMatcher(GlossaryManager([path]))
+
+    found = matcher._fuzzy_match("Снимите петлю и затем петлю", "ru", "en", 0.7)
+
+    assert [(o.entry.key, o.position, o.confidence) for o in found] == [
+        ("loop", 8, 0.8),
+        ("loops", 8, 0.8),
+        ("loop", 8, 0.8),
+        ("loops", 8, 0.8),
+    ]
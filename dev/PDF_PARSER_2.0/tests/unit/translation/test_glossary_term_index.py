@@ -0,0 +1,81 @@
+import re
+
+import pytest
+
+from kps.translation.glossary.manager import GlossaryManager
+from kps.translation.glossary.selector import select_glossary_terms
+from kps.translation.glossary.term_index import TermIndex
+
+
+def _regex_hits(terms, text, whole_words=True):
+    hits = []
+    for term_id, term in enumerate(terms):
+        if not term:
+            continue
+        pattern = re.escape(term.lower())
+        if whole_words:
+            pattern = r"\b" + pattern + r"\b"
+        hits.extend((term_id, m.start(), m.end()) for m in re.finditer(pattern, text.lower()))
+    return hits
+
+
+TERMS = ["лиц", "лицевая", "2 петли вместе", "(k2tog)", "aa", "ряд", "", "Ряд"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Провяжите 2 петли вместе, лицевая гладь",
+        "лиц.лиц лицевые (k2tog) x(k2tog)",
+        "aaaa aa aa_aa",
+        "РЯД 1: ряд",
+    ],
+)
+@pytest.mark.parametrize("whole_words", [True, False])
+def test_hits_match_regex(text, whole_words):
+    index = TermIndex(TERMS)
+    found = [(h.term_id, h.start, h.end) for h in index.find(text, whole_words)]
+    assert found == _regex_hits(TERMS, text, whole_words)
+
+
+def test_trie_lookups():
+    index = TermIndex(["лиц", "лицевая", "изнаночная", "петля"])
+    assert index.exact("ЛИЦ") == [0]
+    assert index.prefixes_of("лицевая") == [0, 1]
+    assert sorted(index.extensions_of("лиц")) == [0, 1]
+    assert index.containing("наноч") == [2]
+    with pytest.raises(ValueError):
+        index.containing("лиц")
+
+
+def test_manager_builds_index_once_per_checksum(tmp_path):
+    path = tmp_path / "g.yaml"
+    path.write_text(
+        "terms:\n  k:\n    ru: лиц\n    en: knit\n    fr: endroit\n",
+        encoding="utf-8",
+    )
+    manager = GlossaryManager([path])
+    index = manager.term_index("ru")
+    assert manager.term_index("ru") is index
+    assert manager.find_term_keys("2 лиц, 2 изн") == ["k"]
+
+    extra = tmp_path / "extra.yaml"
+    extra.write_text(
+        "terms:\n  p:\n    ru: изн\n    en: purl\n    fr: envers\n",
+        encoding="utf-8",
+    )
+    manager.load_from_yaml(str(extra))
+    assert manager.term_index("ru") is not index
+    assert manager.find_term_keys("2 лиц, 2 изн") == ["k", "p"]
+
+
+def test_select_glossary_terms_scores():
+    entries = [
+        {"key": "k", "ru": "лиц"},
+        {"key": "kf", "ru": "лицевая"},
+        {"key": "p", "ru": "изнаночная"},
+        {"key": "x", "ru": "петля"},
+    ]
+    selected = select_glossary_terms(["Лиц", "наноч"], entries, "ru")
+    # Exact, then prefix, then substring matches
+    assert [e["key"] for e in selected] == ["k", "kf", "p"]
@@ -0,0 +1,74 @@
+"""Tests for in-document segment deduplication."""
+
+import pytest
+
+from kps.extraction.segmenter import Segmenter
+from kps.core.document import (
+    BlockType,
+    ContentBlock,
+    DocumentMetadata,
+    KPSDocument,
+    Section,
+    SectionType,
+)
+from kps.translation.segment_dedup import deduplicate_segments
+
+
+def _segments(*texts):
+    blocks = [
+        ContentBlock(block_id=f"p.steps.{i:03d}", block_type=BlockType.PARAGRAPH, content=text)
+        for i, text in enumerate(texts)
+    ]
+    document = KPSDocument(
+        slug="dedup",
+        metadata=DocumentMetadata(title="t", language="ru"),
+        sections=[Section(section_type=SectionType.INSTRUCTIONS, title="Steps", blocks=blocks)],
+    )
+    return Segmenter().segment_document(document)
+
+
+def _fake_translate(segments):
+    return [f"EN[{s.text}]" for s in segments]
+
+
+def test_identical_segments_are_translated_once():
+    segments = _segments("Повторить ряды 1–4", "Лицевая гладь", "Повторить ряды 1–4")
+
+    plan = deduplicate_segments(segments)
+
+    assert plan.unique == 2
+    assert plan.ratio == pytest.approx(1 / 3)
+    expanded = plan.expand(_fake_translate(plan.unique_segments))
+    assert expanded[0] == expanded[2]
+    assert len(expanded) == 3
+
+
+def test_different_numbers_stay_separate_by_default():
+    segments = _segments("Повторить ряды 1–4", "Повторить ряды 5–8")
+
+    plan = deduplicate_segments(segments)
+
+    assert plan.unique == 2
+    assert plan.ratio == 0.0
+
+
+def test_ignore_placeholder_values_decodes_per_segment():
+    segments = _segments("Повторить ряды 1–4", "Повторить ряды 5–8", "Повторить ряды 1–4")
+
+    plan = deduplicate_segments(segments, ignore_placeholder_values=True)
+
+    assert plan.unique == 1
+    assert plan.unique_segments[0].placeholders == {}
+    translations = [seg.text.replace("Повторить ряды", "Repeat rows") for seg in plan.unique_segments]
+    assert plan.expand(translations) == [
+        "Repeat rows 1–4",
+        "Repeat rows 5–8",
+        "Repeat rows 1–4",
+    ]
+
+
+def test_expand_rejects_wrong_count():
+    plan = deduplicate_segments(_segments("А", "Б"))
+
+    with pytest.raises(ValueError):
+        plan.expand(["A"])
@@ -0,0 +1,65 @@
+"""Tests for the single-pass glossary suggestion miner."""
+
+from kps.translation.glossary.term_index import TermIndex
+from kps.translation.term_miner import PhraseMiner
+from kps.translation.translation_memory import TranslationMemory
+
+
+def test_counts_every_phrase_up_to_three_words():
+    miner = PhraseMiner()
+
+    counted = miner.add("a b c d")
+
+    # 4 unigrams + 3 bigrams + 2 trigrams
+    assert counted == 9
+    assert "a b c d" not in {c.phrase for c in miner.candidates()}
+    assert miner.occurrences == 9
+
+
+def test_known_glossary_terms_are_skipped_case_insensitively():
+    index = TermIndex(["лиц", "2 петли вместе"])
+    miner = PhraseMiner(index.exact)
+
+    miner.add("Провяжите 2 ПЕТЛИ вместе", context="ctx")
+
+    phrases = {c.phrase for c in miner.candidates()}
+    assert "2 ПЕТЛИ вместе" not in phrases
+    assert "Провяжите 2" in phrases
+
+
+def test_frequencies_aggregate_across_segments():
+    miner = PhraseMiner(max_contexts=2)
+    for i in range(3):
+        miner.add("лицевая петля", context=f"ctx{i}")
+
+    by_phrase = {c.phrase: c for c in miner.candidates()}
+    assert len(miner) == 3
+    assert by_phrase["лицевая петля"].frequency == 3
+    assert by_phrase["лицевая петля"].contexts == ["ctx1", "ctx2"]
+
+    miner.add("лицевая петля", context="ctx1")
+    assert by_phrase["лицевая петля"].contexts == ["ctx2", "ctx1"]
+
+
+def test_bulk_suggestions_match_per_occurrence_writes():
+    miner = PhraseMiner()
+    for text in ["лицевая петля", "лицевая гладь"]:
+        miner.add(text, context=text)
+
+    bulk = TranslationMemory()
+    bulk.suggest_glossary_terms_bulk([c.as_row() for c in miner.candidates()], "ru", "en")
+
+    single = TranslationMemory()
+    for text in ["лицевая петля", "лицевая гладь"]:
+        words = text.split()
+        for i in range(len(words)):
+            for j in range(i + 1, len(words) + 1):
+                single.suggest_glossary_term(" ".join(words[i:j]), "", "ru", "en", context=text)
+
+    def summary(memory):
+        return {
+            t.source_text: (t.frequency, t.contexts)
+            for t in memory.get_glossary_suggestions(min_frequency=1, min_confidence=0)
+        }
+
+    assert summary(bulk) == summary(single)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from kps.translation.semantic_memory import SemanticTranslationMemory
+from kps.translation.vector_index import FlatVectorIndex, create_vector_index
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_flat_index_matches_brute_force(dtype):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    index = FlatVectorIndex(16, initial_capacity=8, dtype=dtype)
+    index.add_many([f"k{i}" for i in range(300)], vectors)
+
+    query = rng.standard_normal(16).astype(np.float32)
+    cosines = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    expected = [f"k{i}" for i in np.argsort(-cosines)[:5]]
+
+    hits = index.search(query, k=5)
+    assert [key for key, _ in hits] == expected
+    assert hits[0][1] == pytest.approx(cosines.max(), abs=1e-2)
+
+
+def test_flat_index_remove_and_reuse_slot():
+    index = create_vector_index(3, backend="flat")
+    index.add("a", [1.0, 0.0, 0.0])
+    index.add("b", [0.0, 1.0, 0.0])
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert [key for key, _ in index.search([1.0, 0.0, 0.0], k=5)] == ["b"]
+    assert index.search([1.0, 0.0, 0.0], k=5, min_cosine=0.5) == []
+
+    index.add("c", [1.0, 0.1, 0.0])
+    assert len(index) == 2
+    assert index.search([1.0, 0.0, 0.0], k=1)[0][0] == "c"
+
+
+def test_flat_index_replaced_and_zero_vectors():
+    index = FlatVectorIndex(2, initial_capacity=1)
+    index.add("a", [3.0, 0.0])
+    index.add("zero", [0.0, 0.0])
+    index.add("b", [0.0, 2.0])
+
+    assert index.search([1.0, 0.0], k=5) == [("a", 1.0), ("b", 0.0)]
+
+    index.add("a", [0.0, -5.0])
+    assert dict(index.search([1.0, 0.0], k=5)) == {"a": 0.0, "b": 0.0}
+    assert [key for key, _ in index.search([0.0, 1.0], k=1)] == ["b"]
+
+
+class _AxisEmbeddings:
+    """Embeds text onto fixed axes so similarities are predictable."""
+
+    AXES = {"петля": 0, "ряд": 1, "край": 2}
+
+    def create_vectors(self, texts):
+        vectors = []
+        for text in texts:
+            vec = [0.05, 0.05, 0.05, 0.05]
+            for word, axis in self.AXES.items():
+                if word in text:
+                    vec[axis] = 1.0
+            vectors.append(vec)
+        return vectors
+
+
+def test_find_similar_tracks_add_and_delete(tmp_path):
+    memory = SemanticTranslationMemory(
+        str(tmp_path / "memory.db"),
+        embedding_client=_AxisEmbeddings(),
+        embedding_dimensions=None,
+    )
+    memory.add_translation("петля лицевая", "knit stitch", "ru", "en", [])
+    memory.add_translation("ряд 1", "row 1", "ru", "en", [])
+
+    results = memory.find_similar("одна петля", "ru", "en", threshold=0.9)
+    assert [r.entry.source_text for r in results] == ["петля лицевая"]
+
+    # Added after the index was loaded
+    memory.add_translation("петля изнаночная", "purl stitch", "ru", "en", [])
+    results = memory.find_similar("одна петля", "ru", "en", threshold=0.9)
+    assert {r.entry.source_text for r in results} == {"петля лицевая", "петля изнаночная"}
+
+    memory.delete_translation("петля лицевая", "ru", "en")
+    results = memory.find_similar("одна петля", "ru", "en", threshold=0.9)
+    assert [r.entry.source_text for r in results] == ["петля изнаночная"]
+    assert memory.find_similar("одна петля", "ru", "fr", threshold=0.9) == []